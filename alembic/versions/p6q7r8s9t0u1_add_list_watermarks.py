@@ -0,0 +1,31 @@
+"""Add list_watermarks to scheduled_refresh_jobs.
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-18
+
+Stores the newest row each incremental list field saw on the job's last
+refresh (JSON object), so the next refresh can stop paginating there.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, Sequence[str], None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scheduled_refresh_jobs",
+        sa.Column("list_watermarks", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scheduled_refresh_jobs", "list_watermarks")
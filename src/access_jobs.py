@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from src import session_store
 from src.audit import record_audit_event
 from src.config import get_settings
+from src.core.acquire_queue import acquire_priority, priority_for_job_type
 from src.core.mfa_manager import get_mfa_manager
 from src.database import AccessJob, SessionLocal, decrypt_credential, encrypt_credential
 from src.exceptions import ConcurrentAccessError, MFARequiredError, PlaidifyError
@@ -576,7 +577,8 @@ async def _execute_existing_job(
     execution_kwargs.setdefault("session_id", job.session_id)
 
     try:
-        result = await executor(**execution_kwargs)
+        with acquire_priority(priority_for_job_type(job.job_type)):
+            result = await executor(**execution_kwargs)
     except asyncio.CancelledError:
         await get_mfa_manager().remove_session(job.session_id)
         _apply_job_state(
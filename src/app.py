@@ -28,6 +28,7 @@ from src import session_store
 from src.access_jobs import shutdown_access_jobs
 from src.config import get_settings
 from src.core.browser_pool import shutdown_browser_pool
+from src.core.engine import close_selector_cache
 from src.crypto import _get_redis
 from src.database import (
     AuditLog,
@@ -295,6 +296,13 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.error(f"Error during browser pool shutdown: {exc}")
 
+    try:
+        await asyncio.wait_for(asyncio.to_thread(close_selector_cache), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning("Selector cache flush timed out; continuing shutdown")
+    except Exception as exc:
+        logger.error(f"Error while flushing the selector cache: {exc}")
+
     try:
         redis_client = _get_redis()
         if redis_client is not None:
@@ -467,9 +475,12 @@ async def plaidify_error_handler(request: Request, exc: PlaidifyError) -> JSONRe
             }
         },
     )
+    retry_after = getattr(exc, "retry_after", None)
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
     return JSONResponse(
         status_code=exc.status_code,
         content={"error": exc.message, "error_code": code},
+        headers=headers,
     )
 
 
@@ -0,0 +1,88 @@
+"""
+Saved browser sessions for blueprints that opt into session reuse.
+
+After a successful login the engine hands the Playwright ``storage_state()``
+(cookies + localStorage) to :func:`save_browser_session`, which encrypts it
+with the owning user's DEK and stores it in ``session_store`` under a hash of
+the access token. The next fetch for the same token restores it and probes
+the site instead of replaying the whole auth flow.
+
+Everything here is best-effort: a missing, expired, or undecryptable state
+simply means the engine runs the normal auth steps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from src import session_store
+from src.config import get_settings
+from src.database import SessionLocal, User, decrypt_credential_for_user, encrypt_credential_for_user
+from src.logging_config import get_logger
+
+logger = get_logger("browser_sessions")
+
+
+def session_state_key(access_token: str) -> str:
+    """Derive the store key for an access token without exposing the token itself."""
+    return hashlib.sha256(f"browser-session:{access_token}".encode("utf-8")).hexdigest()
+
+
+def _load_user(user_id: int) -> Optional[User]:
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.id == user_id).first()
+    finally:
+        db.close()
+
+
+def save_browser_session(user_id: int, state_key: str, state: Dict[str, Any]) -> bool:
+    """Encrypt and store a Playwright storage state. Returns False if it was not saved."""
+    ttl = get_settings().browser_session_reuse_ttl_seconds
+    if ttl <= 0:
+        return False
+    try:
+        user = _load_user(user_id)
+        if user is None:
+            return False
+        ciphertext = encrypt_credential_for_user(user, json.dumps(state, separators=(",", ":")))
+        session_store.set_browser_session_state(state_key, ciphertext, ttl)
+        return True
+    except Exception as exc:
+        logger.warning(
+            "Failed to save browser session",
+            extra={"extra_data": {"user_id": user_id, "error": str(exc)}},
+        )
+        return False
+
+
+def load_browser_session(user_id: int, state_key: str) -> Optional[Dict[str, Any]]:
+    """Return the decrypted storage state for ``state_key``, or None."""
+    if get_settings().browser_session_reuse_ttl_seconds <= 0:
+        return None
+    try:
+        ciphertext = session_store.get_browser_session_state(state_key)
+        if not ciphertext:
+            return None
+        user = _load_user(user_id)
+        if user is None:
+            return None
+        state = json.loads(decrypt_credential_for_user(user, ciphertext))
+        return state if isinstance(state, dict) else None
+    except Exception as exc:
+        logger.warning(
+            "Discarding unreadable browser session",
+            extra={"extra_data": {"user_id": user_id, "error": str(exc)}},
+        )
+        discard_browser_session(state_key)
+        return None
+
+
+def discard_browser_session(state_key: str) -> None:
+    """Forget a saved session (e.g. after the site logged it out)."""
+    try:
+        session_store.delete_browser_session_state(state_key)
+    except Exception:
+        pass
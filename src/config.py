@@ -212,6 +212,20 @@ class Settings(BaseSettings):
         default="60/minute",
         description="Default rate limit for all other endpoints. Format: 'N/period'.",
     )
+    site_rate_limit_enabled: bool = Field(
+        default=True,
+        description=(
+            "Enforce each blueprint's rate_limit (max_requests_per_hour, min_interval_seconds) "
+            "across all workers before a connection acquires a browser. Shared through Redis when configured."
+        ),
+    )
+    site_rate_limit_max_wait_seconds: float = Field(
+        default=120.0,
+        description=(
+            "Longest a connection is queued for its site's rate limit. Beyond this it fails with "
+            "429 RATE_LIMITED and a retry_after; scheduled refreshes are deferred instead."
+        ),
+    )
 
     # ── Resilience ────────────────────────────────────────────
     llm_circuit_failure_threshold: int = Field(
@@ -234,6 +248,18 @@ class Settings(BaseSettings):
         default=30.0,
         description="Seconds the browser circuit stays open before allowing a trial launch.",
     )
+    site_circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive timeouts/unreachable errors for one site before its circuit opens and its jobs fail fast.",
+    )
+    site_circuit_reset_seconds: float = Field(
+        default=60.0,
+        description="Seconds a site's circuit stays open before one trial job is let through.",
+    )
+    site_latency_slo_seconds: float = Field(
+        default=60.0,
+        description=("Blueprint runs faster than this raise the site's adaptive concurrency limit; timeouts halve it."),
+    )
 
     # ── Redis ─────────────────────────────────────────────────
     redis_url: Optional[str] = Field(
@@ -280,6 +306,78 @@ class Settings(BaseSettings):
         default=5,
         description="Maximum number of concurrent browser contexts in the pool.",
     )
+    browser_memory_min_available_mb: int = Field(
+        default=0,
+        description=(
+            "Lower the pool's effective context limit while host MemAvailable (from /proc/meminfo) "
+            "would drop below this many MiB. 0 disables."
+        ),
+    )
+    browser_memory_max_rss_mb: int = Field(
+        default=0,
+        description=(
+            "Lower the pool's effective context limit while the combined RSS of its Chromium "
+            "processes would exceed this many MiB. 0 disables."
+        ),
+    )
+    browser_memory_min_contexts: int = Field(
+        default=1,
+        description="Floor for the memory-adjusted context limit.",
+    )
+    browser_memory_check_seconds: float = Field(
+        default=5.0,
+        description="How often memory pressure is sampled when memory admission is enabled.",
+    )
+    browser_site_max_contexts: int = Field(
+        default=0,
+        description=(
+            "Default cap on concurrent browser contexts per site, used when a blueprint's "
+            "rate_limit does not set max_concurrent_sessions. 0 means no cap."
+        ),
+    )
+    browser_prewarm_contexts: int = Field(
+        default=0,
+        description="Number of fully set-up, unassigned browser contexts kept warm so acquire() is a queue pop. 0 disables the reserve.",
+    )
+    browser_shards: int = Field(
+        default=1,
+        description="Number of Chromium processes the pool spreads contexts across. New contexts go to the least-loaded shard.",
+    )
+    browser_shard_max_contexts: int = Field(
+        default=0,
+        description="Maximum contexts hosted by one browser shard. 0 means no per-shard cap.",
+    )
+    browser_recycle_after_contexts: int = Field(
+        default=0,
+        description="Drain and relaunch a browser after it has created this many contexts. 0 disables.",
+    )
+    browser_recycle_max_age_seconds: int = Field(
+        default=0,
+        description="Drain and relaunch a browser once it is older than this many seconds. 0 disables.",
+    )
+    browser_recycle_max_rss_mb: int = Field(
+        default=0,
+        description="Drain and relaunch a browser when its process-tree RSS (from /proc) exceeds this many MiB. 0 disables.",
+    )
+    browser_service_url: Optional[str] = Field(
+        default=None,
+        description=(
+            "Address of the shared browser service (python -m src.core.browser_service), e.g. "
+            "tcp://127.0.0.1:9330. When set, workers attach to its Chromium and share its context "
+            "limit instead of each launching their own browser. The service binds to this address too."
+        ),
+    )
+    browser_service_cdp_port: int = Field(
+        default=9331,
+        description="Loopback port the shared browser service exposes Chromium's CDP endpoint on.",
+    )
+    browser_session_reuse_ttl_seconds: int = Field(
+        default=900,
+        description=(
+            "How long an encrypted, saved browser session is kept for blueprints that declare "
+            "auth.session_probe. 0 disables session reuse."
+        ),
+    )
     browser_idle_timeout: int = Field(
         default=300,
         description="Seconds before an idle browser context is closed.",
@@ -292,10 +390,64 @@ class Settings(BaseSettings):
         default=10000,
         description="Default timeout for individual actions (click, fill) in milliseconds.",
     )
+    extraction_batch_mode: bool = Field(
+        default=True,
+        description=(
+            "Read every selector-extracted field and list row in one page.evaluate round trip, "
+            "falling back to per-element queries for anything the batch read cannot resolve."
+        ),
+    )
+    extraction_deadline_ms: int = Field(
+        default=15000,
+        description=(
+            "Extraction-wide deadline in milliseconds shared by all scalar fields, which are resolved "
+            "concurrently. A field's own timeout can only extend it."
+        ),
+    )
+    extraction_settle_timeout_ms: int = Field(
+        default=3000,
+        description=(
+            "How long to wait for network idle before re-checking fields the batch read found missing. "
+            "Fields still missing then resolve to their defaults without a selector timeout."
+        ),
+    )
+    http_mode_enabled: bool = Field(
+        default=True,
+        description=(
+            "Run blueprints declaring execution_mode 'http' over plain HTTP instead of a browser. "
+            "Disable to send every connection through Chromium."
+        ),
+    )
+    http_mode_timeout_seconds: float = Field(
+        default=20.0,
+        description="Per-request timeout for HTTP-mode connections.",
+    )
+    extraction_max_tabs: int = Field(
+        default=3,
+        description=(
+            "Maximum extra tabs a blueprint run opens at once for pages declared with "
+            "parallel: true. 0 visits those pages one at a time on the main page."
+        ),
+    )
     browser_block_resources: bool = Field(
         default=True,
         description="Block images, fonts, and analytics scripts for speed.",
     )
+    browser_native_blocking: bool = Field(
+        default=False,
+        description=(
+            "Also enforce the default blocks inside Chromium (images disabled in Blink, tracker hosts "
+            "unresolvable) so they never reach the route handler. Browser-wide: blueprint allow rules "
+            "cannot re-enable them. Only applies with BROWSER_BLOCK_RESOURCES."
+        ),
+    )
+    browser_asset_cache_mb: int = Field(
+        default=0,
+        description=(
+            "Share a byte-bounded LRU cache of credential-free, publicly cacheable static responses "
+            "(scripts, styles, fonts, public XHR) across all browser contexts. 0 disables."
+        ),
+    )
     browser_stealth: bool = Field(
         default=True,
         description="Enable anti-detection measures (randomized viewport, user-agent).",
@@ -344,7 +496,40 @@ class Settings(BaseSettings):
     )
     llm_token_budget: int = Field(
         default=30000,
-        description="Max input tokens for DOM sent to LLM. Larger pages are truncated.",
+        description="Max input tokens for DOM sent to LLM. Larger pages drop their least relevant subtrees.",
+    )
+    llm_dom_in_browser: bool = Field(
+        default=True,
+        description=(
+            "Simplify the DOM for LLM extraction inside the page and ship only the cleaned tree, "
+            "instead of serializing the full page HTML to Python. Falls back to the Python parser."
+        ),
+    )
+    selector_cache_key: str = Field(
+        default="path+fingerprint",
+        description=(
+            "What LLM selector-cache entries are keyed by: 'path' (templated URL path, ids collapsed), "
+            "'fingerprint' (structural DOM fingerprint) or 'path+fingerprint'."
+        ),
+    )
+    selector_cache_backend: str = Field(
+        default="local",
+        description=(
+            "Where learned selectors live: 'local' (per process, optionally persisted to "
+            "PLAIDIFY_SELECTOR_CACHE_PATH) or 'redis' (shared by every worker through REDIS_URL, "
+            "fronted by a per-process LRU)."
+        ),
+    )
+    selector_cache_local_max_entries: int = Field(
+        default=1024,
+        description="Entries the per-process LRU in front of the Redis selector cache holds.",
+    )
+    selector_cache_local_ttl_seconds: float = Field(
+        default=60.0,
+        description=(
+            "Seconds a worker serves a selector-cache entry from its LRU before re-reading Redis. "
+            "Bounds staleness if an invalidation broadcast is missed."
+        ),
     )
     llm_fallback_model: Optional[str] = Field(
         default=None,
@@ -359,6 +544,22 @@ class Settings(BaseSettings):
             raise ValueError("llm_provider must be 'openai' or 'anthropic'")
         return v
 
+    @field_validator("selector_cache_key")
+    @classmethod
+    def validate_selector_cache_key(cls, v: str) -> str:
+        v = v.lower().strip()
+        if v not in ("path", "fingerprint", "path+fingerprint"):
+            raise ValueError("selector_cache_key must be 'path', 'fingerprint', or 'path+fingerprint'")
+        return v
+
+    @field_validator("selector_cache_backend")
+    @classmethod
+    def validate_selector_cache_backend(cls, v: str) -> str:
+        v = v.lower().strip()
+        if v not in ("local", "redis"):
+            raise ValueError("selector_cache_backend must be 'local' or 'redis'")
+        return v
+
     @field_validator("env")
     @classmethod
     def validate_env(cls, v: str) -> str:
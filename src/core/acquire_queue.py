@@ -0,0 +1,208 @@
+"""
+Priority-aware, per-site-fair admission queue for browser contexts.
+
+Replaces a plain semaphore in front of the browser pool. Waiters are granted a
+slot in this order:
+
+1. Priority class — ``interactive`` (hosted Link / connect) before
+   ``fetch_data`` before ``scheduled_refresh``.
+2. Within a class, the site that currently holds the fewest slots, so one slow
+   site cannot take every slot from the others.
+3. Arrival order.
+
+A site may also carry a concurrency cap (from the blueprint's
+``rate_limit.max_concurrent_sessions`` or ``BROWSER_SITE_MAX_CONTEXTS``).
+Waiters for a capped site are skipped, not blocking, so lower classes and
+other sites keep flowing.
+
+The caller's class travels in a context variable so the job runner can set it
+once (``with acquire_priority(...)``) without threading it through every
+executor signature.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterator, Optional
+
+
+class AcquirePriority(IntEnum):
+    """Admission classes, lowest value first."""
+
+    INTERACTIVE = 0
+    FETCH_DATA = 1
+    SCHEDULED_REFRESH = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def parse(cls, value: object) -> AcquirePriority:
+        """Accept an enum, its int value, or its label; default to ``fetch_data``."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            try:
+                return cls(value)
+            except ValueError:
+                return cls.FETCH_DATA
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper(), cls.FETCH_DATA)
+        return cls.FETCH_DATA
+
+
+_JOB_TYPE_PRIORITIES = {
+    "connect": AcquirePriority.INTERACTIVE,
+    "fetch_data": AcquirePriority.FETCH_DATA,
+    "scheduled_refresh": AcquirePriority.SCHEDULED_REFRESH,
+}
+
+_current_priority: ContextVar[AcquirePriority] = ContextVar(
+    "plaidify_acquire_priority", default=AcquirePriority.FETCH_DATA
+)
+
+
+def priority_for_job_type(job_type: Optional[str]) -> AcquirePriority:
+    """Map an access job type to its admission class."""
+    return _JOB_TYPE_PRIORITIES.get(job_type or "", AcquirePriority.FETCH_DATA)
+
+
+def current_priority() -> AcquirePriority:
+    """The admission class of the running task."""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def acquire_priority(priority: AcquirePriority) -> Iterator[None]:
+    """Run the enclosed block (and tasks it creates) under ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass
+class _Waiter:
+    priority: AcquirePriority
+    seq: int
+    site: Optional[str]
+    future: asyncio.Future = field(repr=False)
+
+
+class AcquireQueue:
+    """Counting admission queue with priority classes and per-site caps."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(1, capacity)
+        self._in_use = 0
+        self._site_active: dict[str, int] = {}
+        self._site_limits: dict[str, int] = {}
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def waiting_by_priority(self) -> dict[str, int]:
+        counts = {p.label: 0 for p in AcquirePriority}
+        for waiter in self._waiters:
+            counts[waiter.priority.label] += 1
+        return counts
+
+    def site_active(self, site: str) -> int:
+        return self._site_active.get(site, 0)
+
+    def set_capacity(self, capacity: int) -> None:
+        """Change the slot count; growing it admits waiters immediately."""
+        self._capacity = max(1, capacity)
+        self._dispatch()
+
+    async def acquire(
+        self,
+        *,
+        site: Optional[str] = None,
+        priority: Optional[AcquirePriority] = None,
+        site_limit: int = 0,
+    ) -> float:
+        """Wait for a slot and return how many seconds the caller queued."""
+        priority = current_priority() if priority is None else priority
+        if site is not None:
+            if site_limit > 0:
+                self._site_limits[site] = site_limit
+            else:
+                self._site_limits.pop(site, None)
+
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            site=site,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+        if waiter.future.done():
+            return 0.0
+
+        started = time.monotonic()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we were cancelled — hand the slot on.
+                self.release(site)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic() - started
+
+    def release(self, site: Optional[str] = None) -> None:
+        """Return a slot taken by :meth:`acquire` with the same ``site``."""
+        if self._in_use > 0:
+            self._in_use -= 1
+        if site is not None:
+            remaining = self._site_active.get(site, 0) - 1
+            if remaining > 0:
+                self._site_active[site] = remaining
+            else:
+                self._site_active.pop(site, None)
+        self._dispatch()
+
+    def _eligible(self, waiter: _Waiter) -> bool:
+        if waiter.site is None:
+            return True
+        limit = self._site_limits.get(waiter.site, 0)
+        return limit <= 0 or self._site_active.get(waiter.site, 0) < limit
+
+    def _dispatch(self) -> None:
+        # A cancelled waiter's future is done before its except block runs.
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        while self._in_use < self._capacity and self._waiters:
+            candidates = [w for w in self._waiters if self._eligible(w)]
+            if not candidates:
+                return
+            chosen = min(
+                candidates,
+                key=lambda w: (w.priority, self._site_active.get(w.site, 0) if w.site else 0, w.seq),
+            )
+            self._waiters.remove(chosen)
+            self._in_use += 1
+            if chosen.site is not None:
+                self._site_active[chosen.site] = self._site_active.get(chosen.site, 0) + 1
+            chosen.future.set_result(None)
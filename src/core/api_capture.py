@@ -0,0 +1,338 @@
+"""
+JSON api sources — extract fields from the XHR payloads behind a page.
+
+Single-page banking portals load balances and transactions from internal
+JSON endpoints and render them client-side; scraping the rendered DOM means
+waiting for that rendering and re-parsing what was already structured data.
+A blueprint can declare those endpoints under ``api`` and point fields at
+them (``"api": "accounts", "json_path": "$.accounts[0].balance"``).
+
+Two ways to get the payloads:
+
+- **capture** (default): :class:`ApiCapture` sits in the pool's ``context.route``
+  hook. XHR / fetch requests matching an endpoint are fetched on the page's
+  behalf, their JSON is recorded, and the response is handed back to the page
+  unchanged. Fields wait (up to the endpoint's ``timeout``) for the payload;
+- **replay** (``api.replay: true``): after auth the endpoints are called
+  directly with the session's cookies — ``context.request`` in the browser,
+  the cookie jar in HTTP mode — so pages that only api fields needed are
+  never rendered.
+
+JSON paths support ``$``, ``.key``, ``['key']``, ``[n]`` (negative counts
+from the end) and ``[*]``. A scalar field takes the first match; a list's
+``json_path`` selects the row objects and column paths are relative to each
+row (the leading ``$`` is optional).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from src import metrics
+from src.core.blueprint import ApiEndpoint, ExtractionField, ListExtractionField
+from src.core.data_extractor import DataExtractor, plan_for
+from src.core.read_only_policy import ReadOnlyExecutionPolicy
+from src.core.watermarks import RowCollector
+from src.exceptions import DataExtractionError, ReadOnlyPolicyViolationError
+from src.logging_config import get_logger
+
+logger = get_logger("api_capture")
+
+#: Payloads larger than this are passed through without being recorded.
+MAX_CAPTURE_BYTES = 5 * 1024 * 1024
+
+_CAPTURE_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+_PATH_TOKEN = re.compile(r"\.([^.\[\]]+)|\[(\*|-?\d+|'[^']*'|\"[^\"]*\")\]")
+_WILDCARD = object()
+
+JsonFetcher = Callable[[str, str, Optional[Dict[str, Any]]], Awaitable[Any]]
+
+
+class JsonPathError(ValueError):
+    """A json_path expression could not be parsed."""
+
+
+def _compile_path(expr: str) -> List[Any]:
+    path = expr.strip()
+    if path.startswith("$"):
+        path = path[1:]
+    if path and not path.startswith((".", "[")):
+        path = "." + path
+    tokens: List[Any] = []
+    position = 0
+    while position < len(path):
+        match = _PATH_TOKEN.match(path, position)
+        if match is None:
+            raise JsonPathError(f"Invalid json_path '{expr}' at '{path[position:]}'")
+        key, bracket = match.groups()
+        if key is not None:
+            tokens.append(key)
+        elif bracket == "*":
+            tokens.append(_WILDCARD)
+        elif bracket[0] in "'\"":
+            tokens.append(bracket[1:-1])
+        else:
+            tokens.append(int(bracket))
+        position = match.end()
+    return tokens
+
+
+_compiled_paths: Dict[str, List[Any]] = {}
+
+
+def json_path(data: Any, expr: str) -> List[Any]:
+    """All values in ``data`` matched by ``expr`` (empty when none match)."""
+    tokens = _compiled_paths.get(expr)
+    if tokens is None:
+        tokens = _compiled_paths[expr] = _compile_path(expr)
+    matches = [data]
+    for token in tokens:
+        step: List[Any] = []
+        for value in matches:
+            if token is _WILDCARD:
+                if isinstance(value, list):
+                    step.extend(value)
+                elif isinstance(value, dict):
+                    step.extend(value.values())
+            elif isinstance(token, int):
+                if isinstance(value, list) and -len(value) <= token < len(value):
+                    step.append(value[token])
+            elif isinstance(value, dict) and token in value:
+                step.append(value[token])
+        matches = step
+    return matches
+
+
+def _url_pattern(url: str) -> re.Pattern:
+    return re.compile(".*".join(re.escape(piece) for piece in url.lower().split("*")))
+
+
+def _raw(value: Any) -> Optional[str]:
+    """JSON scalar -> the string a transform plan expects."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+class ApiCapture:
+    """Records JSON responses of declared endpoints from a context's route hook."""
+
+    def __init__(self, endpoints: Dict[str, ApiEndpoint], site: str = "unknown") -> None:
+        self.endpoints = endpoints
+        self.site = site
+        self.payloads: Dict[str, Any] = {}
+        self.urls: Dict[str, str] = {}
+        self._patterns = [(name, ep.method.upper(), _url_pattern(ep.url)) for name, ep in endpoints.items()]
+        self._events: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in endpoints}
+
+    def match(self, url: str, method: str = "GET") -> Optional[str]:
+        """Name of the endpoint ``url`` belongs to, if any."""
+        lowered = url.lower()
+        for name, endpoint_method, pattern in self._patterns:
+            if endpoint_method == method.upper() and pattern.search(lowered):
+                return name
+        return None
+
+    def wants(self, request: Any) -> bool:
+        """Cheap check whether the route hook should capture ``request``."""
+        return request.resource_type in _CAPTURE_RESOURCE_TYPES and self.match(request.url, request.method) is not None
+
+    async def handle(self, route: Any, request: Any) -> None:
+        """Fetch the request for the page, record its JSON, fulfill the page unchanged."""
+        response = await route.fetch()
+        body = await response.body()
+        name = self.match(request.url, request.method)
+        if name is not None and response.ok and len(body) <= MAX_CAPTURE_BYTES:
+            try:
+                self.record(name, request.url, json.loads(body))
+            except ValueError:
+                logger.debug(
+                    "Captured api response is not JSON",
+                    extra={"extra_data": {"endpoint": name, "url": request.url}},
+                )
+        await route.fulfill(response=response, body=body)
+
+    def record(self, name: str, url: str, payload: Any) -> None:
+        self.payloads[name] = payload
+        self.urls[name] = url
+        self._events[name].set()
+
+    async def payload(self, name: str) -> Any:
+        """The endpoint's latest payload, waiting up to its timeout for the page to request it.
+
+        Raises:
+            LookupError: If the page did not request the endpoint in time.
+        """
+        if name not in self.payloads:
+            try:
+                await asyncio.wait_for(self._events[name].wait(), self.endpoints[name].timeout / 1000)
+            except asyncio.TimeoutError:
+                metrics.record_api_payload(self.site, "capture", "missing")
+                raise LookupError(f"api endpoint '{name}' was not requested by the page") from None
+        metrics.record_api_payload(self.site, "capture", "ok")
+        return self.payloads[name]
+
+
+@dataclass
+class _ReplayRequest:
+    """Request-shaped view of a replayed call for ``ReadOnlyExecutionPolicy.evaluate_request``."""
+
+    method: str
+    headers: Dict[str, str] = field(default_factory=lambda: {"content-type": "application/json"})
+
+    def is_navigation_request(self) -> bool:
+        return False
+
+
+class ApiReplayer:
+    """Calls declared endpoints directly with an authenticated session.
+
+    ``fetch_json(method, url, body)`` performs the request with the session's
+    cookies and returns the decoded JSON. Each endpoint is fetched at most
+    once per run.
+    """
+
+    def __init__(
+        self,
+        endpoints: Dict[str, ApiEndpoint],
+        fetch_json: JsonFetcher,
+        *,
+        read_only_policy: Optional[ReadOnlyExecutionPolicy] = None,
+        site: str = "unknown",
+    ) -> None:
+        self.endpoints = endpoints
+        self.fetch_json = fetch_json
+        self.read_only_policy = read_only_policy
+        self.site = site
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def replay_url(endpoint: ApiEndpoint) -> Optional[str]:
+        """The concrete URL replay calls, or None if the endpoint has none."""
+        if endpoint.replay_url:
+            return endpoint.replay_url
+        return None if "*" in endpoint.url else endpoint.url
+
+    async def payload(self, name: str) -> Any:
+        call = self._calls.get(name)
+        if call is None:
+            call = self._calls[name] = asyncio.ensure_future(self._fetch(name))
+        return await call
+
+    async def _fetch(self, name: str) -> Any:
+        endpoint = self.endpoints[name]
+        url = self.replay_url(endpoint)
+        if url is None:
+            raise LookupError(f"api endpoint '{name}' has a wildcard url and no replay_url")
+        method = endpoint.method.upper()
+        if self.read_only_policy is not None:
+            reason = self.read_only_policy.evaluate_request(_ReplayRequest(method))
+            if reason:
+                self.read_only_policy.record_blocked("request", reason, target=url)
+                raise ReadOnlyPolicyViolationError(reason)
+        try:
+            payload = await self.fetch_json(method, url, endpoint.body)
+        except Exception:
+            metrics.record_api_payload(self.site, "replay", "error")
+            raise
+        metrics.record_api_payload(self.site, "replay", "ok")
+        return payload
+
+
+PayloadSource = Union[ApiCapture, ApiReplayer]
+
+
+def api_fields(fields: Dict[str, Union[ExtractionField, ListExtractionField]]) -> List[str]:
+    """Names of the fields read from api payloads."""
+    return [name for name, field_def in fields.items() if field_def.api]
+
+
+class ApiExtractor:
+    """Extracts api-sourced fields from captured or replayed payloads.
+
+    Mirrors ``DataExtractor``: values go through the same transform plans, a
+    missing scalar falls back to its default or raises ``DataExtractionError``,
+    and any other failure leaves the field at its default.
+    """
+
+    def __init__(self, source: PayloadSource) -> None:
+        self.source = source
+        self.timings: Dict[str, float] = {}
+        self.waits: List[Dict[str, Any]] = []
+
+    async def extract(
+        self,
+        fields: Dict[str, Union[ExtractionField, ListExtractionField]],
+        site: str = "unknown",
+    ) -> Dict[str, Any]:
+        started = time.monotonic()
+        self.timings = {}
+        names = sorted({field_def.api for field_def in fields.values()})
+        outcomes = await asyncio.gather(*(self.source.payload(name) for name in names), return_exceptions=True)
+        payloads = dict(zip(names, outcomes))
+
+        result: Dict[str, Any] = {}
+        for name, field_def in fields.items():
+            payload = payloads[field_def.api]
+            try:
+                if isinstance(payload, ReadOnlyPolicyViolationError):
+                    raise payload
+                if isinstance(payload, BaseException):
+                    logger.warning(
+                        f"No api payload for {name}: {payload}",
+                        extra={"extra_data": {"field": name, "endpoint": field_def.api, "error": str(payload)}},
+                    )
+                    payload = None
+                if isinstance(field_def, ListExtractionField):
+                    result[name] = self._rows(field_def, name, payload)
+                else:
+                    result[name] = self._scalar(field_def, name, site, payload)
+            except (DataExtractionError, ReadOnlyPolicyViolationError):
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Api extraction failed for {name}: {e}",
+                    extra={"extra_data": {"field": name, "error": str(e)}},
+                )
+                result[name] = field_def.default if isinstance(field_def, ExtractionField) else None
+            self.timings[name] = round((time.monotonic() - started) * 1000, 1)
+        return result
+
+    @staticmethod
+    def _scalar(field_def: ExtractionField, name: str, site: str, payload: Any) -> Any:
+        matches = json_path(payload, field_def.json_path) if payload is not None else []
+        raw = _raw(matches[0]) if matches else None
+        if raw is None:
+            return DataExtractor._missing(field_def, name, site)
+        return plan_for(field_def).apply(raw)
+
+    @staticmethod
+    def _rows(field_def: ListExtractionField, name: str, payload: Any) -> List[Dict[str, Any]]:
+        if payload is None:
+            return []
+        rows: List[Any] = json_path(payload, field_def.json_path)
+        if len(rows) == 1 and isinstance(rows[0], list):
+            rows = rows[0]  # '$.transactions' instead of '$.transactions[*]'
+        if field_def.max_items:
+            rows = rows[: field_def.max_items]
+        raw_rows = []
+        for row in rows:
+            raw_row: Dict[str, Optional[str]] = {}
+            for col_name, col_def in field_def.fields.items():
+                matches = json_path(row, col_def.json_path or col_name)
+                raw_row[col_name] = _raw(matches[0]) if matches else None
+            raw_rows.append(raw_row)
+        collector = RowCollector(field_def, name)
+        for row in DataExtractor._finish_rows(field_def, raw_rows):
+            if not collector.offer(row):
+                break
+        return collector.items
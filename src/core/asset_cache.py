@@ -0,0 +1,248 @@
+"""
+Shared static-asset cache for browser contexts.
+
+Every pooled context is isolated, so without help each connection re-downloads
+the same script bundles for a site's login page. When
+``BROWSER_ASSET_CACHE_MB`` is set, the pool's route handler sends eligible
+requests through one ``StaticAssetCache`` shared by all its contexts and
+answers repeats with ``route.fulfill``.
+
+Only credential-free, publicly cacheable responses are stored:
+
+- the request is a GET for a static resource (script, stylesheet, font, image),
+  or an XHR/fetch whose response says ``Cache-Control: public``;
+- the request carries no ``Cookie`` or ``Authorization`` header, and the
+  context holds no cookies for its URL (``route.fetch`` would send them);
+- the response is a 200 without ``Set-Cookie``, ``private``, ``no-store`` or
+  ``Vary: *``/``Vary: Cookie``, and it is either fresh for a while
+  (``max-age``/``s-maxage``/``Expires``) or has a validator to revalidate with.
+
+Entries are keyed by URL plus the values of any request headers the response
+``Vary``s on (a URL whose ``Vary`` set changes drops its older entries),
+evicted least-recently-used to stay under a byte budget, and revalidated
+with ``If-None-Match``/``If-Modified-Since`` once stale.
+"""
+
+from __future__ import annotations
+
+import collections
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from src import metrics
+from src.logging_config import get_logger
+
+logger = get_logger("asset_cache")
+
+STATIC_RESOURCE_TYPES = {"script", "stylesheet", "font", "image"}
+DATA_RESOURCE_TYPES = {"xhr", "fetch"}
+
+_CREDENTIAL_HEADERS = ("cookie", "authorization", "proxy-authorization")
+# Headers that describe the wire encoding, not the decoded body we replay.
+_DROP_ON_REPLAY = {"content-encoding", "content-length", "transfer-encoding", "set-cookie", "connection"}
+
+
+@dataclass
+class CachedAsset:
+    """One cached response body and the metadata needed to replay it."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    fresh_until: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def validators(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+def _cache_control(headers: dict[str, str]) -> dict[str, Optional[str]]:
+    directives: dict[str, Optional[str]] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _freshness_seconds(headers: dict[str, str], directives: dict[str, Optional[str]]) -> float:
+    for name in ("s-maxage", "max-age"):
+        value = directives.get(name)
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return 0.0
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+
+def has_credentials(request_headers: dict[str, str]) -> bool:
+    """True if the request would carry cookies or an auth header."""
+    return any(request_headers.get(name) for name in _CREDENTIAL_HEADERS)
+
+
+class StaticAssetCache:
+    """Byte-bounded LRU of replayable responses, shared across browser contexts."""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: Optional[int] = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes or max(1, max_bytes // 8)
+        self._entries: collections.OrderedDict[tuple, CachedAsset] = collections.OrderedDict()
+        # Vary header names per URL, and how many entries each URL has; a URL's
+        # metadata is dropped with its last entry.
+        self._vary: dict[str, tuple[str, ...]] = {}
+        self._url_entries: dict[str, int] = {}
+        self._bytes = 0
+
+    # ── Bookkeeping ───────────────────────────────────────────────────────────
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._vary.clear()
+        self._url_entries.clear()
+        self._bytes = 0
+        metrics.set_browser_asset_cache_bytes(0)
+
+    def _key(self, url: str, request_headers: dict[str, str]) -> tuple:
+        vary = self._vary.get(url, ())
+        return (url, *(request_headers.get(name, "") for name in vary))
+
+    def _drop(self, key: tuple) -> None:
+        self._bytes -= self._entries.pop(key).size
+        url = key[0]
+        self._url_entries[url] -= 1
+        if not self._url_entries[url]:
+            del self._url_entries[url]
+            del self._vary[url]
+
+    def get(self, url: str, request_headers: dict[str, str]) -> Optional[CachedAsset]:
+        key = self._key(url, request_headers)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, url: str, request_headers: dict[str, str], vary: tuple[str, ...], entry: CachedAsset) -> None:
+        if entry.size > self.max_entry_bytes:
+            return
+        if self._vary.get(url, vary) != vary:
+            # Entries keyed by the old Vary headers could no longer be looked up.
+            for stale in [key for key in self._entries if key[0] == url]:
+                self._drop(stale)
+        key = (url, *(request_headers.get(name, "") for name in vary))
+        if key in self._entries:
+            self._drop(key)
+        self._vary[url] = vary
+        self._url_entries[url] = self._url_entries.get(url, 0) + 1
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+        metrics.set_browser_asset_cache_bytes(self._bytes)
+
+    # ── Policy ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def is_candidate(request: Any) -> bool:
+        """Cheap pre-check on the request alone (method and resource type)."""
+        return request.method == "GET" and (
+            request.resource_type in STATIC_RESOURCE_TYPES or request.resource_type in DATA_RESOURCE_TYPES
+        )
+
+    def _build_entry(self, resource_type: str, status: int, headers: dict[str, str], body: bytes):
+        """Return ``(entry, vary)`` for a storable response, or None."""
+        if status != 200 or "set-cookie" in headers:
+            return None
+        directives = _cache_control(headers)
+        if "no-store" in directives or "private" in directives:
+            return None
+        if resource_type in DATA_RESOURCE_TYPES and "public" not in directives:
+            return None
+        vary = tuple(sorted(v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()))
+        if "*" in vary or any(name in _CREDENTIAL_HEADERS for name in vary):
+            return None
+
+        fresh_for = 0.0 if "no-cache" in directives else _freshness_seconds(headers, directives)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if fresh_for <= 0 and not (etag or last_modified):
+            return None
+
+        replay_headers = {k: v for k, v in headers.items() if k not in _DROP_ON_REPLAY}
+        entry = CachedAsset(
+            status=status,
+            headers=replay_headers,
+            body=body,
+            fresh_until=time.time() + fresh_for,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        return entry, vary
+
+    # ── Route handling ────────────────────────────────────────────────────────
+
+    async def handle(self, route: Any, request: Any, request_headers: dict[str, str]) -> None:
+        """Answer ``route`` from the cache, revalidating or fetching as needed.
+
+        The caller has already checked :meth:`is_candidate` and that the
+        request carries no credentials.
+        """
+        url = request.url
+        entry = self.get(url, request_headers)
+        if entry is not None and entry.is_fresh:
+            metrics.record_browser_asset_cache("hit")
+            await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+            return
+
+        fetch_headers = dict(request_headers)
+        if entry is not None:
+            fetch_headers.update(entry.validators())
+        response = await route.fetch(headers=fetch_headers)
+        headers = {k.lower(): v for k, v in response.headers.items()}
+
+        if response.status == 304 and entry is not None:
+            directives = _cache_control(headers or entry.headers)
+            fresh_for = 0.0 if "no-cache" in directives else _freshness_seconds(headers or entry.headers, directives)
+            entry.fresh_until = time.time() + fresh_for
+            metrics.record_browser_asset_cache("revalidated")
+            await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+            return
+
+        body = await response.body()
+        built = self._build_entry(request.resource_type, response.status, headers, body)
+        if built is not None:
+            new_entry, vary = built
+            self.put(url, request_headers, vary, new_entry)
+            metrics.record_browser_asset_cache("miss")
+        else:
+            metrics.record_browser_asset_cache("uncacheable")
+        await route.fulfill(response=response, body=body)
@@ -15,7 +15,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 # ── Enums ─────────────────────────────────────────────────────────────────────
 
@@ -93,6 +93,31 @@ class AuthType(str, Enum):
 # ── Step Models ───────────────────────────────────────────────────────────────
 
 
+class SettleConfig(BaseModel):
+    """Wait after a step until the page settles: the earliest enabled signal wins.
+
+    Set a signal to ``null`` to disable it. Pagination also races a change of
+    the list's rows against these signals.
+    """
+
+    network_idle_ms: Optional[int] = Field(
+        500,
+        description="Settle once no request has been in flight for this many ms.",
+    )
+    dom_quiet_ms: Optional[int] = Field(
+        None,
+        description="Settle once the DOM has not changed for this many ms.",
+    )
+    ready_selector: Optional[str] = Field(
+        None,
+        description="Settle as soon as this selector is visible.",
+    )
+    timeout: int = Field(
+        10000,
+        description="Upper bound in ms; the step continues when it is reached.",
+    )
+
+
 class BlueprintStep(BaseModel):
     """A single step in an auth or cleanup flow."""
 
@@ -143,6 +168,20 @@ class BlueprintStep(BaseModel):
         None,
         description="Number of pixels to scroll.",
     )
+    settle: Optional[SettleConfig] = Field(
+        None,
+        description=(
+            "Wait for the page to settle after this step instead of a fixed load state "
+            "(goto, click, wait_for_navigation)."
+        ),
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Extract fields this step is needed for. When a fetch requests a subset of "
+            "fields, tagged steps serving none of them are skipped; untagged steps always run."
+        ),
+    )
 
     @field_validator("url")
     @classmethod
@@ -239,6 +278,17 @@ class ExtractionField(BaseModel):
         None,
         description="Fallback CSS selector if primary selector fails (V3).",
     )
+    api: Optional[str] = Field(
+        None,
+        description="Read this field from the JSON payload of this api endpoint instead of the page.",
+    )
+    json_path: Optional[str] = Field(
+        None,
+        description=(
+            "JSONPath-like expression into the api payload (e.g., '$.accounts[0].balance'). "
+            "In list columns it is relative to the row."
+        ),
+    )
 
 
 class ListExtractionField(BaseModel):
@@ -265,6 +315,27 @@ class ListExtractionField(BaseModel):
         None,
         description="Pagination configuration for multi-page extraction.",
     )
+    api: Optional[str] = Field(
+        None,
+        description="Read the rows from the JSON payload of this api endpoint instead of the page.",
+    )
+    json_path: Optional[str] = Field(
+        None,
+        description="JSONPath-like expression selecting the row objects (e.g., '$.transactions[*]').",
+    )
+    watermark: Optional[str] = Field(
+        None,
+        description=(
+            "Column identifying a row (an id, or a date column in a newest-first list). "
+            "Incremental refreshes stop paginating at the first row the previous refresh already saw."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_watermark(self) -> "ListExtractionField":
+        if self.watermark is not None and self.watermark not in self.fields:
+            raise ValueError(f"watermark '{self.watermark}' is not a column of this list.")
+        return self
 
 
 class PaginationConfig(BaseModel):
@@ -273,12 +344,42 @@ class PaginationConfig(BaseModel):
     next_selector: str = Field(..., description="CSS selector for the 'next page' button.")
     max_pages: int = Field(5, description="Maximum number of pages to traverse.")
     wait_after_click: int = Field(2000, description="ms to wait after clicking next.")
+    settle: Optional[SettleConfig] = Field(
+        None,
+        description="Wait for the next page to settle (or its rows to change) instead of wait_after_click.",
+    )
 
 
 # Fix forward reference
 ListExtractionField.model_rebuild()
 
 
+class ExtractionPage(BaseModel):
+    """A page reached after authentication that some extract fields live on.
+
+    The page's steps run only when at least one of its fields is requested, and
+    its fields are extracted right after them.
+    """
+
+    name: str = Field(..., description="Page name used in step labels and logs (e.g., 'statements').")
+    steps: List[BlueprintStep] = Field(
+        ...,
+        description="Steps that navigate from the previous page to this one.",
+    )
+    fields: List[str] = Field(
+        ...,
+        description="Keys of the blueprint's extract map that are read on this page.",
+    )
+    parallel: bool = Field(
+        False,
+        description=(
+            "The page does not depend on the pages before it: open it in its own tab of the "
+            "logged-in context, concurrently with other parallel pages. Its steps start from a "
+            "blank tab, so they usually begin with a goto."
+        ),
+    )
+
+
 # ── Rate Limit & Health ──────────────────────────────────────────────────────
 
 
@@ -289,6 +390,13 @@ class ExtractionStrategy(str, Enum):
     LLM_ADAPTIVE = "llm_adaptive"  # V3: LLM-based with selector caching
 
 
+class ExecutionMode(str, Enum):
+    """How the engine drives the site."""
+
+    BROWSER = "browser"  # Playwright / Chromium
+    HTTP = "http"  # plain HTTP requests + server-rendered HTML, browser fallback
+
+
 class RateLimitConfig(BaseModel):
     """Rate limiting configuration for the target site."""
 
@@ -300,6 +408,70 @@ class RateLimitConfig(BaseModel):
         30,
         description="Minimum interval between requests in seconds.",
     )
+    max_concurrent_sessions: Optional[int] = Field(
+        None,
+        description=(
+            "Maximum browser sessions open against this site at once. "
+            "Defaults to BROWSER_SITE_MAX_CONTEXTS when omitted."
+        ),
+    )
+
+
+class RequestRulesConfig(BaseModel):
+    """Extra request-blocking rules applied on top of the pool defaults.
+
+    A bare host (``cdn.tracker.io``) matches the host and its subdomains; any
+    rule containing ``/`` or ``*`` is a URL pattern where ``*`` is a wildcard.
+    Allow rules win over every block rule, including the default blocked
+    resource types.
+    """
+
+    block: List[str] = Field(
+        default_factory=list,
+        description="Hosts or URL patterns to abort in addition to the defaults.",
+    )
+    allow: List[str] = Field(
+        default_factory=list,
+        description="Hosts or URL patterns that must load even if a block rule matches.",
+    )
+
+
+class ApiEndpoint(BaseModel):
+    """A JSON endpoint the site's own pages call (XHR / fetch)."""
+
+    url: str = Field(
+        ...,
+        description="URL of the endpoint; '*' matches any characters. Matched against the page's requests.",
+    )
+    method: str = Field("GET", description="HTTP method of the endpoint.")
+    replay_url: Optional[str] = Field(
+        None,
+        description="URL to call in replay mode when 'url' contains wildcards.",
+    )
+    body: Optional[Dict[str, Any]] = Field(
+        None,
+        description="JSON body sent in replay mode for non-GET endpoints.",
+    )
+    timeout: int = Field(
+        10000,
+        description="Max ms to wait for the page to request the endpoint (capture mode).",
+    )
+
+
+class ApiConfig(BaseModel):
+    """JSON endpoints that extract fields can read from instead of the rendered DOM.
+
+    By default responses are captured from the page's own XHR / fetch traffic
+    during the run. With ``replay`` the endpoints are called directly with the
+    authenticated session's cookies after login, and page steps only needed by
+    api fields are skipped.
+    """
+
+    endpoints: Dict[str, ApiEndpoint] = Field(..., description="Endpoints by name, referenced by a field's 'api'.")
+    replay: bool = Field(
+        False,
+        description="Call the endpoints directly after auth instead of capturing the page's requests.",
+    )
 
 
 class HealthCheckConfig(BaseModel):
@@ -312,6 +484,20 @@ class HealthCheckConfig(BaseModel):
 # ── Auth Config ──────────────────────────────────────────────────────────────
 
 
+class SessionProbeConfig(BaseModel):
+    """Cheap check that a restored browser session is still logged in."""
+
+    url: str = Field(..., description="Authenticated page to open with the restored session.")
+    logged_in_selector: str = Field(
+        ...,
+        description="CSS selector that is only present when the session is still logged in.",
+    )
+    timeout: int = Field(
+        5000,
+        description="Max ms to wait for the logged-in selector before falling back to full auth.",
+    )
+
+
 class AuthConfig(BaseModel):
     """Authentication configuration."""
 
@@ -320,6 +506,15 @@ class AuthConfig(BaseModel):
         ...,
         description="Ordered steps to perform authentication.",
     )
+    session_probe: Optional[SessionProbeConfig] = Field(
+        None,
+        description=(
+            "Opt into browser session reuse. After a successful login the session "
+            "state is saved; later runs restore it and skip the auth steps when this "
+            "probe finds the logged-in selector. Cleanup steps are skipped while a "
+            "reusable session is saved so a logout does not invalidate it."
+        ),
+    )
 
 
 # ── Top-Level Blueprint ──────────────────────────────────────────────────────
@@ -356,10 +551,25 @@ class BlueprintV2(BaseModel):
         ExtractionStrategy.SELECTOR,
         description="Extraction approach: 'selector' (V2 CSS) or 'llm_adaptive' (V3 LLM).",
     )
+    execution_mode: ExecutionMode = Field(
+        ExecutionMode.BROWSER,
+        description=(
+            "'http' runs the steps as plain HTTP requests (links and form posts with a cookie "
+            "jar) and extracts from the response HTML, for server-rendered sites. Runs fall "
+            "back to the browser when a step or page needs one."
+        ),
+    )
     extract: Dict[str, Union[ExtractionField, ListExtractionField]] = Field(
         default_factory=dict,
         description="Data fields to extract after authentication.",
     )
+    pages: List[ExtractionPage] = Field(
+        default_factory=list,
+        description=(
+            "Pages visited in order after authentication, each serving some extract "
+            "fields. Fields not assigned to a page are extracted on the page auth ends on."
+        ),
+    )
     page_context: Optional[str] = Field(
         None,
         description="Description of the page for LLM context (V3, e.g. 'utility bill dashboard').",
@@ -380,6 +590,14 @@ class BlueprintV2(BaseModel):
         None,
         description="Health check configuration.",
     )
+    request_rules: Optional[RequestRulesConfig] = Field(
+        None,
+        description="Per-site request blocking and allow rules for the browser.",
+    )
+    api: Optional[ApiConfig] = Field(
+        None,
+        description="JSON endpoints that extract fields with an 'api' source read from.",
+    )
     credential_schema: Optional[Dict[str, Any]] = Field(
         None,
         description=(
@@ -410,6 +628,30 @@ class BlueprintV2(BaseModel):
             raise ValueError(f"Unsupported schema version: {v}. Expected '1.0', '2.0', or '3.0'.")
         return v
 
+    @model_validator(mode="after")
+    def validate_pages(self) -> "BlueprintV2":
+        seen: set = set()
+        for page in self.pages:
+            for name in page.fields:
+                if name not in self.extract:
+                    raise ValueError(f"Page '{page.name}' lists unknown extract field '{name}'.")
+                if name in seen:
+                    raise ValueError(f"Extract field '{name}' is assigned to more than one page.")
+                seen.add(name)
+        return self
+
+    @model_validator(mode="after")
+    def validate_api_sources(self) -> "BlueprintV2":
+        endpoints = self.api.endpoints if self.api else {}
+        for name, field_def in self.extract.items():
+            if field_def.api is None:
+                continue
+            if field_def.api not in endpoints:
+                raise ValueError(f"Field '{name}' reads unknown api endpoint '{field_def.api}'.")
+            if not field_def.json_path:
+                raise ValueError(f"Field '{name}' reads api endpoint '{field_def.api}' without a json_path.")
+        return self
+
     @property
     def is_llm_adaptive(self) -> bool:
         """Check if this blueprint uses LLM-adaptive extraction."""
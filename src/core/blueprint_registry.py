@@ -0,0 +1,196 @@
+"""
+Process-wide registry of compiled blueprints and Python connectors.
+
+Parsing a blueprint means reading the JSON and validating it through Pydantic,
+and loading a Python connector means executing its module. Both used to happen
+on every connection and every ``/blueprints`` call. The registry does each once
+per file version instead:
+
+- entries are keyed by path and invalidated by ``(st_mtime_ns, st_size)``, so
+  editing a file on disk hot-reloads it on the next lookup (mtime polling —
+  one ``stat`` per lookup, no watcher thread);
+- a connection only looks at its own site's files, so its setup cost does not
+  grow with the number of installed connectors;
+- the directory listing used by ``/blueprints`` is refreshed when the
+  directory's own mtime changes (a file was added, removed or renamed).
+
+Blueprints handed out are shared between requests and must not be mutated;
+use ``model_copy`` for per-request changes.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Type, Union
+
+from src.config import get_settings
+from src.core.blueprint import BlueprintV2, load_blueprint
+from src.core.connector_base import BaseConnector
+from src.logging_config import get_logger
+
+logger = get_logger("blueprint_registry")
+
+_SITE_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_CONNECTOR_SUFFIX = "_connector"
+
+
+def _file_version(path: Path) -> tuple[int, int]:
+    """Cheap change detector for a file; raises FileNotFoundError if it is gone."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class _BlueprintEntry:
+    version: tuple[int, int]
+    blueprint: Optional[BlueprintV2] = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class _ConnectorEntry:
+    version: tuple[int, int]
+    connector: Optional[Type[BaseConnector]] = None
+
+
+class BlueprintRegistry:
+    """Compiled blueprints and connector classes for one connectors directory."""
+
+    def __init__(self, connectors_dir: Union[str, Path]) -> None:
+        self.connectors_dir = Path(connectors_dir).resolve()
+        self._blueprints: dict[Path, _BlueprintEntry] = {}
+        self._connectors: dict[str, _ConnectorEntry] = {}
+        self._listing: Optional[tuple[int, list[Path]]] = None
+
+    # ── Blueprints ────────────────────────────────────────────────────────────
+
+    def get(self, path: Union[str, Path]) -> BlueprintV2:
+        """Return the compiled blueprint at ``path``, re-parsing only if it changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError / pydantic.ValidationError: As ``load_blueprint``;
+                a broken file is not re-parsed until it changes again.
+        """
+        path = Path(path)
+        version = _file_version(path)
+        entry = self._blueprints.get(path)
+        if entry is None or entry.version != version:
+            try:
+                entry = _BlueprintEntry(version, blueprint=load_blueprint(path))
+            except Exception as e:
+                entry = _BlueprintEntry(version, error=e)
+            self._blueprints[path] = entry
+            logger.debug(
+                "Blueprint compiled",
+                extra={"extra_data": {"path": str(path), "valid": entry.error is None}},
+            )
+        if entry.error is not None:
+            raise entry.error.with_traceback(None)
+        return entry.blueprint
+
+    def blueprint_paths(self) -> list[Path]:
+        """Sorted ``*.json`` files in the connectors directory."""
+        try:
+            dir_version = self.connectors_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._listing = None
+            return []
+        if self._listing is None or self._listing[0] != dir_version:
+            paths = sorted(self.connectors_dir.glob("*.json"))
+            for stale in set(self._blueprints) - set(paths):
+                if stale.parent == self.connectors_dir:
+                    del self._blueprints[stale]
+            self._listing = (dir_version, paths)
+        return list(self._listing[1])
+
+    def blueprints(self) -> list[tuple[Path, Union[BlueprintV2, Exception]]]:
+        """Every blueprint in the directory, or the error that prevents loading it."""
+        results: list[tuple[Path, Union[BlueprintV2, Exception]]] = []
+        for path in self.blueprint_paths():
+            try:
+                results.append((path, self.get(path)))
+            except Exception as e:
+                results.append((path, e))
+        return results
+
+    # ── Python connectors ─────────────────────────────────────────────────────
+
+    def python_connector(self, site: str) -> Optional[Type[BaseConnector]]:
+        """The connector class in ``<site>_connector.py``, imported once per version."""
+        if not _SITE_RE.match(site):
+            return None
+        return self._connector(f"{site}{_CONNECTOR_SUFFIX}")
+
+    def python_connectors(self) -> Dict[str, Type[BaseConnector]]:
+        """Every connector class in the directory, keyed by module name."""
+        if not self.connectors_dir.is_dir():
+            logger.warning(
+                "Connectors directory not found",
+                extra={"extra_data": {"path": str(self.connectors_dir)}},
+            )
+            return {}
+        connectors: Dict[str, Type[BaseConnector]] = {}
+        for path in sorted(self.connectors_dir.glob(f"*{_CONNECTOR_SUFFIX}.py")):
+            connector = self._connector(path.stem)
+            if connector is not None:
+                connectors[path.stem] = connector
+        return connectors
+
+    def _connector(self, module_name: str) -> Optional[Type[BaseConnector]]:
+        path = self.connectors_dir / f"{module_name}.py"
+        try:
+            version = _file_version(path)
+        except FileNotFoundError:
+            self._connectors.pop(module_name, None)
+            return None
+        entry = self._connectors.get(module_name)
+        if entry is None or entry.version != version:
+            entry = _ConnectorEntry(version, connector=_import_connector(module_name, path))
+            self._connectors[module_name] = entry
+        return entry.connector
+
+    def clear(self) -> None:
+        self._blueprints.clear()
+        self._connectors.clear()
+        self._listing = None
+
+
+def _import_connector(module_name: str, path: Path) -> Optional[Type[BaseConnector]]:
+    connector: Optional[Type[BaseConnector]] = None
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            for attr in dir(module):
+                obj = getattr(module, attr)
+                if isinstance(obj, type) and issubclass(obj, BaseConnector) and obj is not BaseConnector:
+                    connector = obj
+            if connector is not None:
+                logger.debug("Loaded connector", extra={"extra_data": {"name": module_name}})
+    except Exception as e:
+        logger.error(
+            "Failed to load connector",
+            extra={"extra_data": {"file": path.name, "error": str(e)}},
+        )
+    return connector
+
+
+# ── Module-Level Singleton ────────────────────────────────────────────────────
+
+_registries: dict[Path, BlueprintRegistry] = {}
+
+
+def get_blueprint_registry(connectors_dir: Optional[Union[str, Path]] = None) -> BlueprintRegistry:
+    """Get or create the registry for ``connectors_dir`` (default: ``CONNECTORS_DIR``)."""
+    directory = Path(connectors_dir or get_settings().connectors_dir).resolve()
+    registry = _registries.get(directory)
+    if registry is None:
+        registry = _registries[directory] = BlueprintRegistry(directory)
+    return registry
@@ -3,21 +3,30 @@ Browser Pool Manager — manages a pool of Playwright browser contexts.
 
 Provides:
 - Async context manager for safe browser lifecycle
-- Configurable concurrency (max simultaneous contexts)
+- Configurable concurrency (max simultaneous contexts), admitted by priority
+  class with per-site caps and fair sharing between sites
 - Session isolation (each connection gets its own BrowserContext)
 - Resource blocking (images, fonts, analytics) for speed
+- Optional shared cache of public static assets, replayed into every context
 - Stealth mode (randomized viewport, user-agent)
 - Automatic cleanup of idle contexts
+- Optional reserve of pre-warmed contexts so acquire() is a queue pop
+- Optional sharding across several Chromium processes, each recycled after a
+  context count, an age limit, or an RSS ceiling
+- Optional memory-pressure admission: the effective context limit shrinks
+  when Chromium RSS or host available memory approach their budgets
 """
 
 from __future__ import annotations
 
 import asyncio
+import collections
 import os
 import random
 import shutil
 import tempfile
 import time
+import uuid
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -30,8 +39,13 @@ from playwright.async_api import (
 
 from src import metrics
 from src.config import get_settings
+from src.core import proc_stats
+from src.core.acquire_queue import AcquirePriority, AcquireQueue, current_priority
+from src.core.api_capture import ApiCapture
+from src.core.asset_cache import StaticAssetCache, has_credentials
 from src.core.circuit_breaker import CircuitBreaker
 from src.core.read_only_policy import ExecutionPhase, ReadOnlyExecutionPolicy
+from src.core.request_filter import RequestFilter, native_block_args
 from src.logging_config import get_logger
 
 logger = get_logger("browser_pool")
@@ -42,6 +56,26 @@ _browser_breaker = CircuitBreaker(
     failure_threshold=_bp_settings.browser_circuit_failure_threshold,
     reset_timeout=_bp_settings.browser_circuit_reset_seconds,
 )
+_shard_breakers: dict[int, CircuitBreaker] = {}
+
+# Per-context memory assumed until the pool has live contexts to measure.
+_DEFAULT_CONTEXT_RSS = 256 * 1024 * 1024
+
+
+def _shard_breaker(index: int) -> CircuitBreaker:
+    """Return the launch breaker for a shard slot; shard 0 uses ``_browser_breaker``."""
+    if index == 0:
+        return _browser_breaker
+    breaker = _shard_breakers.get(index)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            f"browser-{index}",
+            failure_threshold=_bp_settings.browser_circuit_failure_threshold,
+            reset_timeout=_bp_settings.browser_circuit_reset_seconds,
+        )
+        _shard_breakers[index] = breaker
+    return breaker
+
 
 # ── Stealth Profiles ─────────────────────────────────────────────────────────
 
@@ -61,21 +95,26 @@ VIEWPORTS = [
     {"width": 1280, "height": 720},
 ]
 
-# Resource types to block for performance
-BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
-BLOCKED_URL_PATTERNS = [
-    "google-analytics.com",
-    "googletagmanager.com",
-    "facebook.net",
-    "doubleclick.net",
-    "hotjar.com",
-    "mixpanel.com",
-    "segment.io",
-    "amplitude.com",
-]
+# ── Data Classes ──────────────────────────────────────────────────────────────
 
 
-# ── Data Classes ──────────────────────────────────────────────────────────────
+@dataclass
+class BrowserShard:
+    """One Chromium process hosting a share of the pool's contexts."""
+
+    index: int
+    browser: Browser
+    marker: str = ""
+    launched_at: float = field(default_factory=time.time)
+    contexts_created: int = 0
+    load: int = 0
+    pid: Optional[int] = None
+    recycle_reason: Optional[str] = None
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the browser process was launched."""
+        return time.time() - self.launched_at
 
 
 @dataclass
@@ -84,7 +123,11 @@ class PooledContext:
 
     context: BrowserContext
     session_id: str
+    shard: Optional[BrowserShard] = None
+    site: Optional[str] = None
     read_only_policy: Optional[ReadOnlyExecutionPolicy] = None
+    request_filter: Optional[RequestFilter] = None
+    api_capture: Optional[ApiCapture] = None
     download_dir: Optional[str] = None
     downloads: list[dict[str, Any]] = field(default_factory=list)
     created_at: float = field(default_factory=time.time)
@@ -130,16 +173,45 @@ class BrowserPool:
         self._headless: bool = settings.browser_headless
         self._idle_timeout: int = settings.browser_idle_timeout
         self._block_resources: bool = settings.browser_block_resources
+        self._native_blocking: bool = settings.browser_native_blocking and self._block_resources
         self._stealth: bool = settings.browser_stealth
         self._nav_timeout: int = settings.browser_navigation_timeout
         self._action_timeout: int = settings.browser_action_timeout
         self._allow_read_downloads: bool = settings.browser_allow_read_downloads
         self._download_root: str = settings.browser_download_root
+        self._reserve_size: int = max(0, settings.browser_prewarm_contexts)
+        self._asset_cache: Optional[StaticAssetCache] = (
+            StaticAssetCache(settings.browser_asset_cache_mb * 1024 * 1024)
+            if settings.browser_asset_cache_mb > 0
+            else None
+        )
+        # Reserve contexts get the route handler whenever a checkout could need
+        # it, so a pre-warmed context is interchangeable with a fresh one.
+        self._reserve_routed: bool = (
+            self._block_resources or settings.strict_read_only_mode or self._asset_cache is not None
+        )
+        self._shard_count: int = max(1, settings.browser_shards)
+        self._shard_max_contexts: int = max(0, settings.browser_shard_max_contexts)
+        self._recycle_after_contexts: int = max(0, settings.browser_recycle_after_contexts)
+        self._recycle_max_age: int = max(0, settings.browser_recycle_max_age_seconds)
+        self._recycle_max_rss: int = max(0, settings.browser_recycle_max_rss_mb) * 1024 * 1024
+        if self._shard_max_contexts:
+            self._max_size = min(self._max_size, self._shard_count * self._shard_max_contexts)
+        self._mem_min_available: int = max(0, settings.browser_memory_min_available_mb) * 1024 * 1024
+        self._mem_max_rss: int = max(0, settings.browser_memory_max_rss_mb) * 1024 * 1024
+        self._mem_floor: int = max(1, settings.browser_memory_min_contexts)
+        self._mem_check_interval: float = max(0.5, settings.browser_memory_check_seconds)
+        self._context_rss_estimate: float = _DEFAULT_CONTEXT_RSS
+        self._effective_limit: int = self._max_size
+        self._last_memory_sample: dict[str, Any] = {}
 
         self._playwright: Optional[Playwright] = None
-        self._browser: Optional[Browser] = None
+        self._shards: list[BrowserShard] = []
+        self._draining: list[BrowserShard] = []
         self._contexts: dict[str, PooledContext] = {}
-        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(self._max_size)
+        self._reserve: collections.deque[PooledContext] = collections.deque()
+        self._refill_event: asyncio.Event = asyncio.Event()
+        self._queue: AcquireQueue = AcquireQueue(self._max_size)
         self._lock: asyncio.Lock = asyncio.Lock()
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running: bool = False
@@ -156,29 +228,21 @@ class BrowserPool:
                     "max_size": self._max_size,
                     "headless": self._headless,
                     "stealth": self._stealth,
+                    "shards": self._shard_count,
                 }
             },
         )
 
         self._playwright = await async_playwright().start()
-
-        async def _launch() -> Browser:
-            return await self._playwright.chromium.launch(
-                headless=self._headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--no-first-run",
-                    "--no-default-browser-check",
-                ],
-            )
-
-        # Fail fast if browser launches keep failing (e.g. resource exhaustion).
-        self._browser = await _browser_breaker.call(_launch)
+        for index in range(self._shard_count):
+            self._shards.append(await self._launch_shard(index))
         self._running = True
+        self._set_effective_limit(self._max_size)
 
-        # Start background cleanup of idle contexts
+        # Start background cleanup of idle contexts (and reserve refills)
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        if self._reserve_size:
+            self._refill_event.set()
         logger.info("Browser pool started")
 
     async def stop(self) -> None:
@@ -198,17 +262,22 @@ class BrowserPool:
 
         # Close all contexts
         async with self._lock:
-            for pooled in list(self._contexts.values()):
+            for pooled in [*self._contexts.values(), *self._reserve]:
                 try:
                     await pooled.context.close()
                 except Exception:
                     pass
             self._contexts.clear()
+            self._reserve.clear()
 
-        # Close browser and playwright
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
+        # Close browsers and playwright
+        for shard in [*self._shards, *self._draining]:
+            try:
+                await shard.browser.close()
+            except Exception:
+                pass
+        self._shards.clear()
+        self._draining.clear()
 
         if self._playwright:
             await self._playwright.stop()
@@ -228,20 +297,35 @@ class BrowserPool:
         session_id: str,
         proxy: Optional[dict] = None,
         read_only_policy: Optional[ReadOnlyExecutionPolicy] = None,
+        site: Optional[str] = None,
+        site_limit: int = 0,
+        priority: Optional[AcquirePriority] = None,
+        request_filter: Optional[RequestFilter] = None,
+        api_capture: Optional[ApiCapture] = None,
     ) -> PooledContext:
         """
         Acquire a browser context for the given session.
 
-        Blocks if the pool is at max capacity.
+        Blocks if the pool is at max capacity or ``site`` is at its cap. Waiters
+        are admitted by priority class, then fairly across sites.
 
         Args:
             session_id: Unique session identifier.
             proxy: Optional proxy config {"server": "http://...", "username": "...", "password": "..."}.
+            site: Site the context is for; used for per-site caps and fairness.
+            site_limit: Max concurrent contexts for ``site`` (0 = no cap).
+            priority: Admission class; defaults to the caller's ``acquire_priority``.
+            request_filter: Blueprint-specific blocking rules; defaults to
+                ``RequestFilter.default()``.
+            api_capture: Records the blueprint's api endpoints from the
+                context's XHR / fetch traffic.
 
         Returns:
             PooledContext with an isolated BrowserContext.
         """
-        await self._semaphore.acquire()
+        priority = current_priority() if priority is None else priority
+        waited = await self._acquire_slot(site=site, priority=priority, site_limit=site_limit)
+        metrics.observe_browser_pool_queue_wait(priority.label, waited)
 
         async with self._lock:
             # Return existing context if session already has one
@@ -249,32 +333,50 @@ class BrowserPool:
                 self._contexts[session_id].touch()
                 if read_only_policy is not None:
                     self._contexts[session_id].read_only_policy = read_only_policy
-                self._semaphore.release()  # Didn't actually use a new slot
+                if request_filter is not None:
+                    self._contexts[session_id].request_filter = request_filter
+                if api_capture is not None:
+                    self._contexts[session_id].api_capture = api_capture
+                self._release_slot(site)  # Didn't actually use a new slot
                 return self._contexts[session_id]
 
-            if not self._browser:
-                self._semaphore.release()
+            if not self._shards:
+                self._release_slot(site)
                 raise RuntimeError("Browser pool is not started. Call start() first.")
 
-            # Build context options
-            context_options = self._build_context_options(proxy)
-
-            context = await self._browser.new_context(**context_options)
-            context.set_default_navigation_timeout(self._nav_timeout)
-            context.set_default_timeout(self._action_timeout)
-
-            pooled = PooledContext(
-                context=context,
-                session_id=session_id,
-                read_only_policy=read_only_policy,
-                download_dir=self._ensure_download_dir(session_id),
+            routed = (
+                self._block_resources
+                or read_only_policy is not None
+                or request_filter is not None
+                or self._asset_cache is not None
+                or api_capture is not None
             )
+            pooled = self._take_reserved(proxy, routed)
+            if pooled is not None:
+                pooled.session_id = session_id
+                pooled.read_only_policy = read_only_policy
+                pooled.download_dir = self._ensure_download_dir(session_id)
+                pooled.touch()
+                metrics.record_browser_pool_reserve("hit")
+                self._refill_event.set()
+            else:
+                if self._reserve_size:
+                    metrics.record_browser_pool_reserve("miss")
+                try:
+                    pooled = await self._new_pooled_context(
+                        session_id,
+                        proxy=proxy,
+                        read_only_policy=read_only_policy,
+                        routed=routed,
+                    )
+                except Exception:
+                    self._release_slot(site)
+                    raise
+                pooled.download_dir = self._ensure_download_dir(session_id)
 
-            # Set up route-based request filtering.
-            if self._block_resources or read_only_policy is not None:
-                await self._setup_resource_blocking(context, pooled)
-            await self._setup_page_guards(context, pooled)
-
+            pooled.site = site
+            pooled.request_filter = request_filter
+            pooled.api_capture = api_capture
             self._contexts[session_id] = pooled
 
             logger.debug(
@@ -304,14 +406,30 @@ class BrowserPool:
                     )
                 if pooled.download_dir:
                     shutil.rmtree(pooled.download_dir, ignore_errors=True)
+                await self._detach_from_shard(pooled)
 
-        self._semaphore.release()
+        if pooled:
+            self._release_slot(pooled.site)
         logger.debug(
             "Context released",
             extra={"extra_data": {"session_id": session_id, "pool_size": len(self._contexts)}},
         )
         metrics.set_browser_pool_active(len(self._contexts))
 
+    async def _acquire_slot(
+        self,
+        *,
+        site: Optional[str],
+        priority: AcquirePriority,
+        site_limit: int,
+    ) -> float:
+        """Wait for capacity for one more context; returns seconds spent queued."""
+        return await self._queue.acquire(site=site, priority=priority, site_limit=site_limit)
+
+    def _release_slot(self, site: Optional[str] = None) -> None:
+        """Return one unit of capacity taken by ``_acquire_slot``."""
+        self._queue.release(site)
+
     @property
     def active_count(self) -> int:
         """Number of active browser contexts."""
@@ -320,7 +438,300 @@ class BrowserPool:
     @property
     def available_slots(self) -> int:
         """Number of available slots in the pool."""
-        return self._max_size - len(self._contexts)
+        return max(0, self._effective_limit - len(self._contexts))
+
+    @property
+    def effective_limit(self) -> int:
+        """Context limit currently admitted, after memory-pressure throttling."""
+        return self._effective_limit
+
+    @property
+    def throttled(self) -> bool:
+        """True while memory pressure holds the limit below the configured size."""
+        return self._effective_limit < self._max_size
+
+    def admission_status(self) -> dict[str, Any]:
+        """Snapshot of the pool's admission state for health reporting."""
+        return {
+            "active": len(self._contexts),
+            "queued": self._queue.waiting,
+            "max_size": self._max_size,
+            "effective_limit": self._effective_limit,
+            "throttled": self.throttled,
+            **self._last_memory_sample,
+        }
+
+    @property
+    def queued_count(self) -> int:
+        """Number of callers waiting for a context slot."""
+        return self._queue.waiting
+
+    @property
+    def reserve_count(self) -> int:
+        """Number of pre-warmed, unassigned contexts waiting in the reserve."""
+        return len(self._reserve)
+
+    async def _new_pooled_context(
+        self,
+        session_id: str,
+        proxy: Optional[dict] = None,
+        read_only_policy: Optional[ReadOnlyExecutionPolicy] = None,
+        routed: bool = True,
+    ) -> PooledContext:
+        """Create a context with timeouts, request filtering and page guards installed."""
+        shard = self._pick_shard()
+        # Count the context against the shard before awaiting so concurrent
+        # creations spread across shards instead of piling onto one.
+        shard.load += 1
+        try:
+            context = await shard.browser.new_context(**self._build_context_options(proxy))
+        except Exception:
+            shard.load -= 1
+            raise
+        shard.contexts_created += 1
+        if self._recycle_after_contexts and shard.contexts_created >= self._recycle_after_contexts:
+            self._mark_for_recycle(shard, "contexts")
+
+        pooled = PooledContext(
+            context=context,
+            session_id=session_id,
+            shard=shard,
+            read_only_policy=read_only_policy,
+        )
+        try:
+            context.set_default_navigation_timeout(self._nav_timeout)
+            context.set_default_timeout(self._action_timeout)
+            # Set up route-based request filtering.
+            if routed:
+                await self._setup_resource_blocking(context, pooled)
+            await self._setup_page_guards(context, pooled)
+        except BaseException:
+            # Nobody holds the context yet: close it and give back its shard slot.
+            try:
+                await context.close()
+            except Exception:
+                pass
+            await self._detach_from_shard(pooled)
+            raise
+        return pooled
+
+    def _take_reserved(self, proxy: Optional[dict], routed: bool) -> Optional[PooledContext]:
+        """Pop a pre-warmed context if one matches the requested setup.
+
+        Proxied contexts and contexts whose routing differs from the reserve's
+        are always built fresh.
+        """
+        if proxy is not None or routed != self._reserve_routed:
+            return None
+        if not self._reserve:
+            return None
+        return self._reserve.popleft()
+
+    async def _refill_reserve(self) -> None:
+        """Top the reserve back up to its configured size (paused while throttled)."""
+        while self._running and self._shards and not self.throttled and len(self._reserve) < self._reserve_size:
+            started = time.monotonic()
+            try:
+                pooled = await self._new_pooled_context(
+                    "reserve",
+                    routed=self._reserve_routed,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to pre-warm browser context",
+                    extra={"extra_data": {"error": str(e)}},
+                )
+                return
+            metrics.observe_browser_pool_reserve_refill(time.monotonic() - started)
+            async with self._lock:
+                self._reserve.append(pooled)
+
+    # ── Memory admission ──────────────────────────────────────────────────────
+
+    async def _chromium_rss(self) -> int:
+        total = 0
+        for shard in [*self._shards, *self._draining]:
+            if shard.pid is None and shard.marker:
+                shard.pid = await asyncio.to_thread(proc_stats.find_pid_by_cmdline, shard.marker)
+            if shard.pid is not None:
+                total += await asyncio.to_thread(proc_stats.process_tree_rss_bytes, shard.pid)
+        return total
+
+    async def _adjust_admission(self) -> None:
+        """Resize the effective limit from Chromium RSS and host available memory.
+
+        Each live context is assumed to cost the current average RSS per
+        context; the limit is the number of contexts that fit in the remaining
+        headroom. It drops at once under pressure and climbs back one slot per
+        sample once pressure eases.
+        """
+        if not (self._mem_max_rss or self._mem_min_available):
+            return
+
+        rss = await self._chromium_rss()
+        available = await asyncio.to_thread(proc_stats.system_available_memory_bytes)
+        live = len(self._contexts) + len(self._reserve)
+        if live and rss:
+            self._context_rss_estimate = max(rss / live, 1.0)
+
+        target = self._max_size
+        if self._mem_max_rss and rss:
+            target = min(target, live + int((self._mem_max_rss - rss) // self._context_rss_estimate))
+        if self._mem_min_available and available is not None:
+            target = min(target, live + int((available - self._mem_min_available) // self._context_rss_estimate))
+        target = max(self._mem_floor, min(self._max_size, target))
+
+        if target > self._effective_limit:
+            target = self._effective_limit + 1
+        self._last_memory_sample = {
+            "chromium_rss_bytes": rss,
+            "available_memory_bytes": available,
+        }
+        if target != self._effective_limit:
+            self._set_effective_limit(target)
+
+    def _set_effective_limit(self, limit: int) -> None:
+        was_throttled = self.throttled
+        self._effective_limit = limit
+        self._queue.set_capacity(limit)
+        metrics.set_browser_pool_effective_limit(limit)
+        if self.throttled != was_throttled:
+            logger.warning(
+                "Browser pool throttled by memory pressure" if self.throttled else "Browser pool throttle lifted",
+                extra={
+                    "extra_data": {
+                        "effective_limit": limit,
+                        "max_size": self._max_size,
+                        **self._last_memory_sample,
+                    }
+                },
+            )
+
+    # ── Shards ────────────────────────────────────────────────────────────────
+
+    async def _launch_shard(self, index: int) -> BrowserShard:
+        """Launch one Chromium process for shard slot ``index``."""
+        # An inert switch that tags the process so its RSS can be found in /proc.
+        marker = f"--plaidify-shard={index}-{uuid.uuid4().hex[:12]}"
+
+        async def _launch() -> Browser:
+            return await self._playwright.chromium.launch(
+                headless=self._headless,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-dev-shm-usage",
+                    "--no-first-run",
+                    "--no-default-browser-check",
+                    *(native_block_args() if self._native_blocking else ()),
+                    marker,
+                ],
+            )
+
+        # Fail fast if browser launches keep failing (e.g. resource exhaustion).
+        browser = await _shard_breaker(index).call(_launch)
+        shard = BrowserShard(index=index, browser=browser, marker=marker)
+        browser.on("disconnected", lambda _browser: self._mark_for_recycle(shard, "disconnected"))
+        return shard
+
+    def _pick_shard(self) -> BrowserShard:
+        """Choose the least-loaded shard, preferring ones under their cap and not awaiting recycling."""
+        candidates = self._shards
+        if self._shard_max_contexts:
+            candidates = [s for s in candidates if s.load < self._shard_max_contexts] or candidates
+        candidates = [s for s in candidates if s.recycle_reason is None] or candidates
+        return min(candidates, key=lambda s: s.load)
+
+    def _mark_for_recycle(self, shard: BrowserShard, reason: str) -> None:
+        if shard.recycle_reason is not None or shard not in self._shards:
+            return
+        shard.recycle_reason = reason
+        logger.info(
+            "Browser shard scheduled for recycling",
+            extra={"extra_data": {"shard": shard.index, "reason": reason}},
+        )
+        self._refill_event.set()
+
+    async def _recycle_reason(self, shard: BrowserShard) -> Optional[str]:
+        if shard.recycle_reason is not None:
+            return shard.recycle_reason
+        if self._recycle_max_age and shard.age_seconds >= self._recycle_max_age:
+            return "age"
+        if self._recycle_max_rss:
+            if shard.pid is None:
+                shard.pid = await asyncio.to_thread(proc_stats.find_pid_by_cmdline, shard.marker)
+            if shard.pid is not None:
+                rss = await asyncio.to_thread(proc_stats.process_tree_rss_bytes, shard.pid)
+                if rss >= self._recycle_max_rss:
+                    return "rss"
+        return None
+
+    async def _recycle_shards(self) -> None:
+        """Replace shards that hit a recycle limit; the old browser drains in-flight contexts."""
+        for shard in list(self._shards):
+            reason = await self._recycle_reason(shard)
+            if reason is None:
+                continue
+
+            try:
+                replacement = await self._launch_shard(shard.index)
+            except Exception as e:
+                logger.warning(
+                    "Failed to launch replacement browser",
+                    extra={"extra_data": {"shard": shard.index, "reason": reason, "error": str(e)}},
+                )
+                shard.recycle_reason = reason
+                continue
+
+            async with self._lock:
+                self._shards[self._shards.index(shard)] = replacement
+                self._draining.append(shard)
+                stale = [pooled for pooled in self._reserve if pooled.shard is shard]
+                for pooled in stale:
+                    self._reserve.remove(pooled)
+
+            logger.info(
+                "Recycling browser shard",
+                extra={
+                    "extra_data": {
+                        "shard": shard.index,
+                        "reason": reason,
+                        "contexts_created": shard.contexts_created,
+                        "in_flight": shard.load - len(stale),
+                    }
+                },
+            )
+            metrics.record_browser_recycle(reason)
+
+            for pooled in stale:
+                try:
+                    await pooled.context.close()
+                except Exception:
+                    pass
+                await self._detach_from_shard(pooled)
+            if shard.load <= 0:
+                await self._close_shard(shard)
+
+    async def _detach_from_shard(self, pooled: PooledContext) -> None:
+        """Drop a closed context from its shard's load; close a drained shard."""
+        shard = pooled.shard
+        if shard is None:
+            return
+        pooled.shard = None
+        shard.load = max(0, shard.load - 1)
+        if shard.load == 0 and shard in self._draining:
+            await self._close_shard(shard)
+
+    async def _close_shard(self, shard: BrowserShard) -> None:
+        if shard not in self._draining:
+            return
+        self._draining.remove(shard)
+        try:
+            await shard.browser.close()
+        except Exception as e:
+            logger.warning(
+                "Error closing recycled browser",
+                extra={"extra_data": {"shard": shard.index, "error": str(e)}},
+            )
 
     def _build_context_options(self, proxy: Optional[dict] = None) -> dict:
         """Build Playwright BrowserContext options with optional stealth."""
@@ -375,16 +786,40 @@ class BrowserPool:
                     await route.abort()
                     return
 
-            if request.resource_type in BLOCKED_RESOURCE_TYPES:
-                await route.abort()
-                return
-
-            url = request.url.lower()
-            for pattern in BLOCKED_URL_PATTERNS:
-                if pattern in url:
+            # Contexts routed only for the asset cache or api capture keep their
+            # resources; a blueprint's own request_rules always apply.
+            if self._block_resources or policy is not None or pooled.request_filter is not None:
+                request_filter = pooled.request_filter or RequestFilter.default()
+                if request_filter.should_block(request.url, request.resource_type):
                     await route.abort()
                     return
 
+            capture = pooled.api_capture
+            if capture is not None and capture.wants(request):
+                try:
+                    await capture.handle(route, request)
+                    return
+                except Exception as e:
+                    logger.debug(
+                        "Api capture bypassed",
+                        extra={"extra_data": {"url": request.url, "error": str(e)}},
+                    )
+
+            cache = self._asset_cache
+            if cache is not None and cache.is_candidate(request):
+                request_headers = await request.all_headers()
+                # route.fetch() sends the context's cookie jar, which the request
+                # headers seen here may not show.
+                if not has_credentials(request_headers) and not await context.cookies(request.url):
+                    try:
+                        await cache.handle(route, request, request_headers)
+                        return
+                    except Exception as e:
+                        logger.debug(
+                            "Asset cache bypassed",
+                            extra={"extra_data": {"url": request.url, "error": str(e)}},
+                        )
+
             await route.continue_()
 
         await context.route("**/*", block_resources)
@@ -401,6 +836,7 @@ class BrowserPool:
                 and pooled.read_only_policy.enabled
                 and pooled.read_only_policy.phase == ExecutionPhase.READ
                 and len(context.pages) > 1
+                and not pooled.read_only_policy.claim_tab()
             ):
                 asyncio.create_task(self._close_extra_page(page, pooled))
 
@@ -480,11 +916,24 @@ class BrowserPool:
         return candidate
 
     async def _cleanup_loop(self) -> None:
-        """Background task that closes idle contexts."""
+        """Background task that closes idle contexts, recycles shards and refills the reserve.
+
+        Wakes every 30 seconds (or every ``browser_memory_check_seconds`` when
+        memory admission is on), or immediately when a reserve checkout asks
+        for a refill.
+        """
+        interval = self._mem_check_interval if (self._mem_max_rss or self._mem_min_available) else 30
         while self._running:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                try:
+                    await asyncio.wait_for(self._refill_event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._refill_event.clear()
+                await self._adjust_admission()
                 await self._cleanup_idle()
+                await self._recycle_shards()
+                await self._refill_reserve()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -496,11 +945,23 @@ class BrowserPool:
     async def _cleanup_idle(self) -> None:
         """Close contexts that have been idle longer than the timeout."""
         to_remove: list[str] = []
+        stale: list[PooledContext] = []
 
         async with self._lock:
             for session_id, pooled in self._contexts.items():
                 if pooled.idle_seconds > self._idle_timeout:
                     to_remove.append(session_id)
+            # Reserve contexts are recycled on the same schedule so a warm
+            # context never outlives the idle timeout.
+            while self._reserve and self._reserve[0].idle_seconds > self._idle_timeout:
+                stale.append(self._reserve.popleft())
+
+        for pooled in stale:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+            await self._detach_from_shard(pooled)
 
         for session_id in to_remove:
             logger.info(
@@ -519,11 +980,19 @@ async def get_browser_pool() -> BrowserPool:
     """
     Get the global browser pool instance.
 
-    Creates and starts the pool on first call (lazy initialization).
+    Creates and starts the pool on first call (lazy initialization). When
+    ``BROWSER_SERVICE_URL`` is set the pool attaches to the shared browser
+    service instead of launching its own Chromium.
     """
     global _pool
     if _pool is None or not _pool._running:
-        _pool = BrowserPool()
+        service_url = get_settings().browser_service_url
+        if service_url:
+            from src.core.browser_service import RemoteBrowserPool
+
+            _pool = RemoteBrowserPool(service_url)
+        else:
+            _pool = BrowserPool()
         await _pool.start()
     return _pool
 
@@ -0,0 +1,484 @@
+"""
+Shared browser service — one browser and one capacity limit per host.
+
+Each gunicorn worker normally builds its own ``BrowserPool`` and launches its
+own Chromium. Running this module as a separate process instead gives the host
+a single Chromium and a single, global context limit:
+
+    python -m src.core.browser_service
+
+The service launches Chromium with a loopback-only CDP endpoint and hands out
+context leases over a small newline-delimited JSON protocol. Workers configured
+with ``BROWSER_SERVICE_URL`` get a ``RemoteBrowserPool`` from
+``get_browser_pool()``: it attaches to the shared Chromium with
+``connect_over_cdp`` and takes a lease before creating each context, so request
+filtering, page guards and downloads still run in the worker that owns the
+session. Leases held by a worker are returned automatically if its connection
+drops.
+
+Protocol (one JSON object per line; replies echo the request ``id``):
+    {"id": 1, "op": "hello"}    -> {"id": 1, "ok": true, "cdp_endpoint": "...", "max_contexts": 20}
+    {"id": 2, "op": "acquire", "priority": "interactive", "site": "bank", "site_limit": 2}
+                                -> {"id": 2, "ok": true, "lease": "..."}   (waits for capacity)
+    {"op": "release", "lease": "..."}                                      (no reply without an id)
+    {"id": 3, "op": "stats"}    -> {"id": 3, "ok": true, "leased": 4, "waiting": 0, "max_contexts": 20}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from src.config import get_settings
+from src.core.acquire_queue import AcquirePriority, AcquireQueue
+from src.core.browser_pool import BrowserPool, BrowserShard, _shard_breaker
+from src.core.request_filter import native_block_args
+from src.logging_config import get_logger, setup_logging
+
+logger = get_logger("browser_service")
+
+DEFAULT_SERVICE_URL = "tcp://127.0.0.1:9330"
+
+
+class BrowserServiceError(Exception):
+    """Raised when the browser service rejects a request or is unreachable."""
+
+
+def parse_service_url(url: str) -> tuple[str, int]:
+    """Split ``tcp://host:port`` into its host and port."""
+    parsed = urlparse(url if "://" in url else f"tcp://{url}")
+    if parsed.scheme != "tcp" or not parsed.hostname or not parsed.port:
+        raise ValueError(f"Invalid browser service URL: {url!r}. Expected tcp://host:port.")
+    return parsed.hostname, parsed.port
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+# ── Service ───────────────────────────────────────────────────────────────────
+
+
+class BrowserService:
+    """Owns the host's Chromium process and its global context limit."""
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        cdp_port: int,
+        max_contexts: int,
+        headless: bool = True,
+        native_blocking: bool = False,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.cdp_port = cdp_port
+        self.max_contexts = max(1, max_contexts)
+        self.headless = headless
+        self.native_blocking = native_blocking
+        self.cdp_endpoint = f"http://127.0.0.1:{cdp_port}"
+
+        self._slots = AcquireQueue(self.max_contexts)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._running = False
+
+    @classmethod
+    def from_settings(cls) -> BrowserService:
+        settings = get_settings()
+        host, port = parse_service_url(settings.browser_service_url or DEFAULT_SERVICE_URL)
+        return cls(
+            host=host,
+            port=port,
+            cdp_port=settings.browser_service_cdp_port,
+            max_contexts=settings.browser_pool_size,
+            headless=settings.browser_headless,
+            native_blocking=settings.browser_native_blocking and settings.browser_block_resources,
+        )
+
+    async def start(self) -> None:
+        """Launch Chromium, then start accepting worker connections."""
+        self._running = True
+        self._playwright = await async_playwright().start()
+        await self._launch_browser()
+        await self._start_server()
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("Browser service is not started. Call start() first.")
+        await self._server.serve_forever()
+
+    async def _launch_browser(self) -> None:
+        async def _launch() -> Browser:
+            return await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-dev-shm-usage",
+                    "--no-first-run",
+                    "--no-default-browser-check",
+                    *(native_block_args() if self.native_blocking else ()),
+                    "--remote-debugging-address=127.0.0.1",
+                    f"--remote-debugging-port={self.cdp_port}",
+                ],
+            )
+
+        self._browser = await _shard_breaker(0).call(_launch)
+        self._browser.on("disconnected", lambda _browser: self._on_browser_disconnected())
+        logger.info(
+            "Shared browser launched",
+            extra={"extra_data": {"cdp_endpoint": self.cdp_endpoint}},
+        )
+
+    def _on_browser_disconnected(self) -> None:
+        if not self._running:
+            return
+        logger.warning("Shared browser disconnected; relaunching")
+        asyncio.create_task(self._relaunch_browser())
+
+    async def _relaunch_browser(self) -> None:
+        try:
+            await self._launch_browser()
+        except Exception as e:
+            logger.error(
+                "Failed to relaunch shared browser",
+                extra={"extra_data": {"error": str(e)}},
+            )
+
+    async def _start_server(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        sockets = self._server.sockets or []
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        logger.info(
+            "Browser service listening",
+            extra={"extra_data": {"host": self.host, "port": self.port, "max_contexts": self.max_contexts}},
+        )
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        owned: dict[str, Optional[str]] = {}
+        tasks: set[asyncio.Task] = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                task = asyncio.create_task(self._dispatch(message, writer, owned))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for task in list(tasks):
+                task.cancel()
+            # A worker that goes away must not strand its share of the capacity.
+            for lease in list(owned):
+                self._return_lease(lease, owned)
+            writer.close()
+
+    async def _dispatch(
+        self, message: dict[str, Any], writer: asyncio.StreamWriter, owned: dict[str, Optional[str]]
+    ) -> None:
+        op = message.get("op")
+        try:
+            if op == "hello":
+                reply: dict[str, Any] = {"cdp_endpoint": self.cdp_endpoint, "max_contexts": self.max_contexts}
+            elif op == "acquire":
+                lease = await self._take_lease(
+                    owned,
+                    site=message.get("site"),
+                    priority=AcquirePriority.parse(message.get("priority")),
+                    site_limit=int(message.get("site_limit") or 0),
+                )
+                reply = {"lease": lease}
+            elif op == "release":
+                self._return_lease(str(message.get("lease")), owned)
+                reply = {}
+            elif op == "stats":
+                reply = self.stats()
+            else:
+                raise BrowserServiceError(f"unknown op {op!r}")
+            reply["ok"] = True
+        except BrowserServiceError as e:
+            reply = {"ok": False, "error": str(e)}
+
+        if "id" not in message:
+            return
+        reply["id"] = message["id"]
+        try:
+            writer.write(_encode(reply))
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _take_lease(
+        self,
+        owned: dict[str, Optional[str]],
+        *,
+        site: Optional[str] = None,
+        priority: AcquirePriority = AcquirePriority.FETCH_DATA,
+        site_limit: int = 0,
+    ) -> str:
+        await self._slots.acquire(site=site, priority=priority, site_limit=site_limit)
+        lease = uuid.uuid4().hex
+        owned[lease] = site
+        return lease
+
+    def _return_lease(self, lease: str, owned: dict[str, Optional[str]]) -> None:
+        if lease not in owned:
+            return
+        self._slots.release(owned.pop(lease))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "leased": self._slots.in_use,
+            "waiting": self._slots.waiting,
+            "waiting_by_priority": self._slots.waiting_by_priority(),
+            "max_contexts": self.max_contexts,
+        }
+
+
+# ── Client ────────────────────────────────────────────────────────────────────
+
+
+class BrowserServiceClient:
+    """A single multiplexed connection from a worker to the browser service."""
+
+    def __init__(self, url: str) -> None:
+        self.host, self.port = parse_service_url(url)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._reader_task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        except OSError as e:
+            raise BrowserServiceError(f"browser service unreachable at {self.host}:{self.port}: {e}") from e
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._fail_pending(BrowserServiceError("browser service connection closed"))
+
+    async def request(self, op: str, **fields: Any) -> dict[str, Any]:
+        """Send a request and wait for its reply."""
+        if not self.connected:
+            raise BrowserServiceError("browser service connection is closed")
+        request_id = next(self._ids)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(_encode({"id": request_id, "op": op, **fields}))
+        try:
+            reply = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if not reply.get("ok"):
+            raise BrowserServiceError(reply.get("error") or f"{op} failed")
+        return reply
+
+    def send(self, op: str, **fields: Any) -> None:
+        """Fire-and-forget a request that needs no reply."""
+        if self.connected:
+            self._writer.write(_encode({"op": op, **fields}))
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            self._fail_pending(BrowserServiceError("browser service connection lost"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+# ── Worker-side Pool ──────────────────────────────────────────────────────────
+
+
+class RemoteBrowserPool(BrowserPool):
+    """A ``BrowserPool`` whose browser and capacity live in the browser service.
+
+    Contexts are still created, filtered and guarded in this process; only the
+    Chromium process and the context limit are shared. Recycling by age, RSS
+    or context count is the service's job, so it is disabled here, as is
+    memory admission: this process cannot see the shared browser's load.
+    There is no pre-warmed reserve either — every context holds a lease.
+    """
+
+    def __init__(self, service_url: str) -> None:
+        super().__init__()
+        self._service_url = service_url
+        self._client: Optional[BrowserServiceClient] = None
+        # Leases are per site because the service tracks per-site caps by lease.
+        self._leases: dict[Optional[str], list[str]] = {}
+        self._client_lock = asyncio.Lock()
+        self._shard_count = 1
+        self._shard_max_contexts = 0
+        self._recycle_after_contexts = 0
+        self._recycle_max_age = 0
+        self._recycle_max_rss = 0
+        self._mem_max_rss = 0
+        self._mem_min_available = 0
+        # Pre-warmed contexts would sit outside the service's global lease count.
+        self._reserve_size = 0
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        await self._ensure_client()
+        await super().start()
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        self._leases.clear()
+
+    async def _ensure_client(self) -> BrowserServiceClient:
+        async with self._client_lock:
+            if self._client is None or not self._client.connected:
+                if self._client is not None:
+                    await self._client.close()
+                # The service returned every lease of the old connection when it dropped.
+                self._leases.clear()
+                client = BrowserServiceClient(self._service_url)
+                await client.connect()
+                self._client = client
+            return self._client
+
+    async def _launch_shard(self, index: int) -> BrowserShard:
+        client = await self._ensure_client()
+        hello = await client.request("hello")
+        self._max_size = int(hello["max_contexts"])
+        browser = await _shard_breaker(index).call(self._playwright.chromium.connect_over_cdp, hello["cdp_endpoint"])
+        shard = BrowserShard(index=index, browser=browser, marker=hello["cdp_endpoint"])
+        browser.on("disconnected", lambda _browser: self._mark_for_recycle(shard, "disconnected"))
+        logger.info(
+            "Attached to shared browser service",
+            extra={"extra_data": {"service": self._service_url, "cdp_endpoint": hello["cdp_endpoint"]}},
+        )
+        return shard
+
+    async def _acquire_slot(
+        self,
+        *,
+        site: Optional[str],
+        priority: AcquirePriority,
+        site_limit: int,
+    ) -> float:
+        client = await self._ensure_client()
+        started = time.monotonic()
+        request = asyncio.ensure_future(
+            client.request("acquire", site=site, priority=priority.label, site_limit=site_limit)
+        )
+        try:
+            reply = await asyncio.shield(request)
+        except asyncio.CancelledError:
+            # The service still grants the queued request; hand that lease straight back.
+            request.add_done_callback(lambda done: _release_abandoned(client, done))
+            raise
+        self._leases.setdefault(site, []).append(reply["lease"])
+        return time.monotonic() - started
+
+    def _release_slot(self, site: Optional[str] = None) -> None:
+        leases = self._leases.get(site)
+        if not leases:
+            return
+        lease = leases.pop()
+        if self._client is not None:
+            self._client.send("release", lease=lease)
+
+
+def _release_abandoned(client: BrowserServiceClient, request: asyncio.Future) -> None:
+    """Return a lease granted to an acquire whose caller was cancelled."""
+    if request.cancelled() or request.exception() is not None:
+        return  # never granted, or the connection (and its leases) is gone
+    client.send("release", lease=request.result()["lease"])
+
+
+# ── Entry Point ───────────────────────────────────────────────────────────────
+
+
+async def _main() -> None:
+    settings = get_settings()
+    setup_logging(level=settings.log_level, log_format=settings.log_format)
+    service = BrowserService.from_settings()
+    await service.start()
+    try:
+        await service.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main() -> None:
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        logger.info("Browser service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -41,15 +41,31 @@ class CircuitBreaker:
     After ``failure_threshold`` consecutive failures the breaker opens and
     rejects calls for ``reset_timeout`` seconds. It then allows a single trial
     call (half-open); a success closes it, a failure re-opens it.
+
+    ``is_failure`` decides which exceptions count against the breaker; any
+    other exception is re-raised but recorded as a success (the dependency
+    answered). With ``single_trial`` only one call is let through while
+    half-open and concurrent callers are rejected until it settles.
     """
 
-    def __init__(self, name: str, *, failure_threshold: int = 5, reset_timeout: float = 30.0):
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        is_failure: Optional[Callable[[BaseException], bool]] = None,
+        single_trial: bool = False,
+    ):
         self.name = name
         self.failure_threshold = max(1, failure_threshold)
         self.reset_timeout = max(0.0, reset_timeout)
+        self._is_failure = is_failure
+        self._single_trial = single_trial
         self._state = CircuitState.CLOSED
         self._failures = 0
         self._opened_at = 0.0
+        self._trial_in_flight = False
         self._lock = asyncio.Lock()
 
     @property
@@ -61,6 +77,18 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failures = 0
         self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def status(self) -> dict:
+        """Snapshot of the breaker for health reporting."""
+        retry_after = 0.0
+        if self._state is CircuitState.OPEN:
+            retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        return {
+            "state": self._state.value,
+            "consecutive_failures": self._failures,
+            "retry_after_seconds": round(retry_after, 1),
+        }
 
     async def _before_call(self) -> None:
         async with self._lock:
@@ -68,9 +96,14 @@ class CircuitBreaker:
                 elapsed = time.monotonic() - self._opened_at
                 if elapsed >= self.reset_timeout:
                     self._state = CircuitState.HALF_OPEN
+                    self._trial_in_flight = self._single_trial
                     logger.info("Circuit '%s' entering half-open trial", self.name)
                 else:
                     raise CircuitBreakerOpenError(self.name, self.reset_timeout - elapsed)
+            elif self._state is CircuitState.HALF_OPEN and self._single_trial:
+                if self._trial_in_flight:
+                    raise CircuitBreakerOpenError(self.name, self.reset_timeout)
+                self._trial_in_flight = True
 
     async def _on_success(self) -> None:
         async with self._lock:
@@ -78,9 +111,11 @@ class CircuitBreaker:
                 logger.info("Circuit '%s' closed (recovered)", self.name)
             self._failures = 0
             self._state = CircuitState.CLOSED
+            self._trial_in_flight = False
 
     async def _on_failure(self) -> None:
         async with self._lock:
+            self._trial_in_flight = False
             self._failures += 1
             if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
                 self._state = CircuitState.OPEN
@@ -92,8 +127,15 @@ class CircuitBreaker:
         await self._before_call()
         try:
             result = await fn(*args, **kwargs)
-        except Exception:
-            await self._on_failure()
+        except Exception as exc:
+            if self._is_failure is None or self._is_failure(exc):
+                await self._on_failure()
+            else:
+                await self._on_success()
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the dependency, but free the trial slot.
+            self._trial_in_flight = False
             raise
         await self._on_success()
         return result
@@ -3,27 +3,37 @@ Data Extractor — extracts and normalizes data from pages using blueprint defin
 
 Provides:
 - Typed extraction (text, currency, date, number, etc.)
-- Built-in transforms (strip_whitespace, parse_date, regex_extract, etc.)
+- Built-in transforms (strip_whitespace, parse_date, regex_extract, etc.),
+  compiled once into per-field ``TransformPlan``s that run over whole columns
 - List/table extraction with row iteration
+- Batch mode: the whole ``extract`` map is read in one ``page.evaluate``
+  round trip, with the per-element path as fallback
+- Scalar fields resolved concurrently under one extraction-wide deadline
 - Sensitive field handling (marked fields are never logged)
 - Pagination support
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Sequence, Union
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from src.config import get_settings
 from src.core.blueprint import (
     ExtractionField,
     FieldType,
     ListExtractionField,
     TransformType,
 )
+from src.core.settle import PageSettler
+from src.core.watermarks import take_rows
 from src.exceptions import DataExtractionError
 from src.logging_config import get_logger
 
@@ -56,9 +66,27 @@ def transform_to_uppercase(value: str) -> str:
     return value.upper()
 
 
+_NON_NUMERIC = re.compile(r"[^\d.\-]")
+_NON_PHONE = re.compile(r"[^\d+\-() ]")
+_PARAMETERIZED = re.compile(r"(\w+)\((.+)\)")
+
+# Formats parse_date tries, in order, when no explicit format matches.
+DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%m-%d-%Y",
+    "%d/%m/%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%m/%d/%y",
+)
+
+
 def transform_to_number(value: str) -> float:
     """Parse a string to a number, stripping non-numeric chars except . and -."""
-    cleaned = re.sub(r"[^\d.\-]", "", value)
+    cleaned = _NON_NUMERIC.sub("", value)
     try:
         return float(cleaned)
     except ValueError:
@@ -67,7 +95,7 @@ def transform_to_number(value: str) -> float:
 
 def transform_to_currency(value: str) -> float:
     """Parse a currency string to a float."""
-    cleaned = re.sub(r"[^\d.\-]", "", value)
+    cleaned = _NON_NUMERIC.sub("", value)
     try:
         return round(float(cleaned), 2)
     except ValueError:
@@ -76,39 +104,54 @@ def transform_to_currency(value: str) -> float:
 
 def transform_parse_date(value: str, fmt: Optional[str] = None) -> str:
     """Parse a date string and return ISO format."""
-    if fmt:
-        try:
-            dt = datetime.strptime(value.strip(), fmt)
-            return dt.isoformat()
-        except ValueError:
-            pass
-
-    # Try common formats
-    formats = [
-        "%m/%d/%Y",
-        "%Y-%m-%d",
-        "%m-%d-%Y",
-        "%d/%m/%Y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%m/%d/%y",
-    ]
-    for f in formats:
-        try:
-            dt = datetime.strptime(value.strip(), f)
+    return DateParser(fmt)(value)
+
+
+class DateParser:
+    """``parse_date`` that remembers the format that last worked.
+
+    One instance is used per column, so after the first cell each value is
+    usually parsed with a single ``strptime``. An explicit ``fmt`` is always
+    tried first; the learned format comes next, then ``DATE_FORMATS`` in
+    order. Within a column, an ambiguous value such as ``03/04/2026`` is
+    therefore read the same way as the column's earlier cells.
+    """
+
+    __slots__ = ("fmt", "learned")
+
+    def __init__(self, fmt: Optional[str] = None) -> None:
+        self.fmt = fmt
+        self.learned: Optional[str] = None
+
+    def __call__(self, value: str) -> str:
+        value = value.strip()
+        if self.fmt:
+            try:
+                return datetime.strptime(value, self.fmt).isoformat()
+            except ValueError:
+                pass
+        if self.learned:
+            try:
+                return datetime.strptime(value, self.learned).isoformat()
+            except ValueError:
+                pass
+        for f in DATE_FORMATS:
+            if f == self.learned:
+                continue
+            try:
+                dt = datetime.strptime(value, f)
+            except ValueError:
+                continue
+            self.learned = f
             return dt.isoformat()
-        except ValueError:
-            continue
 
-    # Return as-is if no format matches
-    return value.strip()
+        # Return as-is if no format matches
+        return value
 
 
-def transform_regex_extract(value: str, pattern: str) -> str:
+def transform_regex_extract(value: str, pattern: Union[str, re.Pattern]) -> str:
     """Extract the first regex match group from a value."""
-    match = re.search(pattern, value)
+    match = re.search(pattern, value) if isinstance(pattern, str) else pattern.search(value)
     if match:
         return match.group(1) if match.groups() else match.group(0)
     return value
@@ -134,6 +177,56 @@ TRANSFORMS = {
 }
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _transform_factory(transform_str: Optional[str]) -> Callable[[], Callable[[str], Any]]:
+    """Resolve a transform string once; the factory builds a per-column callable."""
+    if transform_str is None:
+        return lambda: _identity
+
+    # Handle parameterized transforms: "transform_name(arg)"
+    param_match = _PARAMETERIZED.match(transform_str)
+    if param_match:
+        func_name, param = param_match.group(1), param_match.group(2)
+        if func_name == "regex_extract":
+            try:
+                pattern = re.compile(param)
+            except re.error as e:
+                logger.warning(
+                    f"Invalid regex_extract pattern {param!r}: {e}, returning raw value",
+                    extra={"extra_data": {"transform": transform_str, "error": str(e)}},
+                )
+                return lambda: _identity
+            regex_step = functools.partial(_regex_extract_compiled, pattern)
+            return lambda: regex_step
+        if func_name == "parse_date":
+            return lambda: DateParser(param)
+
+    if transform_str == TransformType.PARSE_DATE.value:
+        return DateParser
+
+    # Simple transforms
+    func = TRANSFORMS.get(transform_str)
+    if func:
+        return lambda: func
+
+    logger.warning(f"Unknown transform: {transform_str}, returning raw value")
+    return lambda: _identity
+
+
+def _regex_extract_compiled(pattern: re.Pattern, value: str) -> str:
+    return transform_regex_extract(value, pattern)
+
+
+def _transform_str(transform: Union[TransformType, str, None]) -> Optional[str]:
+    if transform is None:
+        return None
+    return transform.value if isinstance(transform, TransformType) else str(transform)
+
+
 def apply_transform(value: str, transform: Union[TransformType, str, None]) -> Any:
     """
     Apply a transform function to a raw extracted value.
@@ -147,27 +240,30 @@ def apply_transform(value: str, transform: Union[TransformType, str, None]) -> A
     """
     if transform is None:
         return value
+    return _transform_factory(_transform_str(transform))()(value)
 
-    transform_str = transform.value if isinstance(transform, TransformType) else str(transform)
 
-    # Handle parameterized transforms: "transform_name(arg)"
-    param_match = re.match(r"(\w+)\((.+)\)", transform_str)
-    if param_match:
-        func_name = param_match.group(1)
-        param = param_match.group(2)
+def _coerce_email(value: str) -> str:
+    return value.lower().strip()
 
-        if func_name == "regex_extract":
-            return transform_regex_extract(value, param)
-        if func_name == "parse_date":
-            return transform_parse_date(value, param)
 
-    # Simple transforms
-    func = TRANSFORMS.get(transform_str) or TRANSFORMS.get(transform)
-    if func:
-        return func(value)
+def _coerce_phone(value: str) -> str:
+    return _NON_PHONE.sub("", value)
 
-    logger.warning(f"Unknown transform: {transform_str}, returning raw value")
-    return value
+
+def _coerce_boolean(value: str) -> bool:
+    return value.lower() in ("true", "yes", "1", "on", "active")
+
+
+_COERCERS: Dict[FieldType, Callable[[], Callable[[str], Any]]] = {
+    FieldType.TEXT: lambda: _identity,
+    FieldType.CURRENCY: lambda: transform_to_currency,
+    FieldType.NUMBER: lambda: transform_to_number,
+    FieldType.DATE: DateParser,
+    FieldType.EMAIL: lambda: _coerce_email,
+    FieldType.PHONE: lambda: _coerce_phone,
+    FieldType.BOOLEAN: lambda: _coerce_boolean,
+}
 
 
 def coerce_type(value: Any, field_type: FieldType) -> Any:
@@ -183,24 +279,114 @@ def coerce_type(value: Any, field_type: FieldType) -> Any:
     """
     if value is None:
         return None
+    return _COERCERS.get(field_type, _COERCERS[FieldType.TEXT])()(str(value).strip())
+
+
+class TransformPlan:
+    """A field's transform and type coercion, resolved once per blueprint field.
+
+    ``apply_column`` runs over a whole list column with fresh ``DateParser``s,
+    so the winning date format is learned per column.
+    """
+
+    __slots__ = ("_make_transform", "_make_coerce")
+
+    def __init__(self, transform: Optional[str], field_type: FieldType) -> None:
+        self._make_transform = _transform_factory(transform)
+        self._make_coerce = _COERCERS.get(field_type, _COERCERS[FieldType.TEXT])
+
+    def apply(self, raw: str) -> Any:
+        transformed = self._make_transform()(raw)
+        return None if transformed is None else self._make_coerce()(str(transformed).strip())
+
+    def apply_column(self, raw_values: Sequence[Optional[str]], default: Any = None) -> List[Any]:
+        """Transform and coerce every cell; missing or failing cells get ``default``."""
+        transform = self._make_transform()
+        coerce = self._make_coerce()
+        values: List[Any] = []
+        append = values.append
+        for raw in raw_values:
+            if raw is None:
+                append(default)
+                continue
+            try:
+                transformed = transform(raw)
+                append(None if transformed is None else coerce(str(transformed).strip()))
+            except Exception:
+                append(default)
+        return values
+
+
+@functools.lru_cache(maxsize=1024)
+def _plan(transform: Optional[str], field_type: FieldType) -> TransformPlan:
+    return TransformPlan(transform, field_type)
+
+
+def plan_for(field_def: ExtractionField) -> TransformPlan:
+    """The compiled plan for a field (cached by transform and type)."""
+    return _plan(_transform_str(field_def.transform), field_def.type)
+
+
+# ── Batch Reader ──────────────────────────────────────────────────────────────
+
+# Reads raw strings for every field in one round trip. Selectors go through the
+# native querySelector, so Playwright-only syntax (text=, >>, :has-text, ...)
+# throws and that field is left out; the caller falls back to the per-element
+# path for it. A scalar whose element is missing comes back as null.
+_BATCH_READ_JS = """
+(fields) => {
+  const read = (el, attribute) => attribute ? (el.getAttribute(attribute) ?? "") : el.innerText;
+  const query = (root, selector) => {
+    try { return root.querySelector(selector); } catch (e) { return undefined; }
+  };
+  const out = {};
+  for (const [name, spec] of Object.entries(fields)) {
+    if (!spec.columns) {
+      const el = query(document, spec.selector);
+      if (el !== undefined) out[name] = el ? read(el, spec.attribute) : null;
+      continue;
+    }
+    let rows;
+    try { rows = Array.from(document.querySelectorAll(spec.selector)); } catch (e) { continue; }
+    if (spec.limit) rows = rows.slice(0, spec.limit);
+    const items = [];
+    let supported = true;
+    for (const row of rows) {
+      const item = {};
+      for (const [column, col] of Object.entries(spec.columns)) {
+        const cell = query(row, col.selector);
+        if (cell === undefined) { supported = false; break; }
+        item[column] = cell === null ? null : read(cell, col.attribute);
+      }
+      if (!supported) break;
+      items.push(item);
+    }
+    if (supported) out[name] = items;
+  }
+  return out;
+}
+"""
 
-    str_val = str(value).strip()
-
-    if field_type == FieldType.TEXT:
-        return str_val
-    if field_type == FieldType.CURRENCY:
-        return transform_to_currency(str_val)
-    if field_type == FieldType.NUMBER:
-        return transform_to_number(str_val)
-    if field_type == FieldType.DATE:
-        return transform_parse_date(str_val)
-    if field_type == FieldType.EMAIL:
-        return str_val.lower().strip()
-    if field_type == FieldType.PHONE:
-        return re.sub(r"[^\d+\-() ]", "", str_val)
-    if field_type == FieldType.BOOLEAN:
-        return str_val.lower() in ("true", "yes", "1", "on", "active")
-    return str_val
+
+def _batch_spec(fields: Dict[str, Union[ExtractionField, ListExtractionField]]) -> Dict[str, Any]:
+    spec: Dict[str, Any] = {}
+    for name, field_def in fields.items():
+        if not field_def.selector:
+            continue
+        if isinstance(field_def, ListExtractionField):
+            if not all(col_def.selector for col_def in field_def.fields.values()):
+                continue
+            spec[name] = {
+                "selector": field_def.selector,
+                "limit": field_def.max_items or 0,
+                "columns": {
+                    col_name: {"selector": col_def.selector, "attribute": col_def.attribute}
+                    for col_name, col_def in field_def.fields.items()
+                },
+            }
+        else:
+            spec[name] = {"selector": field_def.selector, "attribute": field_def.attribute}
+    return spec
 
 
 # ── Page Extractor ────────────────────────────────────────────────────────────
@@ -215,8 +401,16 @@ class DataExtractor:
         data = await extractor.extract(blueprint.extract)
     """
 
-    def __init__(self, page: Page) -> None:
+    def __init__(self, page: Page, batch: Optional[bool] = None) -> None:
+        settings = get_settings()
         self.page = page
+        self.batch = settings.extraction_batch_mode if batch is None else batch
+        self.deadline_ms = settings.extraction_deadline_ms
+        self.settle_timeout_ms = settings.extraction_settle_timeout_ms
+        # Milliseconds from the start of the last extract() until each field resolved.
+        self.timings: Dict[str, float] = {}
+        # {"step", "signal", "wait_ms"} for each pagination wait.
+        self.waits: List[Dict[str, Any]] = []
 
     async def extract(
         self,
@@ -226,6 +420,14 @@ class DataExtractor:
         """
         Extract all defined fields from the current page.
 
+        Scalar fields are resolved concurrently under one deadline (the larger
+        of ``EXTRACTION_DEADLINE_MS`` and any per-field ``timeout``). A field the
+        batch read found missing is re-checked once after the page settles;
+        if it is still missing it resolves to its default straight away
+        instead of waiting out a selector timeout, unless the field sets its
+        own ``timeout``. List fields follow, one at
+        a time, since pagination clicks the page.
+
         Args:
             fields: Dict mapping field names to extraction configs.
             site: Site identifier for error messages.
@@ -233,14 +435,51 @@ class DataExtractor:
         Returns:
             Dict of extracted, typed, transformed data.
         """
+        started = time.monotonic()
+        self.timings = {}
+        self.waits = []
         result: Dict[str, Any] = {}
+        batch = await self._batch_read(fields) if self.batch else {}
+
+        scalars = {name: f for name, f in fields.items() if not isinstance(f, ListExtractionField)}
+        timeouts = [f.timeout for f in scalars.values() if f.timeout]
+        deadline = started + max([self.deadline_ms, *timeouts]) / 1000
+        # A field with its own timeout is expected to render late; it keeps
+        # its selector wait instead of the short settle re-check.
+        absent = await self._confirm_absent(
+            {name: f for name, f in scalars.items() if name in batch and batch[name] is None and not f.timeout},
+            batch,
+            deadline,
+        )
+
+        async def _resolve(name: str, field_def: ExtractionField) -> Any:
+            try:
+                raw = batch.get(name)
+                if isinstance(raw, str):
+                    return plan_for(field_def).apply(raw)
+                if name in absent:
+                    return self._missing(field_def, name, site)
+                remaining_ms = (deadline - time.monotonic()) * 1000
+                return await self._extract_field(field_def, name, site, timeout=remaining_ms)
+            finally:
+                self.timings[name] = round((time.monotonic() - started) * 1000, 1)
+
+        outcomes = dict(
+            zip(
+                scalars,
+                await asyncio.gather(*(_resolve(n, f) for n, f in scalars.items()), return_exceptions=True),
+            )
+        )
 
         for name, field_def in fields.items():
             try:
                 if isinstance(field_def, ListExtractionField):
-                    result[name] = await self._extract_list(field_def, name, site)
+                    result[name] = await self._extract_list(field_def, name, site, first_page=batch.get(name, []))
+                    self.timings[name] = round((time.monotonic() - started) * 1000, 1)
+                elif isinstance(outcomes[name], BaseException):
+                    raise outcomes[name]
                 else:
-                    result[name] = await self._extract_field(field_def, name, site)
+                    result[name] = outcomes[name]
 
                 # Log non-sensitive fields
                 if not (isinstance(field_def, ExtractionField) and field_def.sensitive):
@@ -263,23 +502,79 @@ class DataExtractor:
 
         return result
 
+    async def _batch_read(
+        self,
+        fields: Dict[str, Union[ExtractionField, ListExtractionField]],
+    ) -> Dict[str, Any]:
+        """Raw values for every field the page can answer in one evaluate call."""
+        spec = _batch_spec(fields)
+        if not spec:
+            return {}
+        try:
+            raw = await self.page.evaluate(_BATCH_READ_JS, spec)
+        except Exception as e:
+            logger.debug(
+                "Batch extraction unavailable, using per-element path",
+                extra={"extra_data": {"error": str(e)}},
+            )
+            return {}
+        if not isinstance(raw, dict):
+            return {}
+        logger.debug(
+            "Batch extraction read",
+            extra={"extra_data": {"fields": len(fields), "resolved": len(raw)}},
+        )
+        return raw
+
+    async def _confirm_absent(
+        self,
+        candidates: Dict[str, ExtractionField],
+        batch: Dict[str, Any],
+        deadline: float,
+    ) -> set[str]:
+        """Re-read fields the batch found missing once the page settles.
+
+        Values that appeared are written back into ``batch``; the names
+        returned are still missing and will not be waited for.
+        """
+        if not candidates:
+            return set()
+        settle_ms = min(self.settle_timeout_ms, max(1.0, (deadline - time.monotonic()) * 1000))
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=settle_ms)
+        except Exception:
+            pass  # A page that never goes idle is as settled as it will get.
+        recheck = await self._batch_read(candidates)
+        for name, raw in recheck.items():
+            if isinstance(raw, str):
+                batch[name] = raw
+        return {name for name in candidates if name in recheck and recheck[name] is None}
+
+    @staticmethod
+    def _missing(field_def: ExtractionField, name: str, site: str) -> Any:
+        if field_def.default is not None:
+            return field_def.default
+        raise DataExtractionError(
+            site=site,
+            detail=f"Selector '{field_def.selector}' not found for field '{name}'.",
+        )
+
     async def _extract_field(
         self,
         field_def: ExtractionField,
         name: str,
         site: str,
+        timeout: Optional[float] = None,
     ) -> Any:
-        """Extract a single field value."""
-        field_timeout = getattr(field_def, "timeout", None) or 15000
+        """Extract a single field value, waiting at most ``timeout`` ms if given."""
+        field_timeout = field_def.timeout or 15000
+        if timeout is not None:
+            # Playwright treats 0 as "no timeout".
+            field_timeout = max(1, min(field_timeout, int(timeout)))
         try:
             element = await self.page.wait_for_selector(field_def.selector, timeout=field_timeout, state="attached")
         except PlaywrightTimeout:
-            if field_def.default is not None:
-                return field_def.default
-            raise DataExtractionError(
-                site=site,
-                detail=f"Selector '{field_def.selector}' not found for field '{name}'.",
-            )
+            return self._missing(field_def, name, site)
 
         if element is None:
             if field_def.default is not None:
@@ -292,83 +587,122 @@ class DataExtractor:
         else:
             raw_value = await element.inner_text()
 
-        # Apply transform
-        value = apply_transform(raw_value, field_def.transform)
-
-        # Coerce to type
-        value = coerce_type(value, field_def.type)
-
-        return value
+        return plan_for(field_def).apply(raw_value)
 
     async def _extract_list(
         self,
         field_def: ListExtractionField,
         name: str,
         site: str,
+        first_page: Any = None,
     ) -> List[Dict[str, Any]]:
-        """Extract a list of items (e.g., transaction rows)."""
-        items: List[Dict[str, Any]] = []
-        page_num = 0
-        max_pages = 1
-
-        if field_def.pagination:
-            max_pages = field_def.pagination.max_pages
-
-        while page_num < max_pages:
-            # Get all row elements
-            rows = await self.page.query_selector_all(field_def.selector)
-
-            if not rows:
-                break
-
-            max_items = field_def.max_items
-            for i, row in enumerate(rows):
-                if max_items and len(items) >= max_items:
-                    break
-
-                row_data: Dict[str, Any] = {}
-                for col_name, col_def in field_def.fields.items():
-                    try:
-                        cell = await row.query_selector(col_def.selector)
-                        if cell:
-                            if col_def.attribute:
-                                raw = await cell.get_attribute(col_def.attribute) or ""
-                            else:
-                                raw = await cell.inner_text()
-
-                            value = apply_transform(raw, col_def.transform)
-                            value = coerce_type(value, col_def.type)
-                            row_data[col_name] = value
-                        else:
-                            row_data[col_name] = col_def.default
-                    except Exception as e:
-                        logger.debug(
-                            f"Column extraction failed: {col_name} in row {i}",
-                            extra={"extra_data": {"error": str(e)}},
-                        )
-                        row_data[col_name] = col_def.default
-
-                items.append(row_data)
-
-            # Handle pagination
-            if field_def.pagination and page_num < max_pages - 1:
-                try:
-                    next_btn = await self.page.query_selector(field_def.pagination.next_selector)
-                    if next_btn:
-                        is_disabled = await next_btn.get_attribute("disabled")
-                        if is_disabled:
-                            break
-                        await next_btn.click()
-                        await self.page.wait_for_timeout(field_def.pagination.wait_after_click)
-                    else:
-                        break
-                except Exception:
-                    break
-
-            page_num += 1
+        """Extract a list of items (e.g., transaction rows).
 
+        Rows come from :meth:`iter_list` and stop at ``max_items`` or, in an
+        incremental refresh, at the first row the previous run saw (see
+        ``src.core.watermarks``).
+        """
+        items = await take_rows(self.iter_list(field_def, name, first_page), field_def, name)
         logger.debug(
             f"Extracted {len(items)} items for {name}",
             extra={"extra_data": {"field": name, "count": len(items)}},
         )
         return items
+
+    async def iter_list(
+        self,
+        field_def: ListExtractionField,
+        name: str,
+        first_page: Any = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a list's rows, page by page.
+
+        The next page is clicked only once every row of the current one has
+        been taken, so a consumer that stops early never pays for it.
+        ``first_page`` holds raw rows already read by the batch reader (an
+        empty list when it could not answer); other pages are read with one
+        evaluate call each in batch mode. Pages the batch reader cannot answer
+        go through the per-element path.
+        """
+        max_pages = field_def.pagination.max_pages if field_def.pagination else 1
+        for page_num in range(max_pages):
+            raw_rows = None
+            if self.batch:
+                if page_num == 0 and first_page is not None:
+                    raw_rows = first_page
+                else:
+                    raw_rows = (await self._batch_read({name: field_def})).get(name)
+            if isinstance(raw_rows, list) and raw_rows:
+                for row in self._finish_rows(field_def, raw_rows):
+                    yield row
+            else:
+                rows = await self.page.query_selector_all(field_def.selector)
+                if not rows:
+                    return
+                for i, row in enumerate(rows):
+                    yield await self._read_row(field_def, row, i)
+
+            if page_num == max_pages - 1 or not await self._next_page(field_def, name, page_num, max_pages):
+                return
+
+    @staticmethod
+    async def _read_row(field_def: ListExtractionField, row: Any, index: int) -> Dict[str, Any]:
+        row_data: Dict[str, Any] = {}
+        for col_name, col_def in field_def.fields.items():
+            try:
+                cell = await row.query_selector(col_def.selector)
+                if cell:
+                    if col_def.attribute:
+                        raw = await cell.get_attribute(col_def.attribute) or ""
+                    else:
+                        raw = await cell.inner_text()
+
+                    row_data[col_name] = plan_for(col_def).apply(raw)
+                else:
+                    row_data[col_name] = col_def.default
+            except Exception as e:
+                logger.debug(
+                    f"Column extraction failed: {col_name} in row {index}",
+                    extra={"extra_data": {"error": str(e)}},
+                )
+                row_data[col_name] = col_def.default
+        return row_data
+
+    @staticmethod
+    def _finish_rows(field_def: ListExtractionField, raw_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Transform and type batch-read rows column by column with each column's plan."""
+        rows: List[Dict[str, Any]] = [{} for _ in raw_rows]
+        for col_name, col_def in field_def.fields.items():
+            column = plan_for(col_def).apply_column([raw.get(col_name) for raw in raw_rows], col_def.default)
+            for row, value in zip(rows, column):
+                row[col_name] = value
+        return rows
+
+    async def _next_page(self, field_def: ListExtractionField, name: str, page_num: int, max_pages: int) -> bool:
+        """Click to the next page of a list; False when there is none to go to.
+
+        With ``pagination.settle`` the wait ends as soon as the rows change or
+        the page settles; otherwise it is the fixed ``wait_after_click``.
+        """
+        pagination = field_def.pagination
+        if not pagination or page_num >= max_pages - 1:
+            return True
+        step = f"{name} page {page_num + 2}"
+        try:
+            next_btn = await self.page.query_selector(pagination.next_selector)
+            if not next_btn:
+                return False
+            if await next_btn.get_attribute("disabled"):
+                return False
+            if pagination.settle:
+                async with PageSettler(self.page, pagination.settle, row_selector=field_def.selector) as settler:
+                    await next_btn.click()
+                if settler.result is not None:
+                    self.waits.append(settler.result.to_dict(step))
+            else:
+                await next_btn.click()
+                await self.page.wait_for_timeout(pagination.wait_after_click)
+                self.waits.append({"step": step, "signal": "fixed", "wait_ms": float(pagination.wait_after_click)})
+        except Exception:
+            return False
+        return True
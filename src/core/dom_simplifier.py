@@ -6,22 +6,38 @@ suitable for sending to an LLM. Strips non-essential elements (scripts, styles,
 SVGs, etc.), collapses whitespace, assigns stable element IDs (data-pid),
 and estimates token count.
 
+``DOMSimplifier.simplify`` runs the cleaner inside the page by default
+(``LLM_DOM_IN_BROWSER``): the script replays the events Python's parser would
+see for ``page.content()`` through a port of ``_DOMCleaner``, so only the
+cleaned tree and element map cross the Playwright pipe instead of megabytes
+of page HTML. Its output is the same as ``simplify_html``; pages it cannot
+reproduce exactly (raw-text elements such as ``<xmp>`` outside stripped
+subtrees) fall back to ``page.content()`` and the Python parser.
+
 Usage:
     simplifier = DOMSimplifier()
     result = await simplifier.simplify(page)
     # result.html — cleaned HTML string
     # result.element_map — {pid: {tag, text, attrs}} for quick lookup
     # result.token_estimate — approximate token count
+
+Given the fields a prompt asks for, ``simplify(page, fields)`` keeps an
+over-budget DOM under ``token_budget`` by dropping its least relevant
+subtrees (see :func:`prune_to_budget`) instead of sending all of it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
 from html.parser import HTMLParser
 from io import StringIO
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.config import get_settings
+from src.core.extraction_prompt import FieldDefinition, ListFieldDefinition
 from src.logging_config import get_logger
 
 logger = get_logger("dom_simplifier")
@@ -142,6 +158,9 @@ IMPORTANT_TAGS = frozenset(
     }
 )
 
+# Characters Python's ``\s`` matches (str.isspace); nothing above U+3000 is whitespace
+_WHITESPACE_CODEPOINTS = [code for code in range(0x3001) if chr(code).isspace()]
+
 # Approximate chars per token (for GPT-family models)
 CHARS_PER_TOKEN = 4
 
@@ -163,6 +182,16 @@ class ElementInfo:
     children_pids: List[str] = field(default_factory=list)
 
 
+@dataclass
+class PrunedSubtree:
+    """A subtree :func:`prune_to_budget` left out of the prompt."""
+
+    pid: str
+    tag: str
+    chars: int
+    score: float
+
+
 @dataclass
 class SimplifiedDOM:
     """Result of DOM simplification."""
@@ -174,6 +203,10 @@ class SimplifiedDOM:
     simplified_length: int
     reduction_pct: float
     over_budget: bool
+    # pid -> (start, end) offsets of the element's markup in ``html``
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # Subtrees dropped by :func:`prune_to_budget`
+    pruned: List[PrunedSubtree] = field(default_factory=list)
 
 
 # ── HTML Cleaner (Parser-based) ───────────────────────────────────────────────
@@ -188,11 +221,18 @@ class _DOMCleaner(HTMLParser):
     def __init__(self) -> None:
         super().__init__(convert_charrefs=True)
         self._output = StringIO()
+        self._length = 0
+        self._starts: Dict[str, int] = {}
+        self._spans: Dict[str, Tuple[int, int]] = {}
         self._element_map: Dict[str, ElementInfo] = {}
         self._pid_counter = 0
         self._skip_depth = 0  # > 0 means we're inside a stripped tag
         self._tag_stack: List[str] = []  # stack of open tags for nesting
 
+    def _write(self, text: str) -> None:
+        self._output.write(text)
+        self._length += len(text)
+
     def _next_pid(self) -> str:
         self._pid_counter += 1
         return f"p{self._pid_counter}"
@@ -238,10 +278,13 @@ class _DOMCleaner(HTMLParser):
 
         # Write opening tag
         attr_str = " ".join(f'{k}="{_escape_attr(v)}"' for k, v in attr_dict.items())
-        self._output.write(f"<{tag} {attr_str}>" if attr_str else f"<{tag}>")
+        start = self._length
+        self._write(f"<{tag} {attr_str}>" if attr_str else f"<{tag}>")
 
         if tag in VOID_TAGS:
+            self._spans[pid] = (start, self._length)
             return  # no closing tag, don't push stack
+        self._starts[pid] = start
         self._tag_stack.append(pid)
 
     def handle_endtag(self, tag: str) -> None:
@@ -255,10 +298,11 @@ class _DOMCleaner(HTMLParser):
         if tag in STRIP_TAGS or tag in SKIP_TAGS or tag in VOID_TAGS:
             return
 
-        if self._tag_stack:
-            self._tag_stack.pop()
+        pid = self._tag_stack.pop() if self._tag_stack else None
 
-        self._output.write(f"</{tag}>")
+        self._write(f"</{tag}>")
+        if pid is not None:
+            self._spans[pid] = (self._starts.pop(pid), self._length)
 
     def handle_data(self, data: str) -> None:
         if self._skip_depth > 0:
@@ -269,7 +313,7 @@ class _DOMCleaner(HTMLParser):
         if not text:
             return
 
-        self._output.write(text)
+        self._write(text)
 
         # Attach text to nearest parent element
         if self._tag_stack:
@@ -282,8 +326,11 @@ class _DOMCleaner(HTMLParser):
         # Strip all HTML comments
         pass
 
-    def get_result(self) -> tuple[str, Dict[str, ElementInfo]]:
-        return self._output.getvalue(), self._element_map
+    def get_result(self) -> tuple[str, Dict[str, ElementInfo], Dict[str, Tuple[int, int]]]:
+        # Elements still open at the end of the document run to its end
+        for pid, start in self._starts.items():
+            self._spans[pid] = (start, self._length)
+        return self._output.getvalue(), self._element_map, self._spans
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -315,12 +362,19 @@ def simplify_html(raw_html: str, token_budget: int = DEFAULT_TOKEN_BUDGET) -> Si
     Returns:
         SimplifiedDOM with cleaned HTML, element map, and token estimate.
     """
-    original_length = len(raw_html)
-
     cleaner = _DOMCleaner()
     cleaner.feed(raw_html)
-    cleaned_html, element_map = cleaner.get_result()
+    cleaned_html, element_map, spans = cleaner.get_result()
+    return _simplified(cleaned_html, element_map, spans, len(raw_html), token_budget)
+
 
+def _simplified(
+    cleaned_html: str,
+    element_map: Dict[str, ElementInfo],
+    spans: Dict[str, Tuple[int, int]],
+    original_length: int,
+    token_budget: int,
+) -> SimplifiedDOM:
     simplified_length = len(cleaned_html)
     token_est = estimate_tokens(cleaned_html)
     reduction = (1 - simplified_length / original_length) * 100 if original_length > 0 else 0
@@ -346,9 +400,411 @@ def simplify_html(raw_html: str, token_budget: int = DEFAULT_TOKEN_BUDGET) -> Si
         simplified_length=simplified_length,
         reduction_pct=round(reduction, 1),
         over_budget=over_budget,
+        spans=spans,
+    )
+
+
+# ── In-Page Cleaner ───────────────────────────────────────────────────────────
+
+# Walks the live DOM emitting the start/end/data events HTMLParser would see
+# for page.content() (the serializer's void elements get no end tag, adjacent
+# text nodes form one run, comments split runs, raw-text children are parsed
+# as markup) and feeds them to a line-by-line port of _DOMCleaner. Returns
+# null when it cannot reproduce the Python result exactly.
+_SIMPLIFY_JS = r"""
+(spec) => {
+  const HTML_NS = "http://www.w3.org/1999/xhtml";
+  const STRIP = new Set(spec.strip), SKIP = new Set(spec.skip), VOID = new Set(spec.void);
+  const KEEP = new Set(spec.keep), CDATA = new Set(spec.cdata);
+  const SERIALIZER_VOID = new Set(["area", "base", "basefont", "bgsound", "br", "col", "embed", "frame",
+    "hr", "img", "input", "keygen", "link", "meta", "param", "source", "track", "wbr"]);
+  const RAW_TEXT = new Set(["style", "script", "xmp", "iframe", "noembed", "noframes", "plaintext", "noscript"]);
+  const WS = new RegExp("[" + spec.whitespace.map((c) => "\\u" + c.toString(16).padStart(4, "0")).join("") + "]+", "g");
+  const TAG = /<(\/?)([a-zA-Z][^\t\n\r\f \/>\x00]*)([^>]*)>/g;
+  const UNSUPPORTED = {};
+
+  const out = [], elements = [], byPid = new Map(), stack = [];
+  let skipDepth = 0, counter = 0, size = 0;
+  const emit = (text) => { out.push(text); size += text.length; };
+  const escape = (v) => v.replace(/&/g, "&amp;").replace(/"/g, "&quot;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+
+  const start = (tag, attrs) => {
+    if (skipDepth > 0 || STRIP.has(tag)) {
+      if (!VOID.has(tag)) skipDepth++;
+      return;
+    }
+    if (SKIP.has(tag)) return;
+    const pid = "p" + ++counter;
+    const kept = [], index = new Map();
+    for (const [name, value] of attrs) {
+      if (!KEEP.has(name)) continue;
+      if (index.has(name)) kept[index.get(name)][1] = value;
+      else { index.set(name, kept.length); kept.push([name, value]); }
+    }
+    if (index.has("data-pid")) kept[index.get("data-pid")][1] = pid;
+    else kept.push(["data-pid", pid]);
+    const info = [pid, tag, "", kept.filter(([name]) => name !== "data-pid"), [], size, size];
+    elements.push(info);
+    byPid.set(pid, info);
+    if (stack.length) byPid.get(stack[stack.length - 1])[4].push(pid);
+    emit("<" + tag + " " + kept.map(([name, value]) => name + '="' + escape(value) + '"').join(" ") + ">");
+    info[6] = size;
+    if (!VOID.has(tag)) stack.push(pid);
+  };
+
+  const end = (tag) => {
+    if (skipDepth > 0) {
+      if (!VOID.has(tag)) skipDepth--;
+      return;
+    }
+    if (STRIP.has(tag) || SKIP.has(tag) || VOID.has(tag)) return;
+    const pid = stack.pop();
+    emit("</" + tag + ">");
+    if (pid !== undefined) byPid.get(pid)[6] = size;
+  };
+
+  const data = (raw) => {
+    if (skipDepth > 0) return;
+    const text = raw.replace(WS, " ").replace(/^ | $/g, "");
+    if (!text) return;
+    emit(text);
+    if (stack.length) {
+      const info = byPid.get(stack[stack.length - 1]);
+      info[2] = info[2] ? info[2] + " " + text : text;
+    }
+  };
+
+  // Raw-text content is serialized unescaped, so the parser reads any tags in
+  // it. Only their nesting matters inside a stripped subtree.
+  const markup = (text) => {
+    if (skipDepth === 0 && text.includes("<")) throw UNSUPPORTED;
+    for (const match of text.matchAll(TAG)) {
+      const tag = match[2].toLowerCase();
+      if (match[1]) end(tag);
+      else {
+        start(tag, []);
+        if (match[3].endsWith("/")) end(tag);
+      }
+      if (skipDepth === 0) throw UNSUPPORTED;
+    }
+  };
+
+  const children = (node, raw, cdata) => {
+    let run = null;
+    const flush = () => {
+      if (run === null) return;
+      if (cdata) data(run);
+      else if (raw) markup(run);
+      else data(run);
+      run = null;
+    };
+    for (const child of node.childNodes) {
+      if (child.nodeType === 3) {
+        run = (run ?? "") + child.data;
+        continue;
+      }
+      flush();
+      if (child.nodeType === 1 && !cdata) element(child);
+    }
+    flush();
+  };
+
+  const element = (el) => {
+    const tag = el.tagName.toLowerCase();
+    const html = el.namespaceURI === HTML_NS;
+    start(tag, Array.from(el.attributes, (attr) => [attr.name.toLowerCase(), attr.value]));
+    if (html && SERIALIZER_VOID.has(el.localName)) return;
+    const content = html && el.localName === "template" ? el.content : el;
+    const raw = html && RAW_TEXT.has(el.localName);
+    children(content, raw, raw && CDATA.has(tag));
+    end(tag);
+  };
+
+  try {
+    element(document.documentElement);
+  } catch (e) {
+    if (e === UNSUPPORTED) return null;
+    throw e;
+  }
+  for (const pid of stack) byPid.get(pid)[6] = size;
+  let source = document.documentElement.outerHTML;
+  if (document.doctype) source = new XMLSerializer().serializeToString(document.doctype) + source;
+  const astral = source.match(/[\uD800-\uDBFF][\uDC00-\uDFFF]/g);
+  return { html: out.join(""), elements, length: source.length - (astral ? astral.length : 0) };
+}
+"""
+
+
+def _in_page_spec() -> Dict[str, Any]:
+    return {
+        "strip": sorted(STRIP_TAGS),
+        "skip": sorted(SKIP_TAGS),
+        "void": sorted(VOID_TAGS),
+        "keep": sorted(KEEP_ATTRS),
+        "cdata": list(_DOMCleaner.CDATA_CONTENT_ELEMENTS),
+        "whitespace": _WHITESPACE_CODEPOINTS,
+    }
+
+
+def _from_page(raw: Dict[str, Any], token_budget: int) -> SimplifiedDOM:
+    html = raw["html"]
+    # Offsets come in UTF-16 code units; astral characters count twice there
+    index_at: Optional[List[int]] = None
+    if any(ord(char) > 0xFFFF for char in html):
+        index_at = []
+        for index, char in enumerate(html):
+            index_at.extend((index, index) if ord(char) > 0xFFFF else (index,))
+        index_at.append(len(html))
+    element_map: Dict[str, ElementInfo] = {}
+    spans: Dict[str, Tuple[int, int]] = {}
+    for pid, tag, text, attrs, children_pids, start, end in raw["elements"]:
+        element_map[pid] = ElementInfo(
+            tag=tag, pid=pid, text=text, attrs=dict(attrs), children_pids=list(children_pids)
+        )
+        spans[pid] = (index_at[start], index_at[end]) if index_at is not None else (start, end)
+    return _simplified(html, element_map, spans, raw["length"], token_budget)
+
+
+# ── Budget Pruning ────────────────────────────────────────────────────────────
+
+# Score of a field keyword, split between the elements whose text or attributes contain it
+KEYWORD_WEIGHT = 3.0
+# Share of a label's keyword score given to its neighbours and ``for`` target
+LABEL_WEIGHT = 0.5
+# Row-like tags, scored when a list field is requested
+ROW_WEIGHT = 0.5
+# Most pattern matches (currency, dates, numbers) one element is credited for
+PATTERN_CAP = 3
+
+_LABEL_ATTRS = ("id", "class", "name", "for", "title", "placeholder", "aria-label", "alt")
+_ROW_TAGS = frozenset({"table", "tr", "li", "dt", "dd"})
+_WORD = re.compile(r"[a-z0-9]+")
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_CURRENCY = re.compile(r"[$€£¥]\s?-?\d[\d,]*(?:\.\d{2})?|\d[\d,]*\.\d{2}(?!\d)")
+_DATE = re.compile(
+    r"\b\d{1,4}[/.-]\d{1,2}[/.-]\d{1,4}\b|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.? \d{1,2}\b"
+)
+_NUMBER = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_STOPWORDS = frozenset(
+    {"the", "and", "for", "from", "with", "this", "that", "your", "are", "per", "each", "all", "any", "its", "list"}
+)
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD.findall(_CAMEL.sub(" ", text).lower()))
+
+
+class _Relevance:
+    """Scores elements against the fields an extraction asks for."""
+
+    def __init__(self, fields: List[FieldDefinition | ListFieldDefinition]) -> None:
+        self.keywords: set[str] = set()
+        self.types: set[str] = set()
+        self.rows = False
+        for f in fields:
+            self._add(f.name, f.description)
+            if isinstance(f, ListFieldDefinition):
+                self.rows = True
+                for sub in f.fields:
+                    self._add(sub.name, sub.description)
+                    self.types.add(sub.type)
+            else:
+                self.types.add(f.type)
+
+    def _add(self, name: str, description: str) -> None:
+        words = _words(name.replace("_", " ")) | _words(description)
+        self.keywords |= {word for word in words if len(word) >= 3 and word not in _STOPWORDS}
+
+    def keyword_scores(self, element_map: Dict[str, ElementInfo]) -> Dict[str, float]:
+        """Keyword score per element; a keyword repeated on many elements says little about each."""
+        hits: Dict[str, set[str]] = {}
+        for pid, info in element_map.items():
+            haystack = " ".join([info.text, *(info.attrs.get(name, "") for name in _LABEL_ATTRS)])
+            found = self.keywords & _words(haystack)
+            if found:
+                hits[pid] = found
+        frequency: Dict[str, int] = {}
+        for found in hits.values():
+            for word in found:
+                frequency[word] = frequency.get(word, 0) + 1
+        return {pid: sum(KEYWORD_WEIGHT / frequency[word] for word in found) for pid, found in hits.items()}
+
+    def content_score(self, info: ElementInfo) -> float:
+        score = 0.0
+        if "currency" in self.types:
+            score += min(len(_CURRENCY.findall(info.text)), PATTERN_CAP)
+        if "date" in self.types:
+            score += min(len(_DATE.findall(info.text.lower())), PATTERN_CAP)
+        if "number" in self.types:
+            score += 0.5 * min(len(_NUMBER.findall(info.text)), PATTERN_CAP)
+        if self.rows and info.tag in _ROW_TAGS:
+            score += ROW_WEIGHT
+        return score
+
+
+def prune_to_budget(
+    dom: SimplifiedDOM,
+    fields: List[FieldDefinition | ListFieldDefinition],
+    token_budget: int,
+) -> SimplifiedDOM:
+    """
+    Drop the least relevant subtrees of ``dom`` until it fits ``token_budget``.
+
+    Each element is scored for the requested fields: field-name and
+    description keywords in its text or label attributes, weighted down by
+    how many elements share them (and also credited to the adjacent siblings
+    and ``for`` target of such a label), currency,
+    date and number patterns for fields of those types, and table / list
+    rows for list fields. Working down from the document root, children are
+    kept by relevance per character; relevant children too large for what
+    is left are kept as their own tags and pruned recursively, irrelevant
+    ones are dropped whole. Dropped subtrees are listed in ``pruned``.
+
+    Args:
+        dom: Result of :func:`simplify_html` or :meth:`DOMSimplifier.simplify`.
+        fields: Fields the prompt asks for.
+        token_budget: Token estimate the result must not exceed.
+
+    Returns:
+        ``dom`` itself when it fits, otherwise a pruned SimplifiedDOM.
+    """
+    if dom.token_estimate <= token_budget:
+        return dom
+
+    element_map, spans = dom.element_map, dom.spans
+    relevance = _Relevance(fields)
+    ids = {info.attrs["id"]: pid for pid, info in element_map.items() if "id" in info.attrs}
+    parents = {child: pid for pid, info in element_map.items() for child in info.children_pids}
+
+    scores = {pid: relevance.content_score(info) for pid, info in element_map.items()}
+    for pid, label in relevance.keyword_scores(element_map).items():
+        info = element_map[pid]
+        scores[pid] += label
+        siblings = element_map[parents[pid]].children_pids if pid in parents else []
+        neighbours = [ids.get(info.attrs.get("for", ""))]
+        if pid in siblings:
+            index = siblings.index(pid)
+            neighbours += siblings[max(index - 1, 0) : index] + siblings[index + 1 : index + 2]
+        for neighbour in neighbours:
+            if neighbour is not None and neighbour != pid:
+                scores[neighbour] += LABEL_WEIGHT * label
+
+    # Children follow their parent in document order, so one reverse pass sums subtrees
+    subtree = dict(scores)
+    for pid in reversed(element_map):
+        if pid in parents:
+            subtree[parents[pid]] += subtree[pid]
+    costs = {pid: spans[pid][1] - spans[pid][0] for pid in element_map}
+    order = {pid: index for index, pid in enumerate(element_map)}
+
+    dropped: List[str] = []
+
+    def keep(children: List[str], available: int) -> int:
+        used = 0
+        ranked = sorted(children, key=lambda pid: (subtree[pid] <= 0, -subtree[pid] / costs[pid], order[pid]))
+        for pid in ranked:
+            left = available - used
+            if costs[pid] <= left:
+                used += costs[pid]
+                continue
+            shell = costs[pid] - sum(costs[child] for child in element_map[pid].children_pids)
+            if subtree[pid] > 0 and shell <= left:
+                used += shell + keep(element_map[pid].children_pids, left - shell)
+            else:
+                dropped.append(pid)
+        return used
+
+    roots = [pid for pid in element_map if pid not in parents]
+    outside = len(dom.html) - sum(costs[pid] for pid in roots)
+    keep(roots, token_budget * CHARS_PER_TOKEN - outside)
+
+    # Cut the dropped spans (disjoint: nothing under a dropped element is visited)
+    cuts = sorted(spans[pid] for pid in dropped)
+    pieces, cursor = [], 0
+    cut_ends, removed = [], [0]  # removed[i]: chars cut before cut_ends[i - 1]
+    for start, end in cuts:
+        pieces.append(dom.html[cursor:start])
+        cursor = end
+        cut_ends.append(end)
+        removed.append(removed[-1] + end - start)
+    pieces.append(dom.html[cursor:])
+    html = "".join(pieces)
+
+    def shift(offset: int) -> int:
+        return offset - removed[bisect_right(cut_ends, offset)]
+
+    gone: set[str] = set()
+    stack = list(dropped)
+    while stack:
+        pid = stack.pop()
+        gone.add(pid)
+        stack.extend(element_map[pid].children_pids)
+    pruned_map = {
+        pid: replace(info, children_pids=[child for child in info.children_pids if child not in gone])
+        for pid, info in element_map.items()
+        if pid not in gone
+    }
+    pruned_spans = {pid: (shift(spans[pid][0]), shift(spans[pid][1])) for pid in pruned_map}
+
+    token_est = estimate_tokens(html)
+    pruned = [PrunedSubtree(pid, element_map[pid].tag, costs[pid], round(subtree[pid], 2)) for pid in dropped]
+    logger.info(
+        f"DOM pruned to token budget: ~{dom.token_estimate} → ~{token_est} tokens, {len(pruned)} subtrees dropped",
+        extra={
+            "extra_data": {
+                "tokens_before": dom.token_estimate,
+                "tokens": token_est,
+                "budget": token_budget,
+                "subtrees_dropped": len(pruned),
+                "elements_dropped": len(gone),
+            }
+        },
+    )
+    return SimplifiedDOM(
+        html=html,
+        element_map=pruned_map,
+        token_estimate=token_est,
+        original_length=dom.original_length,
+        simplified_length=len(html),
+        reduction_pct=round((1 - len(html) / dom.original_length) * 100, 1) if dom.original_length else 0,
+        over_budget=token_est > token_budget,
+        spans=pruned_spans,
+        pruned=pruned,
     )
 
 
+# ── Structural Fingerprint ────────────────────────────────────────────────────
+
+# Attributes whose values are structure rather than content
+_STRUCTURAL_ATTR_VALUES = ("type", "role")
+
+
+def dom_fingerprint(dom: SimplifiedDOM) -> str:
+    """
+    Hash of the page's tag and attribute skeleton, for selector-cache keys.
+
+    Text, ids and attribute values (other than ``type`` and ``role``) are
+    ignored, and repeated sibling shapes count once, so the same layout
+    with another user's data — a longer transaction table, other account
+    ids — fingerprints the same, while a redesigned page does not.
+    """
+    parents = {child for info in dom.element_map.values() for child in info.children_pids}
+    shapes: Dict[str, str] = {}
+    # Children follow their parent in document order, so one reverse pass sees them first
+    for pid in reversed(dom.element_map):
+        info = dom.element_map[pid]
+        attrs = ",".join(
+            f"{name}={info.attrs[name]}" if name in _STRUCTURAL_ATTR_VALUES else name
+            for name in sorted(info.attrs)
+            if name != "id"
+        )
+        children = "|".join(dict.fromkeys(shapes[child] for child in info.children_pids))
+        shape = f"{info.tag}[{attrs}]({children})"
+        shapes[pid] = hashlib.sha1(shape.encode()).hexdigest()[:12]
+    roots = "|".join(shapes[pid] for pid in dom.element_map if pid not in parents)
+    return hashlib.sha256(roots.encode()).hexdigest()[:16]
+
+
 # ── Playwright Integration ────────────────────────────────────────────────────
 
 
@@ -361,21 +817,47 @@ class DOMSimplifier:
         result = await simplifier.simplify(page)
     """
 
-    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET) -> None:
+    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET, in_browser: Optional[bool] = None) -> None:
         self.token_budget = token_budget
+        self.in_browser = get_settings().llm_dom_in_browser if in_browser is None else in_browser
 
-    async def simplify(self, page) -> SimplifiedDOM:
+    async def simplify(
+        self,
+        page,
+        fields: Optional[List[FieldDefinition | ListFieldDefinition]] = None,
+    ) -> SimplifiedDOM:
         """
-        Get the current page's HTML and simplify it.
+        Simplify the current page's DOM.
+
+        In-page when enabled and supported, otherwise from ``page.content()``
+        with :func:`simplify_html`; both produce the same result.
 
         Args:
             page: A Playwright Page object.
+            fields: Fields the result will be prompted for. When given, an
+                over-budget DOM is pruned to the budget with :func:`prune_to_budget`.
 
         Returns:
             SimplifiedDOM result.
         """
-        raw_html = await page.content()
-        return simplify_html(raw_html, token_budget=self.token_budget)
+        result = None
+        if self.in_browser:
+            try:
+                raw = await page.evaluate(_SIMPLIFY_JS, _in_page_spec())
+            except Exception as e:
+                logger.debug(
+                    "In-page DOM simplification unavailable, using page content",
+                    extra={"extra_data": {"error": str(e)}},
+                )
+                raw = None
+            if isinstance(raw, dict):
+                result = _from_page(raw, self.token_budget)
+        if result is None:
+            raw_html = await page.content()
+            result = simplify_html(raw_html, token_budget=self.token_budget)
+        if fields:
+            result = prune_to_budget(result, fields, self.token_budget)
+        return result
 
     async def get_visible_text(self, page) -> str:
         """
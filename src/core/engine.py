@@ -10,31 +10,37 @@ Python connectors.
 """
 
 import asyncio
-import importlib.util
 import json
 import os
-import sys
+import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
-from urllib.parse import urlparse
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from urllib.parse import quote, urljoin, urlparse
 
-from src import metrics
+import httpx
+
+from src import browser_sessions, metrics
 from src.config import get_settings
+from src.core.api_capture import ApiCapture, ApiExtractor, ApiReplayer, JsonFetcher, PayloadSource
 from src.core.blueprint import (
+    BlueprintStep,
     BlueprintV2,
+    ExecutionMode,
     ExtractionField,
     ListExtractionField,
-    load_blueprint,
+    SessionProbeConfig,
 )
-from src.core.browser_pool import get_browser_pool
+from src.core.blueprint_registry import get_blueprint_registry
+from src.core.browser_pool import USER_AGENTS, PooledContext, get_browser_pool
 from src.core.connector_base import BaseConnector
 from src.core.data_extractor import DataExtractor
-from src.core.dom_simplifier import DOMSimplifier
+from src.core.dom_simplifier import DOMSimplifier, SimplifiedDOM, dom_fingerprint, prune_to_budget
 from src.core.extraction_prompt import (
     ExtractionPromptBuilder,
     fields_from_blueprint_extract,
 )
+from src.core.http_executor import SITE_DOWN_ERRORS, HtmlExtractor, HttpModeUnsupported, HttpStepExecutor
 from src.core.llm_provider import (
     BaseLLMProvider,
     FallbackChain,
@@ -44,8 +50,13 @@ from src.core.llm_provider import (
 from src.core.mfa_manager import get_mfa_manager
 from src.core.multimodal_extractor import MultimodalExtractor
 from src.core.read_only_policy import ExecutionPhase, ReadOnlyExecutionPolicy
-from src.core.selector_cache import SelectorCache
+from src.core.request_filter import RequestFilter
+from src.core.selector_cache import SelectorCache, SharedSelectorCache
+from src.core.site_guard import get_site_guard
+from src.core.site_rate_limit import get_site_rate_limiter
 from src.core.step_executor import StepExecutor
+from src.core.step_plan import PlannedPage, StepPlan, build_step_plan
+from src.core.watermarks import current_watermarks
 from src.exceptions import (
     BlueprintNotFoundError,
     BlueprintValidationError,
@@ -54,11 +65,14 @@ from src.exceptions import (
     MFARequiredError,
     PlaidifyError,
     ReadOnlyPolicyViolationError,
+    SiteUnavailableError,
 )
 from src.logging_config import get_logger
 from src.tracing import span
 
 logger = get_logger("engine")
+
+T = TypeVar("T")
 settings = get_settings()
 
 # ── Module-Level Singletons ──────────────────────────────────────────────────
@@ -70,11 +84,24 @@ def get_selector_cache() -> SelectorCache:
     """Get or create the module-level selector cache singleton."""
     global _selector_cache
     if _selector_cache is None:
-        cache_path = os.environ.get("PLAIDIFY_SELECTOR_CACHE_PATH")
-        _selector_cache = SelectorCache(persist_path=cache_path)
+        if settings.selector_cache_backend == "redis":
+            _selector_cache = SharedSelectorCache(
+                key_mode=settings.selector_cache_key,
+                max_local_entries=settings.selector_cache_local_max_entries,
+                local_ttl=settings.selector_cache_local_ttl_seconds,
+            )
+        else:
+            cache_path = os.environ.get("PLAIDIFY_SELECTOR_CACHE_PATH")
+            _selector_cache = SelectorCache(persist_path=cache_path, key_mode=settings.selector_cache_key)
     return _selector_cache
 
 
+def close_selector_cache() -> None:
+    """Write pending selector-cache changes to disk and stop its background threads."""
+    if _selector_cache is not None:
+        _selector_cache.close()
+
+
 async def connect_to_site(
     site: str,
     username: str,
@@ -82,12 +109,15 @@ async def connect_to_site(
     extract_fields: Optional[list[str]] = None,
     proxy: Optional[dict] = None,
     session_id: Optional[str] = None,
+    session_state_key: Optional[str] = None,
+    user_id: Optional[int] = None,
 ) -> dict:
     """
     Establish a connection to the provided site using the given credentials.
 
     Tries to use a Python connector first, otherwise loads the JSON blueprint
-    and executes it via Playwright.
+    and executes it via Playwright (or over plain HTTP for blueprints with
+    ``execution_mode: "http"``, falling back to Playwright).
 
     Args:
         site: The site identifier (must match a blueprint or connector filename).
@@ -96,6 +126,10 @@ async def connect_to_site(
         extract_fields: Optional list of specific fields to extract (None = all).
         proxy: Optional proxy config for the browser.
         session_id: Optional session ID (generated if not provided).
+        session_state_key: Optional key of a saved browser session (see
+            ``src.browser_sessions``). Used with ``user_id`` when the blueprint
+            declares ``auth.session_probe``.
+        user_id: Owner of the saved session; its DEK encrypts the state.
 
     Returns:
         dict with 'status' and 'data' keys.
@@ -104,16 +138,20 @@ async def connect_to_site(
         BlueprintNotFoundError: If no connector or blueprint exists for the site.
         ConnectionFailedError: If the connection attempt fails.
         MFARequiredError: If MFA is needed (client should call /mfa/submit).
+        SiteUnavailableError: If the site is unreachable, or its circuit is
+            open after repeated failures (``retry_after`` is set).
+        RateLimitedError: If the site's blueprint rate limit would delay the
+            connection longer than ``SITE_RATE_LIMIT_MAX_WAIT_SECONDS``.
     """
     logger.info("Initiating connection", extra={"extra_data": {"site": site}})
 
     connectors_dir = str(Path(settings.connectors_dir).resolve())
+    registry = get_blueprint_registry(connectors_dir)
 
     # ── Try Python connector first ────────────────────────────────────────────
-    python_connectors = load_python_connectors(connectors_dir)
     connector_key = f"{site}_connector"
-    if connector_key in python_connectors:
-        ConnectorClass = python_connectors[connector_key]
+    ConnectorClass = registry.python_connector(site)
+    if ConnectorClass is not None:
         connector_instance = ConnectorClass()
         logger.info(
             "Using Python connector",
@@ -131,28 +169,268 @@ async def connect_to_site(
     # ── Load Blueprint ────────────────────────────────────────────────────────
     blueprint = _load_site_blueprint(site, connectors_dir)
 
+    # ── Site rate limit ───────────────────────────────────────────────────────
+    # Waits (outside the overall timeout, before any browser slot is taken)
+    # for this site's shared request budget; raises RateLimitedError if the
+    # queue is longer than SITE_RATE_LIMIT_MAX_WAIT_SECONDS.
+    throttle_wait = 0.0
+    if blueprint.rate_limit is not None and settings.site_rate_limit_enabled:
+        throttle_wait = await get_site_rate_limiter().wait_turn(site, blueprint.rate_limit)
+
     # ── Execute via Playwright ────────────────────────────────────────────────
     # Overall timeout prevents a hung site from blocking a worker indefinitely.
     # Default: 5 minutes (navigation + auth + extraction + cleanup).
+    # The site's circuit breaker fails fast (SiteUnavailableError with a
+    # retry_after) while the site keeps timing out or erroring. It only sees
+    # the time spent on the site: waiting for a browser slot is outside it, so
+    # a saturated pool is not mistaken for a slow site.
     _OVERALL_TIMEOUT = 300  # seconds
+    get_site_guard(site).reject_if_open()
     try:
-        return await asyncio.wait_for(
-            _execute_blueprint(
-                blueprint=blueprint,
-                site=site,
-                username=username,
-                password=password,
-                extract_fields=extract_fields,
-                proxy=proxy,
-                session_id=session_id or str(uuid.uuid4()),
-            ),
-            timeout=_OVERALL_TIMEOUT,
+        result = await _run_blueprint(
+            blueprint=blueprint,
+            site=site,
+            username=username,
+            password=password,
+            extract_fields=extract_fields,
+            proxy=proxy,
+            session_id=session_id or str(uuid.uuid4()),
+            session_state_key=session_state_key,
+            user_id=user_id,
+            deadline=time.monotonic() + _OVERALL_TIMEOUT,
         )
     except asyncio.TimeoutError:
         raise ConnectionFailedError(
             site=site,
             detail=f"Connection timed out after {_OVERALL_TIMEOUT}s.",
         )
+    if throttle_wait > 0:
+        result["metadata"] = {**(result.get("metadata") or {}), "throttle_wait_seconds": round(throttle_wait, 3)}
+    return result
+
+
+async def _run_blueprint(
+    blueprint: BlueprintV2,
+    site: str,
+    username: str,
+    password: str,
+    extract_fields: Optional[list[str]],
+    proxy: Optional[dict],
+    session_id: str,
+    session_state_key: Optional[str] = None,
+    user_id: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> dict:
+    """Run the blueprint in its execution mode, by ``deadline`` (``time.monotonic()``).
+
+    HTTP-mode runs that hit something only a browser can do
+    (``HttpModeUnsupported``) or an unclassified ``httpx`` error are rerun in
+    the browser, with the reason recorded in ``metadata.http_fallback``. Any
+    other failure propagates: a rejected password surfaces as a missing
+    post-login selector (``ConnectionFailedError``), and retrying it in the
+    browser would double the failed logins against the site.
+    """
+    browser_kwargs = dict(
+        blueprint=blueprint,
+        site=site,
+        username=username,
+        password=password,
+        extract_fields=extract_fields,
+        proxy=proxy,
+        session_id=session_id,
+        session_state_key=session_state_key,
+        user_id=user_id,
+        deadline=deadline,
+    )
+    if blueprint.execution_mode != ExecutionMode.HTTP or not settings.http_mode_enabled:
+        return await _execute_blueprint(**browser_kwargs)
+
+    reason = _http_mode_ineligible(blueprint)
+    if reason is None:
+        site_guard = get_site_guard(site)
+        started = time.monotonic()
+        try:
+            result = await site_guard.call(
+                lambda: _within(
+                    deadline, _execute_http_blueprint(blueprint, site, username, password, extract_fields, proxy)
+                )
+            )
+            metrics.record_http_mode(site, "success")
+            site_guard.record_latency(time.monotonic() - started)
+            return result
+        except (HttpModeUnsupported, httpx.HTTPError) as e:
+            reason = str(e) or type(e).__name__
+            metrics.record_http_mode(site, "fallback")
+            logger.warning(
+                "HTTP mode failed, falling back to the browser",
+                extra={"extra_data": {"site": site, "error": reason}},
+            )
+
+    result = await _execute_blueprint(**browser_kwargs)
+    result["metadata"] = {**(result.get("metadata") or {}), "http_fallback": reason}
+    return result
+
+
+async def _within(deadline: Optional[float], awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, raising ``asyncio.TimeoutError`` once ``deadline`` passes."""
+    if deadline is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, timeout=max(0.0, deadline - time.monotonic()))
+
+
+def _http_mode_ineligible(blueprint: BlueprintV2) -> Optional[str]:
+    """Why the blueprint cannot run over HTTP at all (None if it can try)."""
+    if blueprint.mfa is not None:
+        return "MFA prompts need a browser session to resume"
+    if blueprint.is_llm_adaptive:
+        return "llm_adaptive extraction needs a rendered page"
+    return None
+
+
+def _httpx_proxy(proxy: Optional[dict]) -> Optional[str]:
+    """Playwright proxy config -> proxy URL for httpx."""
+    if not proxy or not proxy.get("server"):
+        return None
+    server = proxy["server"]
+    if "://" not in server:
+        server = f"http://{server}"
+    if proxy.get("username"):
+        scheme, rest = server.split("://", 1)
+        credentials = quote(proxy["username"], safe="")
+        if proxy.get("password"):
+            credentials += ":" + quote(proxy["password"], safe="")
+        server = f"{scheme}://{credentials}@{rest}"
+    return server
+
+
+def _http_json_fetcher(executor: HttpStepExecutor) -> JsonFetcher:
+    """Calls endpoints through the HTTP executor's client and cookie jar."""
+
+    async def fetch_json(method: str, url: str, body: Optional[Dict[str, Any]]) -> Any:
+        target = urljoin(executor.url or "", url)
+        try:
+            response = await executor.client.request(method, target, json=body, headers={"Accept": "application/json"})
+        except SITE_DOWN_ERRORS as e:
+            raise SiteUnavailableError(executor.site, detail=f"{type(e).__name__} calling {target}") from e
+        except httpx.HTTPError as e:
+            raise ConnectionFailedError(site=executor.site, detail=f"{type(e).__name__} calling {target}") from e
+        executor.requests += 1
+        if response.status_code >= 500:
+            raise SiteUnavailableError(executor.site, detail=f"HTTP {response.status_code} from {target}")
+        if response.status_code >= 400:
+            raise ConnectionFailedError(site=executor.site, detail=f"HTTP {response.status_code} from {target}")
+        return response.json()
+
+    return fetch_json
+
+
+async def _execute_http_blueprint(
+    blueprint: BlueprintV2,
+    site: str,
+    username: str,
+    password: str,
+    extract_fields: Optional[list[str]],
+    proxy: Optional[dict],
+) -> dict:
+    """Execute a blueprint over plain HTTP (see ``src.core.http_executor``).
+
+    Same flow as ``_execute_blueprint`` minus MFA and session reuse; pages are
+    visited one after another since they share one cookie jar and document.
+
+    Raises:
+        HttpModeUnsupported: If a step or page needs a browser.
+    """
+    dom_fields, api_defs = _split_api_fields(blueprint, extract_fields, blueprint.api is not None)
+    for name in sorted({definition.api for definition in api_defs.values()}):
+        if ApiReplayer.replay_url(blueprint.api.endpoints[name]) is None:
+            raise HttpModeUnsupported(f"api endpoint '{name}' has no replay_url")
+    plan = build_step_plan(blueprint, dom_fields)
+    read_only_policy = ReadOnlyExecutionPolicy(enabled=settings.strict_read_only_mode)
+    client = httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=settings.http_mode_timeout_seconds,
+        headers={"User-Agent": USER_AGENTS[0], "Accept": "text/html,application/xhtml+xml"},
+        proxy=_httpx_proxy(proxy),
+    )
+    async with client:
+        executor = HttpStepExecutor(
+            client,
+            {"username": username, "password": password},
+            read_only_policy=read_only_policy if read_only_policy.enabled else None,
+            site=site,
+        )
+        read_only_policy.set_phase(ExecutionPhase.AUTH)
+        with span("engine.http_auth", **{"plaidify.site": site}):
+            await executor.execute_steps(plan.auth_steps, context="auth")
+
+        read_only_policy.set_phase(ExecutionPhase.READ)
+        extracted_data: Dict[str, Any] = {}
+        extraction_timings: Dict[str, float] = {}
+        extraction_waits: List[Dict[str, Any]] = []
+        groups = [("", [], plan.extract)]
+        groups += [(f"page:{planned.name}", planned.steps, planned.extract) for planned in plan.pages]
+        for step_context, page_steps, extraction_defs in groups:
+            if page_steps:
+                await executor.execute_steps(page_steps, context=step_context)
+            if extraction_defs:
+                extractor = HtmlExtractor(executor)
+                with span("engine.extract", **{"plaidify.site": site}):
+                    extracted_data.update(await extractor.extract(extraction_defs, site=site))
+                extraction_timings.update(extractor.timings)
+                extraction_waits.extend(extractor.waits)
+
+        if api_defs:
+            replayer = ApiReplayer(
+                blueprint.api.endpoints,
+                _http_json_fetcher(executor),
+                read_only_policy=read_only_policy if read_only_policy.enabled else None,
+                site=site,
+            )
+            api_extractor = ApiExtractor(replayer)
+            with span("engine.extract", **{"plaidify.site": site}):
+                extracted_data.update(await api_extractor.extract(api_defs, site=site))
+            extraction_timings.update(api_extractor.timings)
+
+        if blueprint.cleanup:
+            read_only_policy.set_phase(ExecutionPhase.CLEANUP)
+            try:
+                await executor.execute_steps(blueprint.cleanup, context="cleanup")
+            except Exception as e:
+                logger.warning(
+                    "Cleanup steps failed (non-fatal)",
+                    extra={"extra_data": {"site": site, "error": str(e)}},
+                )
+
+    logger.info(
+        "Connection successful",
+        extra={
+            "extra_data": {
+                "site": site,
+                "fields_extracted": len(extracted_data),
+                "extraction_method": "http_css",
+                "requests": executor.requests,
+            }
+        },
+    )
+    metrics.record_extraction(site, "success")
+    response_metadata: Dict[str, Any] = {"execution_mode": "http", "http_requests": executor.requests}
+    if plan.skipped:
+        response_metadata["skipped_steps"] = plan.skipped
+    if extraction_timings:
+        response_metadata["extraction_timings_ms"] = extraction_timings
+    if extraction_waits:
+        response_metadata["step_waits"] = extraction_waits
+    marks = current_watermarks()
+    if marks is not None and marks.latest:
+        response_metadata["incremental_lists"] = marks.to_metadata()
+    if read_only_policy.enabled:
+        response_metadata["read_only_policy"] = read_only_policy.to_metadata()
+    return {
+        "status": "connected",
+        "data": extracted_data,
+        "extraction_method": "http_css",
+        "metadata": response_metadata,
+    }
 
 
 async def submit_mfa_code(session_id: str, code: str) -> dict:
@@ -187,7 +465,7 @@ async def submit_mfa_code(session_id: str, code: str) -> dict:
 
 
 def _load_site_blueprint(site: str, connectors_dir: str) -> BlueprintV2:
-    """Load and validate a blueprint for the given site."""
+    """Load and validate a blueprint for the given site (compiled once per file version)."""
     import re
 
     if not re.match(r"^[a-zA-Z0-9_-]+$", site):
@@ -204,15 +482,14 @@ def _load_site_blueprint(site: str, connectors_dir: str) -> BlueprintV2:
     if not str(resolved).startswith(str(connectors_resolved)):
         raise BlueprintValidationError(site=site, detail="Invalid site name.")
 
-    if not blueprint_path.exists():
+    try:
+        return get_blueprint_registry(connectors_dir).get(blueprint_path)
+    except FileNotFoundError:
         logger.error(
             "Blueprint not found",
             extra={"extra_data": {"site": site, "path": str(blueprint_path)}},
         )
         raise BlueprintNotFoundError(site=site)
-
-    try:
-        return load_blueprint(blueprint_path)
     except json.JSONDecodeError as e:
         raise BlueprintValidationError(site=site, detail=f"Invalid JSON: {e}") from e
     except Exception as e:
@@ -268,6 +545,7 @@ async def _extract_with_cached_selectors(
     site: str,
     domain: str,
     page_path: str,
+    fingerprint: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """Try to extract data using cached CSS selectors.
 
@@ -306,17 +584,36 @@ async def _extract_with_cached_selectors(
     try:
         extractor = DataExtractor(page)
         result = await extractor.extract(temp_defs, site=site)
-        cache.record_success(domain, page_path)
+        cache.record_success(domain, page_path, fingerprint=fingerprint)
         return result
     except (DataExtractionError, Exception) as e:
         logger.warning(
             "Cached selector extraction failed",
             extra={"extra_data": {"site": site, "error": str(e)}},
         )
-        cache.record_failure(domain, page_path)
+        cache.record_failure(domain, page_path, fingerprint=fingerprint)
         return None
 
 
+async def _page_fingerprint(page: Any, site: str) -> Tuple[Optional[SimplifiedDOM], Optional[str]]:
+    """Simplify the page and fingerprint its structure for the selector-cache key.
+
+    Returns (None, None) when the cache is keyed by path only or the page
+    could not be simplified.
+    """
+    if settings.selector_cache_key == "path":
+        return None, None
+    try:
+        dom = await DOMSimplifier(token_budget=settings.llm_token_budget).simplify(page)
+    except Exception as e:
+        logger.warning(
+            "Could not fingerprint page for the selector cache",
+            extra={"extra_data": {"site": site, "error": str(e)}},
+        )
+        return None, None
+    return dom, dom_fingerprint(dom)
+
+
 async def _extract_with_llm(
     page: Any,
     blueprint: BlueprintV2,
@@ -324,9 +621,12 @@ async def _extract_with_llm(
     site: str,
     domain: str,
     page_path: str,
+    dom: Optional[SimplifiedDOM] = None,
+    fingerprint: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """Run full LLM extraction: simplify DOM → build prompt → call LLM → cache selectors.
 
+    ``dom`` is the page's already simplified DOM, if the caller has it.
     Returns extracted data or None if LLM is unavailable / fails.
     """
     provider = _create_llm_provider()
@@ -335,9 +635,15 @@ async def _extract_with_llm(
         return None
 
     try:
-        # 1. Simplify DOM
-        simplifier = DOMSimplifier(token_budget=settings.llm_token_budget)
-        dom_result = await simplifier.simplify(page)
+        # 1. Convert blueprint extract config to field definitions
+        field_defs = _defs_to_field_defs(extraction_defs)
+
+        # 2. Simplify DOM, pruned to the token budget for these fields
+        if dom is None:
+            simplifier = DOMSimplifier(token_budget=settings.llm_token_budget)
+            dom_result = await simplifier.simplify(page, field_defs)
+        else:
+            dom_result = prune_to_budget(dom, field_defs, settings.llm_token_budget)
 
         logger.info(
             "DOM simplified",
@@ -346,13 +652,11 @@ async def _extract_with_llm(
                     "site": site,
                     "token_estimate": dom_result.token_estimate,
                     "elements": len(dom_result.element_map),
+                    "pruned_subtrees": len(dom_result.pruned),
                 }
             },
         )
 
-        # 2. Convert blueprint extract config to field definitions
-        field_defs = _defs_to_field_defs(extraction_defs)
-
         # 3. Build prompt
         prompt_builder = ExtractionPromptBuilder()
         prompt = prompt_builder.build_extraction_prompt(
@@ -385,7 +689,7 @@ async def _extract_with_llm(
         # 6. Cache selectors if confidence is adequate
         if result.selectors and result.confidence >= 0.5:
             cache = get_selector_cache()
-            cache.put(domain, page_path, result.selectors, confidence=result.confidence)
+            cache.put(domain, page_path, result.selectors, confidence=result.confidence, fingerprint=fingerprint)
 
         return result.data
 
@@ -510,10 +814,11 @@ async def _extract_llm_adaptive(
     """
     domain = blueprint.domain
     page_path = _get_page_path(page)
+    dom, fingerprint = await _page_fingerprint(page, site)
 
     # 1. Try cached selectors
     cache = get_selector_cache()
-    cache_entry = cache.get(domain, page_path)
+    cache_entry = cache.get(domain, page_path, fingerprint=fingerprint)
 
     if cache_entry:
         logger.info(
@@ -527,14 +832,17 @@ async def _extract_llm_adaptive(
             },
         )
         cached_data = await _extract_with_cached_selectors(
-            page, cache_entry.selectors, extraction_defs, site, domain, page_path
+            page, cache_entry.selectors, extraction_defs, site, domain, page_path, fingerprint
         )
         if cached_data:
             return cached_data, "cached_selectors"
+        dom = None  # cached extraction may have paginated; simplify the page as it is now
 
     # 2. Full LLM extraction
     logger.info("Running LLM extraction", extra={"extra_data": {"site": site}})
-    llm_data = await _extract_with_llm(page, blueprint, extraction_defs, site, domain, page_path)
+    llm_data = await _extract_with_llm(
+        page, blueprint, extraction_defs, site, domain, page_path, dom=dom, fingerprint=fingerprint
+    )
     if llm_data:
         return llm_data, "llm"
 
@@ -563,6 +871,138 @@ async def _extract_llm_adaptive(
     )
 
 
+_GroupResult = Tuple[Dict[str, Any], Optional[str], Dict[str, float], List[Dict[str, Any]]]
+
+
+async def _extract_group(
+    page: Any,
+    executor: StepExecutor,
+    blueprint: BlueprintV2,
+    site: str,
+    step_context: str,
+    steps: List[BlueprintStep],
+    extraction_defs: Dict[str, Union[ExtractionField, ListExtractionField]],
+    api_source: Optional[PayloadSource] = None,
+) -> _GroupResult:
+    """Run a page's navigation steps, then extract its fields.
+
+    Fields with an ``api`` source are read from ``api_source`` payloads, the
+    rest from the page. Returns the data, the extraction method (None if
+    nothing was extracted), per-field timings and pagination waits.
+    """
+    if steps:
+        await executor.execute_steps(steps, context=step_context)
+    api_defs = {}
+    if api_source is not None:
+        api_defs = {name: definition for name, definition in extraction_defs.items() if definition.api}
+    page_defs = {name: definition for name, definition in extraction_defs.items() if name not in api_defs}
+    if not extraction_defs:
+        return {}, None, {}, []
+    data: Dict[str, Any] = {}
+    method: Optional[str] = None
+    timings: Dict[str, float] = {}
+    waits: List[Dict[str, Any]] = []
+    with span("engine.extract", **{"plaidify.site": site}):
+        if api_defs:
+            api_extractor = ApiExtractor(api_source)
+            data.update(await api_extractor.extract(api_defs, site=site))
+            method = "api_json"
+            timings.update(api_extractor.timings)
+        if page_defs and blueprint.is_llm_adaptive:
+            page_data, method = await _extract_llm_adaptive(
+                page=page,
+                blueprint=blueprint,
+                extraction_defs=page_defs,
+                site=site,
+            )
+            data.update(page_data)
+        elif page_defs:
+            extractor = DataExtractor(page)
+            data.update(await extractor.extract(page_defs, site=site))
+            method = "css_selectors"
+            timings.update(extractor.timings)
+            waits.extend(extractor.waits)
+    return data, method, timings, waits
+
+
+def _split_api_fields(
+    blueprint: BlueprintV2,
+    extract_fields: Optional[list[str]],
+    replay: bool,
+) -> Tuple[Optional[list[str]], Dict[str, Union[ExtractionField, ListExtractionField]]]:
+    """Fields the pages must serve, and the api fields replayed after auth.
+
+    Without replay every field is served by the pages (api fields through the
+    captured traffic). With replay, api fields are fetched directly, so steps
+    and pages only they needed drop out of the step plan.
+    """
+    if not replay:
+        return extract_fields, {}
+    requested = list(blueprint.extract) if extract_fields is None else extract_fields
+    replayed = {
+        name: blueprint.extract[name] for name in requested if name in blueprint.extract and blueprint.extract[name].api
+    }
+    return [name for name in requested if name not in replayed], replayed
+
+
+def _context_json_fetcher(context: Any, page: Any, site: str) -> JsonFetcher:
+    """Calls endpoints with the browser context's cookies, skipping rendering."""
+
+    async def fetch_json(method: str, url: str, body: Optional[Dict[str, Any]]) -> Any:
+        target = urljoin(page.url, url)
+        response = await context.request.fetch(target, method=method, data=body)
+        if response.status >= 500:
+            raise SiteUnavailableError(site, detail=f"HTTP {response.status} from {target}")
+        if not response.ok:
+            raise ConnectionFailedError(site=site, detail=f"HTTP {response.status} from {target}")
+        return await response.json()
+
+    return fetch_json
+
+
+async def _extract_in_tab(
+    context: Any,
+    blueprint: BlueprintV2,
+    site: str,
+    planned: PlannedPage,
+    variables: Dict[str, str],
+    read_only_policy: ReadOnlyExecutionPolicy,
+    api_source: Optional[PayloadSource] = None,
+) -> _GroupResult:
+    """Visit a parallel page in a new tab of the authenticated context.
+
+    The tab shares the run's read-only policy: its steps are checked like the
+    main page's, and it is announced to the pool's extra-page guard so only
+    pages the site opens itself are closed.
+    """
+    policy = read_only_policy if read_only_policy.enabled else None
+    if policy is not None:
+        policy.expect_tab()
+    try:
+        tab = await context.new_page()
+    except Exception:
+        if policy is not None:
+            policy.claim_tab()
+        raise
+    try:
+        tab_executor = StepExecutor(
+            tab,
+            variables,
+            allow_js_execution=True,
+            read_only_policy=policy,
+            site=site,
+        )
+        data, method, timings, waits = await _extract_group(
+            tab, tab_executor, blueprint, site, f"page:{planned.name}", planned.steps, planned.extract, api_source
+        )
+        return data, method, timings, tab_executor.waits + waits
+    finally:
+        try:
+            await tab.close()
+        except Exception:
+            pass
+
+
 async def _execute_blueprint(
     blueprint: BlueprintV2,
     site: str,
@@ -571,26 +1011,109 @@ async def _execute_blueprint(
     extract_fields: Optional[list[str]],
     proxy: Optional[dict],
     session_id: str,
+    session_state_key: Optional[str] = None,
+    user_id: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> dict:
     """
     Execute a V2 blueprint using Playwright.
 
     Flow:
     1. Acquire a browser context from the pool
-    2. Run auth steps (login)
+    2. Restore a saved session if the blueprint declares a session probe,
+       otherwise run auth steps (login)
     3. Detect MFA (if configured)
-    4. Extract data
-    5. Run cleanup steps (logout)
+    4. Extract data, visiting the blueprint's pages that serve requested fields
+    5. Run cleanup steps (logout), unless the session was saved for reuse
     6. Release the browser context
+
+    Steps tagged only with fields outside ``extract_fields`` are skipped
+    (see ``src.core.step_plan``). Fields with an ``api`` source are read from
+    captured XHR payloads, or from direct endpoint calls after the pages when
+    the blueprint opts into replay (see ``src.core.api_capture``).
+
+    Steps 2-5 run through the site's guard by ``deadline``; queueing for the
+    context in step 1 counts against ``deadline`` but not against the site.
     """
+    replay = bool(blueprint.api and blueprint.api.replay)
+    dom_fields, replay_defs = _split_api_fields(blueprint, extract_fields, replay)
+    plan = build_step_plan(blueprint, dom_fields)
+    if plan.skipped:
+        logger.info(
+            "Skipping steps for unrequested fields",
+            extra={"extra_data": {"site": site, "skipped": plan.skipped}},
+        )
+
     pool = await get_browser_pool()
     read_only_policy = ReadOnlyExecutionPolicy(enabled=settings.strict_read_only_mode)
-    pooled = await pool.acquire(
-        session_id,
-        proxy=proxy,
-        read_only_policy=read_only_policy if read_only_policy.enabled else None,
+    site_limit = settings.browser_site_max_contexts
+    if blueprint.rate_limit and blueprint.rate_limit.max_concurrent_sessions is not None:
+        site_limit = blueprint.rate_limit.max_concurrent_sessions
+    site_guard = get_site_guard(site)
+    site_limit = site_guard.concurrency_limit(site_limit)
+    request_filter = None
+    if blueprint.request_rules:
+        request_filter = RequestFilter.for_rules(blueprint.request_rules.block, blueprint.request_rules.allow)
+    api_capture = None
+    if blueprint.api and not replay:
+        api_capture = ApiCapture(blueprint.api.endpoints, site)
+    pooled = await _within(
+        deadline,
+        pool.acquire(
+            session_id,
+            proxy=proxy,
+            read_only_policy=read_only_policy if read_only_policy.enabled else None,
+            site=site,
+            site_limit=site_limit,
+            request_filter=request_filter,
+            api_capture=api_capture,
+        ),
     )
+    try:
+        return await site_guard.call(
+            lambda: _within(
+                deadline,
+                _run_browser_session(
+                    pooled,
+                    blueprint,
+                    site,
+                    username,
+                    password,
+                    session_id,
+                    plan,
+                    replay_defs,
+                    api_capture,
+                    read_only_policy,
+                    session_state_key,
+                    user_id,
+                ),
+            )
+        )
+    finally:
+        await pool.release(session_id)
+
+
+async def _run_browser_session(
+    pooled: PooledContext,
+    blueprint: BlueprintV2,
+    site: str,
+    username: str,
+    password: str,
+    session_id: str,
+    plan: StepPlan,
+    replay_defs: Dict[str, Union[ExtractionField, ListExtractionField]],
+    api_capture: Optional[ApiCapture],
+    read_only_policy: ReadOnlyExecutionPolicy,
+    session_state_key: Optional[str],
+    user_id: Optional[int],
+) -> dict:
+    """Steps 2-5 of ``_execute_blueprint`` in an acquired browser context."""
+    started = time.monotonic()
     page = None
+    session_probe = blueprint.auth.session_probe
+    reuse_session = bool(session_probe and session_state_key and user_id is not None)
+    session_reused = False
+    session_saved = False
 
     try:
         page = await pooled.context.new_page()
@@ -607,51 +1130,105 @@ async def _execute_blueprint(
 
         # ── Step 1: Authentication ────────────────────────────────────────────
         read_only_policy.set_phase(ExecutionPhase.AUTH)
-        logger.info(
-            "Executing auth steps",
-            extra={"extra_data": {"site": site, "steps": len(blueprint.auth.steps)}},
-        )
-        await executor.execute_steps(blueprint.auth.steps, context="auth")
-
-        # ── Step 2: MFA Detection ────────────────────────────────────────────
-        if blueprint.mfa:
-            read_only_policy.set_phase(ExecutionPhase.MFA)
-            mfa_result = await _handle_mfa(
-                page,
-                blueprint,
-                site,
-                session_id,
-                read_only_policy=read_only_policy if read_only_policy.enabled else None,
+        if reuse_session:
+            session_reused = await _restore_browser_session(
+                pooled.context, page, session_probe, site, session_state_key, user_id
             )
-            if mfa_result:
-                return mfa_result
+
+        if not session_reused:
+            logger.info(
+                "Executing auth steps",
+                extra={"extra_data": {"site": site, "steps": len(plan.auth_steps)}},
+            )
+            await executor.execute_steps(plan.auth_steps, context="auth")
+
+            # ── Step 2: MFA Detection ────────────────────────────────────────
+            if blueprint.mfa:
+                read_only_policy.set_phase(ExecutionPhase.MFA)
+                mfa_result = await _handle_mfa(
+                    page,
+                    blueprint,
+                    site,
+                    session_id,
+                    read_only_policy=read_only_policy if read_only_policy.enabled else None,
+                )
+                if mfa_result:
+                    return mfa_result
+
+        if reuse_session:
+            session_saved = await _save_browser_session(pooled.context, site, session_state_key, user_id)
 
         read_only_policy.set_phase(ExecutionPhase.READ)
 
         # ── Step 3: Data Extraction ───────────────────────────────────────────
-        extraction_defs = blueprint.extract
-        if extract_fields is not None:
-            extraction_defs = {k: v for k, v in extraction_defs.items() if k in extract_fields}
+        # Fields on the page auth ends on first, then each planned page after
+        # its navigation steps. Parallel pages run in their own tabs meanwhile.
+        max_tabs = settings.extraction_max_tabs
+        serial_pages = [(i, p) for i, p in enumerate(plan.pages) if not (p.parallel and max_tabs > 0)]
+        tab_pages = [(i, p) for i, p in enumerate(plan.pages) if p.parallel and max_tabs > 0]
+
+        async def run_serial() -> List[Tuple[int, _GroupResult]]:
+            results = [(-1, await _extract_group(page, executor, blueprint, site, "", [], plan.extract, api_capture))]
+            for index, planned in serial_pages:
+                result = await _extract_group(
+                    page,
+                    executor,
+                    blueprint,
+                    site,
+                    f"page:{planned.name}",
+                    planned.steps,
+                    planned.extract,
+                    api_capture,
+                )
+                results.append((index, result))
+            return results
+
+        async def run_tab(index: int, planned: PlannedPage) -> List[Tuple[int, _GroupResult]]:
+            async with tab_slots:
+                result = await _extract_in_tab(
+                    pooled.context, blueprint, site, planned, variables, read_only_policy, api_capture
+                )
+            return [(index, result)]
+
+        tab_slots = asyncio.Semaphore(max(1, max_tabs))
+        tasks = [asyncio.ensure_future(run_serial())]
+        tasks += [asyncio.ensure_future(run_tab(index, planned)) for index, planned in tab_pages]
+        try:
+            grouped = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         extracted_data: Dict[str, Any] = {}
         extraction_method = "none"
-
-        if extraction_defs:
+        extraction_timings: Dict[str, float] = {}
+        extraction_waits: List[Dict[str, Any]] = []
+        for _, result in sorted((item for results in grouped for item in results), key=lambda item: item[0]):
+            data, method, timings, waits = result
+            extracted_data.update(data)
+            extraction_method = method or extraction_method
+            extraction_timings.update(timings)
+            extraction_waits.extend(waits)
+
+        if replay_defs:
+            replayer = ApiReplayer(
+                blueprint.api.endpoints,
+                _context_json_fetcher(pooled.context, page, site),
+                read_only_policy=read_only_policy if read_only_policy.enabled else None,
+                site=site,
+            )
+            api_extractor = ApiExtractor(replayer)
             with span("engine.extract", **{"plaidify.site": site}):
-                if blueprint.is_llm_adaptive:
-                    extracted_data, extraction_method = await _extract_llm_adaptive(
-                        page=page,
-                        blueprint=blueprint,
-                        extraction_defs=extraction_defs,
-                        site=site,
-                    )
-                else:
-                    extractor = DataExtractor(page)
-                    extracted_data = await extractor.extract(extraction_defs, site=site)
-                    extraction_method = "css_selectors"
+                extracted_data.update(await api_extractor.extract(replay_defs, site=site))
+            extraction_timings.update(api_extractor.timings)
+            if extraction_method == "none":
+                extraction_method = "api_json"
 
         # ── Step 4: Cleanup (logout) ──────────────────────────────────────────
-        if blueprint.cleanup:
+        # A logout would invalidate the session just saved for reuse.
+        if blueprint.cleanup and not session_saved:
             read_only_policy.set_phase(ExecutionPhase.CLEANUP)
             try:
                 await executor.execute_steps(blueprint.cleanup, context="cleanup")
@@ -673,6 +1250,18 @@ async def _execute_blueprint(
         )
 
         response_metadata: Dict[str, Any] = {}
+        if session_reused:
+            response_metadata["session_reused"] = True
+        if plan.skipped:
+            response_metadata["skipped_steps"] = plan.skipped
+        if extraction_timings:
+            response_metadata["extraction_timings_ms"] = extraction_timings
+        step_waits = executor.waits + extraction_waits
+        if step_waits:
+            response_metadata["step_waits"] = step_waits
+        marks = current_watermarks()
+        if marks is not None and marks.latest:
+            response_metadata["incremental_lists"] = marks.to_metadata()
         if read_only_policy.enabled:
             response_metadata["read_only_policy"] = read_only_policy.to_metadata()
         if pooled.downloads:
@@ -686,6 +1275,7 @@ async def _execute_blueprint(
             ]
 
         metrics.record_extraction(site, "success")
+        get_site_guard(site).record_latency(time.monotonic() - started)
         return {
             "status": "connected",
             "data": extracted_data,
@@ -711,13 +1301,95 @@ async def _execute_blueprint(
         )
         raise ConnectionFailedError(site=site, detail=str(e)) from e
     finally:
-        # Always close the page and release the context
         if page:
             try:
                 await page.close()
             except Exception:
                 pass
-        await pool.release(session_id)
+
+
+# Sets the saved keys for the page's origin that the page has not set itself;
+# returns how many were set.
+_SEED_LOCAL_STORAGE = """(saved) => {
+    const items = saved[window.location.origin];
+    let seeded = 0;
+    for (const [k, v] of Object.entries(items || {})) {
+        if (window.localStorage.getItem(k) === null) {
+            window.localStorage.setItem(k, v);
+            seeded += 1;
+        }
+    }
+    return seeded;
+}"""
+
+
+async def _restore_browser_session(
+    context: Any,
+    page: Any,
+    probe: SessionProbeConfig,
+    site: str,
+    state_key: str,
+    user_id: int,
+) -> bool:
+    """Load a saved session into ``context`` and check that it is still logged in.
+
+    Returns True when the probe finds the logged-in selector, in which case the
+    auth steps can be skipped. On any failure the restored cookies and the
+    probe origin's localStorage are cleared so the normal login starts from a
+    clean context.
+    """
+    state = browser_sessions.load_browser_session(user_id, state_key)
+    if not state:
+        metrics.record_session_reuse(site, "missing")
+        return False
+
+    try:
+        cookies = state.get("cookies") or []
+        if cookies:
+            await context.add_cookies(cookies)
+        local_storage = {
+            origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            for origin in state.get("origins") or []
+            if origin.get("localStorage")
+        }
+
+        await page.goto(probe.url)
+        # Seed once on the probe page rather than with an init script, which
+        # would keep re-injecting the saved keys if the full login runs after
+        # a failed probe. Reload so the app starts with the restored keys.
+        if local_storage and await page.evaluate(_SEED_LOCAL_STORAGE, local_storage):
+            await page.reload()
+        await page.wait_for_selector(probe.logged_in_selector, timeout=probe.timeout)
+    except Exception as e:
+        logger.info(
+            "Saved session no longer valid, running full auth",
+            extra={"extra_data": {"site": site, "error": str(e)}},
+        )
+        metrics.record_session_reuse(site, "expired")
+        browser_sessions.discard_browser_session(state_key)
+        try:
+            await context.clear_cookies()
+            await page.evaluate("() => window.localStorage.clear()")
+        except Exception:
+            pass
+        return False
+
+    logger.info("Reusing saved browser session", extra={"extra_data": {"site": site}})
+    metrics.record_session_reuse(site, "reused")
+    return True
+
+
+async def _save_browser_session(context: Any, site: str, state_key: str, user_id: int) -> bool:
+    """Persist the context's current storage state for the next run (best-effort)."""
+    try:
+        state = await context.storage_state()
+    except Exception as e:
+        logger.warning(
+            "Could not capture browser session state",
+            extra={"extra_data": {"site": site, "error": str(e)}},
+        )
+        return False
+    return browser_sessions.save_browser_session(user_id, state_key, state)
 
 
 async def _handle_mfa(
@@ -833,7 +1505,8 @@ def load_python_connectors(connectors_dir: str) -> Dict[str, Type[BaseConnector]
     Dynamically load all Python connector classes from the connectors directory.
 
     Scans for files matching *_connector.py and imports classes that
-    inherit from BaseConnector.
+    inherit from BaseConnector. Modules are imported once and re-imported
+    only when the file changes (see ``BlueprintRegistry``).
 
     Args:
         connectors_dir: Absolute path to the connectors directory.
@@ -841,40 +1514,4 @@ def load_python_connectors(connectors_dir: str) -> Dict[str, Type[BaseConnector]
     Returns:
         Dict mapping module names to connector classes.
     """
-    connectors: Dict[str, Type[BaseConnector]] = {}
-
-    if not os.path.isdir(connectors_dir):
-        logger.warning(
-            "Connectors directory not found",
-            extra={"extra_data": {"path": connectors_dir}},
-        )
-        return connectors
-
-    for file in os.listdir(connectors_dir):
-        if not file.endswith("_connector.py"):
-            continue
-
-        module_name = file[:-3]
-        module_path = os.path.join(connectors_dir, file)
-
-        try:
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                for attr in dir(module):
-                    obj = getattr(module, attr)
-                    if isinstance(obj, type) and issubclass(obj, BaseConnector) and obj is not BaseConnector:
-                        connectors[module_name] = obj
-                        logger.debug(
-                            "Loaded connector",
-                            extra={"extra_data": {"name": module_name}},
-                        )
-        except Exception as e:
-            logger.error(
-                "Failed to load connector",
-                extra={"extra_data": {"file": file, "error": str(e)}},
-            )
-
-    return connectors
+    return get_blueprint_registry(connectors_dir).python_connectors()
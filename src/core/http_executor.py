@@ -0,0 +1,392 @@
+"""
+HTTP execution mode — run server-rendered blueprints without a browser.
+
+Many portals render their login form and statement pages on the server, yet
+every connection used to cost a Chromium context. A blueprint with
+``execution_mode: "http"`` is instead driven over plain HTTP:
+
+- ``goto`` fetches the page with an ``httpx`` client whose cookie jar carries
+  the session;
+- ``fill`` / ``select`` record values for the form the element belongs to;
+- ``click`` follows a link (``<a href>``) or submits the enclosing form with
+  every successful control — hidden CSRF inputs included — the way a browser
+  would;
+- ``wait`` with a selector checks the current response for it; timed waits,
+  ``wait_for_navigation``, ``scroll`` and ``screenshot`` are no-ops;
+- extract fields run their CSS selectors against the response HTML
+  (BeautifulSoup + soupsieve) and reuse the browser path's transform plans.
+  List pagination follows the next link's ``href``.
+
+Anything that needs a real browser — ``execute_js``, ``iframe``, a click on
+an element that is neither a link nor a submit control, a Playwright-only
+selector, a next-page button without an ``href`` — raises
+:class:`HttpModeUnsupported`, and the engine reruns the connection in the
+browser. Other failures are not retried there: a missing post-login selector
+usually means the credentials were rejected, and a second login attempt
+would only bring the account closer to lockout. The strict read-only policy applies as in the browser: post-auth
+``fill`` / ``select`` steps, risky clicks and form submissions are blocked.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+import httpx
+from bs4 import BeautifulSoup, Tag
+from soupsieve import SelectorSyntaxError
+
+from src.core.blueprint import BlueprintStep, ExtractionField, ListExtractionField, StepAction
+from src.core.data_extractor import DataExtractor, plan_for
+from src.core.read_only_policy import ReadOnlyExecutionPolicy
+from src.core.watermarks import take_rows
+from src.exceptions import (
+    ConnectionFailedError,
+    DataExtractionError,
+    ReadOnlyPolicyViolationError,
+    SiteUnavailableError,
+)
+from src.logging_config import get_logger
+
+logger = get_logger("http_executor")
+
+#: Transport errors that mean the site is unreachable (not a rejected request).
+SITE_DOWN_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+_SUBMIT_INPUT_TYPES = {"submit", "image"}
+_SKIPPED_INPUT_TYPES = {"submit", "image", "button", "reset", "file"}
+
+
+class HttpModeUnsupported(Exception):
+    """A step, selector or page needs a real browser."""
+
+
+@dataclass
+class _FormSubmission:
+    """Request-shaped view of a form post for ``ReadOnlyExecutionPolicy.evaluate_request``."""
+
+    method: str
+    headers: Dict[str, str] = field(default_factory=lambda: {"content-type": "application/x-www-form-urlencoded"})
+
+    def is_navigation_request(self) -> bool:
+        return True
+
+
+def _text(element: Tag) -> str:
+    """Whitespace-collapsed text, close to what ``inner_text()`` returns."""
+    return " ".join(element.get_text(" ").split())
+
+
+def _form_data(form: Tag, values: Dict[str, str], submitter: Optional[Tag]) -> List[Tuple[str, str]]:
+    """The form's successful controls, with filled ``values`` replacing theirs."""
+    data: List[Tuple[str, str]] = []
+    for control in form.find_all(["input", "select", "textarea"]):
+        name = control.get("name")
+        if not name or control.has_attr("disabled") or name in values:
+            continue
+        if control.name == "input":
+            kind = (control.get("type") or "text").lower()
+            if kind in _SKIPPED_INPUT_TYPES:
+                continue
+            if kind in ("checkbox", "radio"):
+                if not control.has_attr("checked"):
+                    continue
+                data.append((name, control.get("value", "on")))
+            else:
+                data.append((name, control.get("value", "")))
+        elif control.name == "select":
+            option = control.find("option", selected=True) or control.find("option")
+            if option is not None:
+                data.append((name, option.get("value", _text(option))))
+        else:
+            data.append((name, control.get_text()))
+    data.extend(values.items())
+    if submitter is not None and submitter.get("name"):
+        data.append((submitter["name"], submitter.get("value", "")))
+    return data
+
+
+class HttpStepExecutor:
+    """Executes blueprint steps as HTTP requests, mirroring ``StepExecutor``.
+
+    ``document`` is the parsed HTML of the last response and ``url`` its final
+    URL (after redirects); ``requests`` counts the requests made.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        variables: Dict[str, str],
+        *,
+        read_only_policy: Optional[ReadOnlyExecutionPolicy] = None,
+        site: str = "unknown",
+    ) -> None:
+        self.client = client
+        self.variables = variables
+        self.read_only_policy = read_only_policy
+        self.site = site
+        self.url: Optional[str] = None
+        self.document: Optional[BeautifulSoup] = None
+        self.requests = 0
+        # Same shape as StepExecutor.waits; HTTP steps never wait on a page.
+        self.waits: List[Dict[str, Any]] = []
+        self._form_values: Dict[int, Dict[str, str]] = {}
+
+    def _interpolate(self, value: Optional[str]) -> Optional[str]:
+        """Replace {{variable}} placeholders with actual values."""
+        if value is None:
+            return None
+
+        def replacer(match):
+            key = match.group(1).strip()
+            return self.variables.get(key, match.group(0))
+
+        return re.sub(r"\{\{(\w+)\}\}", replacer, value)
+
+    async def execute_steps(self, steps: List[BlueprintStep], context: str = "auth") -> None:
+        """Execute steps in order.
+
+        Raises:
+            HttpModeUnsupported: If a step needs a browser.
+            ConnectionFailedError: If a step fails (element missing, HTTP error).
+            SiteUnavailableError: If the site answers with a 5xx.
+            ReadOnlyPolicyViolationError: If the read-only policy blocks a step.
+        """
+        for i, step in enumerate(steps):
+            step_label = f"{context}[{i}] {step.action.value}"
+            logger.debug(
+                f"Executing HTTP step: {step_label}",
+                extra={"extra_data": {"step": i, "action": step.action.value}},
+            )
+            try:
+                await self._execute_step(step)
+            except (HttpModeUnsupported, ConnectionFailedError, SiteUnavailableError, ReadOnlyPolicyViolationError):
+                raise
+            except SITE_DOWN_ERRORS as e:
+                raise SiteUnavailableError(self.site, detail=f"Step '{step_label}' failed: {e}") from e
+            except httpx.HTTPError as e:
+                raise ConnectionFailedError(site=self.site, detail=f"Step '{step_label}' failed: {e}") from e
+
+    async def _execute_step(self, step: BlueprintStep) -> None:
+        self._enforce_step_policy(step)
+        handlers = {
+            StepAction.GOTO: self._step_goto,
+            StepAction.FILL: self._step_fill,
+            StepAction.SELECT: self._step_fill,
+            StepAction.CLICK: self._step_click,
+            StepAction.WAIT: self._step_wait,
+            StepAction.CONDITIONAL: self._step_conditional,
+        }
+        if step.action in (StepAction.WAIT_FOR_NAVIGATION, StepAction.SCROLL, StepAction.SCREENSHOT):
+            return  # Responses are complete documents; nothing to wait for or render.
+        handler = handlers.get(step.action)
+        if handler is None:
+            raise HttpModeUnsupported(f"'{step.action.value}' steps need a browser")
+        await handler(step)
+
+    def _enforce_step_policy(self, step: BlueprintStep) -> None:
+        if not self.read_only_policy:
+            return
+        reason = self.read_only_policy.evaluate_step(step)
+        if reason:
+            self.read_only_policy.record_blocked(step.action.value, reason, target=step.selector or step.url)
+            raise ReadOnlyPolicyViolationError(reason)
+
+    # ── Documents ────────────────────────────────────────────────────────────
+
+    async def fetch(self, method: str, url: str, **kwargs: Any) -> None:
+        """Request ``url`` (relative to the current page) and parse the response."""
+        target = urljoin(self.url or "", url)
+        response = await self.client.request(method, target, **kwargs)
+        self.requests += 1
+        if response.status_code >= 500:
+            raise SiteUnavailableError(self.site, detail=f"HTTP {response.status_code} from {target}")
+        if response.status_code >= 400:
+            raise ConnectionFailedError(site=self.site, detail=f"HTTP {response.status_code} from {target}")
+        self.url = str(response.url)
+        self.document = BeautifulSoup(response.text, "lxml")
+        self._form_values = {}
+
+    def select_one(self, selector: str) -> Optional[Tag]:
+        return self.select(selector, first=True)
+
+    def select(self, selector: str, *, first: bool = False, root: Optional[Tag] = None) -> Any:
+        """CSS-select in the current document (or ``root``)."""
+        scope = root if root is not None else self.document
+        if scope is None:
+            raise ConnectionFailedError(site=self.site, detail="No page loaded before a selector step")
+        try:
+            return scope.select_one(selector) if first else scope.select(selector)
+        except SelectorSyntaxError as e:
+            raise HttpModeUnsupported(f"selector '{selector}' is not plain CSS") from e
+
+    def _require(self, selector: Optional[str]) -> Tag:
+        element = self.select_one(self._interpolate(selector) or "")
+        if element is None:
+            raise ConnectionFailedError(site=self.site, detail=f"Selector '{selector}' not found in {self.url}")
+        return element
+
+    # ── Step Handlers ────────────────────────────────────────────────────────
+
+    async def _step_goto(self, step: BlueprintStep) -> None:
+        url = self._interpolate(step.url)
+        if not url:
+            raise ConnectionFailedError(site=self.site, detail="goto step requires a 'url'.")
+        await self.fetch("GET", url)
+
+    async def _step_fill(self, step: BlueprintStep) -> None:
+        element = self._require(step.selector)
+        form = element.find_parent("form")
+        name = element.get("name")
+        if form is None or not name:
+            raise HttpModeUnsupported(f"'{step.selector}' is not a named control inside a form")
+        self._form_values.setdefault(id(form), {})[name] = self._interpolate(step.value) or ""
+
+    async def _step_click(self, step: BlueprintStep) -> None:
+        element = self._require(step.selector)
+        if self.read_only_policy:
+            reason = self.read_only_policy.evaluate_click(
+                step.selector or "", {"text": _text(element), "value": element.get("value")}
+            )
+            if reason:
+                self.read_only_policy.record_blocked("click", reason, target=step.selector)
+                raise ReadOnlyPolicyViolationError(reason)
+
+        if element.name == "a" and element.get("href"):
+            await self.fetch("GET", element["href"])
+            return
+        form = element if element.name == "form" else element.find_parent("form")
+        kind = (element.get("type") or "submit").lower()
+        is_submitter = (element.name == "button" and kind == "submit") or (
+            element.name == "input" and kind in _SUBMIT_INPUT_TYPES
+        )
+        if form is None or not (is_submitter or element is form):
+            raise HttpModeUnsupported(f"click on '{step.selector}' is neither a link nor a form submission")
+        await self._submit(form, element if is_submitter else None)
+
+    async def _submit(self, form: Tag, submitter: Optional[Tag]) -> None:
+        method = (form.get("method") or "get").upper()
+        if self.read_only_policy:
+            reason = self.read_only_policy.evaluate_request(_FormSubmission(method))
+            if reason:
+                self.read_only_policy.record_blocked("form_submit", reason, target=form.get("action"))
+                raise ReadOnlyPolicyViolationError(reason)
+        data: Dict[str, List[str]] = {}
+        for name, value in _form_data(form, self._form_values.get(id(form), {}), submitter):
+            data.setdefault(name, []).append(value)
+        action = form.get("action") or self.url or ""
+        if method == "POST":
+            await self.fetch("POST", action, data=data)
+        else:
+            await self.fetch("GET", action, params=data)
+
+    async def _step_wait(self, step: BlueprintStep) -> None:
+        if step.selector:
+            self._require(step.selector)
+
+    async def _step_conditional(self, step: BlueprintStep) -> None:
+        if not step.condition_selector:
+            return
+        present = self.select_one(self._interpolate(step.condition_selector)) is not None
+        branch = step.then_steps if present else step.else_steps
+        if branch:
+            await self.execute_steps(branch, context="conditional")
+
+
+class HtmlExtractor:
+    """Extracts blueprint fields from the HTTP executor's current document.
+
+    Same results as ``DataExtractor`` for server-rendered pages: scalars
+    first, then lists; a missing field falls back to its default or raises
+    ``DataExtractionError``.
+    """
+
+    def __init__(self, executor: HttpStepExecutor) -> None:
+        self.executor = executor
+        self.timings: Dict[str, float] = {}
+        self.waits: List[Dict[str, Any]] = []
+
+    async def extract(
+        self,
+        fields: Dict[str, Union[ExtractionField, ListExtractionField]],
+        site: str = "unknown",
+    ) -> Dict[str, Any]:
+        started = time.monotonic()
+        self.timings = {}
+        self.waits = []
+        result: Dict[str, Any] = {}
+        ordered = sorted(fields.items(), key=lambda item: isinstance(item[1], ListExtractionField))
+        for name, field_def in ordered:
+            try:
+                if isinstance(field_def, ListExtractionField):
+                    result[name] = await self._extract_list(field_def, name)
+                else:
+                    result[name] = self._extract_field(field_def, name, site)
+            except (DataExtractionError, HttpModeUnsupported):
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"HTTP extraction failed for {name}: {e}",
+                    extra={"extra_data": {"field": name, "error": str(e)}},
+                )
+                result[name] = field_def.default if isinstance(field_def, ExtractionField) else None
+            self.timings[name] = round((time.monotonic() - started) * 1000, 1)
+        return {name: result[name] for name in fields}
+
+    @staticmethod
+    def _raw(element: Tag, field_def: ExtractionField) -> str:
+        if field_def.attribute:
+            return element.get(field_def.attribute) or ""
+        return _text(element)
+
+    def _extract_field(self, field_def: ExtractionField, name: str, site: str) -> Any:
+        if not field_def.selector:
+            raise HttpModeUnsupported(f"field '{name}' has no selector")
+        element = self.executor.select_one(field_def.selector)
+        if element is None:
+            return DataExtractor._missing(field_def, name, site)
+        return plan_for(field_def).apply(self._raw(element, field_def))
+
+    async def _extract_list(self, field_def: ListExtractionField, name: str) -> List[Dict[str, Any]]:
+        if not field_def.selector:
+            raise HttpModeUnsupported(f"list '{name}' has no selector")
+        return await take_rows(self.iter_list(field_def, name), field_def, name)
+
+    async def iter_list(self, field_def: ListExtractionField, name: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a list's rows; the next page is fetched only when its rows are wanted."""
+        max_pages = field_def.pagination.max_pages if field_def.pagination else 1
+        for page_num in range(max_pages):
+            raw_rows = []
+            for row in self.executor.select(field_def.selector):
+                raw: Dict[str, Optional[str]] = {}
+                for col_name, col_def in field_def.fields.items():
+                    cell = self.executor.select(col_def.selector, first=True, root=row) if col_def.selector else None
+                    raw[col_name] = None if cell is None else self._raw(cell, col_def)
+                raw_rows.append(raw)
+            if not raw_rows:
+                return
+            for row_data in DataExtractor._finish_rows(field_def, raw_rows):
+                yield row_data
+            if page_num == max_pages - 1 or not await self._next_page(field_def, name, page_num):
+                return
+
+    async def _next_page(self, field_def: ListExtractionField, name: str, page_num: int) -> bool:
+        next_link = self.executor.select_one(field_def.pagination.next_selector)
+        if next_link is None or next_link.has_attr("disabled"):
+            return False
+        href = next_link.get("href")
+        if not href:
+            raise HttpModeUnsupported(f"'{name}' pagination needs a browser (next control has no href)")
+        started = time.monotonic()
+        await self.executor.fetch("GET", href)
+        self.waits.append(
+            {
+                "step": f"{name} page {page_num + 2}",
+                "signal": "http",
+                "wait_ms": round((time.monotonic() - started) * 1000, 1),
+            }
+        )
+        return True
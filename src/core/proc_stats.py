@@ -0,0 +1,97 @@
+"""Process and memory sampling from ``/proc``.
+
+Used by the browser pool to watch Chromium and host memory. Every helper degrades to
+``None``/``0`` on platforms without procfs so callers can treat the numbers as
+advisory.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+_PROC = "/proc"
+
+
+def _page_size() -> int:
+    try:
+        return os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):  # pragma: no cover - non-POSIX
+        return 4096
+
+
+def _pids() -> list[int]:
+    try:
+        return [int(name) for name in os.listdir(_PROC) if name.isdigit()]
+    except OSError:
+        return []
+
+
+def _parent_pid(pid: int) -> Optional[int]:
+    try:
+        with open(f"{_PROC}/{pid}/stat", "rb") as handle:
+            raw = handle.read().decode(errors="replace")
+    except OSError:
+        return None
+    # The command name is wrapped in parentheses and may itself contain spaces
+    # or parentheses, so split after the last ')'.
+    fields = raw[raw.rfind(")") + 2 :].split()
+    try:
+        return int(fields[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def find_pid_by_cmdline(marker: str) -> Optional[int]:
+    """Return the lowest pid whose command line contains ``marker``."""
+    needle = marker.encode()
+    for pid in sorted(_pids()):
+        try:
+            with open(f"{_PROC}/{pid}/cmdline", "rb") as handle:
+                if needle in handle.read():
+                    return pid
+        except OSError:
+            continue
+    return None
+
+
+def process_rss_bytes(pid: int) -> int:
+    """Resident set size of a single process, or 0 if it cannot be read."""
+    try:
+        with open(f"{_PROC}/{pid}/statm") as handle:
+            return int(handle.read().split()[1]) * _page_size()
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def process_tree_rss_bytes(root_pid: int) -> int:
+    """Summed resident set size of ``root_pid`` and all of its descendants."""
+    children: dict[int, list[int]] = {}
+    for pid in _pids():
+        parent = _parent_pid(pid)
+        if parent is not None:
+            children.setdefault(parent, []).append(pid)
+
+    total = 0
+    stack = [root_pid]
+    seen: set[int] = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += process_rss_bytes(pid)
+        stack.extend(children.get(pid, ()))
+    return total
+
+
+def system_available_memory_bytes() -> Optional[int]:
+    """``MemAvailable`` from ``/proc/meminfo``, or None if it cannot be read."""
+    try:
+        with open(f"{_PROC}/meminfo") as handle:
+            for line in handle:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
@@ -66,10 +66,22 @@ class ReadOnlyExecutionPolicy:
     enabled: bool = True
     phase: ExecutionPhase = ExecutionPhase.AUTH
     blocked_actions: list[BlockedAction] = field(default_factory=list)
+    pending_tabs: int = 0
 
     def set_phase(self, phase: ExecutionPhase) -> None:
         self.phase = phase
 
+    def expect_tab(self) -> None:
+        """Announce a tab the engine itself is about to open during the read phase."""
+        self.pending_tabs += 1
+
+    def claim_tab(self) -> bool:
+        """Let one announced engine tab past the extra-page guard."""
+        if self.pending_tabs <= 0:
+            return False
+        self.pending_tabs -= 1
+        return True
+
     def record_blocked(self, action: str, reason: str, target: Optional[str] = None) -> None:
         self.blocked_actions.append(
             BlockedAction(
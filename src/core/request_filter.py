@@ -0,0 +1,162 @@
+"""
+Compiled request-blocking rules for browser contexts.
+
+The pool's route handler sees every request of every page, so the blocking
+decision has to be cheap. A ``RequestFilter`` compiles its rules once:
+
+- bare host names (``doubleclick.net``) go into a host-suffix trie, so
+  ``stats.g.doubleclick.net`` matches in one walk over its labels;
+- URL patterns (anything with ``/`` or ``*``) are folded into one combined
+  regex (``*`` is a wildcard, everything else is literal);
+- resource types are a set lookup.
+
+Allow rules win over every block rule, so a blueprint can re-enable a
+stylesheet or a tracker host its site cannot work without. Blueprints add
+their own lists via ``request_rules`` (see ``RequestRulesConfig``).
+
+With ``BROWSER_NATIVE_BLOCKING`` the default blocks are also pushed down into
+Chromium itself (see :func:`native_block_args`).
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+# Resource types to block for performance
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "facebook.net",
+    "doubleclick.net",
+    "hotjar.com",
+    "mixpanel.com",
+    "segment.io",
+    "amplitude.com",
+)
+
+_TERMINAL = ""
+
+
+class HostSuffixTrie:
+    """Set of host suffixes matched label by label from the right."""
+
+    def __init__(self, hosts: Iterable[str] = ()) -> None:
+        self._root: dict = {}
+        self._hosts: list[str] = []
+        for host in hosts:
+            self.add(host)
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+    @property
+    def hosts(self) -> tuple[str, ...]:
+        return tuple(self._hosts)
+
+    def add(self, host: str) -> None:
+        host = host.strip().lower().lstrip(".")
+        if not host:
+            return
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.setdefault(label, {})
+        node[_TERMINAL] = True
+        self._hosts.append(host)
+
+    def matches(self, host: str) -> bool:
+        """True if ``host`` equals, or is a subdomain of, any stored suffix."""
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+
+def _is_host_rule(rule: str) -> bool:
+    return "/" not in rule and "*" not in rule and ":" not in rule
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    parts = [".*".join(re.escape(piece) for piece in p.lower().split("*")) for p in patterns]
+    return re.compile("|".join(parts)) if parts else None
+
+
+class RequestFilter:
+    """Compiled block/allow decision for browser requests."""
+
+    def __init__(
+        self,
+        *,
+        block: Iterable[str] = (),
+        allow: Iterable[str] = (),
+        blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+    ) -> None:
+        block = [r.strip() for r in block if r and r.strip()]
+        allow = [r.strip() for r in allow if r and r.strip()]
+        self._block_hosts = HostSuffixTrie(r for r in block if _is_host_rule(r))
+        self._block_patterns = [r for r in block if not _is_host_rule(r)]
+        self._block_regex = _compile_patterns(self._block_patterns)
+        self._allow_hosts = HostSuffixTrie(r for r in allow if _is_host_rule(r))
+        self._allow_regex = _compile_patterns(r for r in allow if not _is_host_rule(r))
+        self._blocked_types = frozenset(blocked_resource_types)
+
+    @classmethod
+    def default(cls) -> RequestFilter:
+        return _default_filter()
+
+    @classmethod
+    def for_rules(cls, block: Iterable[str] = (), allow: Iterable[str] = ()) -> RequestFilter:
+        """The default rules plus a blueprint's extra block and allow lists (cached)."""
+        return _filter_for_rules(tuple(block), tuple(allow))
+
+    def is_allowed(self, url: str, host: str) -> bool:
+        if self._allow_hosts and self._allow_hosts.matches(host):
+            return True
+        return bool(self._allow_regex and self._allow_regex.search(url))
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request should be aborted."""
+        url = url.lower()
+        host = urlsplit(url).hostname or ""
+        if (self._allow_hosts or self._allow_regex) and self.is_allowed(url, host):
+            return False
+        if resource_type in self._blocked_types:
+            return True
+        if host and self._block_hosts.matches(host):
+            return True
+        return bool(self._block_regex and self._block_regex.search(url))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_filter() -> RequestFilter:
+    return RequestFilter(block=DEFAULT_BLOCKED_HOSTS)
+
+
+@functools.lru_cache(maxsize=256)
+def _filter_for_rules(block: tuple[str, ...], allow: tuple[str, ...]) -> RequestFilter:
+    if not block and not allow:
+        return _default_filter()
+    return RequestFilter(block=(*DEFAULT_BLOCKED_HOSTS, *block), allow=allow)
+
+
+def native_block_args(blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES) -> list[str]:
+    """Chromium switches that enforce the default blocks inside the browser.
+
+    Images are never requested when Blink has them disabled, so they never
+    reach the Python route handler, and the default tracker hosts fail DNS
+    resolution even for contexts that are not routed. Both apply to the whole
+    browser, so blueprint allow rules cannot re-enable them.
+    """
+    args = []
+    if "image" in blocked_resource_types:
+        args.append("--blink-settings=imagesEnabled=false")
+    rules = ", ".join(f"MAP {host} ~NOTFOUND, MAP *.{host} ~NOTFOUND" for host in DEFAULT_BLOCKED_HOSTS)
+    args.append(f"--host-resolver-rules={rules}")
+    return args
@@ -6,7 +6,15 @@ subsequent requests can skip the LLM entirely and use deterministic CSS extracti
 If cached selectors fail N times, they're invalidated and the LLM re-runs.
 
 Cache key: (domain, page_hash) where page_hash is derived from the URL path
-and structural DOM signature (not content, since balances change).
+and structural DOM signature (not content, since balances change):
+
+- the path is templated — numeric and opaque segments such as account ids,
+  UUIDs and session tokens become ``*`` — so ``/accounts/839201/summary``
+  and ``/accounts/118734/summary`` share an entry;
+- ``dom_simplifier.dom_fingerprint`` of the page, when given, is part of the
+  key (``key_mode="path+fingerprint"``) or replaces the path entirely
+  (``"fingerprint"``), so a redesigned page misses the cache at once instead
+  of failing ``MAX_FAILURES`` times on stale selectors.
 
 Usage:
     cache = SelectorCache()
@@ -16,18 +24,46 @@ Usage:
     else:
         # Run LLM extraction, then cache
         cache.put("hydroone.com", "/dashboard", selectors, confidence=0.95)
+
+    # Keyed by page structure as well
+    fingerprint = dom_fingerprint(simplified_dom)
+    entry = cache.get("hydroone.com", "/accounts/839201", fingerprint=fingerprint)
+
+Persistence is write-behind: mutations only mark the entry dirty, and a
+background thread appends the dirty entries to ``<persist_path>.journal``
+(one JSON line per entry, batched every ``flush_interval`` seconds and
+fsynced). After ``compact_after`` journal records the thread folds them
+into the ``persist_path`` snapshot, written to a temp file and swapped in
+with ``os.replace``. Startup loads the snapshot, replays the journal
+(ignoring a torn last line) and compacts. Lookups and hit/failure counts
+never touch the disk on the caller's thread.
+
+``SharedSelectorCache`` (``SELECTOR_CACHE_BACKEND=redis``) shares entries
+across workers instead: Redis holds versioned entries with atomically
+updated counters, each process fronts it with a bounded LRU, and
+re-learned or failing selectors are evicted from every LRU through a
+pub/sub broadcast — so a page template is learned once per fleet rather
+than once per process.
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import os
+import re
+import threading
 import time
+import uuid
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.logging_config import get_logger
+from src.metrics import record_selector_cache
 
 logger = get_logger("selector_cache")
 
@@ -35,6 +71,15 @@ logger = get_logger("selector_cache")
 
 DEFAULT_TTL = 86400 * 7  # 7 days
 MAX_FAILURES = 3  # Invalidate after this many consecutive failures
+KEY_MODES = ("path", "fingerprint", "path+fingerprint")
+DEFAULT_FLUSH_INTERVAL = 1.0  # Seconds of mutations batched into one journal write
+COMPACT_AFTER = 1000  # Journal records folded into the snapshot at a time
+
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+_HEX_ID = re.compile(r"(?=[a-f]*\d)[0-9a-f]{8,}", re.IGNORECASE)
+_TOKEN = re.compile(r"(?=(?:\D*\d){2})(?=.*[A-Za-z])[A-Za-z0-9_~.=%+-]{16,}")
+# A lowercase word of three or more letters, optionally capitalised.
+_WORD = re.compile(r"[A-Z]?[a-z]{3,}")
 
 
 # ── Data Classes ──────────────────────────────────────────────────────────────
@@ -54,6 +99,7 @@ class CacheEntry:
     last_failure_at: Optional[float] = None
     last_success_at: Optional[float] = None
     hit_count: int = 0
+    fingerprint: Optional[str] = None
 
     @property
     def is_expired(self) -> bool:
@@ -88,6 +134,7 @@ class CacheEntry:
             "last_failure_at": self.last_failure_at,
             "last_success_at": self.last_success_at,
             "hit_count": self.hit_count,
+            "fingerprint": self.fingerprint,
         }
 
     @classmethod
@@ -103,48 +150,283 @@ class CacheEntry:
             last_failure_at=data.get("last_failure_at"),
             last_success_at=data.get("last_success_at"),
             hit_count=data.get("hit_count", 0),
+            fingerprint=data.get("fingerprint"),
         )
 
 
 # ── Cache Key ─────────────────────────────────────────────────────────────────
 
 
-def make_cache_key(domain: str, page_path: str) -> str:
-    """Generate a deterministic cache key from domain + page path."""
-    normalized = f"{domain.lower().strip()}/{page_path.strip('/')}"
+def _is_opaque_segment(segment: str) -> bool:
+    """Whether a path segment is an identifier rather than part of the route."""
+    digits = sum(char.isdigit() for char in segment)
+    return bool(
+        segment.isdigit()
+        or (digits >= 4 and digits * 2 >= len(segment))  # acct-839201, 12-3456
+        or _UUID.fullmatch(segment)
+        or _HEX_ID.fullmatch(segment)
+        or (_TOKEN.fullmatch(segment) and not _is_worded(segment))
+    )
+
+
+def _is_worded(segment: str) -> bool:
+    """Whether most letters of ``segment`` form words, as in a route slug.
+
+    ``billing-history-2024-q1`` and ``WelcomePage2023v2`` are worded; the
+    letters of a random token rarely run to three lowercase in a row.
+    """
+    letters = sum(char.isalpha() for char in segment)
+    return sum(len(word) for word in _WORD.findall(segment)) * 2 >= letters
+
+
+def template_path(page_path: str) -> str:
+    """Collapse numeric and opaque path segments (ids, UUIDs, tokens) to ``*``.
+
+    ``;jsessionid=...``-style matrix parameters are dropped.
+    """
+    segments = [segment.split(";", 1)[0] for segment in page_path.strip("/").split("/")]
+    return "/".join("*" if _is_opaque_segment(segment) else segment for segment in segments)
+
+
+def make_cache_key(domain: str, page_path: str, fingerprint: Optional[str] = None) -> str:
+    """Generate a deterministic cache key from domain + templated page path (+ DOM fingerprint)."""
+    normalized = f"{domain.lower().strip()}/{template_path(page_path)}"
+    if fingerprint:
+        normalized += f"#{fingerprint}"
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
 
+# ── Persistence ───────────────────────────────────────────────────────────────
+
+
+class _Journal:
+    """Write-behind snapshot + append-only journal for a SelectorCache.
+
+    ``record``/``delete``/``clear`` only touch an in-memory batch; a daemon
+    thread writes it out. ``_state`` mirrors what is on disk so compaction
+    never reads the live cache.
+    """
+
+    def __init__(self, path: str, flush_interval: float, compact_after: int) -> None:
+        self.snapshot_path = Path(path)
+        self.journal_path = Path(f"{path}.journal")
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+        self._pending: Dict[str, Optional[CacheEntry]] = {}  # None = deleted
+        self._cleared = False
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._journal_records = 0
+        self._snapshot_stale = False
+
+    # Called on the cache's thread
+
+    def load(self) -> Dict[str, CacheEntry]:
+        """Snapshot plus journal; compacts so new records never follow a torn line."""
+        state: Dict[str, Dict[str, Any]] = {}
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.snapshot_path.exists():
+            try:
+                state = json.loads(self.snapshot_path.read_text())
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Failed to load cache snapshot from disk: %s", e)
+                self._snapshot_stale = True  # rewritten on the first flush
+        replayed = 0
+        journaled = self.journal_path.exists() and self.journal_path.stat().st_size > 0
+        if journaled:
+            with self.journal_path.open(encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        _apply(state, json.loads(line))
+                    except (json.JSONDecodeError, KeyError):
+                        logger.warning("Ignoring torn selector cache journal tail after %d records", replayed)
+                        break
+                    replayed += 1
+        store: Dict[str, CacheEntry] = {}
+        for key, entry_data in state.items():
+            try:
+                store[key] = CacheEntry.from_dict(entry_data)
+            except (KeyError, TypeError) as e:
+                logger.warning("Dropping unreadable cache entry %s: %s", key, e)
+        self._state = {key: state[key] for key in store}
+        if journaled:
+            with self._io_lock:
+                self._compact()
+        if store:
+            logger.info("Loaded %d cache entries from disk (%d journal records)", len(store), replayed)
+        return store
+
+    def record(self, key: str, entry: Optional[CacheEntry]) -> None:
+        with self._lock:
+            self._pending[key] = entry
+        self._schedule()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._cleared = True
+        self._schedule()
+
+    def close(self) -> None:
+        """Stop the writer thread and write whatever is still pending."""
+        self._closed.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _schedule(self) -> None:
+        if self._thread is None and not self._closed.is_set():
+            self._thread = threading.Thread(target=self._run, name="selector-cache-journal", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    # Called on the writer thread (or by flush/close)
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait()
+            self._closed.wait(self.flush_interval)  # batch what arrives meanwhile
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the pending batch to the journal, compacting when it is long."""
+        with self._io_lock:  # batches reach the disk in the order they were taken
+            with self._lock:
+                batch, cleared = self._pending, self._cleared
+                self._pending, self._cleared = {}, False
+            records: List[Dict[str, Any]] = [{"op": "clear"}] if cleared else []
+            for key, entry in batch.items():
+                if entry is None:
+                    records.append({"op": "del", "key": key})
+                else:
+                    records.append({"op": "put", "key": key, "entry": entry.to_dict()})
+            for record in records:
+                _apply(self._state, record)
+            if records and not self._snapshot_stale:
+                try:
+                    with self.journal_path.open("a", encoding="utf-8") as journal:
+                        journal.write("".join(json.dumps(record) + "\n" for record in records))
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                    self._journal_records += len(records)
+                except OSError as e:
+                    # _state has the batch; the next snapshot carries it instead
+                    logger.warning("Failed to append to selector cache journal: %s", e)
+                    self._snapshot_stale = True
+            if self._snapshot_stale or self._journal_records >= self.compact_after:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Atomically replace the snapshot with ``_state`` and empty the journal."""
+        tmp = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w", encoding="utf-8") as snapshot:
+                json.dump(self._state, snapshot)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+            os.replace(tmp, self.snapshot_path)
+            # Replaying records already in the snapshot is harmless, so a crash here loses nothing
+            self.journal_path.open("w").close()
+        except OSError as e:
+            logger.warning("Failed to compact selector cache to disk: %s", e)
+            self._snapshot_stale = True
+            return
+        self._journal_records = 0
+        self._snapshot_stale = False
+
+
+def _apply(state: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    """Replay one journal record onto a snapshot dict (idempotent)."""
+    op = record["op"]
+    if op == "put":
+        state[record["key"]] = record["entry"]
+    elif op == "del":
+        state.pop(record["key"], None)
+    elif op == "clear":
+        state.clear()
+
+
+def _close_journal(ref: weakref.ReferenceType) -> None:
+    journal = ref()
+    if journal is not None:
+        journal.close()
+
+
+def _entry_stats(entries: List[CacheEntry]) -> Dict[str, Any]:
+    return {
+        "total_entries": len(entries),
+        "usable": sum(1 for e in entries if e.is_usable),
+        "expired": sum(1 for e in entries if e.is_expired),
+        "invalidated": sum(1 for e in entries if e.is_invalidated),
+        "total_hits": sum(e.hit_count for e in entries),
+    }
+
+
 # ── Selector Cache ────────────────────────────────────────────────────────────
 
 
 class SelectorCache:
     """In-memory selector cache with optional file persistence.
 
-    Stores cached selectors keyed by (domain, page_path).
-    Supports TTL expiration, failure tracking, and file persistence.
+    Stores cached selectors keyed by (domain, templated page_path) and,
+    when callers pass one, the page's DOM fingerprint.
+    Supports TTL expiration, failure tracking, and write-behind file
+    persistence (call ``flush()`` to write pending changes now).
     """
 
-    def __init__(self, persist_path: Optional[str] = None, ttl: int = DEFAULT_TTL):
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        ttl: int = DEFAULT_TTL,
+        key_mode: str = "path+fingerprint",
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_after: int = COMPACT_AFTER,
+    ):
         """
         Args:
             persist_path: Optional file path to persist cache to disk.
             ttl: Default time-to-live in seconds for new entries.
+            key_mode: What a fingerprinted lookup is keyed by — "path",
+                "fingerprint", or "path+fingerprint". Lookups without a
+                fingerprint are always keyed by path.
+            flush_interval: Seconds of changes batched into one journal write.
+            compact_after: Journal records that trigger a snapshot rewrite.
         """
+        if key_mode not in KEY_MODES:
+            raise ValueError(f"key_mode must be one of {KEY_MODES}")
         self._store: Dict[str, CacheEntry] = {}
         self._persist_path = persist_path
         self._default_ttl = ttl
+        self.key_mode = key_mode
+        self._journal: Optional[_Journal] = None
 
         if persist_path:
-            self._load_from_disk()
+            self._journal = _Journal(persist_path, flush_interval, compact_after)
+            self._store = self._journal.load()
+            atexit.register(_close_journal, weakref.ref(self._journal))
 
-    def get(self, domain: str, page_path: str) -> Optional[CacheEntry]:
-        """Look up cached selectors for a domain + page.
+    def _key(self, domain: str, page_path: str, fingerprint: Optional[str]) -> str:
+        if not fingerprint or self.key_mode == "path":
+            return make_cache_key(domain, page_path)
+        if self.key_mode == "fingerprint":
+            return make_cache_key(domain, "", fingerprint)
+        return make_cache_key(domain, page_path, fingerprint)
+
+    def get(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> Optional[CacheEntry]:
+        """Look up cached selectors for a domain + page (+ DOM fingerprint).
 
         Returns None if not cached, expired, or invalidated.
         """
-        key = make_cache_key(domain, page_path)
+        key = self._key(domain, page_path, fingerprint)
         entry = self._store.get(key)
+        record_selector_cache("miss" if entry is None else "local")
 
         if entry is None:
             return None
@@ -168,6 +450,7 @@ class SelectorCache:
         selectors: Dict[str, Any],
         confidence: float = 0.0,
         ttl: Optional[int] = None,
+        fingerprint: Optional[str] = None,
     ) -> CacheEntry:
         """Store selectors in the cache.
 
@@ -177,11 +460,12 @@ class SelectorCache:
             selectors: CSS selector map from LLM extraction.
             confidence: LLM confidence score (0-1).
             ttl: Optional TTL override in seconds.
+            fingerprint: Optional DOM fingerprint of the page.
 
         Returns:
             The new CacheEntry.
         """
-        key = make_cache_key(domain, page_path)
+        key = self._key(domain, page_path, fingerprint)
         entry = CacheEntry(
             domain=domain.lower().strip(),
             page_path=page_path,
@@ -189,8 +473,9 @@ class SelectorCache:
             confidence=confidence,
             created_at=time.time(),
             ttl=ttl or self._default_ttl,
+            fingerprint=fingerprint,
         )
-        self._store[key] = entry
+        self._store_entry(key, entry)
         logger.info(
             "Cached selectors: domain=%s path=%s fields=%d confidence=%.2f",
             domain,
@@ -198,24 +483,25 @@ class SelectorCache:
             len(selectors),
             confidence,
         )
-
-        if self._persist_path:
-            self._save_to_disk()
-
         return entry
 
-    def record_success(self, domain: str, page_path: str) -> None:
+    def _store_entry(self, key: str, entry: CacheEntry) -> None:
+        self._store[key] = entry
+        if self._journal:
+            self._journal.record(key, entry)
+
+    def record_success(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> None:
         """Record a successful extraction using cached selectors."""
-        key = make_cache_key(domain, page_path)
+        key = self._key(domain, page_path, fingerprint)
         entry = self._store.get(key)
         if entry:
             entry.record_success()
-            if self._persist_path:
-                self._save_to_disk()
+            if self._journal:
+                self._journal.record(key, entry)
 
-    def record_failure(self, domain: str, page_path: str) -> None:
+    def record_failure(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> None:
         """Record a failed extraction using cached selectors."""
-        key = make_cache_key(domain, page_path)
+        key = self._key(domain, page_path, fingerprint)
         entry = self._store.get(key)
         if entry:
             entry.record_failure()
@@ -226,19 +512,19 @@ class SelectorCache:
                 entry.failure_count,
                 MAX_FAILURES,
             )
-            if self._persist_path:
-                self._save_to_disk()
+            if self._journal:
+                self._journal.record(key, entry)
 
-    def invalidate(self, domain: str, page_path: str) -> bool:
+    def invalidate(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> bool:
         """Remove a specific cache entry.
 
         Returns True if an entry was removed.
         """
-        key = make_cache_key(domain, page_path)
+        key = self._key(domain, page_path, fingerprint)
         if key in self._store:
             del self._store[key]
-            if self._persist_path:
-                self._save_to_disk()
+            if self._journal:
+                self._journal.record(key, None)
             return True
         return False
 
@@ -251,55 +537,377 @@ class SelectorCache:
         to_remove = [k for k, v in self._store.items() if v.domain == domain]
         for k in to_remove:
             del self._store[k]
-        if to_remove and self._persist_path:
-            self._save_to_disk()
+            if self._journal:
+                self._journal.record(k, None)
         return len(to_remove)
 
     def clear(self) -> None:
         """Remove all entries."""
         self._store.clear()
-        if self._persist_path:
-            self._save_to_disk()
+        if self._journal:
+            self._journal.clear()
 
     def stats(self) -> Dict[str, Any]:
         """Return cache statistics."""
-        total = len(self._store)
-        usable = sum(1 for e in self._store.values() if e.is_usable)
-        expired = sum(1 for e in self._store.values() if e.is_expired)
-        invalidated = sum(1 for e in self._store.values() if e.is_invalidated)
-        total_hits = sum(e.hit_count for e in self._store.values())
-        return {
-            "total_entries": total,
-            "usable": usable,
-            "expired": expired,
-            "invalidated": invalidated,
-            "total_hits": total_hits,
-        }
+        return _entry_stats(list(self._store.values()))
 
     @property
     def size(self) -> int:
         return len(self._store)
 
-    def _save_to_disk(self) -> None:
-        """Persist cache to a JSON file."""
-        if not self._persist_path:
+    def flush(self) -> None:
+        """Write pending changes to disk now (blocking)."""
+        if self._journal:
+            self._journal.flush()
+
+    def close(self) -> None:
+        """Stop background persistence after writing pending changes."""
+        if self._journal:
+            self._journal.close()
+
+
+# ── Shared (Redis) Tier ───────────────────────────────────────────────────────
+
+_REDIS_PREFIX = "plaidify:selector_cache:"
+_VERSION_KEY = f"{_REDIS_PREFIX}version"
+INVALIDATION_CHANNEL = f"{_REDIS_PREFIX}invalidate"
+DEFAULT_LOCAL_MAX_ENTRIES = 1024
+DEFAULT_LOCAL_TTL = 60.0  # Seconds an LRU copy is served before Redis is re-read
+
+
+def _entry_key(key: str) -> str:
+    return f"{_REDIS_PREFIX}entry:{key}"
+
+
+def _counts_key(key: str, version: int) -> str:
+    return f"{_REDIS_PREFIX}counts:{key}:{version}"
+
+
+def _domain_key(domain: str) -> str:
+    return f"{_REDIS_PREFIX}domain:{domain}"
+
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+@dataclass
+class _LocalEntry:
+    entry: CacheEntry
+    version: int  # 0 = never reached Redis
+    fresh_until: float  # time.monotonic()
+
+
+class SharedSelectorCache(SelectorCache):
+    """Selector cache shared by every worker through Redis, fronted by a per-process LRU.
+
+    Redis holds one hash per entry — the selectors and a version from a
+    global counter, bumped on every ``put`` — and a counters hash per
+    (entry, version) updated with ``HINCRBY``, so hits and failures from all
+    workers add up and counts against selectors that were since re-learned
+    are ignored. Each process keeps up to ``max_local_entries`` recently used
+    entries for ``local_ttl`` seconds.
+
+    ``put``, ``record_failure`` and the invalidations publish the affected
+    keys on ``INVALIDATION_CHANNEL``; every other worker drops its LRU copy
+    and re-reads Redis on the next lookup, so a failure on one node counts
+    against the selectors everywhere. ``local_ttl`` bounds how stale a copy
+    gets if a broadcast is missed.
+
+    Without Redis, or while a Redis call fails, the LRU answers on its own.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        key_mode: str = "path+fingerprint",
+        redis_client: Any = None,
+        max_local_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        local_ttl: float = DEFAULT_LOCAL_TTL,
+    ):
+        """
+        Args:
+            ttl: Default time-to-live in seconds for new entries.
+            key_mode: See ``SelectorCache``.
+            redis_client: Client (``decode_responses=True``) to use instead of
+                the shared session-store client.
+            max_local_entries: Entries kept in the in-process LRU.
+            local_ttl: Seconds an LRU entry is trusted before Redis is re-read.
+        """
+        super().__init__(ttl=ttl, key_mode=key_mode)
+        self.max_local_entries = max_local_entries
+        self.local_ttl = local_ttl
+        self._local: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._origin = uuid.uuid4().hex
+        self._redis = redis_client if redis_client is not None else _shared_redis()
+        self._listener: Any = None
+        if self._redis is not None:
+            self._subscribe()
+
+    # ── Lookups ───────────────────────────────────────────────────────────────
+
+    def get(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> Optional[CacheEntry]:
+        """Look up cached selectors, from the LRU if fresh, otherwise from Redis.
+
+        Returns None if not cached, expired, or invalidated.
+        """
+        key = self._key(domain, page_path, fingerprint)
+        local, tier = self._lookup(key)
+        record_selector_cache(tier)
+        if local is None:
+            return None
+
+        entry = local.entry
+        if not entry.is_usable:
+            logger.info(
+                "Cache entry not usable: domain=%s path=%s expired=%s invalidated=%s",
+                domain,
+                page_path,
+                entry.is_expired,
+                entry.is_invalidated,
+            )
+            return None
+        return entry
+
+    def _lookup(self, key: str) -> Tuple[Optional[_LocalEntry], str]:
+        with self._lock:
+            local = self._local.get(key)
+            if local is not None:
+                self._local.move_to_end(key)
+        if local is not None and (self._redis is None or local.version == 0 or local.fresh_until > time.monotonic()):
+            return local, "local"
+        if self._redis is None:
+            return None, "miss"
+
+        try:
+            shared = self._fetch(key)
+        except Exception as e:
+            logger.warning("Selector cache Redis read failed, using the local tier: %s", e)
+            return local, "local" if local is not None else "miss"
+        if shared is None:
+            with self._lock:
+                self._local.pop(key, None)
+            return None, "miss"
+        self._remember(key, shared)
+        return shared, "shared"
+
+    def _fetch(self, key: str) -> Optional[_LocalEntry]:
+        stored = self._redis.hgetall(_entry_key(key))
+        if not stored:
+            return None
+        version = int(stored["version"])
+        counts = self._redis.hgetall(_counts_key(key, version))
+        data = json.loads(stored["entry"])
+        data.update(
+            failure_count=int(counts.get("failures", 0)),
+            hit_count=int(counts.get("hits", 0)),
+            last_success_at=_optional_float(counts.get("last_success_at")),
+            last_failure_at=_optional_float(counts.get("last_failure_at")),
+        )
+        return _LocalEntry(CacheEntry.from_dict(data), version, time.monotonic() + self.local_ttl)
+
+    def _remember(self, key: str, local: _LocalEntry) -> None:
+        with self._lock:
+            self._local[key] = local
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_local_entries:
+                self._local.popitem(last=False)
+
+    # ── Mutations ─────────────────────────────────────────────────────────────
+
+    def _store_entry(self, key: str, entry: CacheEntry) -> None:
+        version = 0
+        if self._redis is not None:
+            try:
+                version = int(self._redis.incr(_VERSION_KEY))
+                pipe = self._redis.pipeline()
+                pipe.hset(_entry_key(key), mapping={"entry": json.dumps(entry.to_dict()), "version": version})
+                pipe.expire(_entry_key(key), entry.ttl)
+                pipe.sadd(_domain_key(entry.domain), key)
+                pipe.expire(_domain_key(entry.domain), max(entry.ttl, self._default_ttl))
+                pipe.publish(INVALIDATION_CHANNEL, self._message([key]))
+                pipe.execute()
+            except Exception as e:
+                logger.warning("Failed to share selector cache entry through Redis: %s", e)
+                version = 0
+        self._remember(key, _LocalEntry(entry, version, time.monotonic() + self.local_ttl))
+
+    def record_success(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> None:
+        """Record a successful extraction using cached selectors."""
+        key = self._key(domain, page_path, fingerprint)
+        with self._lock:
+            local = self._local.get(key)
+        if local is not None:
+            local.entry.record_success()
+        self._count(key, local, "success")
+
+    def record_failure(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> None:
+        """Record a failed extraction and evict the selectors from every worker's LRU."""
+        key = self._key(domain, page_path, fingerprint)
+        with self._lock:
+            local = self._local.get(key)
+            if local is not None and local.version:
+                del self._local[key]  # re-read with the fleet's failure count
+        if local is not None:
+            local.entry.record_failure()
+        failures = self._count(key, local, "failure")
+        if failures is None and local is None:
             return
-        data = {k: v.to_dict() for k, v in self._store.items()}
-        path = Path(self._persist_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2))
-
-    def _load_from_disk(self) -> None:
-        """Load cache from a JSON file."""
-        if not self._persist_path:
+        logger.warning(
+            "Cache failure recorded: domain=%s path=%s count=%d/%d",
+            domain,
+            page_path,
+            failures if failures is not None else local.entry.failure_count,
+            MAX_FAILURES,
+        )
+
+    def _count(self, key: str, local: Optional[_LocalEntry], outcome: str) -> Optional[int]:
+        """Add a hit or failure to the shared counters; returns the new count."""
+        if self._redis is None or (local is not None and local.version == 0):
+            return None
+        try:
+            version = local.version if local is not None else self._redis.hget(_entry_key(key), "version")
+            if version is None:
+                return None
+            counts = _counts_key(key, int(version))
+            pipe = self._redis.pipeline()
+            if outcome == "success":
+                pipe.hincrby(counts, "hits", 1)
+                pipe.hset(counts, mapping={"failures": 0, "last_success_at": time.time()})
+            else:
+                pipe.hincrby(counts, "failures", 1)
+                pipe.hset(counts, "last_failure_at", time.time())
+                pipe.publish(INVALIDATION_CHANNEL, self._message([key]))
+            pipe.expire(counts, local.entry.ttl if local is not None else self._default_ttl)
+            return int(pipe.execute()[0])
+        except Exception as e:
+            logger.warning("Failed to record selector cache %s in Redis: %s", outcome, e)
+            return None
+
+    def invalidate(self, domain: str, page_path: str, fingerprint: Optional[str] = None) -> bool:
+        """Remove a specific cache entry on every worker.
+
+        Returns True if an entry was removed.
+        """
+        key = self._key(domain, page_path, fingerprint)
+        with self._lock:
+            removed = self._local.pop(key, None) is not None
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline()
+                pipe.delete(_entry_key(key))
+                pipe.srem(_domain_key(domain.lower().strip()), key)
+                pipe.publish(INVALIDATION_CHANNEL, self._message([key]))
+                removed = bool(pipe.execute()[0]) or removed
+            except Exception as e:
+                logger.warning("Failed to invalidate selector cache entry in Redis: %s", e)
+        return removed
+
+    def invalidate_domain(self, domain: str) -> int:
+        """Remove all cache entries for a domain on every worker.
+
+        Returns the number of entries removed.
+        """
+        domain = domain.lower().strip()
+        with self._lock:
+            local_keys = [k for k, local in self._local.items() if local.entry.domain == domain]
+            for k in local_keys:
+                del self._local[k]
+        removed = len(local_keys)
+        if self._redis is not None:
+            try:
+                keys = sorted(self._redis.smembers(_domain_key(domain)) | set(local_keys))
+                pipe = self._redis.pipeline()
+                if keys:
+                    pipe.delete(*(_entry_key(k) for k in keys))
+                pipe.delete(_domain_key(domain))
+                pipe.publish(INVALIDATION_CHANNEL, self._message(keys))
+                results = pipe.execute()
+                if keys:
+                    removed = max(removed, int(results[0]))
+            except Exception as e:
+                logger.warning("Failed to invalidate selector cache domain in Redis: %s", e)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries on every worker."""
+        with self._lock:
+            self._local.clear()
+        if self._redis is not None:
+            try:
+                keys = [k for k in self._redis.scan_iter(match=f"{_REDIS_PREFIX}*") if k != _VERSION_KEY]
+                pipe = self._redis.pipeline()
+                if keys:
+                    pipe.delete(*keys)
+                pipe.publish(INVALIDATION_CHANNEL, self._message(None))
+                pipe.execute()
+            except Exception as e:
+                logger.warning("Failed to clear selector cache in Redis: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return statistics of this worker's LRU tier."""
+        with self._lock:
+            entries = [local.entry for local in self._local.values()]
+        return {**_entry_stats(entries), "shared": self._redis is not None}
+
+    @property
+    def size(self) -> int:
+        return len(self._local)
+
+    def close(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        super().close()
+
+    # ── Invalidation Broadcast ────────────────────────────────────────────────
+
+    def _message(self, keys: Optional[List[str]]) -> str:
+        """Broadcast payload; ``keys=None`` drops every entry."""
+        return json.dumps({"origin": self._origin, "keys": keys})
+
+    def _subscribe(self) -> None:
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_message})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=self._on_listener_error
+            )
+        except Exception as e:
+            logger.warning(
+                "Selector cache invalidations unavailable, LRU entries live %.0fs: %s",
+                self.local_ttl,
+                e,
+            )
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError):
             return
-        path = Path(self._persist_path)
-        if not path.exists():
+        if payload.get("origin") == self._origin:
             return
-        try:
-            data = json.loads(path.read_text())
-            for key, entry_data in data.items():
-                self._store[key] = CacheEntry.from_dict(entry_data)
-            logger.info("Loaded %d cache entries from disk", len(self._store))
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning("Failed to load cache from disk: %s", e)
+        keys = payload.get("keys")
+        with self._lock:
+            if keys is None:
+                self._local.clear()
+            else:
+                for key in keys:
+                    self._local.pop(key, None)
+
+    def _on_listener_error(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        logger.warning("Selector cache invalidation listener error, reconnecting: %s", error)
+        time.sleep(1.0)  # redis-py reconnects and resubscribes on the next read
+
+
+def _shared_redis() -> Any:
+    """The session store's Redis client, or None if Redis is not available."""
+    from src import session_store
+
+    try:
+        return session_store._redis()
+    except Exception as e:
+        logger.warning("Redis unavailable for the shared selector cache: %s", e)
+        return None
@@ -0,0 +1,256 @@
+"""
+Settle waits — end a step's wait as soon as the page is ready.
+
+Blueprint steps used to wait on fixed timers (pagination's
+``wait_after_click``) or on full load states (``wait_for_navigation`` waits
+for ``domcontentloaded``, up to 30 s). A step that declares ``settle`` instead
+waits for the *earliest* of the signals it enables:
+
+- ``network_idle``   — no request in flight for ``network_idle_ms``;
+- ``dom_quiet``      — no DOM mutation for ``dom_quiet_ms``;
+- ``ready_selector`` — the blueprint's ready selector is visible;
+- ``rows_changed``   — (pagination) the list's row set differs from before
+  the click;
+
+capped at ``timeout`` (reported as ``timeout``, not raised — the old fixed
+waits never failed a step either). A signal whose probe errors, e.g. because a
+navigation destroyed the execution context, just drops out of the race.
+
+Usage::
+
+    async with PageSettler(page, step.settle) as settler:
+        await page.click(selector)
+    settler.result  # SettleResult(signal="network_idle", waited_ms=212.4)
+
+Network activity is recorded from ``__aenter__`` so requests started by the
+action count; the wait itself happens in ``__aexit__`` and is what
+``waited_ms`` measures.
+
+A ``wait_for_navigation`` step runs after the action that navigates, so it
+cannot wrap it. The step executor starts a :class:`NavigationWatch` before
+that action instead; the step waits for the main frame to navigate and reach
+``domcontentloaded`` before settling, rather than settling the old document.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Dict, Optional
+
+from src import metrics
+from src.core.blueprint import SettleConfig
+from src.logging_config import get_logger
+
+logger = get_logger("settle")
+
+_POLL_SECONDS = 0.05
+
+# Resolves once no mutation has been observed for quietMs (or after maxMs).
+_DOM_QUIET_JS = """([quietMs, maxMs]) => new Promise((resolve) => {
+    let timer;
+    const observer = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(done, quietMs); });
+    const cap = setTimeout(() => done(false), maxMs);
+    function done(quiet = true) {
+        observer.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(quiet);
+    }
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    timer = setTimeout(done, quietMs);
+})"""
+
+# Cheap identity of a row set: count plus first and last row text.
+_ROW_SIGNATURE_JS = """(selector) => {
+    const rows = document.querySelectorAll(selector);
+    if (!rows.length) return '0';
+    return rows.length + '|' + rows[0].textContent + '|' + rows[rows.length - 1].textContent;
+}"""
+
+_ROWS_CHANGED_JS = """([selector, before]) => {
+    const rows = document.querySelectorAll(selector);
+    const now = rows.length
+        ? rows.length + '|' + rows[0].textContent + '|' + rows[rows.length - 1].textContent
+        : '0';
+    return now !== before;
+}"""
+
+
+@dataclass
+class SettleResult:
+    """Which signal ended a settle wait and how long the wait took."""
+
+    signal: str
+    waited_ms: float
+
+    def to_dict(self, step: str) -> Dict[str, Any]:
+        return {"step": step, "signal": self.signal, "wait_ms": self.waited_ms}
+
+
+class _NetworkTracker:
+    """Counts in-flight requests on a page from Playwright request events."""
+
+    def __init__(self, page: Any) -> None:
+        self.page = page
+        self.inflight: set = set()
+        self.last_activity = time.monotonic()
+        self._attached = False
+
+    def _started(self, request: Any) -> None:
+        self.inflight.add(request)
+        self.last_activity = time.monotonic()
+
+    def _ended(self, request: Any) -> None:
+        self.inflight.discard(request)
+        self.last_activity = time.monotonic()
+
+    def attach(self) -> None:
+        try:
+            self.page.on("request", self._started)
+            self.page.on("requestfinished", self._ended)
+            self.page.on("requestfailed", self._ended)
+            self._attached = True
+        except Exception:
+            self._attached = False
+
+    def detach(self) -> None:
+        if not self._attached:
+            return
+        for event, handler in (
+            ("request", self._started),
+            ("requestfinished", self._ended),
+            ("requestfailed", self._ended),
+        ):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception:
+                pass
+        self._attached = False
+
+    async def wait_idle(self, quiet_ms: int) -> None:
+        if not self._attached:
+            raise RuntimeError("page does not emit request events")
+        quiet = quiet_ms / 1000
+        while True:
+            idle_for = time.monotonic() - self.last_activity
+            if not self.inflight and idle_for >= quiet:
+                return
+            await asyncio.sleep(_POLL_SECONDS if self.inflight else max(_POLL_SECONDS, quiet - idle_for))
+
+
+class NavigationWatch:
+    """Notes main-frame navigations of ``page`` from construction until :meth:`close`."""
+
+    def __init__(self, page: Any) -> None:
+        self.page = page
+        self._navigated = asyncio.Event()
+        page.on("framenavigated", self._on_frame_navigated)
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        if frame is self.page.main_frame:
+            self._navigated.set()
+
+    async def wait(self, timeout_ms: float) -> bool:
+        """Wait for a navigation to have started; False if none within ``timeout_ms``."""
+        try:
+            await asyncio.wait_for(self._navigated.wait(), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def close(self) -> None:
+        self.page.remove_listener("framenavigated", self._on_frame_navigated)
+
+
+class PageSettler:
+    """Async context manager that waits for a page to settle after an action.
+
+    Args:
+        page: The Playwright page the action runs on.
+        config: Which signals to race and the overall cap.
+        row_selector: Enables the ``rows_changed`` signal for this selector.
+    """
+
+    def __init__(self, page: Any, config: SettleConfig, *, row_selector: Optional[str] = None) -> None:
+        self.page = page
+        self.config = config
+        self.row_selector = row_selector
+        self.result: Optional[SettleResult] = None
+        self._network = _NetworkTracker(page)
+        self._rows_before: Optional[str] = None
+
+    async def __aenter__(self) -> "PageSettler":
+        if self.config.network_idle_ms is not None:
+            self._network.attach()
+        if self.row_selector:
+            try:
+                self._rows_before = await self.page.evaluate(_ROW_SIGNATURE_JS, self.row_selector)
+            except Exception:
+                self._rows_before = None
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.result = await self.wait()
+        finally:
+            self._network.detach()
+
+    async def wait(self) -> SettleResult:
+        """Race the enabled signals; returns the winner (or ``timeout``)."""
+        started = time.monotonic()
+        timeout_ms = max(1, self.config.timeout)
+        probes: Dict[str, Awaitable[Any]] = {}
+        if self.config.network_idle_ms is not None and self._network._attached:
+            probes["network_idle"] = self._network.wait_idle(self.config.network_idle_ms)
+        if self.config.dom_quiet_ms is not None:
+            probes["dom_quiet"] = self._dom_quiet(self.config.dom_quiet_ms, timeout_ms)
+        if self.config.ready_selector:
+            probes["ready_selector"] = self.page.wait_for_selector(
+                self.config.ready_selector, state="visible", timeout=timeout_ms
+            )
+        if self.row_selector and self._rows_before is not None:
+            probes["rows_changed"] = self.page.wait_for_function(
+                _ROWS_CHANGED_JS, arg=[self.row_selector, self._rows_before], timeout=timeout_ms
+            )
+
+        tasks = {asyncio.ensure_future(probe): name for name, probe in probes.items()}
+        signal = "timeout"
+        try:
+            pending = set(tasks)
+            deadline = started + timeout_ms / 1000
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                winners = [task for task in done if not task.cancelled() and task.exception() is None]
+                if winners:
+                    signal = tasks[winners[0]]
+                    if signal == "dom_quiet" and winners[0].result() is False:
+                        signal = "timeout"
+                    break
+                for task in done:
+                    if not task.cancelled() and task.exception() is not None:
+                        logger.debug(
+                            "Settle signal unavailable",
+                            extra={"extra_data": {"signal": tasks[task], "error": str(task.exception())}},
+                        )
+            else:
+                # No signal enabled, or every probe errored out: wait out the
+                # cap, like the fixed timer a settle config replaces.
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        waited = time.monotonic() - started
+        metrics.observe_step_settle(signal, waited)
+        return SettleResult(signal=signal, waited_ms=round(waited * 1000, 1))
+
+    async def _dom_quiet(self, quiet_ms: int, max_ms: int) -> bool:
+        return await self.page.evaluate(_DOM_QUIET_JS, [quiet_ms, max_ms])
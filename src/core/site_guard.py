@@ -0,0 +1,197 @@
+"""
+Per-site circuit breakers and adaptive concurrency for blueprint execution.
+
+The global breakers in ``src.core.circuit_breaker`` protect Plaidify's own
+dependencies (browser launches, the LLM). This module protects the *target
+sites*: when one institution is down or crawling, jobs for it should neither
+burn the engine's overall timeout one after another nor hold browser contexts
+that other sites could use.
+
+Each site gets a :class:`SiteGuard` with
+
+- a :class:`CircuitBreaker` that opens after ``SITE_CIRCUIT_FAILURE_THRESHOLD``
+  consecutive site failures: timeouts and ``SiteUnavailableError`` (5xx
+  responses, navigation timeouts, unreachable hosts). While open,
+  ``connect_to_site`` fails fast with ``SiteUnavailableError`` carrying a
+  ``retry_after``; after ``SITE_CIRCUIT_RESET_SECONDS`` a single trial job is
+  let through. ``ConnectionFailedError`` — a rejected password shows up as a
+  missing post-login selector — and MFA or extraction errors mean the site
+  answered and do not count, so a few users with bad credentials cannot open
+  the circuit for everyone;
+- an AIMD concurrency limit used as the site's cap in the browser pool's
+  acquire queue: every run that finishes within ``SITE_LATENCY_SLO_SECONDS``
+  adds ``1 / limit`` (about +1 per full round of runs), every timeout halves
+  it. The limit stays between 1 and the configured cap
+  (``rate_limit.max_concurrent_sessions``, ``BROWSER_SITE_MAX_CONTEXTS`` or
+  the pool size).
+
+Only time spent on the site goes through the guard, in browser and HTTP mode
+alike: the engine queues for a browser context before calling it, so a
+saturated pool neither halves the limit nor opens the circuit.
+
+State is per process, like the browser pool the limits apply to.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from src import metrics
+from src.config import get_settings
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitState
+from src.exceptions import SiteUnavailableError
+from src.logging_config import get_logger
+
+logger = get_logger("site_guard")
+
+T = TypeVar("T")
+
+#: Exceptions that say the site itself is unhealthy.
+_SITE_FAILURES = (asyncio.TimeoutError, SiteUnavailableError)
+#: Exceptions that say the site is overloaded and concurrency should back off.
+_OVERLOAD = (asyncio.TimeoutError, SiteUnavailableError)
+
+
+def _is_site_failure(exc: BaseException) -> bool:
+    return isinstance(exc, _SITE_FAILURES)
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease concurrency limit."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        slo_seconds: float = 60.0,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.slo_seconds = slo_seconds
+        self.decrease_factor = decrease_factor
+        self._limit = float(self.max_limit)
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, min(self.max_limit, int(self._limit)))
+
+    def set_max(self, max_limit: int) -> None:
+        """Move the ceiling (the configured cap may change with the blueprint)."""
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = min(self._limit, float(self.max_limit))
+
+    def on_success(self, latency_seconds: float) -> None:
+        if latency_seconds <= self.slo_seconds:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0))
+
+    def on_overload(self) -> None:
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+
+class SiteGuard:
+    """Circuit breaker and adaptive concurrency limit for one site."""
+
+    def __init__(self, site: str) -> None:
+        settings = get_settings()
+        self.site = site
+        self.breaker = CircuitBreaker(
+            f"site:{site}",
+            failure_threshold=settings.site_circuit_failure_threshold,
+            reset_timeout=settings.site_circuit_reset_seconds,
+            is_failure=_is_site_failure,
+            single_trial=True,
+        )
+        self.concurrency = AdaptiveConcurrency(
+            max(1, settings.browser_pool_size),
+            slo_seconds=settings.site_latency_slo_seconds,
+        )
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run one job for the site through its breaker.
+
+        Raises:
+            SiteUnavailableError: Without calling ``fn`` if the circuit is open.
+        """
+        try:
+            return await self.breaker.call(fn)
+        except CircuitBreakerOpenError as exc:
+            raise self._rejected(exc.retry_after) from None
+        except _OVERLOAD:
+            self.concurrency.on_overload()
+            metrics.set_site_concurrency_limit(self.site, self.concurrency.limit)
+            logger.info(
+                "Site concurrency decreased",
+                extra={"extra_data": {"site": self.site, "limit": self.concurrency.limit}},
+            )
+            raise
+
+    def reject_if_open(self) -> None:
+        """Fail fast while the circuit is open, e.g. before queueing for a browser.
+
+        Raises:
+            SiteUnavailableError: If the circuit is open and not yet due a trial.
+        """
+        retry_after = self.breaker.status()["retry_after_seconds"]
+        if self.breaker.state is CircuitState.OPEN and retry_after > 0:
+            raise self._rejected(retry_after)
+
+    def _rejected(self, retry_after: float) -> SiteUnavailableError:
+        retry_after = max(1, math.ceil(retry_after))
+        metrics.record_site_circuit_rejection(self.site)
+        return SiteUnavailableError(
+            self.site,
+            detail=f"too many recent failures; retry in ~{retry_after}s",
+            retry_after=retry_after,
+        )
+
+    def concurrency_limit(self, configured_cap: int = 0) -> int:
+        """Current cap for the site's browser contexts under ``configured_cap`` (0 = pool size)."""
+        self.concurrency.set_max(configured_cap if configured_cap > 0 else max(1, get_settings().browser_pool_size))
+        return self.concurrency.limit
+
+    def record_latency(self, seconds: float) -> None:
+        """Feed one successful run's latency (excluding queueing) to the limit."""
+        self.concurrency.on_success(seconds)
+        metrics.set_site_concurrency_limit(self.site, self.concurrency.limit)
+
+    def status(self) -> dict:
+        return {
+            **self.breaker.status(),
+            "concurrency_limit": self.concurrency.limit,
+            "concurrency_max": self.concurrency.max_limit,
+        }
+
+
+# ── Module-Level Registry ─────────────────────────────────────────────────────
+
+_guards: Dict[str, SiteGuard] = {}
+
+
+def get_site_guard(site: str) -> SiteGuard:
+    """Get or create the guard for ``site``."""
+    guard = _guards.get(site)
+    if guard is None:
+        guard = _guards[site] = SiteGuard(site)
+    return guard
+
+
+def site_guard_status() -> Dict[str, dict]:
+    """Breaker and concurrency state of every site seen by this process."""
+    return {site: guard.status() for site, guard in sorted(_guards.items())}
+
+
+def tripped_sites() -> list[str]:
+    """Sites whose circuit is currently open or half-open."""
+    return [site for site, guard in sorted(_guards.items()) if guard.breaker.state is not CircuitState.CLOSED]
+
+
+def reset_site_guards(site: Optional[str] = None) -> None:
+    """Forget guard state for one site or all of them (mainly for tests)."""
+    if site is None:
+        _guards.clear()
+    else:
+        _guards.pop(site, None)
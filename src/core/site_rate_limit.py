@@ -0,0 +1,207 @@
+"""
+Site-wide rate limiting from a blueprint's ``rate_limit`` block.
+
+``RateLimitConfig`` declares how hard Plaidify may hit a target site
+(``max_requests_per_hour`` and ``min_interval_seconds``). The limit has to hold
+for the whole deployment, not per process: every gunicorn worker and every
+access-job worker draws from the same per-site budget.
+
+The budget is a token bucket (capacity ``max_requests_per_hour``, refilled at
+``max_requests_per_hour / 3600`` per second) plus a minimum spacing between
+starts. Callers *reserve* a start time instead of polling:
+
+- a reservation takes a token even if the bucket is empty (tokens may go
+  negative) and pushes the site's next allowed start ``min_interval_seconds``
+  out, so concurrent callers are queued in arrival order with no thundering
+  herd;
+- the caller then sleeps until its start time, before it acquires a browser
+  slot, so throttled jobs never hold a context;
+- a caller that would wait longer than ``SITE_RATE_LIMIT_MAX_WAIT_SECONDS``
+  does not reserve and gets ``RateLimitedError`` with ``retry_after`` set to
+  when a slot frees up. The refresh scheduler treats that as a deferral, not
+  a failure.
+
+The state lives in Redis (one hash per site, updated by a Lua script using the
+Redis server clock, so it is atomic across processes and hosts). Without Redis
+— or if a Redis call fails — each process keeps its own bucket, which is the
+same limit per process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.config import get_settings
+from src.core.blueprint import RateLimitConfig
+from src.exceptions import RateLimitedError
+from src.logging_config import get_logger
+from src.metrics import observe_site_throttle_wait, record_site_throttle
+
+logger = get_logger("site_rate_limit")
+
+_KEY_PREFIX = "plaidify:site_rate:"
+
+# KEYS[1] = bucket hash; ARGV = capacity, refill rate (tokens/s), min interval,
+# max wait. Returns {reserved (0/1), wait seconds}; numbers are returned as
+# strings because Redis truncates Lua floats to integers.
+_RESERVE_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local interval = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'next')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+local start = tonumber(state[3]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+if tokens < 1 then start = math.max(start, now + (1 - tokens) / rate) end
+start = math.max(start, now)
+local wait = start - now
+if wait > max_wait then return {0, tostring(wait)} end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - 1), 'ts', tostring(now), 'next', tostring(start + interval))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate + interval + max_wait))
+return {1, tostring(wait)}
+"""
+
+
+def _bucket_params(config: RateLimitConfig) -> tuple[float, float, float]:
+    """``(capacity, refill rate per second, min interval)`` for a site's limits."""
+    capacity = float(max(1, config.max_requests_per_hour))
+    return capacity, capacity / 3600.0, float(max(0, config.min_interval_seconds))
+
+
+@dataclass
+class _LocalBucket:
+    tokens: float
+    updated: float
+    next_start: float
+
+
+class SiteRateLimiter:
+    """Per-site reservation token bucket shared through Redis when available.
+
+    Args:
+        max_wait_seconds: Longest a caller may be queued before it is rejected
+            with ``RateLimitedError`` (default: ``SITE_RATE_LIMIT_MAX_WAIT_SECONDS``).
+        redis_client: Client to use instead of the shared session-store client.
+            ``None`` resolves the shared client on each call.
+    """
+
+    def __init__(self, max_wait_seconds: Optional[float] = None, redis_client: Any = None) -> None:
+        settings = get_settings()
+        self.max_wait_seconds = (
+            settings.site_rate_limit_max_wait_seconds if max_wait_seconds is None else max_wait_seconds
+        )
+        self._redis_client = redis_client
+        self._local: dict[str, _LocalBucket] = {}
+
+    def reserve(self, site: str, config: RateLimitConfig) -> float:
+        """Reserve the next start slot for ``site`` and return the seconds until it.
+
+        Raises:
+            RateLimitedError: If the slot is more than ``max_wait_seconds`` away;
+                nothing is reserved in that case.
+        """
+        reserved, wait = self._reserve_redis(site, config)
+        if reserved is None:
+            reserved, wait = self._reserve_local(site, config)
+
+        if not reserved:
+            record_site_throttle(site, "rejected")
+            logger.info(
+                "Site rate limit exceeded",
+                extra={"extra_data": {"site": site, "wait_seconds": round(wait, 3)}},
+            )
+            raise RateLimitedError(retry_after=max(1, math.ceil(wait)))
+
+        record_site_throttle(site, "delayed" if wait > 0 else "immediate")
+        observe_site_throttle_wait(site, wait)
+        return wait
+
+    async def wait_turn(self, site: str, config: RateLimitConfig) -> float:
+        """Reserve a slot for ``site`` and sleep until it; returns the seconds waited."""
+        wait = self.reserve(site, config)
+        if wait > 0:
+            logger.info(
+                "Throttling request to site",
+                extra={"extra_data": {"site": site, "wait_seconds": round(wait, 3)}},
+            )
+            await asyncio.sleep(wait)
+        return wait
+
+    def reset(self) -> None:
+        """Forget the in-process buckets (Redis state is left to expire)."""
+        self._local.clear()
+
+    # ── Backends ──────────────────────────────────────────────────────────────
+
+    def _client(self) -> Any:
+        if self._redis_client is not None:
+            return self._redis_client
+        from src import session_store
+
+        return session_store._redis()
+
+    def _reserve_redis(self, site: str, config: RateLimitConfig) -> tuple[Optional[bool], float]:
+        try:
+            redis_client = self._client()
+            if redis_client is None:
+                return None, 0.0
+            capacity, rate, interval = _bucket_params(config)
+            reserved, wait = redis_client.eval(
+                _RESERVE_SCRIPT,
+                1,
+                f"{_KEY_PREFIX}{site}",
+                capacity,
+                rate,
+                interval,
+                self.max_wait_seconds,
+            )
+            return bool(int(reserved)), max(0.0, float(wait))
+        except Exception as exc:
+            logger.warning(
+                "Redis site rate limit unavailable, falling back to local bucket",
+                extra={"extra_data": {"site": site, "error": str(exc)}},
+            )
+            return None, 0.0
+
+    def _reserve_local(self, site: str, config: RateLimitConfig) -> tuple[bool, float]:
+        capacity, rate, interval = _bucket_params(config)
+        now = time.monotonic()
+        bucket = self._local.get(site)
+        if bucket is None:
+            bucket = self._local[site] = _LocalBucket(tokens=capacity, updated=now, next_start=now)
+
+        tokens = min(capacity, bucket.tokens + max(0.0, now - bucket.updated) * rate)
+        start = bucket.next_start
+        if tokens < 1:
+            start = max(start, now + (1 - tokens) / rate)
+        start = max(start, now)
+        wait = start - now
+        if wait > self.max_wait_seconds:
+            return False, wait
+
+        bucket.tokens = tokens - 1
+        bucket.updated = now
+        bucket.next_start = start + interval
+        return True, wait
+
+
+# ── Module-Level Singleton ────────────────────────────────────────────────────
+
+_site_rate_limiter: Optional[SiteRateLimiter] = None
+
+
+def get_site_rate_limiter() -> SiteRateLimiter:
+    """Get or create the process-wide site rate limiter."""
+    global _site_rate_limiter
+    if _site_rate_limiter is None:
+        _site_rate_limiter = SiteRateLimiter()
+    return _site_rate_limiter
@@ -9,13 +9,16 @@ branching, and step-level timeouts.
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
 
+from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from src.core.blueprint import BlueprintStep, StepAction
 from src.core.read_only_policy import ReadOnlyExecutionPolicy
+from src.core.settle import NavigationWatch, PageSettler, SettleResult
 from src.exceptions import (
     AuthenticationError,
     ConnectionFailedError,
@@ -26,13 +29,26 @@ from src.logging_config import get_logger
 
 logger = get_logger("step_executor")
 
+# Chromium navigation errors that mean the site could not be reached.
+_UNREACHABLE = re.compile(
+    r"net::ERR_(NAME_NOT_RESOLVED|CONNECTION_(REFUSED|RESET|CLOSED|TIMED_OUT|FAILED)"
+    r"|ADDRESS_UNREACHABLE|TIMED_OUT|EMPTY_RESPONSE)\b"
+)
+
+
+def _settles_navigation(steps: List[BlueprintStep]) -> bool:
+    """True if ``steps`` starts with a ``wait_for_navigation`` that settles."""
+    return bool(steps) and steps[0].action == StepAction.WAIT_FOR_NAVIGATION and steps[0].settle is not None
+
 
 class StepExecutor:
     """
     Executes an ordered list of BlueprintStep actions against a Playwright Page.
 
     Supports variable interpolation ({{username}}, {{password}}, etc.)
-    and all V2 step actions.
+    and all V2 step actions. Steps with a ``settle`` config wait for the page
+    to settle instead of a fixed load state; every such wait (and every plain
+    ``wait_for_navigation``) is recorded in ``waits``.
     """
 
     def __init__(
@@ -55,6 +71,11 @@ class StepExecutor:
         self.allow_js_execution = allow_js_execution
         self.read_only_policy = read_only_policy
         self.site = site
+        # {"step", "signal", "wait_ms"} for each settle / navigation wait.
+        self.waits: List[Dict[str, Any]] = []
+        self._step_label = ""
+        # Armed before a step followed by a settling wait_for_navigation.
+        self._navigation: Optional[NavigationWatch] = None
 
     def _interpolate(self, value: Optional[str]) -> Optional[str]:
         """Replace {{variable}} placeholders with actual values."""
@@ -84,40 +105,50 @@ class StepExecutor:
             AuthenticationError: If login is detected as failed.
             SiteUnavailableError: If the site is unreachable.
         """
-        for i, step in enumerate(steps):
-            step_label = f"{context}[{i}] {step.action.value}"
-            logger.debug(
-                f"Executing step: {step_label}",
-                extra={"extra_data": {"step": i, "action": step.action.value}},
-            )
-            try:
-                await self._execute_step(step)
-            except PlaywrightTimeout as e:
-                logger.error(
-                    f"Step timed out: {step_label}",
-                    extra={"extra_data": {"step": i, "error": str(e)}},
-                )
-                raise ConnectionFailedError(
-                    site="unknown",
-                    detail=f"Step '{step.action.value}' timed out: {e}",
-                ) from e
-            except ConnectionFailedError:
-                raise
-            except AuthenticationError:
-                raise
-            except ReadOnlyPolicyViolationError:
-                raise
-            except SiteUnavailableError:
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Step failed: {step_label}",
-                    extra={"extra_data": {"step": i, "error": str(e)}},
+        watch: Optional[NavigationWatch] = None
+        try:
+            for i, step in enumerate(steps):
+                # Hand the watch armed before the previous step to this one.
+                self._navigation, watch = watch, None
+                if _settles_navigation(steps[i + 1 : i + 2]):
+                    watch = NavigationWatch(self.page)
+                step_label = f"{context}[{i}] {step.action.value}"
+                logger.debug(
+                    f"Executing step: {step_label}",
+                    extra={"extra_data": {"step": i, "action": step.action.value}},
                 )
-                raise ConnectionFailedError(
-                    site="unknown",
-                    detail=f"Step '{step.action.value}' failed: {e}",
-                ) from e
+                self._step_label = step_label
+                try:
+                    await self._execute_step(step)
+                except PlaywrightTimeout as e:
+                    logger.error(
+                        f"Step timed out: {step_label}",
+                        extra={"extra_data": {"step": i, "error": str(e)}},
+                    )
+                    raise ConnectionFailedError(
+                        site="unknown",
+                        detail=f"Step '{step.action.value}' timed out: {e}",
+                    ) from e
+                except ConnectionFailedError:
+                    raise
+                except AuthenticationError:
+                    raise
+                except ReadOnlyPolicyViolationError:
+                    raise
+                except SiteUnavailableError:
+                    raise
+                except Exception as e:
+                    logger.error(
+                        f"Step failed: {step_label}",
+                        extra={"extra_data": {"step": i, "error": str(e)}},
+                    )
+                    raise ConnectionFailedError(
+                        site="unknown",
+                        detail=f"Step '{step.action.value}' failed: {e}",
+                    ) from e
+        finally:
+            if watch is not None:
+                watch.close()
 
     async def _execute_step(self, step: BlueprintStep) -> None:
         """Dispatch a single step to the appropriate handler."""
@@ -190,6 +221,15 @@ class StepExecutor:
 
         return {}
 
+    def _record_wait(self, result: Optional[SettleResult]) -> None:
+        if result is None:
+            return
+        self.waits.append(result.to_dict(self._step_label))
+        logger.debug(
+            f"Settled after {self._step_label}",
+            extra={"extra_data": {"signal": result.signal, "wait_ms": result.waited_ms}},
+        )
+
     # ── Step Handlers ─────────────────────────────────────────────────────────
 
     async def _step_goto(self, step: BlueprintStep) -> None:
@@ -200,11 +240,20 @@ class StepExecutor:
 
         timeout = step.timeout or 30000
         try:
-            response = await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            if step.settle:
+                async with PageSettler(self.page, step.settle) as settler:
+                    response = await self.page.goto(url, wait_until="commit", timeout=timeout)
+                self._record_wait(settler.result)
+            else:
+                response = await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
             if response and response.status >= 500:
                 raise SiteUnavailableError(site=url, detail=f"HTTP {response.status}")
         except PlaywrightTimeout as e:
             raise SiteUnavailableError(site=url, detail=f"Navigation timeout: {e}") from e
+        except PlaywrightError as e:
+            if _UNREACHABLE.search(str(e)):
+                raise SiteUnavailableError(site=url, detail=f"Site unreachable: {e}") from e
+            raise
 
         logger.debug(f"Navigated to {url}")
 
@@ -236,7 +285,15 @@ class StepExecutor:
                 self.read_only_policy.record_blocked("click", reason, target=selector)
                 raise ReadOnlyPolicyViolationError(reason)
 
-        if step.wait_for_navigation:
+        if step.settle:
+            async with PageSettler(self.page, step.settle) as settler:
+                if step.wait_for_navigation:
+                    async with self.page.expect_navigation(wait_until="commit", timeout=step.timeout or 30000):
+                        await self.page.click(selector)
+                else:
+                    await self.page.click(selector)
+            self._record_wait(settler.result)
+        elif step.wait_for_navigation:
             async with self.page.expect_navigation(wait_until="domcontentloaded", timeout=step.timeout or 30000):
                 await self.page.click(selector)
         else:
@@ -317,9 +374,26 @@ class StepExecutor:
         logger.debug(f"Switched to iframe: {selector}")
 
     async def _step_wait_for_navigation(self, step: BlueprintStep) -> None:
-        """Wait for a navigation event."""
+        """Wait for a navigation event, or for the page to settle if configured."""
+        if step.settle:
+            started = time.monotonic()
+            watch, self._navigation = self._navigation, None
+            if watch is not None:
+                # Settle the document the previous step navigated to, not the old one.
+                try:
+                    if await watch.wait(step.settle.timeout):
+                        await self.page.wait_for_load_state("domcontentloaded", timeout=step.timeout or 30000)
+                finally:
+                    watch.close()
+            async with PageSettler(self.page, step.settle) as settler:
+                pass
+            waited_ms = round((time.monotonic() - started) * 1000, 1)
+            self._record_wait(SettleResult(settler.result.signal, waited_ms))
+            return
         timeout = step.timeout or 30000
+        started = time.monotonic()
         await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        self._record_wait(SettleResult("domcontentloaded", round((time.monotonic() - started) * 1000, 1)))
         logger.debug("Navigation complete")
 
     async def _step_execute_js(self, step: BlueprintStep) -> None:
@@ -0,0 +1,124 @@
+"""
+Field-aware step plans — run only the navigation a partial fetch needs.
+
+``fetch_data`` narrows ``extract_fields`` to what the consent and token scopes
+grant, but a blueprint used to walk every page regardless: a consent for
+``current_bill`` alone still clicked through transactions and statements.
+Blueprints can now say which fields a navigation serves:
+
+- ``BlueprintStep.fields`` tags a single step (auth or page step). A tagged
+  step whose fields are all unrequested is dropped; untagged steps always run.
+  Tags inside ``then_steps`` / ``else_steps`` are pruned the same way;
+- ``BlueprintV2.pages`` groups the steps that reach a page with the extract
+  fields read there. A page none of whose fields is requested is skipped
+  entirely, steps and extraction.
+
+With ``extract_fields=None`` (a full fetch) the plan is the blueprint as
+written.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from src.core.blueprint import BlueprintStep, BlueprintV2, ExtractionField, ListExtractionField
+
+ExtractionDefs = Dict[str, Union[ExtractionField, ListExtractionField]]
+
+
+@dataclass
+class PlannedPage:
+    """A page to visit: its (pruned) navigation steps and the fields read there."""
+
+    name: str
+    steps: List[BlueprintStep]
+    extract: ExtractionDefs
+    parallel: bool = False
+
+
+@dataclass
+class StepPlan:
+    """The minimal steps and extraction groups for one requested field set."""
+
+    auth_steps: List[BlueprintStep]
+    extract: ExtractionDefs
+    pages: List[PlannedPage] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def fields(self) -> List[str]:
+        """Every extract field the plan reads, in extraction order."""
+        names = list(self.extract)
+        for page in self.pages:
+            names.extend(page.extract)
+        return names
+
+
+def prune_steps(
+    steps: Iterable[BlueprintStep],
+    requested: Optional[Iterable[str]],
+    *,
+    context: str = "steps",
+) -> Tuple[List[BlueprintStep], List[str]]:
+    """Drop tagged steps that serve none of ``requested``.
+
+    Returns the kept steps and labels (``"auth[3] goto"``) of the dropped ones.
+    ``requested=None`` keeps everything.
+    """
+    steps = list(steps)
+    if requested is None:
+        return steps, []
+    wanted = set(requested)
+    kept: List[BlueprintStep] = []
+    skipped: List[str] = []
+    for index, step in enumerate(steps):
+        label = f"{context}[{index}]"
+        if step.fields is not None and wanted.isdisjoint(step.fields):
+            skipped.append(f"{label} {step.action.value}")
+            continue
+        update = {}
+        for branch in ("then_steps", "else_steps"):
+            children = getattr(step, branch)
+            if children:
+                pruned, dropped = prune_steps(children, wanted, context=f"{label}.{branch}")
+                if dropped:
+                    update[branch] = pruned
+                    skipped.extend(dropped)
+        kept.append(step.model_copy(update=update) if update else step)
+    return kept, skipped
+
+
+def build_step_plan(blueprint: BlueprintV2, extract_fields: Optional[List[str]] = None) -> StepPlan:
+    """Plan auth steps, page visits and extraction for ``extract_fields``."""
+    requested = None if extract_fields is None else set(extract_fields)
+    on_page = {name for page in blueprint.pages for name in page.fields}
+
+    auth_steps, skipped = prune_steps(blueprint.auth.steps, requested, context="auth")
+    plan = StepPlan(
+        auth_steps=auth_steps,
+        extract={
+            name: definition
+            for name, definition in blueprint.extract.items()
+            if name not in on_page and (requested is None or name in requested)
+        },
+        skipped=skipped,
+    )
+
+    for page in blueprint.pages:
+        wanted = [name for name in page.fields if requested is None or name in requested]
+        context = f"page:{page.name}"
+        if not wanted:
+            plan.skipped.extend(f"{context}[{index}] {step.action.value}" for index, step in enumerate(page.steps))
+            continue
+        steps, dropped = prune_steps(page.steps, requested, context=context)
+        plan.skipped.extend(dropped)
+        plan.pages.append(
+            PlannedPage(
+                name=page.name,
+                steps=steps,
+                extract={name: blueprint.extract[name] for name in wanted},
+                parallel=page.parallel,
+            )
+        )
+    return plan
@@ -680,6 +680,7 @@ class ScheduledRefreshJob(Base):
     last_refreshed = Column(DateTime, nullable=True)
     last_error = Column(Text, nullable=True)
     consecutive_failures = Column(Integer, default=0, nullable=False)
+    list_watermarks = Column(Text, nullable=True)  # JSON {list field: watermark} from the last refresh
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
@@ -6,6 +6,8 @@ This allows callers to catch all Plaidify errors with a single except clause,
 or catch specific sub-types for fine-grained handling.
 """
 
+from typing import Optional
+
 from src.error_taxonomy import LinkErrorCode
 
 
@@ -122,12 +124,13 @@ class SiteUnavailableError(PlaidifyError):
 
     error_code = LinkErrorCode.INSTITUTION_DOWN
 
-    def __init__(self, site: str, detail: str = ""):
+    def __init__(self, site: str, detail: str = "", retry_after: Optional[int] = None):
         msg = f"Site unavailable: {site}"
         if detail:
             msg += f" — {detail}"
         super().__init__(message=msg, status_code=503)
         self.site = site
+        self.retry_after = retry_after
 
 
 class RateLimitedError(PlaidifyError):
@@ -17,7 +17,7 @@ from src.logging_config import get_logger
 logger = get_logger("metrics")
 
 try:
-    from prometheus_client import Counter, Gauge
+    from prometheus_client import Counter, Gauge, Histogram
 
     PROMETHEUS_AVAILABLE = True
 
@@ -25,6 +25,82 @@ try:
         "plaidify_browser_pool_active_contexts",
         "Number of active browser contexts in the pool",
     )
+    browser_pool_effective_limit = Gauge(
+        "plaidify_browser_pool_effective_limit",
+        "Context limit currently admitted by the pool after memory-pressure throttling",
+    )
+    browser_pool_reserve_total = Counter(
+        "plaidify_browser_pool_reserve_total",
+        "Browser context checkouts served from (hit) or missing (miss) the pre-warmed reserve",
+        ["result"],
+    )
+    browser_pool_reserve_refill_seconds = Histogram(
+        "plaidify_browser_pool_reserve_refill_seconds",
+        "Time to create and set up one pre-warmed browser context",
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+    browser_pool_queue_wait_seconds = Histogram(
+        "plaidify_browser_pool_queue_wait_seconds",
+        "Time a caller waited for a browser context slot, by priority class",
+        ["priority"],
+        buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0),
+    )
+    browser_asset_cache_total = Counter(
+        "plaidify_browser_asset_cache_total",
+        "Static asset requests seen by the shared asset cache, by outcome",
+        ["result"],
+    )
+    browser_asset_cache_bytes = Gauge(
+        "plaidify_browser_asset_cache_bytes",
+        "Bytes of response bodies held by the shared asset cache",
+    )
+    browser_recycles_total = Counter(
+        "plaidify_browser_recycles_total",
+        "Browser processes drained and relaunched, by trigger",
+        ["reason"],
+    )
+    site_throttle_total = Counter(
+        "plaidify_site_throttle_total",
+        "Site rate-limit reservations, by site and outcome (immediate/delayed/rejected)",
+        ["site", "result"],
+    )
+    site_throttle_wait_seconds = Histogram(
+        "plaidify_site_throttle_wait_seconds",
+        "Time a connection was delayed by its site's blueprint rate limit",
+        ["site"],
+        buckets=(0.0, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0),
+    )
+    site_circuit_rejected_total = Counter(
+        "plaidify_site_circuit_rejected_total",
+        "Connections failed fast because the site's circuit breaker was open",
+        ["site"],
+    )
+    site_concurrency_limit = Gauge(
+        "plaidify_site_concurrency_limit",
+        "Adaptive (AIMD) cap on concurrent browser contexts for a site",
+        ["site"],
+    )
+    step_settle_seconds = Histogram(
+        "plaidify_step_settle_seconds",
+        "Time blueprint steps waited for the page to settle, by the signal that ended the wait",
+        ["signal"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+    )
+    http_mode_total = Counter(
+        "plaidify_http_mode_total",
+        "Connections attempted without a browser, by site and outcome (success/fallback)",
+        ["site", "result"],
+    )
+    api_payloads_total = Counter(
+        "plaidify_api_payloads_total",
+        "JSON api payloads used for extraction, by site, mode (capture/replay) and result",
+        ["site", "mode", "result"],
+    )
+    selector_cache_lookups_total = Counter(
+        "plaidify_selector_cache_lookups_total",
+        "LLM selector-cache lookups, by the tier that answered (local/shared/miss)",
+        ["tier"],
+    )
     extraction_total = Counter(
         "plaidify_blueprint_extractions_total",
         "Total blueprint data extractions",
@@ -35,11 +111,32 @@ try:
         "Total MFA challenges encountered",
         ["mfa_type"],
     )
+    session_reuse_total = Counter(
+        "plaidify_session_reuse_total",
+        "Saved browser sessions tried before auth, by outcome (reused/expired/missing)",
+        ["site", "result"],
+    )
 except ImportError:  # pragma: no cover - prometheus is an optional dependency
     PROMETHEUS_AVAILABLE = False
     browser_pool_active = None
+    browser_pool_effective_limit = None
+    browser_pool_reserve_total = None
+    browser_pool_reserve_refill_seconds = None
+    browser_pool_queue_wait_seconds = None
+    browser_asset_cache_total = None
+    browser_asset_cache_bytes = None
+    browser_recycles_total = None
+    site_throttle_total = None
+    site_throttle_wait_seconds = None
+    site_circuit_rejected_total = None
+    site_concurrency_limit = None
+    step_settle_seconds = None
+    http_mode_total = None
+    api_payloads_total = None
+    selector_cache_lookups_total = None
     extraction_total = None
     mfa_challenges_total = None
+    session_reuse_total = None
 
 
 def record_extraction(site: str, status: str) -> None:
@@ -62,6 +159,16 @@ def record_mfa_challenge(mfa_type: str) -> None:
         pass
 
 
+def record_session_reuse(site: str, result: str) -> None:
+    """Count one saved-session restore attempt (reused/expired/missing)."""
+    if session_reuse_total is None:
+        return
+    try:
+        session_reuse_total.labels(site=site, result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
 def set_browser_pool_active(count: int) -> None:
     """Set the gauge of currently-active browser contexts."""
     if browser_pool_active is None:
@@ -70,3 +177,153 @@ def set_browser_pool_active(count: int) -> None:
         browser_pool_active.set(count)
     except Exception:  # pragma: no cover
         pass
+
+
+def set_browser_pool_effective_limit(limit: int) -> None:
+    """Set the gauge of the memory-adjusted context limit."""
+    if browser_pool_effective_limit is None:
+        return
+    try:
+        browser_pool_effective_limit.set(limit)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_browser_pool_reserve(result: str) -> None:
+    """Count one context checkout against the pre-warmed reserve (hit/miss)."""
+    if browser_pool_reserve_total is None:
+        return
+    try:
+        browser_pool_reserve_total.labels(result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def observe_browser_pool_reserve_refill(seconds: float) -> None:
+    """Record how long it took to pre-warm one reserve context."""
+    if browser_pool_reserve_refill_seconds is None:
+        return
+    try:
+        browser_pool_reserve_refill_seconds.observe(seconds)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def observe_browser_pool_queue_wait(priority: str, seconds: float) -> None:
+    """Record how long a caller of one priority class queued for a context slot."""
+    if browser_pool_queue_wait_seconds is None:
+        return
+    try:
+        browser_pool_queue_wait_seconds.labels(priority=priority).observe(seconds)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_browser_asset_cache(result: str) -> None:
+    """Count one asset-cache lookup (hit/revalidated/miss/uncacheable)."""
+    if browser_asset_cache_total is None:
+        return
+    try:
+        browser_asset_cache_total.labels(result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def set_browser_asset_cache_bytes(size: int) -> None:
+    """Set the gauge of bytes held by the shared asset cache."""
+    if browser_asset_cache_bytes is None:
+        return
+    try:
+        browser_asset_cache_bytes.set(size)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_browser_recycle(reason: str) -> None:
+    """Count one browser shard recycle, labelled by trigger (contexts/age/rss/disconnected)."""
+    if browser_recycles_total is None:
+        return
+    try:
+        browser_recycles_total.labels(reason=reason).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_site_throttle(site: str, result: str) -> None:
+    """Count one site rate-limit reservation (immediate/delayed/rejected)."""
+    if site_throttle_total is None:
+        return
+    try:
+        site_throttle_total.labels(site=site, result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def observe_site_throttle_wait(site: str, seconds: float) -> None:
+    """Record how long a connection waited for its site's rate limit."""
+    if site_throttle_wait_seconds is None:
+        return
+    try:
+        site_throttle_wait_seconds.labels(site=site).observe(seconds)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_site_circuit_rejection(site: str) -> None:
+    """Count one connection rejected by an open site circuit."""
+    if site_circuit_rejected_total is None:
+        return
+    try:
+        site_circuit_rejected_total.labels(site=site).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def set_site_concurrency_limit(site: str, limit: int) -> None:
+    """Set the gauge of a site's adaptive concurrency limit."""
+    if site_concurrency_limit is None:
+        return
+    try:
+        site_concurrency_limit.labels(site=site).set(limit)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def observe_step_settle(signal: str, seconds: float) -> None:
+    """Record one settle wait, labelled by the signal that ended it."""
+    if step_settle_seconds is None:
+        return
+    try:
+        step_settle_seconds.labels(signal=signal).observe(seconds)
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_http_mode(site: str, result: str) -> None:
+    """Count one HTTP-mode connection attempt (success/fallback)."""
+    if http_mode_total is None:
+        return
+    try:
+        http_mode_total.labels(site=site, result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_api_payload(site: str, mode: str, result: str) -> None:
+    """Count one api payload lookup (capture/replay; ok/missing/error)."""
+    if api_payloads_total is None:
+        return
+    try:
+        api_payloads_total.labels(site=site, mode=mode, result=result).inc()
+    except Exception:  # pragma: no cover
+        pass
+
+
+def record_selector_cache(tier: str) -> None:
+    """Count one selector-cache lookup (local/shared/miss)."""
+    if selector_cache_lookups_total is None:
+        return
+    try:
+        selector_cache_lookups_total.labels(tier=tier).inc()
+    except Exception:  # pragma: no cover
+        pass
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from src import session_store
 from src.access_jobs import run_access_job
 from src.audit import record_audit_event
+from src.browser_sessions import discard_browser_session, session_state_key
 from src.config import get_settings
 from src.core.engine import connect_to_site
 from src.crypto import decrypt_with_session_key, destroy_session_key, generate_keypair
@@ -320,6 +321,8 @@ async def fetch_data(
             "username": username,
             "password": password,
             "extract_fields": sorted(allowed_fields) if allowed_fields is not None else None,
+            "session_state_key": session_state_key(access_token),
+            "user_id": user.id,
         },
         user_id=user.id,
         metadata={
@@ -373,7 +376,10 @@ async def delete_link(
     link = db.query(Link).filter_by(link_token=link_token, user_id=user.id).first()
     if not link:
         raise HTTPException(status_code=404, detail="Link not found.")
-    db.query(AccessToken).filter_by(link_token=link_token, user_id=user.id).delete()
+    tokens = db.query(AccessToken).filter_by(link_token=link_token, user_id=user.id)
+    for token_obj in tokens:
+        discard_browser_session(session_state_key(token_obj.token))
+    tokens.delete()
     db.delete(link)
     db.commit()
     record_audit_event(
@@ -406,6 +412,7 @@ async def delete_token(
         raise HTTPException(status_code=404, detail="Token not found.")
     db.delete(token_obj)
     db.commit()
+    discard_browser_session(session_state_key(token))
     record_audit_event(db, "token", "revoke", user_id=user.id, resource=token)
     return {"status": "Token deleted."}
 
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from src.access_jobs import run_access_job
 from src.audit import record_audit_event
+from src.browser_sessions import session_state_key
 from src.config import get_settings
 from src.core.engine import connect_to_site
 from src.database import (
@@ -67,6 +68,8 @@ def _get_refresh_scheduler() -> RefreshScheduler:
                         "site": site.site,
                         "username": username,
                         "password": password,
+                        "session_state_key": session_state_key(access_token),
+                        "user_id": user_id,
                     },
                     user_id=user_id,
                     metadata={"access_token_prefix": access_token[:12]},
@@ -66,7 +66,9 @@ async def health_detailed(
     """
     Detailed health check with optional bearer-token gating.
 
-    Returns system status, version, database, browser pool, and Redis connectivity.
+    Returns system status, version, database, browser pool, and Redis
+    connectivity, plus circuit and concurrency state for sites this worker
+    has connected to.
     """
     if settings.health_check_token:
         auth_header = request.headers.get("authorization", "")
@@ -95,14 +97,24 @@ async def health_detailed(
         checks["database"] = "error"
 
     # Browser pool check (bounded so a stuck Playwright launch can't hang the probe)
+    browser_pool_status = None
     try:
-        await asyncio.wait_for(get_browser_pool(), timeout=_HEALTH_CHECK_TIMEOUT)
-        checks["browser_pool"] = "ok"
+        pool = await asyncio.wait_for(get_browser_pool(), timeout=_HEALTH_CHECK_TIMEOUT)
+        admission_status = getattr(pool, "admission_status", None)
+        browser_pool_status = admission_status() if callable(admission_status) else None
+        checks["browser_pool"] = "throttled" if browser_pool_status and browser_pool_status["throttled"] else "ok"
     except asyncio.TimeoutError:
         checks["browser_pool"] = "timeout"
     except Exception:
         checks["browser_pool"] = "unavailable"
 
+    # Per-site circuits: a tripped site fails its jobs fast but does not make
+    # the service itself unhealthy.
+    from src.core.site_guard import site_guard_status, tripped_sites
+
+    sites_status = site_guard_status()
+    checks["sites"] = "tripped" if tripped_sites() else "ok"
+
     # Redis check (ping off the event loop with a timeout so a hung socket
     # can't block the worker thread)
     try:
@@ -133,21 +145,25 @@ async def health_detailed(
 
     # DB, Redis, and KMS are required to serve credential traffic; their failure
     # (or a probe timeout) marks the service degraded (503). Browser-pool
-    # unavailability is non-fatal because the pool starts lazily on first use.
+    # unavailability is non-fatal because the pool starts lazily on first use,
+    # and a memory-throttled pool still serves (at a reduced limit).
     error_states = {"error", "unhealthy", "degraded", "timeout"}
     critical_checks = ("database", "redis", "kms")
     has_errors = any(checks.get(name) in error_states for name in critical_checks)
     overall = "degraded" if has_errors else "healthy"
     status_code = 503 if has_errors else 200
 
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": overall,
-            "version": settings.app_version,
-            "checks": checks,
-        },
-    )
+    content = {
+        "status": overall,
+        "version": settings.app_version,
+        "checks": checks,
+    }
+    if browser_pool_status is not None:
+        content["browser_pool"] = browser_pool_status
+    if sites_status:
+        content["sites"] = sites_status
+
+    return JSONResponse(status_code=status_code, content=content)
 
 
 @router.get("/status")
@@ -216,32 +232,28 @@ async def list_blueprints():
 
     Returns the name and basic info for each blueprint in the connectors directory.
     """
-    from pathlib import Path
-
-    from src.core.blueprint import blueprint_is_discoverable, load_blueprint
+    from src.core.blueprint import blueprint_is_discoverable
+    from src.core.blueprint_registry import get_blueprint_registry
 
-    connectors_path = Path(settings.connectors_dir).resolve()
     blueprints = []
 
-    if connectors_path.is_dir():
-        for f in sorted(connectors_path.glob("*.json")):
-            try:
-                bp = load_blueprint(f)
-                tags = bp.tags or []
-                if not blueprint_is_discoverable(tags, demo_mode=settings.demo_mode):
-                    continue
-                blueprints.append(
-                    {
-                        "site": f.stem,
-                        "name": bp.name,
-                        "domain": bp.domain,
-                        "tags": tags,
-                        "has_mfa": bp.mfa is not None,
-                        "schema_version": bp.schema_version,
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load blueprint {f.name}: {e}")
+    for f, bp in get_blueprint_registry(settings.connectors_dir).blueprints():
+        if isinstance(bp, Exception):
+            logger.warning(f"Failed to load blueprint {f.name}: {bp}")
+            continue
+        tags = bp.tags or []
+        if not blueprint_is_discoverable(tags, demo_mode=settings.demo_mode):
+            continue
+        blueprints.append(
+            {
+                "site": f.stem,
+                "name": bp.name,
+                "domain": bp.domain,
+                "tags": tags,
+                "has_mfa": bp.mfa is not None,
+                "schema_version": bp.schema_version,
+            }
+        )
 
     return {"blueprints": blueprints, "count": len(blueprints)}
 
@@ -396,7 +408,8 @@ async def get_blueprint_info(site: str):
     import re as _re
     from pathlib import Path
 
-    from src.core.blueprint import blueprint_is_discoverable, load_blueprint
+    from src.core.blueprint import blueprint_is_discoverable
+    from src.core.blueprint_registry import get_blueprint_registry
 
     # Validate site name to prevent path traversal
     if not _re.match(r"^[a-zA-Z0-9_-]+$", site):
@@ -411,7 +424,7 @@ async def get_blueprint_info(site: str):
     if not blueprint_path.exists():
         raise HTTPException(status_code=404, detail=f"Blueprint not found: {site}")
 
-    bp = load_blueprint(blueprint_path)
+    bp = get_blueprint_registry(settings.connectors_dir).get(blueprint_path)
     if not blueprint_is_discoverable(bp.tags, demo_mode=settings.demo_mode):
         raise HTTPException(status_code=404, detail=f"Blueprint not found: {site}")
     return {
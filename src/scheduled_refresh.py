@@ -20,12 +20,17 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from collections.abc import Coroutine
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Optional
 
+from src.core.acquire_queue import AcquirePriority, acquire_priority
+from src.core.watermarks import incremental_lists
+from src.exceptions import RateLimitedError, SiteUnavailableError
+
 logger = logging.getLogger("plaidify.scheduler")
 
 
@@ -51,6 +56,10 @@ _PRESET_INTERVAL_SECONDS = {
 
 MIN_INTERVAL_SECONDS = 300  # 5 minutes
 
+# Errors that carry a ``retry_after`` (site rate limit, open site circuit):
+# the job is retried then instead of being counted as a failure.
+_DEFERRABLE_ERRORS = (RateLimitedError, SiteUnavailableError)
+
 
 def resolve_schedule(
     schedule_format: Optional[str] = None,
@@ -84,6 +93,19 @@ class RefreshJob:
     last_error: Optional[str] = None
     consecutive_failures: int = 0
     enabled: bool = True
+    retry_at: Optional[datetime] = None  # set when deferred by a site's retry_after
+    list_watermarks: Dict[str, str] = field(default_factory=dict)  # newest row seen, by list field
+
+
+def _load_watermarks(raw: Optional[str]) -> Dict[str, str]:
+    """Parse a persisted ``list_watermarks`` column; unreadable values start over."""
+    if not raw:
+        return {}
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
 
 
 class RefreshScheduler:
@@ -93,7 +115,14 @@ class RefreshScheduler:
     Each tick, it iterates jobs whose interval has elapsed and invokes the
     provided ``fetch_callback`` (which should call the same logic as GET /fetch_data).
 
+    Each refresh runs in an ``incremental_lists`` scope: list fields with a
+    ``watermark`` column stop paginating at the newest row the job's previous
+    refresh saw, and the new watermarks are kept on the job for the next one.
+
     Exponential backoff is applied on failure: base interval * 2^(failures), capped at 24 h.
+    A refresh rejected with a ``retry_after`` (the site's blueprint rate limit,
+    or its open circuit breaker) is not a failure: the job is retried once
+    ``retry_after`` has passed.
 
     Args:
         fetch_callback: Async callable ``(access_token, user_id) -> dict`` that
@@ -289,6 +318,8 @@ class RefreshScheduler:
 
     def _is_due(self, job: RefreshJob, now: datetime) -> bool:
         """Check if a job is due for refresh, considering backoff."""
+        if job.retry_at is not None:
+            return now >= job.retry_at  # Deferred by the site's retry_after
         if not job.last_refreshed:
             return True  # Never refreshed — run immediately
         effective_interval = self._effective_interval(job)
@@ -308,10 +339,14 @@ class RefreshScheduler:
             token_short = job.access_token[:12]
             try:
                 logger.info("Refreshing data for %s...", token_short)
-                data = await self._fetch(job.access_token, job.user_id)
+                with acquire_priority(AcquirePriority.SCHEDULED_REFRESH):
+                    with incremental_lists(job.list_watermarks) as marks:
+                        data = await self._fetch(job.access_token, job.user_id)
+                job.list_watermarks.update(marks.latest)
                 job.last_refreshed = datetime.now(timezone.utc)
                 job.last_error = None
                 job.consecutive_failures = 0
+                job.retry_at = None
                 logger.info("Successfully refreshed %s", token_short)
 
                 # Fire webhook if callback is provided
@@ -322,6 +357,12 @@ class RefreshScheduler:
                         logger.exception("Webhook callback failed for %s", token_short)
 
             except Exception as exc:
+                retry_after = getattr(exc, "retry_after", None) if isinstance(exc, _DEFERRABLE_ERRORS) else None
+                if retry_after is not None:
+                    job.retry_at = datetime.now(timezone.utc) + timedelta(seconds=retry_after)
+                    logger.info("Refresh for %s deferred %ds: %s", token_short, retry_after, exc)
+                    return
+                job.retry_at = None
                 job.consecutive_failures += 1
                 job.last_error = str(exc)
                 job.last_refreshed = datetime.now(timezone.utc)
@@ -377,6 +418,7 @@ class RefreshScheduler:
                         last_error=row.last_error,
                         consecutive_failures=row.consecutive_failures,
                         enabled=row.enabled,
+                        list_watermarks=_load_watermarks(getattr(row, "list_watermarks", None)),
                     )
                 logger.info("Loaded %d refresh jobs from database", len(rows))
                 return len(rows)
@@ -402,6 +444,8 @@ class RefreshScheduler:
                     row.last_refreshed = job.last_refreshed
                     row.last_error = job.last_error
                     row.consecutive_failures = job.consecutive_failures
+                    if hasattr(row, "list_watermarks"):
+                        row.list_watermarks = json.dumps(job.list_watermarks) if job.list_watermarks else None
                 else:
                     kwargs = dict(
                         access_token=job.access_token,
@@ -414,6 +458,8 @@ class RefreshScheduler:
                     )
                     if hasattr(ScheduledRefreshJob, "schedule_format"):
                         kwargs["schedule_format"] = job.schedule_format
+                    if hasattr(ScheduledRefreshJob, "list_watermarks") and job.list_watermarks:
+                        kwargs["list_watermarks"] = json.dumps(job.list_watermarks)
                     row = ScheduledRefreshJob(**kwargs)
                     db.add(row)
                 db.commit()
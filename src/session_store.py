@@ -1,5 +1,6 @@
 """
-Redis-backed session store for link sessions, link scopes, and webhook deliveries.
+Redis-backed session store for link sessions, link scopes, webhook deliveries,
+and saved browser session state.
 
 Falls back to in-memory dicts when Redis is not configured (single-worker dev mode).
 Supports Redis pub/sub for cross-worker link session event notifications.
@@ -28,6 +29,7 @@ _MAX_MEM_LINK_SESSIONS = 10_000
 _MAX_MEM_LINK_SCOPES = 10_000
 _MAX_MEM_LINK_LAUNCH_BOOTSTRAPS = 10_000
 _MAX_MEM_WEBHOOK_DELIVERIES = 5_000
+_MAX_MEM_BROWSER_SESSIONS = 5_000
 
 
 def _get_redis():
@@ -253,6 +255,54 @@ def pop_link_refresh_schedule(link_token: str) -> Optional[str]:
         return _mem_link_refresh_schedules.pop(link_token, None)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# Browser Session State Store
+# ══════════════════════════════════════════════════════════════════════════════
+# Opaque (already encrypted) Playwright storage_state blobs, keyed by a hash of
+# the access token so a restored session can skip the auth steps.
+
+_mem_browser_sessions: Dict[str, Dict[str, Any]] = {}
+
+
+def set_browser_session_state(state_key: str, ciphertext: str, ttl: int) -> None:
+    """Store an encrypted browser session state for ``ttl`` seconds."""
+    r = _redis()
+    if r:
+        r.set(f"plaidify:browser_session:{state_key}", ciphertext, ex=ttl)
+    else:
+        now = time.time()
+        expired = [k for k, v in _mem_browser_sessions.items() if v["expires_at"] <= now]
+        for k in expired:
+            del _mem_browser_sessions[k]
+        if len(_mem_browser_sessions) >= _MAX_MEM_BROWSER_SESSIONS:
+            for k in list(_mem_browser_sessions)[: len(_mem_browser_sessions) - _MAX_MEM_BROWSER_SESSIONS + 1]:
+                del _mem_browser_sessions[k]
+        _mem_browser_sessions[state_key] = {"ciphertext": ciphertext, "expires_at": now + ttl}
+
+
+def get_browser_session_state(state_key: str) -> Optional[str]:
+    """Return the encrypted browser session state, or None if missing or expired."""
+    r = _redis()
+    if r:
+        return r.get(f"plaidify:browser_session:{state_key}")
+    entry = _mem_browser_sessions.get(state_key)
+    if not entry:
+        return None
+    if entry["expires_at"] <= time.time():
+        del _mem_browser_sessions[state_key]
+        return None
+    return entry["ciphertext"]
+
+
+def delete_browser_session_state(state_key: str) -> None:
+    """Forget a saved browser session state."""
+    r = _redis()
+    if r:
+        r.delete(f"plaidify:browser_session:{state_key}")
+    else:
+        _mem_browser_sessions.pop(state_key, None)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Link Launch Bootstrap Store
 # ══════════════════════════════════════════════════════════════════════════════
@@ -453,3 +503,4 @@ def clear_all():
     _mem_link_scopes.clear()
     _mem_link_launch_bootstraps.clear()
     _mem_webhook_deliveries.clear()
+    _mem_browser_sessions.clear()
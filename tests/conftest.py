@@ -68,6 +68,26 @@ def reset_rate_limiter():
     limiter._limiter.storage = MemoryStorage()
 
 
+@pytest.fixture(autouse=True)
+def reset_site_rate_limiter():
+    """Start every test with empty per-site rate-limit buckets."""
+    from src.core.site_rate_limit import get_site_rate_limiter
+
+    get_site_rate_limiter().reset()
+    yield
+    get_site_rate_limiter().reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_site_guards():
+    """Start every test with closed site circuits and full concurrency limits."""
+    from src.core.site_guard import reset_site_guards
+
+    reset_site_guards()
+    yield
+    reset_site_guards()
+
+
 @pytest.fixture
 def client():
     """FastAPI test client."""
@@ -0,0 +1,112 @@
+"""
+Benchmark for browserless (HTTP-mode) blueprint connections.
+
+Runs complete connections — login form post, cookie-carried account page,
+paginated list, second page — through ``_execute_http_blueprint`` against an
+in-process mock site, and reports wall time and peak Python heap per
+connection. Compare with a browser-mode connection on the same host: a fresh
+Chromium context costs hundreds of milliseconds and tens of MiB before the
+first navigation.
+
+Run:
+    ENCRYPTION_KEY=... JWT_SECRET_KEY=... python -m tests.load.bench_http_mode
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+import respx
+
+from src.core.blueprint import (
+    AuthConfig,
+    BlueprintStep,
+    BlueprintV2,
+    ExecutionMode,
+    ExtractionField,
+    FieldType,
+    ListExtractionField,
+    PaginationConfig,
+    StepAction,
+)
+from src.core.engine import _execute_http_blueprint
+
+CONNECTIONS = 200
+BASE = "https://utility.bench"
+ROWS = "".join(
+    f'<tr class="txn"><td class="d">2024-01-{i:02d}</td><td class="a">${i}.00</td></tr>' for i in range(1, 31)
+)
+LOGIN = (
+    '<form method="post" action="/session"><input type="hidden" name="csrf" value="t">'
+    '<input name="user" id="user"><input name="pass" id="pass"><button id="go">Go</button></form>'
+)
+ACCOUNT = f'<span id="bill">$1,234.50</span><table>{ROWS}</table><a id="next" href="/account?page=2">Next</a>'
+PAGE_TWO = f'<table>{ROWS}</table><a id="next" disabled>Next</a>'
+
+BLUEPRINT = BlueprintV2(
+    name="Bench Utility",
+    domain="utility.bench",
+    execution_mode=ExecutionMode.HTTP,
+    auth=AuthConfig(
+        steps=[
+            BlueprintStep(action=StepAction.GOTO, url=f"{BASE}/login"),
+            BlueprintStep(action=StepAction.FILL, selector="#user", value="{{username}}"),
+            BlueprintStep(action=StepAction.FILL, selector="#pass", value="{{password}}"),
+            BlueprintStep(action=StepAction.CLICK, selector="#go"),
+        ]
+    ),
+    extract={
+        "current_bill": ExtractionField(selector="#bill", type=FieldType.CURRENCY),
+        "transactions": ListExtractionField(
+            selector="tr.txn",
+            fields={
+                "date": ExtractionField(selector="td.d", type=FieldType.DATE),
+                "amount": ExtractionField(selector="td.a", type=FieldType.CURRENCY),
+            },
+            pagination=PaginationConfig(next_selector="#next", max_pages=2),
+        ),
+    },
+)
+
+
+def _router() -> respx.MockRouter:
+    router = respx.mock(base_url=BASE)
+    router.get("/login").respond(200, html=LOGIN)
+    router.post("/session").respond(302, headers={"location": "/account", "set-cookie": "sid=1; Path=/"})
+    router.get("/account", params={"page": "2"}).respond(200, html=PAGE_TWO)
+    router.get("/account").respond(200, html=ACCOUNT)
+    return router
+
+
+async def _connect() -> dict:
+    return await _execute_http_blueprint(BLUEPRINT, "bench_utility", "user", "pass", None, None)
+
+
+async def main() -> None:
+    with _router():
+        result = await _connect()  # warm up imports and parsers
+        assert len(result["data"]["transactions"]) == 60, result
+
+        latencies = []
+        for _ in range(CONNECTIONS):
+            started = time.perf_counter()
+            await _connect()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        await _connect()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    latencies.sort()
+    print(f"HTTP-mode connections: {CONNECTIONS} (4 requests each, 60 rows)")
+    print(f"  median   {statistics.median(latencies):8.2f} ms")
+    print(f"  p95      {latencies[int(len(latencies) * 0.95)]:8.2f} ms")
+    print(f"  peak heap per connection {peak / 1024 / 1024:6.2f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+Microbenchmark for the browser pool's request-blocking route handler.
+
+Compares the old per-request linear substring scan with the compiled
+``RequestFilter`` and times a full pass through the pool's route handler with
+fake routes, so no browser is needed.
+
+Run:
+    ENCRYPTION_KEY=... JWT_SECRET_KEY=... python -m tests.load.bench_route_handler
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.request_filter import DEFAULT_BLOCKED_HOSTS, DEFAULT_BLOCKED_RESOURCE_TYPES, RequestFilter
+
+REQUESTS = 50_000
+EXTRA_RULES = [f"ads{i}.example-tracker{i}.com" for i in range(200)]
+
+_URLS = [
+    ("https://bank.test/api/accounts?page=2", "xhr"),
+    ("https://bank.test/static/app.3f9a1c.js", "script"),
+    ("https://bank.test/img/logo.png", "image"),
+    ("https://www.google-analytics.com/g/collect?v=2&tid=G-1", "ping"),
+    ("https://stats.g.doubleclick.net/j/collect", "xhr"),
+    ("https://bank.test/dashboard", "document"),
+    ("https://ads150.example-tracker150.com/pixel.gif", "image"),
+    ("https://cdn.bank.test/fonts/inter.woff2", "font"),
+]
+
+
+def _linear_should_block(url: str, resource_type: str, patterns: list[str]) -> bool:
+    if resource_type in DEFAULT_BLOCKED_RESOURCE_TYPES:
+        return True
+    url = url.lower()
+    return any(pattern in url for pattern in patterns)
+
+
+def _time(label: str, fn, workload) -> float:
+    started = time.perf_counter()
+    for url, resource_type in workload:
+        fn(url, resource_type)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {elapsed / len(workload) * 1e6:8.2f} µs/request")
+    return elapsed
+
+
+class _Request:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.url = url
+        self.resource_type = resource_type
+        self.method = "GET"
+
+
+class _Route:
+    def __init__(self, request: _Request) -> None:
+        self.request = request
+
+    async def abort(self) -> None:
+        pass
+
+    async def continue_(self) -> None:
+        pass
+
+
+async def _time_handler(workload, rules: RequestFilter) -> None:
+    from tests.test_browser_pool import _make_pool
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = _make_pool(Path(tmp))
+        pooled = await pool.acquire("bench", request_filter=rules)
+        _pattern, handler = pooled.context.routes[0]
+        routes = [_Route(_Request(url, resource_type)) for url, resource_type in workload]
+        started = time.perf_counter()
+        for route in routes:
+            await handler(route)
+        elapsed = time.perf_counter() - started
+        print(f"{'pool route handler (compiled)':<36} {elapsed / len(routes) * 1e6:8.2f} µs/request")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    workload = [rng.choice(_URLS) for _ in range(REQUESTS)]
+    patterns = [*DEFAULT_BLOCKED_HOSTS, *EXTRA_RULES]
+    rules = RequestFilter.for_rules(block=EXTRA_RULES)
+
+    for url, resource_type in _URLS:
+        assert _linear_should_block(url, resource_type, patterns) == rules.should_block(url, resource_type), url
+
+    print(f"{REQUESTS} requests, {len(patterns)} block rules")
+    linear = _time("linear substring scan", lambda u, t: _linear_should_block(u, t, patterns), workload)
+    compiled = _time("compiled RequestFilter", rules.should_block, workload)
+    print(f"{'speedup':<36} {linear / compiled:8.1f}x")
+    asyncio.run(_time_handler(workload, rules))
+
+
+if __name__ == "__main__":
+    main()
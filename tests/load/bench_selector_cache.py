@@ -0,0 +1,98 @@
+"""
+Benchmark for the selector-cache hit path against cache size.
+
+A cached-selector extraction does ``get`` + ``record_success``. The original
+persistence (kept here as ``_LegacyCache``) rewrote the whole JSON file on
+every ``record_success``; the write-behind journal only marks the entry
+dirty on the caller's thread. Reports per-hit latency for both at growing
+cache sizes.
+
+Run:
+    ENCRYPTION_KEY=... JWT_SECRET_KEY=... python -m tests.load.bench_selector_cache [sizes...]
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.selector_cache import SelectorCache
+
+
+class _LegacyCache(SelectorCache):
+    """SelectorCache with the original rewrite-everything persistence."""
+
+    def __init__(self, persist_path: str) -> None:
+        super().__init__()
+        self._legacy_path = persist_path
+
+    def put(self, *args, **kwargs):
+        entry = super().put(*args, **kwargs)
+        self._save_to_disk()
+        return entry
+
+    def record_success(self, *args, **kwargs) -> None:
+        super().record_success(*args, **kwargs)
+        self._save_to_disk()
+
+    def _save_to_disk(self) -> None:
+        data = {k: v.to_dict() for k, v in self._store.items()}
+        path = Path(self._legacy_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+
+
+def _populate(cache: SelectorCache, size: int) -> None:
+    selectors = {"balance": "#balance", "transactions": {"row": "tr.txn", "fields": {"amount": "td.amt"}}}
+    for i in range(size):
+        SelectorCache.put(cache, f"site{i % 50}.example", f"/page/{i}/view", selectors, confidence=0.9)
+
+
+def _hits(cache: SelectorCache, size: int, count: int) -> list[float]:
+    timings = []
+    for i in range(count):
+        domain, path = f"site{i % 50}.example", f"/page/{(i * 7919) % size}/view"
+        started = time.perf_counter()
+        if cache.get(domain, path) is not None:
+            cache.record_success(domain, path)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _row(label: str, timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{label:<24} mean {statistics.mean(timings) * 1e6:10.1f} us"
+        f"   p50 {statistics.median(timings) * 1e6:10.1f} us   p99 {p99 * 1e6:10.1f} us"
+    )
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy = _LegacyCache(f"{tmp}/legacy.json")
+            _populate(legacy, size)
+            legacy_timings = _hits(legacy, size, max(10, min(1000, 200_000 // size)))
+
+            journal = SelectorCache(persist_path=f"{tmp}/journal.json")
+            _populate(journal, size)
+            journal.flush()
+            journal_timings = _hits(journal, size, 5000)
+            started = time.perf_counter()
+            journal.close()
+            close_s = time.perf_counter() - started
+
+        print(f"cache size {size}")
+        print(_row("  rewrite file (legacy)", legacy_timings))
+        print(_row("  write-behind journal", journal_timings))
+        print(f"  {'final journal flush':<22} {close_s * 1000:10.1f} ms (writer thread, off the event loop)")
+
+
+if __name__ == "__main__":
+    main()
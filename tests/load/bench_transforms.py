@@ -0,0 +1,133 @@
+"""
+Benchmark for list-field transforms on large tables.
+
+Compares the original cell-by-cell ``apply_transform`` + ``coerce_type`` (kept
+here verbatim as ``_legacy_*``) with compiled ``TransformPlan``s run over whole
+columns, on a synthetic transaction table.
+
+Run:
+    ENCRYPTION_KEY=... JWT_SECRET_KEY=... python -m tests.load.bench_transforms [rows]
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from src.core.blueprint import ExtractionField, FieldType
+from src.core.data_extractor import TRANSFORMS, plan_for
+
+
+def _legacy_parse_date(value, fmt=None):
+    if fmt:
+        try:
+            return datetime.strptime(value.strip(), fmt).isoformat()
+        except ValueError:
+            pass
+    formats = [
+        "%m/%d/%Y",
+        "%Y-%m-%d",
+        "%m-%d-%Y",
+        "%d/%m/%Y",
+        "%B %d, %Y",
+        "%b %d, %Y",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%m/%d/%y",
+    ]
+    for f in formats:
+        try:
+            return datetime.strptime(value.strip(), f).isoformat()
+        except ValueError:
+            continue
+    return value.strip()
+
+
+def _legacy_apply_transform(value, transform):
+    if transform is None:
+        return value
+    param_match = re.match(r"(\w+)\((.+)\)", transform)
+    if param_match:
+        func_name, param = param_match.group(1), param_match.group(2)
+        if func_name == "regex_extract":
+            match = re.search(param, value)
+            if match:
+                return match.group(1) if match.groups() else match.group(0)
+            return value
+        if func_name == "parse_date":
+            return _legacy_parse_date(value, param)
+    if transform == "parse_date":
+        return _legacy_parse_date(value)
+    return TRANSFORMS[transform](value)
+
+
+def _legacy_coerce(value, field_type):
+    if value is None:
+        return None
+    str_val = str(value).strip()
+    if field_type == FieldType.CURRENCY:
+        cleaned = re.sub(r"[^\d.\-]", "", str_val)
+        return round(float(cleaned), 2)
+    if field_type == FieldType.DATE:
+        return _legacy_parse_date(str_val)
+    return str_val
+
+
+COLUMNS = {
+    "posted": ExtractionField(selector=".posted", type=FieldType.DATE, transform="parse_date"),
+    "value_date": ExtractionField(selector=".value", type=FieldType.DATE),
+    "amount": ExtractionField(selector=".amount", type=FieldType.CURRENCY, transform="strip_dollar_sign"),
+    "description": ExtractionField(selector=".desc", transform="strip_whitespace"),
+    "reference": ExtractionField(selector=".ref", transform=r"regex_extract(REF-(\d+))"),
+}
+
+
+def _table(rows: int) -> list[dict[str, str]]:
+    rng = random.Random(0)
+    start = date(2024, 1, 1)
+    table = []
+    for i in range(rows):
+        day = start + timedelta(days=rng.randrange(700))
+        table.append(
+            {
+                "posted": day.strftime("%m/%d/%Y"),
+                "value_date": day.strftime("%d %b %Y") if i % 50 == 0 else day.strftime("%b %d, %Y"),
+                "amount": f" ${rng.uniform(-900, 900):,.2f} ",
+                "description": f"  POS   PURCHASE   STORE {rng.randrange(1000)}  ",
+                "reference": f"Ref REF-{rng.randrange(10**8)}",
+            }
+        )
+    return table
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    table = _table(rows)
+
+    started = time.perf_counter()
+    legacy = [
+        {
+            name: _legacy_coerce(_legacy_apply_transform(row[name], col.transform), col.type)
+            for name, col in COLUMNS.items()
+        }
+        for row in table
+    ]
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columns = {name: plan_for(col).apply_column([row[name] for row in table]) for name, col in COLUMNS.items()}
+    compiled = [{name: columns[name][i] for name in COLUMNS} for i in range(rows)]
+    compiled_s = time.perf_counter() - started
+
+    assert compiled == legacy, "compiled plans disagree with the cell-by-cell path"
+    print(f"{rows} rows x {len(COLUMNS)} columns")
+    print(f"{'cell-by-cell (legacy)':<28} {legacy_s * 1000:8.1f} ms")
+    print(f"{'compiled column plans':<28} {compiled_s * 1000:8.1f} ms")
+    print(f"{'speedup':<28} {legacy_s / compiled_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
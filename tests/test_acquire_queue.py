@@ -0,0 +1,146 @@
+"""Tests for the priority-aware, per-site-fair browser admission queue."""
+
+import asyncio
+
+import pytest
+from prometheus_client import generate_latest
+
+from src.core.acquire_queue import (
+    AcquirePriority,
+    AcquireQueue,
+    acquire_priority,
+    current_priority,
+    priority_for_job_type,
+)
+from tests.test_browser_pool import _make_pool
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _start(queue: AcquireQueue, order: list, name: str, **kwargs) -> asyncio.Task:
+    async def _run():
+        await queue.acquire(**kwargs)
+        order.append(name)
+
+    return asyncio.create_task(_run())
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_class_is_admitted_first():
+    queue = AcquireQueue(1)
+    await queue.acquire()
+    order: list[str] = []
+
+    tasks = [
+        _start(queue, order, "refresh", priority=AcquirePriority.SCHEDULED_REFRESH),
+        _start(queue, order, "fetch", priority=AcquirePriority.FETCH_DATA),
+        _start(queue, order, "interactive", priority=AcquirePriority.INTERACTIVE),
+    ]
+    await _settle()
+    assert queue.waiting_by_priority() == {"interactive": 1, "fetch_data": 1, "scheduled_refresh": 1}
+
+    for _ in tasks:
+        queue.release()
+        await _settle()
+
+    assert order == ["interactive", "fetch", "refresh"]
+
+
+@pytest.mark.asyncio
+async def test_site_cap_skips_waiters_without_blocking_others():
+    queue = AcquireQueue(3)
+    await queue.acquire(site="slow-bank", site_limit=1)
+    order: list[str] = []
+
+    blocked = _start(queue, order, "slow-bank-2", site="slow-bank", site_limit=1)
+    other = _start(queue, order, "utility", site="utility")
+    await _settle()
+
+    assert order == ["utility"]
+    assert not blocked.done()
+    assert queue.in_use == 2
+
+    queue.release("slow-bank")
+    await _settle()
+    assert order == ["utility", "slow-bank-2"]
+    assert queue.site_active("slow-bank") == 1
+    await asyncio.gather(blocked, other)
+
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_fairly_between_sites():
+    queue = AcquireQueue(2)
+    await queue.acquire(site="busy")
+    await queue.acquire(site="busy")
+    order: list[str] = []
+
+    tasks = [
+        _start(queue, order, "busy-3", site="busy"),
+        _start(queue, order, "busy-4", site="busy"),
+        _start(queue, order, "quiet-1", site="quiet"),
+    ]
+    await _settle()
+
+    queue.release("busy")
+    await _settle()
+    # The quiet site holds no slots, so it goes ahead of earlier busy waiters.
+    assert order == ["quiet-1"]
+
+    queue.release("busy")
+    queue.release("quiet")
+    await asyncio.gather(*tasks)
+    assert order == ["quiet-1", "busy-3", "busy-4"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    queue = AcquireQueue(1)
+    await queue.acquire()
+
+    waiter = asyncio.create_task(queue.acquire())
+    await _settle()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    queue.release()
+    assert queue.in_use == 0
+    assert queue.waiting == 0
+    assert await queue.acquire() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_priority_context_flows_into_tasks():
+    assert current_priority() is AcquirePriority.FETCH_DATA
+    assert priority_for_job_type("connect") is AcquirePriority.INTERACTIVE
+    assert priority_for_job_type("scheduled_refresh") is AcquirePriority.SCHEDULED_REFRESH
+    assert AcquirePriority.parse("interactive") is AcquirePriority.INTERACTIVE
+    assert AcquirePriority.parse("bogus") is AcquirePriority.FETCH_DATA
+
+    with acquire_priority(AcquirePriority.SCHEDULED_REFRESH):
+        seen = await asyncio.create_task(asyncio.sleep(0, result=current_priority()))
+    assert seen is AcquirePriority.SCHEDULED_REFRESH
+    assert current_priority() is AcquirePriority.FETCH_DATA
+
+
+@pytest.mark.asyncio
+async def test_pool_applies_site_cap_and_records_wait_by_class(tmp_path):
+    pool = _make_pool(tmp_path)
+
+    with acquire_priority(AcquirePriority.INTERACTIVE):
+        await pool.acquire("cap-a", site="bank", site_limit=1)
+    pending = asyncio.create_task(pool.acquire("cap-b", site="bank", site_limit=1))
+    await _settle()
+    assert not pending.done()
+    assert pool.queued_count == 1
+
+    await pool.release("cap-a")
+    second = await asyncio.wait_for(pending, timeout=1)
+    assert second.site == "bank"
+
+    out = generate_latest().decode()
+    assert 'plaidify_browser_pool_queue_wait_seconds_count{priority="interactive"}' in out
+    assert 'plaidify_browser_pool_queue_wait_seconds_count{priority="fetch_data"}' in out
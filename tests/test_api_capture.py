@@ -0,0 +1,394 @@
+"""Tests for JSON api sources: path matching, XHR capture and direct replay."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+
+from src.core import engine
+from src.core.api_capture import ApiCapture, ApiExtractor, ApiReplayer, JsonPathError, json_path
+from src.core.blueprint import (
+    ApiConfig,
+    ApiEndpoint,
+    AuthConfig,
+    BlueprintStep,
+    BlueprintV2,
+    ExecutionMode,
+    ExtractionField,
+    ExtractionPage,
+    FieldType,
+    ListExtractionField,
+    StepAction,
+)
+from src.core.read_only_policy import ExecutionPhase, ReadOnlyExecutionPolicy
+from src.exceptions import DataExtractionError, ReadOnlyPolicyViolationError
+from tests.test_browser_sessions import FakeContext, FakePage, FakePool
+from tests.test_step_plan import FieldExtractor, StepRecorder
+
+ACCOUNTS = {
+    "accounts": [
+        {"id": "chk", "balance": "1,234.50", "open": True},
+        {"id": "sav", "balance": 99, "open": False},
+    ],
+    "owner": {"name": "Ada"},
+}
+TRANSACTIONS = {"items": [{"date": "2024-01-05", "amount": -10}, {"date": "2024-01-06", "amount": 20.5}]}
+
+
+def test_json_path_expressions():
+    assert json_path(ACCOUNTS, "$.accounts[0].balance") == ["1,234.50"]
+    assert json_path(ACCOUNTS, "$['owner']['name']") == ["Ada"]
+    assert json_path(ACCOUNTS, "$.accounts[*].id") == ["chk", "sav"]
+    assert json_path(ACCOUNTS, "$.accounts[-1].id") == ["sav"]
+    assert json_path(ACCOUNTS, "accounts[5].id") == []
+    assert json_path(ACCOUNTS, "$.missing.key") == []
+    assert json_path(ACCOUNTS, "$") == [ACCOUNTS]
+    with pytest.raises(JsonPathError):
+        json_path(ACCOUNTS, "$.accounts[?(@.open)]")
+
+
+def _fields():
+    return {
+        "balance": ExtractionField(
+            selector="#balance", api="accounts", json_path="$.accounts[0].balance", type=FieldType.CURRENCY
+        ),
+        "owner": ExtractionField(selector="#owner", api="accounts", json_path="$.owner.name"),
+        "nickname": ExtractionField(selector="#nick", api="accounts", json_path="$.nickname", default="none"),
+        "transactions": ListExtractionField(
+            selector="tr.txn",
+            api="transactions",
+            json_path="$.items",
+            fields={
+                "date": ExtractionField(selector="td.d"),
+                "amount": ExtractionField(selector="td.a", type=FieldType.NUMBER),
+            },
+        ),
+    }
+
+
+class StaticSource:
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    async def payload(self, name):
+        if name not in self.payloads:
+            raise LookupError(name)
+        return self.payloads[name]
+
+
+@pytest.mark.asyncio
+async def test_extractor_applies_field_types_and_defaults():
+    extractor = ApiExtractor(StaticSource({"accounts": ACCOUNTS, "transactions": TRANSACTIONS}))
+
+    data = await extractor.extract(_fields(), site="bank")
+
+    assert data == {
+        "balance": 1234.5,
+        "owner": "Ada",
+        "nickname": "none",
+        "transactions": [{"date": "2024-01-05", "amount": -10.0}, {"date": "2024-01-06", "amount": 20.5}],
+    }
+    assert set(extractor.timings) == set(data)
+
+
+@pytest.mark.asyncio
+async def test_missing_payload_leaves_lists_empty_and_fails_required_scalars():
+    fields = _fields()
+    data = await ApiExtractor(StaticSource({"accounts": ACCOUNTS})).extract(
+        {"transactions": fields["transactions"]}, site="bank"
+    )
+    assert data == {"transactions": []}
+
+    with pytest.raises(DataExtractionError):
+        await ApiExtractor(StaticSource({})).extract({"owner": fields["owner"]}, site="bank")
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, ok: bool = True):
+        self._body = body
+        self.ok = ok
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, response):
+        self.response = response
+        self.fulfilled = None
+
+    async def fetch(self):
+        return self.response
+
+    async def fulfill(self, response=None, body=None):
+        self.fulfilled = (response, body)
+
+
+class FakeRequest:
+    def __init__(self, url, method="GET", resource_type="xhr"):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+
+
+@pytest.mark.asyncio
+async def test_capture_records_matching_xhr_and_passes_the_response_through():
+    capture = ApiCapture({"accounts": ApiEndpoint(url="/api/v2/accounts*")}, site="bank")
+    request = FakeRequest("https://bank.test/API/v2/accounts?ts=1")
+    route = FakeRoute(FakeResponse(json.dumps(ACCOUNTS).encode()))
+
+    assert capture.wants(request)
+    assert not capture.wants(FakeRequest(request.url, resource_type="document"))
+    assert not capture.wants(FakeRequest(request.url, method="POST"))
+
+    await capture.handle(route, request)
+
+    assert route.fulfilled == (route.response, json.dumps(ACCOUNTS).encode())
+    assert await capture.payload("accounts") == ACCOUNTS
+    assert capture.urls["accounts"] == request.url
+
+
+@pytest.mark.asyncio
+async def test_capture_waits_for_the_page_then_gives_up():
+    capture = ApiCapture({"accounts": ApiEndpoint(url="/accounts", timeout=10)}, site="bank")
+    bad = FakeRoute(FakeResponse(b"<html>login</html>"))
+    await capture.handle(bad, FakeRequest("https://bank.test/accounts"))
+
+    assert bad.fulfilled is not None
+    with pytest.raises(LookupError):
+        await capture.payload("accounts")
+
+
+@pytest.mark.asyncio
+async def test_replay_fetches_each_endpoint_once():
+    calls = []
+
+    async def fetch_json(method, url, body):
+        calls.append((method, url, body))
+        return ACCOUNTS
+
+    endpoints = {
+        "accounts": ApiEndpoint(url="/api/accounts*", replay_url="/api/accounts?all=1"),
+        "search": ApiEndpoint(url="/api/search", method="post", body={"q": "*"}),
+    }
+    replayer = ApiReplayer(endpoints, fetch_json, site="bank")
+    fields = {
+        "owner": ExtractionField(selector="#o", api="accounts", json_path="$.owner.name"),
+        "first": ExtractionField(selector="#f", api="accounts", json_path="$.accounts[0].id"),
+        "hits": ExtractionField(selector="#h", api="search", json_path="$.owner.name"),
+    }
+
+    data = await ApiExtractor(replayer).extract(fields, site="bank")
+
+    assert data == {"owner": "Ada", "first": "chk", "hits": "Ada"}
+    assert sorted(calls) == [("GET", "/api/accounts?all=1", None), ("POST", "/api/search", {"q": "*"})]
+    assert ApiReplayer.replay_url(ApiEndpoint(url="/api/accounts*")) is None
+
+
+@pytest.mark.asyncio
+async def test_replay_respects_the_read_only_policy():
+    async def fetch_json(method, url, body):
+        raise AssertionError("blocked requests must not be sent")
+
+    policy = ReadOnlyExecutionPolicy(enabled=True)
+    policy.set_phase(ExecutionPhase.READ)
+    replayer = ApiReplayer(
+        {"purge": ApiEndpoint(url="/api/cache", method="DELETE")}, fetch_json, read_only_policy=policy, site="bank"
+    )
+    fields = {"x": ExtractionField(selector="#x", api="purge", json_path="$.x", default="")}
+
+    with pytest.raises(ReadOnlyPolicyViolationError):
+        await ApiExtractor(replayer).extract(fields, site="bank")
+    assert policy.blocked_actions[0].target == "/api/cache"
+
+
+def test_api_fields_must_reference_a_declared_endpoint_with_a_path():
+    with pytest.raises(ValidationError, match="unknown api endpoint"):
+        BlueprintV2(
+            name="x",
+            domain="x.test",
+            auth=AuthConfig(steps=[]),
+            extract={"bill": ExtractionField(selector="#bill", api="billing", json_path="$.due")},
+        )
+    with pytest.raises(ValidationError, match="without a json_path"):
+        BlueprintV2(
+            name="x",
+            domain="x.test",
+            auth=AuthConfig(steps=[]),
+            extract={"bill": ExtractionField(selector="#bill", api="billing")},
+            api=ApiConfig(endpoints={"billing": ApiEndpoint(url="/api/billing")}),
+        )
+
+
+def _blueprint(replay: bool, **overrides) -> BlueprintV2:
+    data = dict(
+        name="Bank",
+        domain="bank.test",
+        auth=AuthConfig(steps=[BlueprintStep(action=StepAction.GOTO, url="https://bank.test/login")]),
+        extract={
+            "holder": ExtractionField(selector="#holder"),
+            "owner": ExtractionField(selector="#owner", api="accounts", json_path="$.owner.name"),
+            "transactions": ListExtractionField(
+                selector="tr.txn",
+                api="transactions",
+                json_path="$.items[*]",
+                fields={"amount": ExtractionField(selector="td.a", type=FieldType.NUMBER)},
+            ),
+        },
+        pages=[
+            ExtractionPage(
+                name="activity",
+                steps=[BlueprintStep(action=StepAction.GOTO, url="https://bank.test/activity")],
+                fields=["transactions"],
+            )
+        ],
+        api=ApiConfig(
+            endpoints={
+                "accounts": ApiEndpoint(url="https://bank.test/api/accounts"),
+                "transactions": ApiEndpoint(url="https://bank.test/api/transactions"),
+            },
+            replay=replay,
+        ),
+    )
+    data.update(overrides)
+    return BlueprintV2(**data)
+
+
+class ApiResponse:
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+        self.ok = status < 400
+
+    async def json(self):
+        return self.payload
+
+
+class RequestContext:
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, url, method="GET", data=None):
+        self.calls.append((method, url))
+        return ApiResponse(ACCOUNTS if url.endswith("/accounts") else TRANSACTIONS)
+
+
+class ReplayContext(FakeContext):
+    def __init__(self):
+        super().__init__(FakePage(logged_in=True))
+        self.page.url = "https://bank.test/home"
+        self.request = RequestContext()
+
+
+async def _run_browser(monkeypatch, blueprint, context, extract_fields=None):
+    async def fake_get_pool():
+        return FakePool(context)
+
+    StepRecorder.runs = []
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", StepRecorder)
+    monkeypatch.setattr(engine, "DataExtractor", FieldExtractor)
+    return await engine._execute_blueprint(
+        blueprint=blueprint,
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=extract_fields,
+        proxy=None,
+        session_id="sess-api",
+    )
+
+
+@pytest.mark.asyncio
+async def test_browser_replay_skips_pages_only_api_fields_needed(monkeypatch):
+    context = ReplayContext()
+
+    result = await _run_browser(monkeypatch, _blueprint(replay=True), context)
+
+    assert [run for run, _ in StepRecorder.runs] == ["auth"]
+    assert sorted(context.request.calls) == [
+        ("GET", "https://bank.test/api/accounts"),
+        ("GET", "https://bank.test/api/transactions"),
+    ]
+    assert result["data"] == {
+        "holder": "<holder>",
+        "owner": "Ada",
+        "transactions": [{"amount": -10.0}, {"amount": 20.5}],
+    }
+    assert result["metadata"]["skipped_steps"] == ["page:activity[0] goto"]
+
+
+@pytest.mark.asyncio
+async def test_browser_capture_reads_payloads_the_pages_requested(monkeypatch):
+    captures = []
+
+    class CapturingPool(FakePool):
+        async def acquire(self, session_id, api_capture=None, **_kwargs):
+            api_capture.record("accounts", "https://bank.test/api/accounts", ACCOUNTS)
+            api_capture.record("transactions", "https://bank.test/api/transactions", TRANSACTIONS)
+            captures.append(api_capture)
+            return self.pooled
+
+    async def fake_get_pool():
+        return CapturingPool(FakeContext(FakePage(logged_in=True)))
+
+    StepRecorder.runs = []
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", StepRecorder)
+    monkeypatch.setattr(engine, "DataExtractor", FieldExtractor)
+    result = await engine._execute_blueprint(
+        blueprint=_blueprint(replay=False),
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=["owner", "transactions"],
+        proxy=None,
+        session_id="sess-capture",
+    )
+
+    assert len(captures) == 1
+    assert [run for run, _ in StepRecorder.runs] == ["auth", "page:activity"]
+    assert result["data"] == {"owner": "Ada", "transactions": [{"amount": -10.0}, {"amount": 20.5}]}
+    assert result["extraction_method"] == "api_json"
+
+
+@pytest.mark.asyncio
+async def test_http_mode_replays_endpoints_with_the_session_cookies():
+    blueprint = _blueprint(replay=False, execution_mode=ExecutionMode.HTTP, pages=[])
+    blueprint.extract["holder"] = ExtractionField(selector="#holder")
+
+    def accounts(request):
+        assert "sid=abc" in request.headers.get("cookie", "")
+        return httpx.Response(200, json=ACCOUNTS)
+
+    with respx.mock(base_url="https://bank.test") as router:
+        router.get("/login").respond(200, html='<h1 id="holder">Ada L.</h1>', headers={"set-cookie": "sid=abc; Path=/"})
+        router.get("/api/accounts").mock(side_effect=accounts)
+        router.get("/api/transactions").respond(200, json=TRANSACTIONS)
+        result = await engine._execute_http_blueprint(blueprint, "bank", "u", "p", None, None)
+
+    assert result["data"] == {
+        "holder": "Ada L.",
+        "owner": "Ada",
+        "transactions": [{"amount": -10.0}, {"amount": 20.5}],
+    }
+    assert result["metadata"]["http_requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_http_mode_needs_a_concrete_replay_url():
+    blueprint = _blueprint(
+        replay=True,
+        execution_mode=ExecutionMode.HTTP,
+        api=ApiConfig(
+            endpoints={
+                "accounts": ApiEndpoint(url="https://bank.test/api/accounts?*"),
+                "transactions": ApiEndpoint(url="https://bank.test/api/transactions"),
+            }
+        ),
+    )
+
+    with pytest.raises(engine.HttpModeUnsupported, match="replay_url"):
+        await engine._execute_http_blueprint(blueprint, "bank", "u", "p", ["owner"], None)
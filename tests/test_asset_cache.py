@@ -0,0 +1,227 @@
+"""Tests for the shared static-asset cache used by the browser pool."""
+
+import pytest
+
+from src.core.asset_cache import CachedAsset, StaticAssetCache, has_credentials
+from tests.test_browser_pool import _make_pool
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET", headers=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self._headers = headers or {}
+
+    async def all_headers(self):
+        return dict(self._headers)
+
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None, body=b"console.log(1)"):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, request, response=None):
+        self.request = request
+        self.response = response or FakeResponse()
+        self.fetched_with: list[dict] = []
+        self.fulfilled: list[dict] = []
+        self.continued = False
+        self.aborted = False
+
+    async def fetch(self, headers=None):
+        self.fetched_with.append(headers or {})
+        return self.response
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled.append(kwargs)
+
+    async def continue_(self):
+        self.continued = True
+
+    async def abort(self):
+        self.aborted = True
+
+
+CACHEABLE = {"cache-control": "public, max-age=600", "content-encoding": "gzip", "etag": '"v1"'}
+
+
+async def _serve(cache, url, response, resource_type="script", headers=None):
+    request = FakeRequest(url, resource_type=resource_type, headers=headers)
+    route = FakeRoute(request, response)
+    await cache.handle(route, request, await request.all_headers())
+    return route
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_cache():
+    cache = StaticAssetCache(max_bytes=1024)
+
+    first = await _serve(cache, "https://bank.test/app.js", FakeResponse(headers=CACHEABLE))
+    second = await _serve(cache, "https://bank.test/app.js", FakeResponse(body=b"never fetched"))
+
+    assert len(first.fetched_with) == 1
+    assert second.fetched_with == []
+    replay = second.fulfilled[0]
+    assert replay["body"] == b"console.log(1)"
+    assert "content-encoding" not in replay["headers"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"cache-control": "private, max-age=600"},
+        {"cache-control": "no-store"},
+        {"cache-control": "max-age=600", "set-cookie": "sid=1"},
+        {"cache-control": "max-age=600", "vary": "Cookie"},
+        {},
+    ],
+)
+async def test_uncacheable_responses_are_not_stored(headers):
+    cache = StaticAssetCache(max_bytes=1024)
+
+    route = await _serve(cache, "https://bank.test/app.js", FakeResponse(headers=headers))
+
+    assert len(cache) == 0
+    assert route.fulfilled[0]["response"] is route.response
+
+
+@pytest.mark.asyncio
+async def test_xhr_is_cached_only_when_public():
+    cache = StaticAssetCache(max_bytes=1024)
+
+    await _serve(cache, "https://bank.test/config", FakeResponse(headers={"cache-control": "max-age=60"}), "xhr")
+    assert len(cache) == 0
+
+    await _serve(
+        cache, "https://bank.test/config", FakeResponse(headers={"cache-control": "public, max-age=60"}), "xhr"
+    )
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_validators():
+    cache = StaticAssetCache(max_bytes=1024)
+    headers = {"cache-control": "no-cache", "etag": '"v1"'}
+    await _serve(cache, "https://bank.test/app.js", FakeResponse(headers=headers))
+
+    route = await _serve(cache, "https://bank.test/app.js", FakeResponse(status=304, headers={}, body=b""))
+
+    assert route.fetched_with[0]["if-none-match"] == '"v1"'
+    assert route.fulfilled[0]["body"] == b"console.log(1)"
+    assert route.fulfilled[0]["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_vary_headers_are_part_of_the_key():
+    cache = StaticAssetCache(max_bytes=1024)
+    headers = {**CACHEABLE, "vary": "Accept-Language"}
+    await _serve(cache, "https://bank.test/app.js", FakeResponse(headers=headers), headers={"accept-language": "en"})
+
+    other = await _serve(
+        cache,
+        "https://bank.test/app.js",
+        FakeResponse(headers=headers, body=b"fr"),
+        headers={"accept-language": "fr"},
+    )
+    assert len(other.fetched_with) == 1
+    assert len(cache) == 2
+
+
+def test_lru_eviction_respects_byte_budget():
+    cache = StaticAssetCache(max_bytes=10, max_entry_bytes=10)
+
+    def entry(body: bytes) -> CachedAsset:
+        return CachedAsset(status=200, headers={}, body=body, fresh_until=float("inf"))
+
+    cache.put("a", {}, (), entry(b"aaaa"))
+    cache.put("b", {}, (), entry(b"bbbb"))
+    assert cache.get("a", {}) is not None  # touch "a" so "b" is the LRU entry
+    cache.put("c", {}, (), entry(b"cccc"))
+
+    assert cache.size_bytes == 8
+    assert cache.get("b", {}) is None
+    assert cache.get("a", {}) is not None
+
+    cache.put("huge", {}, (), entry(b"x" * 11))
+    assert cache.get("huge", {}) is None
+
+
+def test_evicting_a_url_forgets_its_vary_headers():
+    cache = StaticAssetCache(max_bytes=8, max_entry_bytes=8)
+
+    def entry(body: bytes) -> CachedAsset:
+        return CachedAsset(status=200, headers={}, body=body, fresh_until=float("inf"))
+
+    for n in range(10):
+        cache.put(f"https://bank.test/app.js?v={n}", {"accept-language": "en"}, ("accept-language",), entry(b"aaaa"))
+
+    assert len(cache) == 2
+    assert len(cache._vary) == 2
+
+
+def test_changed_vary_headers_purge_the_urls_old_entries():
+    cache = StaticAssetCache(max_bytes=1024)
+    url = "https://bank.test/app.js"
+    old = CachedAsset(status=200, headers={}, body=b"old", fresh_until=float("inf"))
+    new = CachedAsset(status=200, headers={}, body=b"new!", fresh_until=float("inf"))
+
+    cache.put(url, {"accept-language": "en"}, ("accept-language",), old)
+    cache.put(url, {"accept-language": "fr"}, ("accept-language",), old)
+    cache.put(url, {}, (), new)
+
+    assert len(cache) == 1
+    assert cache.size_bytes == 4
+    assert cache.get(url, {"accept-language": "en"}) is new
+
+
+def test_credential_headers_are_detected():
+    assert has_credentials({"cookie": "sid=1"})
+    assert has_credentials({"authorization": "Bearer x"})
+    assert not has_credentials({"accept": "*/*"})
+
+
+@pytest.mark.asyncio
+async def test_pool_route_handler_bypasses_cache_for_credentialed_requests(tmp_path):
+    pool = _make_pool(tmp_path)
+    pool._block_resources = False
+    pool._asset_cache = StaticAssetCache(max_bytes=1024)
+    pooled = await pool.acquire("cache-a")
+    _pattern, handler = pooled.context.routes[0]
+
+    anonymous = FakeRoute(FakeRequest("https://bank.test/app.js"), FakeResponse(headers=CACHEABLE))
+    await handler(anonymous)
+    credentialed = FakeRoute(FakeRequest("https://bank.test/app.js", headers={"cookie": "sid=1"}))
+    await handler(credentialed)
+    image = FakeRoute(FakeRequest("https://bank.test/logo.png", resource_type="image"), FakeResponse(headers=CACHEABLE))
+    await handler(image)
+
+    assert anonymous.fetched_with and len(pool._asset_cache) == 2
+    assert credentialed.continued is True
+    assert image.aborted is False
+
+
+@pytest.mark.asyncio
+async def test_pool_route_handler_bypasses_cache_when_the_context_has_cookies(tmp_path):
+    pool = _make_pool(tmp_path)
+    pool._block_resources = False
+    pool._asset_cache = StaticAssetCache(max_bytes=1024)
+    pooled = await pool.acquire("cache-b")
+    pooled.context.cookie_jar.append({"name": "sid", "value": "1", "domain": ".bank.test"})
+    _pattern, handler = pooled.context.routes[0]
+
+    same_origin = FakeRoute(FakeRequest("https://bank.test/app.js"), FakeResponse(headers=CACHEABLE))
+    await handler(same_origin)
+    cdn = FakeRoute(FakeRequest("https://cdn.test/lib.js"), FakeResponse(headers=CACHEABLE))
+    await handler(cdn)
+
+    assert same_origin.continued is True and not same_origin.fetched_with
+    assert cdn.fetched_with and len(pool._asset_cache) == 1
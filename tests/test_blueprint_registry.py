@@ -0,0 +1,125 @@
+"""Tests for the process-wide compiled blueprint and connector registry."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.core import blueprint_registry
+from src.core.blueprint_registry import BlueprintRegistry, get_blueprint_registry
+from src.core.engine import _load_site_blueprint, load_python_connectors
+from src.exceptions import BlueprintNotFoundError, BlueprintValidationError
+
+
+def _write_blueprint(path, name="Registry Test"):
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": "2.0",
+                "name": name,
+                "domain": "registry.test",
+                "auth": {"type": "form", "steps": [{"action": "goto", "url": "https://registry.test"}]},
+                "extract": {"name": {"selector": "#name", "type": "text"}},
+            }
+        )
+    )
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+CONNECTOR_SOURCE = """
+from src.core.connector_base import BaseConnector
+
+
+class {name}(BaseConnector):
+    def connect(self, username, password):
+        return {{"status": "connected", "data": {{"version": {version}}}}}
+"""
+
+
+def _write_connector(directory, site, version=1):
+    path = directory / f"{site}_connector.py"
+    path.write_text(CONNECTOR_SOURCE.format(name=f"Site{version}Connector", version=version))
+    return path
+
+
+def test_blueprint_is_compiled_once_until_the_file_changes(tmp_path):
+    path = tmp_path / "bank.json"
+    _write_blueprint(path)
+    registry = BlueprintRegistry(tmp_path)
+
+    with patch.object(blueprint_registry, "load_blueprint", wraps=blueprint_registry.load_blueprint) as load:
+        first = registry.get(path)
+        assert registry.get(path) is first
+        assert load.call_count == 1
+
+        _write_blueprint(path, name="Renamed Bank")
+        _bump_mtime(path)
+        assert registry.get(path).name == "Renamed Bank"
+        assert load.call_count == 2
+
+
+def test_invalid_blueprint_error_is_cached_per_version(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json")
+    registry = BlueprintRegistry(tmp_path)
+
+    with patch.object(blueprint_registry, "load_blueprint", wraps=blueprint_registry.load_blueprint) as load:
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                registry.get(path)
+        assert load.call_count == 1
+
+
+def test_listing_follows_directory_changes(tmp_path):
+    _write_blueprint(tmp_path / "a.json", name="A")
+    registry = BlueprintRegistry(tmp_path)
+    assert [p.stem for p in registry.blueprint_paths()] == ["a"]
+
+    _write_blueprint(tmp_path / "b.json", name="B")
+    (tmp_path / "c.json").write_text("[]")
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1_000_000_000))
+
+    loaded = {path.stem: bp for path, bp in registry.blueprints()}
+    assert loaded["b"].name == "B"
+    assert isinstance(loaded["c"], Exception)
+
+
+def test_python_connector_is_imported_once_and_reloaded_on_change(tmp_path):
+    path = _write_connector(tmp_path, "acme")
+    registry = BlueprintRegistry(tmp_path)
+
+    with patch.object(blueprint_registry, "_import_connector", wraps=blueprint_registry._import_connector) as do_import:
+        first = registry.python_connector("acme")
+        assert registry.python_connector("acme") is first
+        assert registry.python_connectors() == {"acme_connector": first}
+        assert do_import.call_count == 1
+
+        _write_connector(tmp_path, "acme", version=2)
+        _bump_mtime(path)
+        second = registry.python_connector("acme")
+        assert second().connect("u", "p")["data"]["version"] == 2
+        assert do_import.call_count == 2
+
+    assert registry.python_connector("missing") is None
+    assert registry.python_connector("../acme") is None
+
+
+def test_engine_helpers_share_the_registry(tmp_path):
+    _write_blueprint(tmp_path / "bank.json")
+    _write_connector(tmp_path, "acme")
+    registry = get_blueprint_registry(tmp_path)
+
+    blueprint = _load_site_blueprint("bank", str(tmp_path))
+    assert registry.get(tmp_path / "bank.json") is blueprint
+    assert load_python_connectors(str(tmp_path))["acme_connector"] is registry.python_connector("acme")
+
+    with pytest.raises(BlueprintNotFoundError):
+        _load_site_blueprint("missing", str(tmp_path))
+    (tmp_path / "broken.json").write_text("{")
+    with pytest.raises(BlueprintValidationError):
+        _load_site_blueprint("broken", str(tmp_path))
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -86,3 +87,43 @@ async def test_extra_page_is_closed_in_read_phase():
 
     assert page.closed is True
     assert policy.blocked_actions[-1].action == "popup"
+
+
+class GuardedPage(FakePage):
+    def on(self, event, handler) -> None:
+        pass
+
+
+class GuardedContext:
+    def __init__(self):
+        self.pages: list = [GuardedPage()]
+        self.handlers: list = []
+
+    def on(self, event, handler) -> None:
+        self.handlers.append(handler)
+
+    def open(self) -> GuardedPage:
+        page = GuardedPage()
+        self.pages.append(page)
+        for handler in self.handlers:
+            handler(page)
+        return page
+
+
+@pytest.mark.asyncio
+async def test_engine_tabs_pass_the_extra_page_guard_but_popups_do_not():
+    pool = BrowserPool()
+    policy = ReadOnlyExecutionPolicy(enabled=True, phase=ExecutionPhase.READ)
+    context = GuardedContext()
+    pooled = PooledContext(context=context, session_id="session-tabs", read_only_policy=policy)
+    await pool._setup_page_guards(context, pooled)
+
+    policy.expect_tab()
+    tab = context.open()
+    popup = context.open()
+    await asyncio.sleep(0)
+
+    assert tab.closed is False
+    assert popup.closed is True
+    assert policy.pending_tabs == 0
+    assert [action.action for action in policy.blocked_actions] == ["popup"]
@@ -0,0 +1,372 @@
+"""Tests for BrowserPool scheduling and lifecycle, driven by a fake browser."""
+
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+from prometheus_client import generate_latest
+
+from src.core import proc_stats
+from src.core.acquire_queue import AcquireQueue
+from src.core.browser_pool import BrowserPool, BrowserShard
+from src.core.read_only_policy import ReadOnlyExecutionPolicy
+
+
+class FakeContext:
+    def __init__(self, options: dict):
+        self.options = options
+        self.pages: list = []
+        self.routes: list = []
+        self.cookie_jar: list[dict] = []
+        self.closed = False
+
+    async def cookies(self, urls=None) -> list[dict]:
+        host = urlsplit(urls).hostname if urls else None
+        return [c for c in self.cookie_jar if host is None or f".{host}".endswith(f".{c['domain'].lstrip('.')}")]
+
+    def set_default_navigation_timeout(self, _ms) -> None:
+        pass
+
+    def set_default_timeout(self, _ms) -> None:
+        pass
+
+    async def route(self, pattern, handler) -> None:
+        self.routes.append((pattern, handler))
+
+    def on(self, _event, _handler) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+        self.handlers: dict = {}
+        self.closed = False
+
+    async def new_context(self, **options) -> FakeContext:
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    def on(self, event, handler) -> None:
+        self.handlers[event] = handler
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launches: list[dict] = []
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        self.launches.append(kwargs)
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+
+def _make_pool(tmp_path, *, reserve: int = 0, shards: int = 1) -> BrowserPool:
+    pool = BrowserPool()
+    pool._playwright = FakePlaywright()
+    pool._shards = [BrowserShard(index=i, browser=FakeBrowser()) for i in range(shards)]
+    pool._running = True
+    pool._download_root = str(tmp_path)
+    pool._reserve_size = reserve
+    pool._reserve_routed = True
+    pool._block_resources = True
+    return pool
+
+
+# ── Pre-warmed reserve ───────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_refill_fills_reserve_to_configured_size(tmp_path):
+    pool = _make_pool(tmp_path, reserve=2)
+
+    await pool._refill_reserve()
+
+    assert pool.reserve_count == 2
+    assert all(ctx.routes for ctx in pool._shards[0].browser.contexts)
+    assert pool.active_count == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_pops_reserved_context(tmp_path):
+    pool = _make_pool(tmp_path, reserve=1)
+    await pool._refill_reserve()
+    warm = pool._reserve[0]
+
+    policy = ReadOnlyExecutionPolicy(enabled=True)
+    pooled = await pool.acquire("session-a", read_only_policy=policy)
+
+    assert pooled is warm
+    assert pooled.session_id == "session-a"
+    assert pooled.read_only_policy is policy
+    assert pooled.download_dir and pooled.download_dir.startswith(str(tmp_path))
+    assert pool.reserve_count == 0
+    assert len(pool._shards[0].browser.contexts) == 1
+    assert pool._refill_event.is_set()
+
+    await pool.release("session-a")
+    assert warm.context.closed is True
+
+
+@pytest.mark.asyncio
+async def test_acquire_misses_reserve_for_proxied_sessions(tmp_path):
+    pool = _make_pool(tmp_path, reserve=1)
+    await pool._refill_reserve()
+
+    pooled = await pool.acquire("session-proxy", proxy={"server": "http://proxy.test:8080"})
+
+    assert pooled.context.options["proxy"] == {"server": "http://proxy.test:8080"}
+    assert pool.reserve_count == 1
+    await pool.release("session-proxy")
+
+
+@pytest.mark.asyncio
+async def test_reserve_hits_and_misses_are_counted(tmp_path):
+    pool = _make_pool(tmp_path, reserve=1)
+    await pool._refill_reserve()
+
+    await pool.acquire("metrics-hit")
+    await pool.acquire("metrics-miss")
+
+    out = generate_latest().decode()
+    assert 'plaidify_browser_pool_reserve_total{result="hit"}' in out
+    assert 'plaidify_browser_pool_reserve_total{result="miss"}' in out
+    assert "plaidify_browser_pool_reserve_refill_seconds_count" in out
+
+
+@pytest.mark.asyncio
+async def test_stale_reserve_contexts_are_recycled(tmp_path):
+    pool = _make_pool(tmp_path, reserve=1)
+    await pool._refill_reserve()
+    stale = pool._reserve[0]
+    stale.last_used -= pool._idle_timeout + 1
+
+    await pool._cleanup_idle()
+    assert pool.reserve_count == 0
+    assert stale.context.closed is True
+
+    await pool._refill_reserve()
+    assert pool.reserve_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_context_creation_frees_the_slot(tmp_path):
+    pool = _make_pool(tmp_path)
+
+    async def broken_new_context(**_options):
+        raise RuntimeError("browser crashed")
+
+    pool._shards[0].browser.new_context = broken_new_context
+    pool._queue = AcquireQueue(1)
+
+    with pytest.raises(RuntimeError):
+        await pool.acquire("session-broken")
+    assert pool._queue.in_use == 0
+    assert pool._shards[0].load == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_context_setup_closes_the_context(tmp_path):
+    pool = _make_pool(tmp_path)
+    pool._queue = AcquireQueue(1)
+
+    async def broken_route(_pattern, _handler):
+        raise RuntimeError("target closed")
+
+    browser = pool._shards[0].browser
+    create = browser.new_context
+
+    async def new_context(**options):
+        context = await create(**options)
+        context.route = broken_route
+        return context
+
+    browser.new_context = new_context
+
+    with pytest.raises(RuntimeError):
+        await pool.acquire("session-broken")
+    assert browser.contexts[0].closed is True
+    assert pool._queue.in_use == 0
+    assert pool._shards[0].load == 0
+
+
+# ── Sharding and recycling ───────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_contexts_go_to_least_loaded_shard(tmp_path):
+    pool = _make_pool(tmp_path, shards=2)
+
+    a = await pool.acquire("shard-a")
+    b = await pool.acquire("shard-b")
+    assert a.shard is not b.shard
+    freed = a.shard
+
+    await pool.release("shard-a")
+    c = await pool.acquire("shard-c")
+    assert c.shard is freed
+    assert sorted(s.load for s in pool._shards) == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_shard_cap_is_respected(tmp_path):
+    pool = _make_pool(tmp_path, shards=2)
+    pool._shard_max_contexts = 1
+
+    first = await pool.acquire("cap-a")
+    second = await pool.acquire("cap-b")
+
+    assert first.shard is not second.shard
+    assert all(s.load == 1 for s in pool._shards)
+
+
+@pytest.mark.asyncio
+async def test_shard_recycles_after_context_count_and_drains(tmp_path):
+    pool = _make_pool(tmp_path)
+    pool._recycle_after_contexts = 2
+    original = pool._shards[0]
+
+    await pool.acquire("recycle-a")
+    await pool.acquire("recycle-b")
+    assert original.recycle_reason == "contexts"
+
+    await pool._recycle_shards()
+    replacement = pool._shards[0]
+    assert replacement is not original
+    assert replacement.index == 0
+    assert original in pool._draining
+    assert original.browser.closed is False
+
+    fresh = await pool.acquire("recycle-c")
+    assert fresh.shard is replacement
+
+    await pool.release("recycle-a")
+    assert original.browser.closed is False
+    await pool.release("recycle-b")
+    assert original.browser.closed is True
+    assert original not in pool._draining
+
+
+@pytest.mark.asyncio
+async def test_idle_shard_is_closed_immediately_on_recycle(tmp_path):
+    pool = _make_pool(tmp_path, reserve=1)
+    pool._recycle_max_age = 60
+    original = pool._shards[0]
+    await pool._refill_reserve()
+    original.launched_at -= 120
+
+    await pool._recycle_shards()
+
+    assert original.browser.closed is True
+    assert pool.reserve_count == 0
+    assert pool._draining == []
+
+
+@pytest.mark.asyncio
+async def test_shard_recycles_on_rss_threshold(tmp_path, monkeypatch):
+    pool = _make_pool(tmp_path)
+    pool._recycle_max_rss = 100
+    monkeypatch.setattr(proc_stats, "find_pid_by_cmdline", lambda marker: 4242)
+    monkeypatch.setattr(proc_stats, "process_tree_rss_bytes", lambda pid: 500 if pid == 4242 else 0)
+
+    assert await pool._recycle_reason(pool._shards[0]) == "rss"
+
+
+@pytest.mark.asyncio
+async def test_disconnected_browser_is_marked_for_recycle(tmp_path):
+    pool = _make_pool(tmp_path)
+    shard = await pool._launch_shard(0)
+    pool._shards = [shard]
+
+    shard.browser.handlers["disconnected"](shard.browser)
+
+    assert shard.recycle_reason == "disconnected"
+    assert any(arg.startswith("--plaidify-shard=0-") for arg in pool._playwright.chromium.launches[0]["args"])
+
+
+# ── Memory admission ─────────────────────────────────────────────────────────
+
+
+def _fake_memory(monkeypatch, *, rss: int, available: int) -> None:
+    monkeypatch.setattr(proc_stats, "find_pid_by_cmdline", lambda marker: 4242)
+    monkeypatch.setattr(proc_stats, "process_tree_rss_bytes", lambda pid: rss)
+    monkeypatch.setattr(proc_stats, "system_available_memory_bytes", lambda: available)
+
+
+@pytest.mark.asyncio
+async def test_rss_pressure_lowers_effective_limit(tmp_path, monkeypatch):
+    pool = _make_pool(tmp_path)
+    pool._shards[0].marker = "--plaidify-shard=0-test"
+    pool._max_size = 10
+    pool._set_effective_limit(10)
+    pool._mem_max_rss = 1000
+    for name in ("mem-a", "mem-b"):
+        await pool.acquire(name)
+    _fake_memory(monkeypatch, rss=900, available=10**12)
+
+    await pool._adjust_admission()
+
+    # 450 bytes per context and 100 bytes of headroom: no room for a third.
+    assert pool.effective_limit == 2
+    assert pool.throttled is True
+    assert pool.available_slots == 0
+    assert pool.admission_status()["chromium_rss_bytes"] == 900
+
+
+@pytest.mark.asyncio
+async def test_low_available_memory_throttles_and_recovers_gradually(tmp_path, monkeypatch):
+    pool = _make_pool(tmp_path)
+    pool._max_size = 10
+    pool._set_effective_limit(10)
+    pool._mem_min_available = 1000
+    pool._context_rss_estimate = 100
+    _fake_memory(monkeypatch, rss=0, available=1050)
+
+    await pool._adjust_admission()
+    assert pool.effective_limit == pool._mem_floor == 1
+
+    _fake_memory(monkeypatch, rss=0, available=10**9)
+    await pool._adjust_admission()
+    assert pool.effective_limit == 2
+    await pool._adjust_admission()
+    assert pool.effective_limit == 3
+
+
+@pytest.mark.asyncio
+async def test_throttled_pool_queues_new_contexts_and_skips_reserve(tmp_path, monkeypatch):
+    pool = _make_pool(tmp_path, reserve=2)
+    pool._max_size = 4
+    pool._set_effective_limit(1)
+
+    await pool.acquire("throttle-a")
+    pending = asyncio.create_task(pool.acquire("throttle-b"))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    await pool._refill_reserve()
+    assert pool.reserve_count == 0
+
+    pool._set_effective_limit(2)
+    await asyncio.wait_for(pending, timeout=1)
+
+
+def test_system_available_memory_is_read_from_meminfo():
+    assert proc_stats.system_available_memory_bytes() > 0
+
+
+def test_process_tree_rss_includes_current_process():
+    import os
+
+    assert proc_stats.process_rss_bytes(os.getpid()) > 0
+    assert proc_stats.process_tree_rss_bytes(os.getpid()) >= proc_stats.process_rss_bytes(os.getpid())
@@ -0,0 +1,223 @@
+"""Tests for the shared browser service lease protocol and RemoteBrowserPool."""
+
+import asyncio
+
+import pytest
+
+from src.core import browser_pool as browser_pool_module
+from src.core.browser_service import (
+    BrowserService,
+    BrowserServiceClient,
+    BrowserServiceError,
+    RemoteBrowserPool,
+    parse_service_url,
+)
+from tests.test_browser_pool import FakeBrowser
+
+
+class FakeCdpChromium:
+    def __init__(self):
+        self.endpoints: list[str] = []
+
+    async def connect_over_cdp(self, endpoint: str) -> FakeBrowser:
+        self.endpoints.append(endpoint)
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeCdpChromium()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class FakePlaywrightStarter:
+    def __init__(self):
+        self.playwright = FakePlaywright()
+
+    async def start(self) -> FakePlaywright:
+        return self.playwright
+
+
+@pytest.fixture
+async def service():
+    svc = BrowserService(host="127.0.0.1", port=0, cdp_port=9999, max_contexts=2)
+    await svc._start_server()
+    yield svc
+    await svc.stop()
+
+
+def _url(svc: BrowserService) -> str:
+    return f"tcp://127.0.0.1:{svc.port}"
+
+
+def test_parse_service_url():
+    assert parse_service_url("tcp://127.0.0.1:9330") == ("127.0.0.1", 9330)
+    assert parse_service_url("localhost:9330") == ("localhost", 9330)
+    with pytest.raises(ValueError):
+        parse_service_url("http://127.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_hello_reports_cdp_endpoint(service):
+    client = BrowserServiceClient(_url(service))
+    await client.connect()
+
+    hello = await client.request("hello")
+
+    assert hello["cdp_endpoint"] == "http://127.0.0.1:9999"
+    assert hello["max_contexts"] == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_capacity_is_global_across_clients(service):
+    first = BrowserServiceClient(_url(service))
+    second = BrowserServiceClient(_url(service))
+    await first.connect()
+    await second.connect()
+
+    lease_a = (await first.request("acquire"))["lease"]
+    await second.request("acquire")
+
+    blocked = asyncio.create_task(second.request("acquire"))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+    assert (await first.request("stats"))["waiting"] == 1
+
+    first.send("release", lease=lease_a)
+    reply = await asyncio.wait_for(blocked, timeout=1)
+    assert reply["lease"]
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_returns_leases(service):
+    client = BrowserServiceClient(_url(service))
+    await client.connect()
+    await client.request("acquire")
+    await client.request("acquire")
+    assert service.stats()["leased"] == 2
+
+    await client.close()
+    for _ in range(50):
+        if service.stats()["leased"] == 0:
+            break
+        await asyncio.sleep(0.01)
+
+    assert service.stats()["leased"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_op_is_rejected(service):
+    client = BrowserServiceClient(_url(service))
+    await client.connect()
+
+    with pytest.raises(BrowserServiceError):
+        await client.request("launch_missiles")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_service_raises():
+    client = BrowserServiceClient("tcp://127.0.0.1:1")
+    with pytest.raises(BrowserServiceError):
+        await client.connect()
+
+
+@pytest.mark.asyncio
+async def test_remote_pool_leases_contexts_from_service(service, tmp_path, monkeypatch):
+    starter = FakePlaywrightStarter()
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: starter)
+
+    pool = RemoteBrowserPool(_url(service))
+    pool._download_root = str(tmp_path)
+    await pool.start()
+    try:
+        assert starter.playwright.chromium.endpoints == ["http://127.0.0.1:9999"]
+        assert pool._max_size == 2
+
+        await pool.acquire("remote-a")
+        assert service.stats()["leased"] == 1
+
+        await pool.release("remote-a")
+        for _ in range(50):
+            if service.stats()["leased"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert service.stats()["leased"] == 0
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_browser_pool_uses_service_when_configured(service, tmp_path, monkeypatch):
+    starter = FakePlaywrightStarter()
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: starter)
+    monkeypatch.setenv("BROWSER_SERVICE_URL", _url(service))
+    monkeypatch.setattr(browser_pool_module, "_pool", None)
+
+    pool = await browser_pool_module.get_browser_pool()
+    try:
+        assert isinstance(pool, RemoteBrowserPool)
+    finally:
+        await browser_pool_module.shutdown_browser_pool()
+
+
+@pytest.mark.asyncio
+async def test_service_admits_interactive_before_refresh(service):
+    client = BrowserServiceClient(_url(service))
+    await client.connect()
+    leases = [(await client.request("acquire"))["lease"] for _ in range(2)]
+
+    refresh = asyncio.create_task(client.request("acquire", priority="scheduled_refresh"))
+    await asyncio.sleep(0.05)
+    interactive = asyncio.create_task(client.request("acquire", priority="interactive", site="bank"))
+    await asyncio.sleep(0.05)
+    assert (await client.request("stats"))["waiting_by_priority"]["interactive"] == 1
+
+    client.send("release", lease=leases[0])
+    await asyncio.wait_for(interactive, timeout=1)
+    assert not refresh.done()
+
+    client.send("release", lease=leases[1])
+    await asyncio.wait_for(refresh, timeout=1)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_acquire_returns_its_lease_when_granted(service, tmp_path, monkeypatch):
+    starter = FakePlaywrightStarter()
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: starter)
+    other = BrowserServiceClient(_url(service))
+    await other.connect()
+    held = [(await other.request("acquire"))["lease"] for _ in range(2)]
+
+    pool = RemoteBrowserPool(_url(service))
+    pool._download_root = str(tmp_path)
+    await pool.start()
+    try:
+        queued = asyncio.create_task(pool.acquire("remote-a"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        other.send("release", lease=held[0])
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if service.stats()["leased"] == 1 and service.stats()["waiting"] == 0:
+                break
+        assert service.stats()["leased"] == 1  # only the other client's remaining lease
+    finally:
+        await pool.stop()
+        await other.close()
+
+
+def test_remote_pool_keeps_no_prewarmed_reserve(monkeypatch):
+    monkeypatch.setenv("BROWSER_PREWARM_CONTEXTS", "2")
+    assert RemoteBrowserPool("tcp://127.0.0.1:9330")._reserve_size == 0
@@ -0,0 +1,236 @@
+"""Tests for saved browser session reuse (encrypted storage_state + probe)."""
+
+import pytest
+
+from src import browser_sessions, session_store
+from src.core import engine
+from src.core.blueprint import AuthConfig, BlueprintStep, BlueprintV2, SessionProbeConfig, StepAction
+from src.database import SessionLocal, User, create_user_dek
+
+SAVED_STATE = {
+    "cookies": [{"name": "sid", "value": "abc", "domain": "bank.test", "path": "/"}],
+    "origins": [{"origin": "https://bank.test", "localStorage": [{"name": "theme", "value": "dark"}]}],
+}
+
+
+@pytest.fixture
+def user_id():
+    db = SessionLocal()
+    try:
+        user = User(username="session-owner", email="owner@example.com", encrypted_dek=create_user_dek())
+        db.add(user)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_store():
+    session_store.clear_all()
+    yield
+    session_store.clear_all()
+
+
+class FakePage:
+    origin = "https://bank.test"
+
+    def __init__(self, logged_in: bool):
+        self.logged_in = logged_in
+        self.visited: list[str] = []
+        self.local_storage: dict[str, str] = {}
+        self.reloads = 0
+
+    async def goto(self, url, **_kwargs):
+        self.visited.append(url)
+
+    async def reload(self, **_kwargs):
+        self.reloads += 1
+
+    async def evaluate(self, script, arg=None):
+        if "clear()" in script:
+            self.local_storage.clear()
+            return None
+        items = {k: v for k, v in arg.get(self.origin, {}).items() if k not in self.local_storage}
+        self.local_storage.update(items)
+        return len(items)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if not self.logged_in:
+            raise TimeoutError(f"{selector} not found")
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, page: FakePage):
+        self.page = page
+        self.cookies: list = []
+        self.init_scripts: list[str] = []
+
+    async def new_page(self):
+        return self.page
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def clear_cookies(self):
+        self.cookies = []
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "sid", "value": "fresh", "domain": "bank.test", "path": "/"}], "origins": []}
+
+
+class FakePooled:
+    def __init__(self, context):
+        self.context = context
+        self.downloads: list = []
+
+
+class FakePool:
+    def __init__(self, context):
+        self.pooled = FakePooled(context)
+
+    async def acquire(self, session_id, **_kwargs):
+        return self.pooled
+
+    async def release(self, session_id):
+        pass
+
+
+class RecordingExecutor:
+    runs: list[str] = []
+    storage_seen: list[dict] = []
+
+    def __init__(self, page, *_args, **_kwargs):
+        self.page = page
+        self.waits: list[dict] = []
+
+    async def execute_steps(self, steps, context=""):
+        RecordingExecutor.runs.append(context)
+        RecordingExecutor.storage_seen.append(dict(self.page.local_storage))
+
+
+def _blueprint(with_probe: bool = True) -> BlueprintV2:
+    return BlueprintV2(
+        name="Bank",
+        domain="bank.test",
+        auth=AuthConfig(
+            steps=[BlueprintStep(action=StepAction.GOTO, url="https://bank.test/login")],
+            session_probe=(
+                SessionProbeConfig(url="https://bank.test/home", logged_in_selector="#account") if with_probe else None
+            ),
+        ),
+        cleanup=[BlueprintStep(action=StepAction.CLICK, selector="#logout")],
+    )
+
+
+async def _run(monkeypatch, blueprint, context, user_id):
+    async def fake_get_pool():
+        return FakePool(context)
+
+    RecordingExecutor.runs = []
+    RecordingExecutor.storage_seen = []
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", RecordingExecutor)
+    return await engine._execute_blueprint(
+        blueprint=blueprint,
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=None,
+        proxy=None,
+        session_id="sess-1",
+        session_state_key=browser_sessions.session_state_key("tok-1"),
+        user_id=user_id,
+    )
+
+
+def test_state_is_encrypted_and_round_trips(user_id):
+    key = browser_sessions.session_state_key("tok-1")
+    assert "tok-1" not in key
+
+    assert browser_sessions.save_browser_session(user_id, key, SAVED_STATE) is True
+    stored = session_store.get_browser_session_state(key)
+    assert "abc" not in stored
+
+    assert browser_sessions.load_browser_session(user_id, key) == SAVED_STATE
+
+
+def test_unreadable_state_is_discarded(user_id):
+    key = browser_sessions.session_state_key("tok-1")
+    session_store.set_browser_session_state(key, "not-ciphertext", 60)
+
+    assert browser_sessions.load_browser_session(user_id, key) is None
+    assert session_store.get_browser_session_state(key) is None
+
+
+@pytest.mark.asyncio
+async def test_first_run_authenticates_and_saves_session(monkeypatch, user_id):
+    context = FakeContext(FakePage(logged_in=True))
+
+    result = await _run(monkeypatch, _blueprint(), context, user_id)
+
+    assert RecordingExecutor.runs == ["auth"]
+    assert not (result["metadata"] or {}).get("session_reused")
+    saved = browser_sessions.load_browser_session(user_id, browser_sessions.session_state_key("tok-1"))
+    assert saved["cookies"][0]["value"] == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_valid_saved_session_skips_auth(monkeypatch, user_id):
+    key = browser_sessions.session_state_key("tok-1")
+    browser_sessions.save_browser_session(user_id, key, SAVED_STATE)
+    page = FakePage(logged_in=True)
+    context = FakeContext(page)
+
+    result = await _run(monkeypatch, _blueprint(), context, user_id)
+
+    assert RecordingExecutor.runs == []
+    assert result["metadata"]["session_reused"] is True
+    assert page.visited == ["https://bank.test/home"]
+    assert context.cookies[0]["value"] == "abc"
+    assert page.local_storage == {"theme": "dark"}
+    assert page.reloads == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_session_falls_back_to_full_auth(monkeypatch, user_id):
+    key = browser_sessions.session_state_key("tok-1")
+    browser_sessions.save_browser_session(user_id, key, SAVED_STATE)
+    context = FakeContext(FakePage(logged_in=False))
+
+    result = await _run(monkeypatch, _blueprint(), context, user_id)
+
+    assert RecordingExecutor.runs == ["auth"]
+    assert not (result["metadata"] or {}).get("session_reused")
+    assert context.cookies == []
+    assert browser_sessions.load_browser_session(user_id, key)["cookies"][0]["value"] == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_does_not_leak_saved_storage_into_auth(monkeypatch, user_id):
+    key = browser_sessions.session_state_key("tok-1")
+    browser_sessions.save_browser_session(user_id, key, SAVED_STATE)
+    page = FakePage(logged_in=False)
+    context = FakeContext(page)
+
+    await _run(monkeypatch, _blueprint(), context, user_id)
+
+    assert RecordingExecutor.runs == ["auth"]
+    assert RecordingExecutor.storage_seen == [{}]
+    assert context.init_scripts == []
+
+
+@pytest.mark.asyncio
+async def test_blueprints_without_probe_keep_existing_flow(monkeypatch, user_id):
+    context = FakeContext(FakePage(logged_in=True))
+
+    await _run(monkeypatch, _blueprint(with_probe=False), context, user_id)
+
+    assert RecordingExecutor.runs == ["auth", "cleanup"]
+    assert session_store.get_browser_session_state(browser_sessions.session_state_key("tok-1")) is None
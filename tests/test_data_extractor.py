@@ -2,10 +2,20 @@
 Tests for Data Extractor — transforms, type coercion, and extraction logic.
 """
 
-from src.core.blueprint import FieldType, TransformType
+import asyncio
+import re
+import time
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from src.core.blueprint import ExtractionField, FieldType, ListExtractionField, PaginationConfig, TransformType
 from src.core.data_extractor import (
+    DataExtractor,
+    DateParser,
     apply_transform,
     coerce_type,
+    plan_for,
     transform_parse_date,
     transform_regex_extract,
     transform_strip_commas,
@@ -16,6 +26,8 @@ from src.core.data_extractor import (
     transform_to_number,
     transform_to_uppercase,
 )
+from src.core.watermarks import incremental_lists
+from src.exceptions import DataExtractionError
 
 # ── Transform Tests ───────────────────────────────────────────────────────────
 
@@ -92,6 +104,9 @@ class TestApplyTransform:
         result = apply_transform("ID: 42", "regex_extract(\\d+)")
         assert result == "42"
 
+    def test_invalid_regex_returns_raw_value(self):
+        assert apply_transform("ID: 42", "regex_extract((\\d+)") == "ID: 42"
+
     def test_parameterized_parse_date(self):
         result = apply_transform("14-Mar-2026", "parse_date(%d-%b-%Y)")
         assert "2026-03-14" in result
@@ -136,3 +151,400 @@ class TestCoerceType:
 
     def test_none_value(self):
         assert coerce_type(None, FieldType.TEXT) is None
+
+
+# ── Batch Extraction Tests ───────────────────────────────────────────────────
+
+
+class FakeElement:
+    def __init__(self, text="", attrs=None, children=None):
+        self.text = text
+        self.attrs = attrs or {}
+        self.children = children or {}
+
+    async def inner_text(self):
+        return self.text
+
+    async def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    async def query_selector(self, selector):
+        return self.children.get(selector)
+
+
+class FakePage:
+    """Answers batch reads from ``batch`` and per-element queries from ``elements``."""
+
+    def __init__(self, batch=None, elements=None, rows=None):
+        self.batch = batch
+        self.elements = elements or {}
+        self.rows = rows or {}
+        self.evaluate_calls = 0
+        self.waited_for: list[str] = []
+        self.settled: list[tuple] = []
+        self.after_settle: dict = {}
+
+    async def evaluate(self, _script, spec):
+        self.evaluate_calls += 1
+        if isinstance(self.batch, Exception):
+            raise self.batch
+        return {name: value for name, value in (self.batch or {}).items() if name in spec}
+
+    async def wait_for_selector(self, selector, **_kwargs):
+        self.waited_for.append(selector)
+        return self.elements.get(selector)
+
+    async def query_selector_all(self, selector):
+        return self.rows.get(selector, [])
+
+    async def query_selector(self, selector):
+        return self.elements.get(selector)
+
+    async def wait_for_timeout(self, _ms):
+        pass
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.settled.append((state, timeout))
+        self.batch.update(self.after_settle)
+
+
+def _fields():
+    return {
+        "balance": ExtractionField(selector="#balance", type=FieldType.CURRENCY),
+        "account": ExtractionField(selector="#acct", transform="regex_extract(#(\\d+))"),
+        "transactions": ListExtractionField(
+            selector="tr.txn",
+            fields={
+                "date": ExtractionField(selector=".date", type=FieldType.DATE),
+                "amount": ExtractionField(selector=".amount", type=FieldType.CURRENCY, default=0.0),
+            },
+        ),
+    }
+
+
+class TestBatchExtraction:
+    @pytest.mark.asyncio
+    async def test_all_fields_resolved_in_one_round_trip(self):
+        page = FakePage(
+            batch={
+                "balance": "$1,234.50",
+                "account": "Account #98765",
+                "transactions": [
+                    {"date": "03/14/2026", "amount": "-$12.00"},
+                    {"date": "03/15/2026", "amount": None},
+                ],
+            }
+        )
+
+        data = await DataExtractor(page, batch=True).extract(_fields())
+
+        assert page.evaluate_calls == 1
+        assert page.waited_for == []
+        assert data["balance"] == 1234.5
+        assert data["account"] == "98765"
+        assert data["transactions"][0]["amount"] == -12.0
+        assert "2026-03-15" in data["transactions"][1]["date"]
+        assert data["transactions"][1]["amount"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_unresolved_fields_fall_back_to_per_element_path(self):
+        page = FakePage(
+            batch={"balance": "$10"},
+            elements={"#acct": FakeElement("Account #42")},
+            rows={"tr.txn": [FakeElement(children={".date": FakeElement("2026-03-14"), ".amount": FakeElement("$3")})]},
+        )
+
+        data = await DataExtractor(page, batch=True).extract(_fields())
+
+        assert page.waited_for == ["#acct"]
+        assert data["balance"] == 10.0
+        assert data["account"] == "42"
+        assert data["transactions"] == [{"date": "2026-03-14T00:00:00", "amount": 3.0}]
+
+    @pytest.mark.asyncio
+    async def test_evaluate_failure_uses_per_element_path(self):
+        page = FakePage(batch=RuntimeError("context destroyed"), elements={"#balance": FakeElement("$5")})
+
+        data = await DataExtractor(page, batch=True).extract({"balance": _fields()["balance"]})
+
+        assert data == {"balance": 5.0}
+        assert page.waited_for == ["#balance"]
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_disabled_skips_evaluate(self):
+        page = FakePage(batch={"balance": "$1"}, elements={"#balance": FakeElement("$5")})
+
+        data = await DataExtractor(page, batch=False).extract({"balance": _fields()["balance"]})
+
+        assert data == {"balance": 5.0}
+        assert page.evaluate_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_each_page_of_a_paginated_list_is_one_round_trip(self):
+        clicks = []
+        next_button = FakeElement()
+        next_button.click = lambda: clicks.append(1) or asyncio.sleep(0)
+        page = FakePage(
+            batch={"transactions": [{"date": "2026-03-14", "amount": "$1"}]},
+            elements={"a.next": next_button},
+        )
+        transactions = _fields()["transactions"].model_copy(
+            update={"pagination": PaginationConfig(next_selector="a.next", max_pages=3, wait_after_click=0)}
+        )
+
+        data = await DataExtractor(page, batch=True).extract({"transactions": transactions})
+
+        assert len(data["transactions"]) == 3
+        assert page.evaluate_calls == 3
+        assert len(clicks) == 2
+
+
+class SlowPage(FakePage):
+    """wait_for_selector takes ``delay`` seconds, or times out if the selector is absent."""
+
+    def __init__(self, delay, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.timeouts: list[int] = []
+
+    async def wait_for_selector(self, selector, timeout=None, **_kwargs):
+        self.timeouts.append(timeout)
+        if selector not in self.elements:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeout(f"{selector} not found")
+        await asyncio.sleep(self.delay)
+        return self.elements[selector]
+
+
+class TestConcurrentExtraction:
+    @pytest.mark.asyncio
+    async def test_scalar_fields_wait_concurrently(self):
+        fields = {f"f{i}": ExtractionField(selector=f"#f{i}") for i in range(4)}
+        page = SlowPage(0.2, elements={f"#f{i}": FakeElement(str(i)) for i in range(4)})
+
+        extractor = DataExtractor(page, batch=False)
+
+        started = time.monotonic()
+        data = await extractor.extract(fields)
+
+        assert data == {"f0": "0", "f1": "1", "f2": "2", "f3": "3"}
+        assert time.monotonic() - started < 0.6
+        assert all(150 <= ms < 600 for ms in extractor.timings.values())
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_share_one_deadline(self):
+        fields = {f"opt{i}": ExtractionField(selector=f"#opt{i}", default="n/a") for i in range(3)}
+        page = SlowPage(0, elements={})
+        extractor = DataExtractor(page, batch=False)
+        extractor.deadline_ms = 100
+
+        started = time.monotonic()
+        data = await extractor.extract(fields)
+
+        assert data == {"opt0": "n/a", "opt1": "n/a", "opt2": "n/a"}
+        assert time.monotonic() - started < 0.3
+        assert all(t <= 100 for t in page.timeouts)
+
+    @pytest.mark.asyncio
+    async def test_absent_fields_resolve_after_settle_without_waiting(self):
+        fields = {
+            "balance": ExtractionField(selector="#balance", type=FieldType.CURRENCY),
+            "nickname": ExtractionField(selector="#nick", default="none"),
+            "late": ExtractionField(selector="#late"),
+        }
+        page = FakePage(batch={"balance": "$7", "nickname": None, "late": None})
+        page.after_settle = {"late": "rendered after XHR"}
+        extractor = DataExtractor(page, batch=True)
+
+        data = await extractor.extract(fields)
+
+        assert data == {"balance": 7.0, "nickname": "none", "late": "rendered after XHR"}
+        assert page.waited_for == []
+        assert [state for state, _ in page.settled] == ["networkidle"]
+        assert page.evaluate_calls == 2
+        assert set(extractor.timings) == set(fields)
+
+    @pytest.mark.asyncio
+    async def test_absent_field_with_its_own_timeout_waits_for_its_selector(self):
+        page = SlowPage(0.05, batch={"balance": None}, elements={"#balance": FakeElement("$12")})
+        fields = {"balance": ExtractionField(selector="#balance", type=FieldType.CURRENCY, timeout=20000)}
+
+        data = await DataExtractor(page, batch=True).extract(fields)
+
+        assert data == {"balance": 12.0}
+        assert page.settled == []
+        assert page.timeouts[0] > 15000
+
+    @pytest.mark.asyncio
+    async def test_required_absent_field_raises(self):
+        page = FakePage(batch={"balance": None})
+
+        with pytest.raises(DataExtractionError):
+            await DataExtractor(page, batch=True).extract({"balance": ExtractionField(selector="#balance")})
+
+
+# ── Transform Plan Tests ─────────────────────────────────────────────────────
+
+
+class TestTransformPlans:
+    CASES = [
+        ("$1,234.56", "strip_dollar_sign", FieldType.CURRENCY),
+        ("  Account  #12345 ", r"regex_extract(#(\d+))", FieldType.NUMBER),
+        ("March 14, 2026", "parse_date", FieldType.DATE),
+        ("14/03/2026", "parse_date(%d/%m/%Y)", FieldType.DATE),
+        ("not a date", "parse_date", FieldType.DATE),
+        ("John@Example.COM ", None, FieldType.EMAIL),
+        ("Yes", "to_lowercase", FieldType.BOOLEAN),
+        ("(555) 123-4567 ext", None, FieldType.PHONE),
+    ]
+
+    @pytest.mark.parametrize("raw,transform,field_type", CASES)
+    def test_plan_matches_apply_transform_and_coerce_type(self, raw, transform, field_type):
+        field = ExtractionField(selector="#x", transform=transform, type=field_type)
+        expected = coerce_type(apply_transform(raw, transform), field_type)
+
+        assert plan_for(field).apply(raw) == expected
+        assert plan_for(field).apply_column([raw, None], default="-") == [expected, "-"]
+
+    def test_plans_are_compiled_once_per_transform_and_type(self):
+        first = plan_for(ExtractionField(selector="#a", transform="strip_commas", type=FieldType.NUMBER))
+        second = plan_for(ExtractionField(selector="#b", transform="strip_commas", type=FieldType.NUMBER))
+        assert first is second
+
+    def test_date_parser_learns_the_columns_format(self):
+        parser = DateParser()
+        assert parser("25/03/2026") == "2026-03-25T00:00:00"
+        assert parser.learned == "%d/%m/%Y"
+        # Read like the rest of the column rather than as March 4th.
+        assert parser("04/03/2026") == "2026-03-04T00:00:00"
+        assert transform_parse_date("04/03/2026") == "2026-04-03T00:00:00"
+
+    def test_failing_cells_get_the_column_default(self):
+        plan = plan_for(ExtractionField(selector="#x", transform="to_uppercase", type=FieldType.TEXT))
+        assert plan.apply_column(["ok", None], default="n/a") == ["OK", "n/a"]
+
+    def test_regex_is_precompiled(self):
+        assert transform_regex_extract("Ref 42", re.compile(r"(\d+)")) == "42"
+
+
+# ── Streaming / Incremental Lists ─────────────────────────────────────────────
+
+
+class PagedList(FakePage):
+    """Batch reads answer with the current page of ``pages``; clicking next advances it."""
+
+    def __init__(self, pages):
+        super().__init__(batch={})
+        self.pages = pages
+        self.current = 0
+        self.clicks = 0
+        next_button = FakeElement()
+        next_button.click = self._click
+        self.elements = {"a.next": next_button}
+
+    async def _click(self):
+        self.clicks += 1
+        self.current += 1
+
+    async def evaluate(self, _script, spec):
+        self.evaluate_calls += 1
+        return {"transactions": self.pages[self.current]} if "transactions" in spec else {}
+
+
+def _paged_transactions(watermark="id"):
+    return ListExtractionField(
+        selector="tr.txn",
+        fields={
+            "id": ExtractionField(selector=".id"),
+            "date": ExtractionField(selector=".date", type=FieldType.DATE),
+        },
+        pagination=PaginationConfig(next_selector="a.next", max_pages=5, wait_after_click=0),
+        watermark=watermark,
+    )
+
+
+PAGES = [
+    [{"id": "t9", "date": "2026-03-09"}, {"id": "t8", "date": "2026-03-08"}],
+    [{"id": "t7", "date": "2026-03-08"}, {"id": "t6", "date": "2026-03-06"}],
+    [{"id": "t5", "date": "2026-03-05"}, {"id": "t4", "date": "2026-03-04"}],
+]
+
+
+class TestIncrementalLists:
+    @pytest.mark.asyncio
+    async def test_row_stream_clicks_the_next_page_only_when_rows_are_wanted(self):
+        page = PagedList(PAGES)
+        rows = DataExtractor(page, batch=True).iter_list(_paged_transactions(), "transactions")
+
+        first = [await rows.__anext__(), await rows.__anext__()]
+        await rows.aclose()
+
+        assert [row["id"] for row in first] == ["t9", "t8"]
+        assert page.clicks == 0
+
+    @pytest.mark.asyncio
+    async def test_pagination_stops_at_the_previous_refresh_watermark(self):
+        page = PagedList(PAGES)
+
+        with incremental_lists({"transactions": "t7"}) as marks:
+            data = await DataExtractor(page, batch=True).extract({"transactions": _paged_transactions()})
+
+        assert [row["id"] for row in data["transactions"]] == ["t9", "t8"]
+        assert page.clicks == 1
+        assert marks.latest == {"transactions": "t9"}
+        assert marks.stopped == {"transactions": 2}
+
+    @pytest.mark.asyncio
+    async def test_date_watermark_rereads_rows_from_the_same_day(self):
+        page = PagedList(PAGES)
+
+        with incremental_lists({"transactions": "2026-03-08T00:00:00"}) as marks:
+            data = await DataExtractor(page, batch=True).extract({"transactions": _paged_transactions("date")})
+
+        assert [row["id"] for row in data["transactions"]] == ["t9", "t8", "t7"]
+        assert marks.latest == {"transactions": "2026-03-09T00:00:00"}
+
+    @pytest.mark.asyncio
+    async def test_unparsed_dates_do_not_stop_pagination_early(self):
+        pages = [[{"id": "t9", "date": "1 day ago"}, {"id": "t8", "date": "2 days ago"}], []]
+        page = PagedList(pages)
+
+        with incremental_lists({"transactions": "2026-03-08T00:00:00"}) as marks:
+            data = await DataExtractor(page, batch=True).extract({"transactions": _paged_transactions("date")})
+
+        assert [row["id"] for row in data["transactions"]] == ["t9", "t8"]
+        assert page.clicks == 1
+        assert marks.stopped == {}
+
+    @pytest.mark.asyncio
+    async def test_without_a_watermark_every_page_is_read(self):
+        page = PagedList(PAGES + [[]])
+
+        data = await DataExtractor(page, batch=True).extract({"transactions": _paged_transactions()})
+
+        assert len(data["transactions"]) == 6
+        assert page.clicks == 3
+
+    @pytest.mark.asyncio
+    async def test_max_items_does_not_click_past_the_last_needed_page(self):
+        page = PagedList(PAGES)
+        transactions = _paged_transactions().model_copy(update={"max_items": 2})
+
+        data = await DataExtractor(page, batch=True).extract({"transactions": transactions})
+
+        assert len(data["transactions"]) == 2
+        assert page.clicks == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_regex_column_keeps_the_list(self):
+        transactions = _paged_transactions(watermark=None)
+        transactions.fields["id"] = ExtractionField(selector=".id", transform="regex_extract(t(\\d+)")
+        page = PagedList(PAGES[:1] + [[]])
+
+        data = await DataExtractor(page, batch=True).extract({"transactions": transactions})
+
+        assert [row["id"] for row in data["transactions"]] == ["t9", "t8"]
+
+    def test_watermark_must_be_a_column(self):
+        with pytest.raises(ValueError, match="not a column"):
+            _paged_transactions(watermark="reference")
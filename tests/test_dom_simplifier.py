@@ -9,9 +9,11 @@ Covers:
 - Element map structure
 - Reduction percentage (>30% from complex pages)
 - Token budget warning
+- Relevance-ranked pruning to the token budget
 - Playwright integration (DOMSimplifier class)
 """
 
+import re
 from unittest.mock import AsyncMock
 
 import pytest
@@ -23,9 +25,13 @@ from src.core.dom_simplifier import (
     ElementInfo,
     SimplifiedDOM,
     _collapse_whitespace,
+    _from_page,
+    dom_fingerprint,
     estimate_tokens,
+    prune_to_budget,
     simplify_html,
 )
+from src.core.extraction_prompt import FieldDefinition, ListFieldDefinition
 
 # ── Fixtures: Sample DOM strings ──────────────────────────────────────────────
 
@@ -340,6 +346,129 @@ class TestTokenBudget:
         assert DEFAULT_TOKEN_BUDGET == 30_000
 
 
+# ── Tests: Budget Pruning ─────────────────────────────────────────────────────
+
+NAV_LINKS = "".join(f'<li><a href="/help/{i}">Help topic number {i}</a></li>' for i in range(40))
+LEGAL = " ".join(["Terms and conditions apply to every product we offer."] * 30)
+TXN_ROWS = "".join(f"<tr><td>01/{i:02d}/2026</td><td>Payment {i}</td><td>${i}.00</td></tr>" for i in range(1, 29))
+DASHBOARD_HTML = f"""
+<html><body>
+  <nav><ul>{NAV_LINKS}</ul></nav>
+  <main>
+    <div class="summary"><span>Current balance</span><span>$1,234.56</span></div>
+    <div><span>Account number</span><span>12-3456</span></div>
+    <table id="transactions"><tbody>{TXN_ROWS}</tbody></table>
+  </main>
+  <footer><p>{LEGAL}</p></footer>
+</body></html>
+"""
+DASHBOARD_FIELDS = [
+    FieldDefinition(name="current_balance", type="currency"),
+    FieldDefinition(name="account_number"),
+    ListFieldDefinition(
+        name="transactions",
+        fields=(FieldDefinition(name="date", type="date"), FieldDefinition(name="amount", type="currency")),
+    ),
+]
+
+
+class TestPruneToBudget:
+    """Test relevance-ranked pruning of over-budget DOMs."""
+
+    def test_under_budget_is_returned_unchanged(self):
+        dom = simplify_html(DASHBOARD_HTML)
+        assert prune_to_budget(dom, DASHBOARD_FIELDS, DEFAULT_TOKEN_BUDGET) is dom
+
+    def test_keeps_relevant_subtrees_within_budget(self):
+        dom = simplify_html(DASHBOARD_HTML)
+        result = prune_to_budget(dom, DASHBOARD_FIELDS, 600)
+
+        assert dom.token_estimate > 600
+        assert result.token_estimate <= 600
+        assert not result.over_budget
+        assert "$1,234.56" in result.html
+        assert "12-3456" in result.html  # kept for its "Account number" label
+        assert "$1.00" in result.html
+        assert "Terms and conditions" not in result.html
+        assert "Help topic" not in result.html
+        assert {"nav", "footer"} <= {subtree.tag for subtree in result.pruned}
+        assert all(subtree.chars > 0 for subtree in result.pruned)
+
+    def test_tightest_budget_keeps_the_densest_matches(self):
+        result = prune_to_budget(simplify_html(DASHBOARD_HTML), DASHBOARD_FIELDS, 60)
+
+        assert result.token_estimate <= 60
+        assert "$1,234.56" in result.html
+        assert "Payment 28" not in result.html
+
+    def test_element_map_and_spans_match_pruned_html(self):
+        result = prune_to_budget(simplify_html(DASHBOARD_HTML), DASHBOARD_FIELDS, 300)
+
+        assert set(re.findall(r'data-pid="(p\d+)"', result.html)) == set(result.element_map)
+        for pid, info in result.element_map.items():
+            start, end = result.spans[pid]
+            assert result.html[start:end].startswith(f"<{info.tag} ")
+            assert result.html[start:end].endswith(f"</{info.tag}>")
+            assert f'data-pid="{pid}"' in result.html[start:end]
+            assert set(info.children_pids) <= set(result.element_map)
+
+    def test_spans_cover_each_element(self):
+        result = simplify_html(COMPLEX_HTML)
+
+        for pid, info in result.element_map.items():
+            start, end = result.spans[pid]
+            assert result.html[start:].startswith(f"<{info.tag} ")
+            assert f'data-pid="{pid}"' in result.html[start:end]
+
+    @pytest.mark.asyncio
+    async def test_simplifier_prunes_when_given_fields(self):
+        page = AsyncMock()
+        page.content.return_value = DASHBOARD_HTML
+        simplifier = DOMSimplifier(token_budget=600, in_browser=False)
+
+        pruned = await simplifier.simplify(page, DASHBOARD_FIELDS)
+        unpruned = await simplifier.simplify(page)
+
+        assert pruned.token_estimate <= 600 < unpruned.token_estimate
+        assert pruned.pruned and not unpruned.pruned
+
+
+# ── Tests: Structural Fingerprint ─────────────────────────────────────────────
+
+
+def _account_page(rows: int, account: str = "839201", balance: str = "$1,234.56", extra: str = "") -> str:
+    txns = "".join(f"<tr><td>01/{i:02d}</td><td>${i}.00</td></tr>" for i in range(1, rows + 1))
+    return (
+        f'<html><body><h1 id="acct-{account}">Account {account}</h1>'
+        f'<span class="balance">{balance}</span><table><tbody>{txns}</tbody></table>{extra}</body></html>'
+    )
+
+
+class TestDomFingerprint:
+    """Test the structural fingerprint used in selector-cache keys."""
+
+    def test_same_layout_with_other_data_matches(self):
+        first = dom_fingerprint(simplify_html(_account_page(3)))
+        second = dom_fingerprint(simplify_html(_account_page(12, account="118734", balance="$5.00")))
+        assert first == second
+
+    def test_changed_layout_differs(self):
+        base = dom_fingerprint(simplify_html(_account_page(3)))
+        redesigned = dom_fingerprint(simplify_html(_account_page(3, extra="<nav><a href='/x'>Home</a></nav>")))
+        assert base != redesigned
+
+    def test_attribute_names_and_input_types_count(self):
+        text = dom_fingerprint(simplify_html('<form><input type="text" name="q"></form>'))
+        password = dom_fingerprint(simplify_html('<form><input type="password" name="q"></form>'))
+        no_name = dom_fingerprint(simplify_html('<form><input type="text"></form>'))
+        assert len({text, password, no_name}) == 3
+
+    def test_ids_are_ignored(self):
+        assert dom_fingerprint(simplify_html('<div id="a1">x</div>')) == dom_fingerprint(
+            simplify_html('<div id="b2">y</div>')
+        )
+
+
 # ── Tests: Attribute Filtering ────────────────────────────────────────────────
 
 
@@ -442,6 +571,79 @@ class TestDOMSimplifier:
         result = await simplifier.simplify(page)
         assert not result.over_budget
 
+    @pytest.mark.asyncio
+    async def test_in_page_result_skips_page_content(self):
+        expected = simplify_html(SIMPLE_HTML)
+        page = AsyncMock()
+        page.evaluate.return_value = {
+            "html": expected.html,
+            "elements": [
+                [info.pid, info.tag, info.text, list(info.attrs.items()), info.children_pids, *expected.spans[info.pid]]
+                for info in expected.element_map.values()
+            ],
+            "length": len(SIMPLE_HTML),
+        }
+
+        result = await DOMSimplifier(in_browser=True).simplify(page)
+
+        page.content.assert_not_called()
+        assert result == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("outcome", [None, RuntimeError("Execution context was destroyed")])
+    async def test_in_page_failure_falls_back_to_the_python_parser(self, outcome):
+        page = AsyncMock()
+        if isinstance(outcome, Exception):
+            page.evaluate.side_effect = outcome
+        else:
+            page.evaluate.return_value = outcome
+        page.content.return_value = SIMPLE_HTML
+
+        result = await DOMSimplifier(in_browser=True).simplify(page)
+
+        assert result == simplify_html(SIMPLE_HTML)
+
+    @pytest.mark.asyncio
+    async def test_in_browser_disabled_never_evaluates(self):
+        page = AsyncMock()
+        page.content.return_value = SIMPLE_HTML
+
+        await DOMSimplifier(in_browser=False).simplify(page)
+
+        page.evaluate.assert_not_called()
+
+    def test_in_page_whitespace_matches_python(self):
+        from src.core.dom_simplifier import _WHITESPACE_CODEPOINTS
+
+        assert _WHITESPACE_CODEPOINTS == [code for code in range(0x110000) if re.match(r"\s", chr(code))]
+
+    def test_from_page_keeps_attribute_order(self):
+        result = _from_page(
+            {
+                "html": '<a href="/x" id="y" data-pid="p1">x</a>',
+                "elements": [["p1", "a", "x", [["href", "/x"], ["id", "y"]], [], 0, 39]],
+                "length": 40,
+            },
+            DEFAULT_TOKEN_BUDGET,
+        )
+
+        assert list(result.element_map["p1"].attrs) == ["href", "id"]
+        assert result.reduction_pct == 2.5
+
+    def test_from_page_converts_utf16_offsets(self):
+        html = '<p data-pid="p1">\U0001f4b0</p><b data-pid="p2">x</b>'
+        result = _from_page(
+            {
+                "html": html,
+                "elements": [["p1", "p", "\U0001f4b0", [], [], 0, 23], ["p2", "b", "x", [], [], 23, 45]],
+                "length": 50,
+            },
+            DEFAULT_TOKEN_BUDGET,
+        )
+
+        assert result.spans == {"p1": (0, 22), "p2": (22, 44)}
+        assert html[22:44] == '<b data-pid="p2">x</b>'
+
     @pytest.mark.asyncio
     async def test_get_visible_text(self):
         page = AsyncMock()
@@ -0,0 +1,137 @@
+"""
+Conformance corpus for the in-page DOM simplifier.
+
+Each document is loaded into Chromium; the in-page cleaner must return exactly
+what ``simplify_html(page.content())`` does — same HTML, same element map.
+
+Requires: playwright browsers installed (run: playwright install chromium)
+"""
+
+import os
+
+import pytest
+
+from src.core.dom_simplifier import (
+    _SIMPLIFY_JS,
+    DEFAULT_TOKEN_BUDGET,
+    _from_page,
+    _in_page_spec,
+    simplify_html,
+)
+from tests.test_dom_simplifier import (
+    COMPLEX_HTML,
+    DEEP_NESTING_HTML,
+    NESTED_SCRIPT_HTML,
+    SIMPLE_HTML,
+    WHITESPACE_HTML,
+)
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("SKIP_BROWSER_TESTS", "1") == "1",
+    reason="Browser tests disabled. Set SKIP_BROWSER_TESTS=0 and install Playwright to run.",
+)
+
+CORPUS = {
+    "simple": SIMPLE_HTML,
+    "complex": COMPLEX_HTML,
+    "whitespace": WHITESPACE_HTML,
+    "nested_script": NESTED_SCRIPT_HTML,
+    "deep_nesting": DEEP_NESTING_HTML,
+    "entities": (
+        "<p title='a &amp; b \"q\" <x>'>Tom &amp; Jerry &lt;3 &nbsp;&nbsp; x&#8203;y</p><a href='/q?a=1&b=2'>go</a>"
+    ),
+    "forms": (
+        "<form action='/login' method='post' onsubmit='x()'><label for=u>User</label>"
+        "<input id=u name=user data-x=1 value='a\"b'><select name=s><option value=1 selected>One</option></select>"
+        "<textarea name=t>a &lt;b&gt; c</textarea><button type=submit disabled>Go</button></form>"
+    ),
+    "tables": (
+        "<table><colgroup><col span=2></colgroup><thead><tr><th>Date</th><th>Amount</th></tr></thead>"
+        "<tbody><tr><td>01/05</td><td>$5.00</td></tr><tr><td>01/06</td><td>-$2.10</td></tr></tbody></table>"
+    ),
+    "void_and_skipped": "<div>line one<br>line two<hr>after<wbr>word<img src=/a.png alt=A></div>",
+    "stripped_subtrees": (
+        "<noscript><img src='/pixel.gif'><div>enable js</div></noscript><iframe src='/ad'></iframe>"
+        "<svg viewBox='0 0 1 1'><style>.a{}</style><path d='M0'/></svg><template><p>later</p></template>"
+        "<object><embed src=x></object><span>kept</span>"
+    ),
+    "unicode_whitespace": "<p>　lead mid  end​</p><p>﻿bom﻿</p><p>\u0085nel</p>",
+    "astral": "<p>\U0001f4b0 balance \U0001f600</p>",
+    "page_data_pid": "<div data-pid='theirs' id=a class='c1 c2'>x</div>",
+    "aria_nav": (
+        "<nav role=navigation aria-label='Main'><ul><li><a href='/a' title='A'>A</a></li>"
+        "<li><a href='/b' aria-describedby=h>B</a></li></ul></nav>"
+    ),
+    "mathml": "<math><mi>x</mi><mo>=</mo><mn>2</mn></math>",
+    "comments": "<p>before<!-- c -->after</p><p>a <!-- c --> b</p>",
+    "frame_element": "<div><frame src=/f>after frame</div><p>next</p>",
+}
+
+# DOM shapes scripts create but the HTML parser never does.
+DOM_EDITS = {
+    "adjacent_text_nodes": """() => {
+        const p = document.createElement("p");
+        p.append(document.createTextNode("a  "), document.createTextNode("  b"));
+        document.body.append(p);
+    }""",
+    "script_inserted_rows": """() => {
+        const table = document.createElement("table");
+        for (const amount of ["$1.00", "$2.00"]) {
+            const row = table.insertRow();
+            row.insertCell().textContent = amount;
+            row.setAttribute("onclick", "open()");
+        }
+        document.body.append(table);
+    }""",
+}
+
+
+@pytest.fixture
+async def browser():
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        yield browser
+        await browser.close()
+
+
+async def _assert_conforms(page):
+    expected = simplify_html(await page.content())
+    raw = await page.evaluate(_SIMPLIFY_JS, _in_page_spec())
+    assert raw is not None, "in-page simplifier fell back"
+
+    assert _from_page(raw, DEFAULT_TOKEN_BUDGET) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(CORPUS))
+async def test_in_page_simplifier_matches_python(browser, name):
+    page = await browser.new_page()
+    try:
+        await page.set_content(CORPUS[name])
+        await _assert_conforms(page)
+    finally:
+        await page.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(DOM_EDITS))
+async def test_in_page_simplifier_matches_python_after_dom_edits(browser, name):
+    page = await browser.new_page()
+    try:
+        await page.set_content(SIMPLE_HTML)
+        await page.evaluate(DOM_EDITS[name])
+        await _assert_conforms(page)
+    finally:
+        await page.close()
+
+
+@pytest.mark.asyncio
+async def test_raw_text_markup_outside_stripped_subtrees_falls_back(browser):
+    page = await browser.new_page()
+    try:
+        await page.set_content("<xmp><b>raw</b></xmp>")
+        assert await page.evaluate(_SIMPLIFY_JS, _in_page_spec()) is None
+    finally:
+        await page.close()
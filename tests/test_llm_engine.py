@@ -19,6 +19,7 @@ from src.core.blueprint import (
     FieldType,
     StepAction,
 )
+from src.core.dom_simplifier import dom_fingerprint
 from src.core.engine import (
     _create_llm_provider,
     _extract_llm_adaptive,
@@ -27,14 +28,16 @@ from src.core.engine import (
     _extract_with_llm,
     _extract_with_multimodal,
     _get_page_path,
+    _page_fingerprint,
     get_selector_cache,
 )
+from src.core.engine import settings as engine_settings
 from src.core.llm_provider import (
     FallbackChain,
     LLMProviderError,
     OpenAIProvider,
 )
-from src.core.selector_cache import SelectorCache
+from src.core.selector_cache import SelectorCache, SharedSelectorCache
 from src.exceptions import DataExtractionError
 from tests.conftest import (
     make_llm_response,
@@ -180,7 +183,7 @@ class TestExtractWithCachedSelectors:
                 )
 
                 assert result == mock_data
-                mock_cache.record_success.assert_called_once_with("example.com", "/dashboard")
+                mock_cache.record_success.assert_called_once_with("example.com", "/dashboard", fingerprint=None)
 
     @pytest.mark.asyncio
     async def test_failed_extraction_records_failure(self):
@@ -206,7 +209,7 @@ class TestExtractWithCachedSelectors:
                 )
 
                 assert result is None
-                mock_cache.record_failure.assert_called_once_with("example.com", "/dashboard")
+                mock_cache.record_failure.assert_called_once_with("example.com", "/dashboard", fingerprint=None)
 
 
 class TestExtractWithLLM:
@@ -545,7 +548,7 @@ class TestExtractLLMAdaptive:
 
         call_count = 0
 
-        def cache_get_side_effect(domain, path):
+        def cache_get_side_effect(domain, path, fingerprint=None):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -573,6 +576,52 @@ class TestExtractLLMAdaptive:
                 assert method2 == "cached_selectors"
 
 
+class TestSelectorCacheFingerprint:
+    """The adaptive pipeline keys the selector cache by the page's DOM fingerprint."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_and_llm_share_one_simplified_dom(self):
+        blueprint = make_v3_blueprint()
+        page = make_mock_page(url="http://example.com/accounts/839201/dashboard")
+        cache = SelectorCache()
+
+        with patch("src.core.engine.get_selector_cache", return_value=cache):
+            with patch(
+                "src.core.engine._extract_with_llm", new_callable=AsyncMock, return_value={"balance": 1.0}
+            ) as llm:
+                _, method = await _extract_llm_adaptive(page, blueprint, blueprint.extract, "test")
+
+        assert method == "llm"
+        kwargs = llm.call_args.kwargs
+        assert kwargs["fingerprint"] == dom_fingerprint(kwargs["dom"])
+        page.content.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_selectors_found_for_another_account(self):
+        blueprint = make_v3_blueprint()
+        cache = SelectorCache()
+        first = make_mock_page(url="http://example.com/accounts/839201/dashboard")
+        second = make_mock_page(url="http://example.com/accounts/118734/dashboard")
+        _, fingerprint = await _page_fingerprint(first, "test")
+        cache.put("example.com", "/accounts/839201/dashboard", {"balance": "#balance"}, fingerprint=fingerprint)
+
+        with patch("src.core.engine.get_selector_cache", return_value=cache):
+            with patch(
+                "src.core.engine._extract_with_cached_selectors", new_callable=AsyncMock, return_value={"balance": 2.0}
+            ):
+                _, method = await _extract_llm_adaptive(second, blueprint, blueprint.extract, "test")
+
+        assert method == "cached_selectors"
+
+    @pytest.mark.asyncio
+    async def test_path_key_mode_skips_fingerprinting(self, monkeypatch):
+        monkeypatch.setattr(engine_settings, "selector_cache_key", "path")
+        page = make_mock_page()
+
+        assert await _page_fingerprint(page, "test") == (None, None)
+        page.content.assert_not_awaited()
+
+
 class TestExecuteBlueprintBranching:
     """Test that _execute_blueprint correctly branches on extraction strategy."""
 
@@ -621,3 +670,15 @@ class TestSelectorCacheSingleton:
         assert isinstance(cache1, SelectorCache)
 
         engine_mod._selector_cache = None  # Cleanup
+
+    def test_redis_backend_shares_the_cache(self, monkeypatch):
+        """SELECTOR_CACHE_BACKEND=redis selects the two-tier cache."""
+        import src.core.engine as engine_mod
+
+        monkeypatch.setattr(engine_settings, "selector_cache_backend", "redis")
+        monkeypatch.setattr(engine_mod, "_selector_cache", None)
+        with patch("src.core.selector_cache._shared_redis", return_value=None):
+            cache = get_selector_cache()
+
+        assert isinstance(cache, SharedSelectorCache)
+        assert cache.max_local_entries == engine_settings.selector_cache_local_max_entries
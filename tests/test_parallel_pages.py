@@ -0,0 +1,155 @@
+"""Tests for extracting independent blueprint pages in parallel tabs."""
+
+import asyncio
+
+import pytest
+
+from src.core import engine
+from src.core.blueprint import AuthConfig, BlueprintStep, BlueprintV2, ExtractionField, ExtractionPage, StepAction
+from src.core.read_only_policy import ExecutionPhase, ReadOnlyExecutionPolicy
+from src.exceptions import ReadOnlyPolicyViolationError
+from tests.test_browser_sessions import FakePool
+
+
+class TabPage:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class TabContext:
+    def __init__(self):
+        self.pages: list[TabPage] = []
+
+    async def new_page(self):
+        page = TabPage(f"tab{len(self.pages)}" if self.pages else "main")
+        self.pages.append(page)
+        return page
+
+
+class SlowExecutor:
+    active = 0
+    peak = 0
+    runs: list = []
+
+    def __init__(self, page, *_args, **kwargs):
+        self.page = page
+        self.policy = kwargs.get("read_only_policy")
+        self.waits: list[dict] = []
+
+    async def execute_steps(self, steps, context=""):
+        SlowExecutor.runs.append((context, self.page.name))
+        if self.policy is not None:
+            for step in steps:
+                reason = self.policy.evaluate_step(step)
+                if reason:
+                    raise ReadOnlyPolicyViolationError(reason)
+        if context.startswith("page:"):
+            SlowExecutor.active += 1
+            SlowExecutor.peak = max(SlowExecutor.peak, SlowExecutor.active)
+            await asyncio.sleep(0.05)
+            SlowExecutor.active -= 1
+        self.waits.append({"step": context, "signal": "network_idle", "wait_ms": 1.0})
+
+
+class PageExtractor:
+    def __init__(self, page, **_kwargs):
+        self.page = page
+        self.timings: dict = {}
+        self.waits: list = []
+
+    async def extract(self, defs, site=None):
+        return {name: self.page.name for name in defs}
+
+
+def _blueprint(*pages) -> BlueprintV2:
+    extract = {"balance": ExtractionField(selector="#balance")}
+    for page in pages:
+        extract.update({name: ExtractionField(selector=f"#{name}") for name in page.fields})
+    return BlueprintV2(
+        name="Bank",
+        domain="bank.test",
+        auth=AuthConfig(steps=[BlueprintStep(action=StepAction.GOTO, url="https://bank.test/login")]),
+        extract=extract,
+        pages=list(pages),
+    )
+
+
+def _page(name, parallel=True, step=None):
+    return ExtractionPage(
+        name=name,
+        steps=[step or BlueprintStep(action=StepAction.GOTO, url=f"https://bank.test/{name}")],
+        fields=[name],
+        parallel=parallel,
+    )
+
+
+async def _run(monkeypatch, blueprint, context):
+    pool = FakePool(context)
+
+    async def fake_get_pool():
+        return pool
+
+    SlowExecutor.active = SlowExecutor.peak = 0
+    SlowExecutor.runs = []
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", SlowExecutor)
+    monkeypatch.setattr(engine, "DataExtractor", PageExtractor)
+    return await engine._execute_blueprint(
+        blueprint=blueprint,
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=None,
+        proxy=None,
+        session_id="sess-tabs",
+    )
+
+
+@pytest.mark.asyncio
+async def test_parallel_pages_run_in_their_own_tabs_with_bounded_fan_out(monkeypatch):
+    monkeypatch.setattr(engine.settings, "extraction_max_tabs", 2)
+    context = TabContext()
+
+    result = await _run(monkeypatch, _blueprint(_page("bills"), _page("usage"), _page("statements")), context)
+
+    assert result["data"] == {"balance": "main", "bills": "tab1", "usage": "tab2", "statements": "tab3"}
+    assert SlowExecutor.peak == 2
+    assert all(page.closed for page in context.pages)
+    assert {wait["step"] for wait in result["metadata"]["step_waits"]} >= {"page:bills", "page:statements"}
+
+
+@pytest.mark.asyncio
+async def test_serial_pages_stay_on_the_main_page(monkeypatch):
+    monkeypatch.setattr(engine.settings, "extraction_max_tabs", 0)
+    context = TabContext()
+
+    result = await _run(monkeypatch, _blueprint(_page("bills", parallel=False), _page("usage")), context)
+
+    assert result["data"] == {"balance": "main", "bills": "main", "usage": "main"}
+    assert [page for _, page in SlowExecutor.runs] == ["main", "main", "main"]
+    assert len(context.pages) == 1
+
+
+@pytest.mark.asyncio
+async def test_tabs_are_held_to_the_read_only_policy(monkeypatch):
+    monkeypatch.setattr(engine.settings, "strict_read_only_mode", True)
+    context = TabContext()
+    fill = BlueprintStep(action=StepAction.FILL, selector="#memo", value="x")
+
+    with pytest.raises(ReadOnlyPolicyViolationError):
+        await _run(monkeypatch, _blueprint(_page("bills"), _page("memo", step=fill)), context)
+
+    assert all(page.closed for page in context.pages)
+
+
+def test_policy_only_lets_announced_tabs_through():
+    policy = ReadOnlyExecutionPolicy(enabled=True, phase=ExecutionPhase.READ)
+
+    assert policy.claim_tab() is False
+    policy.expect_tab()
+    assert policy.claim_tab() is True
+    assert policy.claim_tab() is False
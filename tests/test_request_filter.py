@@ -0,0 +1,103 @@
+"""Tests for the compiled request-blocking rules and their use in the browser pool."""
+
+import pytest
+
+from src.core.blueprint import RequestRulesConfig
+from src.core.request_filter import HostSuffixTrie, RequestFilter, native_block_args
+from tests.test_asset_cache import FakeRequest, FakeRoute
+from tests.test_browser_pool import _make_pool
+
+
+def test_host_trie_matches_host_and_subdomains_only():
+    trie = HostSuffixTrie(["doubleclick.net", ".tracker.io"])
+
+    assert trie.matches("doubleclick.net")
+    assert trie.matches("stats.g.doubleclick.net")
+    assert trie.matches("cdn.tracker.io")
+    assert not trie.matches("notdoubleclick.net")
+    assert not trie.matches("net")
+    assert trie.hosts == ("doubleclick.net", "tracker.io")
+
+
+def test_default_filter_blocks_resource_types_and_tracker_hosts():
+    rules = RequestFilter.default()
+
+    assert rules.should_block("https://bank.test/logo.png", "image")
+    assert rules.should_block("https://www.google-analytics.com/collect?v=1", "xhr")
+    assert not rules.should_block("https://bank.test/api/accounts", "xhr")
+    # The old substring scan matched this path; host rules only match hosts.
+    assert not rules.should_block("https://bank.test/help/hotjar.com", "document")
+
+
+def test_url_patterns_use_wildcards_and_are_case_insensitive():
+    rules = RequestFilter(block=["/beacon/*.gif", "https://chat.*/widget"], blocked_resource_types=())
+
+    assert rules.should_block("https://bank.test/Beacon/pixel.GIF?x=1", "other")
+    assert rules.should_block("https://chat.vendor.io/widget.js", "script")
+    assert not rules.should_block("https://bank.test/beacon.gif", "other")
+
+
+def test_allow_rules_override_blocks_and_resource_types():
+    rules = RequestFilter.for_rules(block=["cdn.bank.test"], allow=["static.cdn.bank.test", "*/fonts/*"])
+
+    assert rules.should_block("https://cdn.bank.test/app.js", "script")
+    assert not rules.should_block("https://static.cdn.bank.test/app.js", "script")
+    assert not rules.should_block("https://bank.test/fonts/inter.woff2", "font")
+    assert rules.should_block("https://bank.test/img/logo.png", "image")
+    assert RequestFilter.for_rules(("cdn.bank.test",), ()) is RequestFilter.for_rules(["cdn.bank.test"], [])
+    assert RequestFilter.for_rules() is RequestFilter.default()
+
+
+def test_native_block_args_cover_images_and_default_hosts():
+    args = native_block_args()
+
+    assert "--blink-settings=imagesEnabled=false" in args
+    resolver = next(a for a in args if a.startswith("--host-resolver-rules="))
+    assert "MAP *.doubleclick.net ~NOTFOUND" in resolver
+    assert native_block_args(blocked_resource_types=()) == [resolver]
+
+
+def test_blueprint_request_rules_default_to_empty_lists():
+    rules = RequestRulesConfig(block=["tracker.io"])
+    assert rules.allow == []
+
+
+@pytest.mark.asyncio
+async def test_pool_route_handler_uses_the_contexts_rules(tmp_path):
+    pool = _make_pool(tmp_path)
+    rules = RequestFilter.for_rules(block=["chat.vendor.io"], allow=["*/critical.css"])
+    pooled = await pool.acquire("rules-a", request_filter=rules)
+    _pattern, handler = pooled.context.routes[0]
+
+    chat = FakeRoute(FakeRequest("https://chat.vendor.io/widget.js"))
+    await handler(chat)
+    css = FakeRoute(FakeRequest("https://bank.test/critical.css", resource_type="stylesheet"))
+    await handler(css)
+    image = FakeRoute(FakeRequest("https://bank.test/logo.png", resource_type="image"))
+    await handler(image)
+
+    assert chat.aborted is True
+    assert css.continued is True and css.aborted is False
+    assert image.aborted is True
+
+    await pool.release("rules-a")
+    plain = await pool.acquire("rules-b")
+    assert plain.request_filter is None
+    _pattern, handler = plain.context.routes[0]
+    chat = FakeRoute(FakeRequest("https://chat.vendor.io/widget.js"))
+    await handler(chat)
+    assert chat.continued is True
+
+
+@pytest.mark.asyncio
+async def test_blueprint_rules_apply_with_default_blocking_off(tmp_path):
+    pool = _make_pool(tmp_path)
+    pool._block_resources = False
+    pool._reserve_routed = False
+    pooled = await pool.acquire("rules-c", request_filter=RequestFilter.for_rules(block=["beacon.vendor.io"]))
+
+    assert pooled.context.routes, "context with blueprint rules must be routed"
+    _pattern, handler = pooled.context.routes[0]
+    beacon = FakeRoute(FakeRequest("https://beacon.vendor.io/collect"))
+    await handler(beacon)
+    assert beacon.aborted is True
@@ -1,6 +1,8 @@
 """Tests for resilience primitives: circuit breaker, backoff retry, and the
 LLM fallback chain's fail-fast behavior."""
 
+import asyncio
+
 import pytest
 
 from src.core.circuit_breaker import (
@@ -73,6 +75,50 @@ class TestCircuitBreaker:
                 await cb.call(boom)
         assert cb.state is CircuitState.CLOSED
 
+    @pytest.mark.asyncio
+    async def test_is_failure_filters_which_errors_count(self):
+        cb = CircuitBreaker(
+            "t", failure_threshold=1, reset_timeout=60, is_failure=lambda e: isinstance(e, TimeoutError)
+        )
+
+        async def bad_input():
+            raise ValueError("caller error")
+
+        async def timeout():
+            raise TimeoutError()
+
+        with pytest.raises(ValueError):
+            await cb.call(bad_input)
+        assert cb.state is CircuitState.CLOSED
+        with pytest.raises(TimeoutError):
+            await cb.call(timeout)
+        assert cb.status()["state"] == "open"
+        assert 0 < cb.status()["retry_after_seconds"] <= 60
+
+    @pytest.mark.asyncio
+    async def test_single_trial_rejects_concurrent_half_open_calls(self):
+        cb = CircuitBreaker("t", failure_threshold=1, reset_timeout=0.0, single_trial=True)
+        release = asyncio.Event()
+
+        async def boom():
+            raise ValueError()
+
+        async def slow_ok():
+            await release.wait()
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await cb.call(boom)
+        trial = asyncio.create_task(cb.call(slow_ok))
+        await asyncio.sleep(0)
+        assert cb.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitBreakerOpenError):
+            await cb.call(slow_ok)
+
+        release.set()
+        assert await trial == "ok"
+        assert cb.state is CircuitState.CLOSED
+
 
 # ── retry_with_backoff ───────────────────────────────────────────────────────
 
@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.core.watermarks import current_watermarks
+from src.exceptions import RateLimitedError
 from src.scheduled_refresh import RefreshJob, RefreshScheduler
 
 
@@ -173,3 +175,70 @@ class TestRefreshExecution:
 
         assert job.consecutive_failures == 10
         assert job.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_site_rate_limit_defers_without_counting_a_failure(self, scheduler, fetch_callback):
+        fetch_callback.side_effect = RateLimitedError(retry_after=90)
+        job = scheduler.schedule("acc-1", user_id=1)
+        semaphore = asyncio.Semaphore(5)
+
+        await scheduler._execute_job(job, semaphore)
+
+        assert job.consecutive_failures == 0
+        assert job.last_refreshed is None
+        now = datetime.now(timezone.utc)
+        assert not scheduler._is_due(job, now)
+        assert scheduler._is_due(job, now + timedelta(seconds=91))
+
+        fetch_callback.side_effect = None
+        await scheduler._execute_job(job, semaphore)
+        assert job.retry_at is None
+        assert job.last_refreshed is not None
+
+
+class TestIncrementalRefresh:
+    @pytest.mark.asyncio
+    async def test_watermarks_carry_over_to_the_next_refresh(self, scheduler, fetch_callback):
+        seen = []
+
+        async def fetch(access_token, user_id):
+            marks = current_watermarks()
+            seen.append(dict(marks.known))
+            marks.latest["transactions"] = f"t{len(seen)}"
+            return {"transactions": []}
+
+        fetch_callback.side_effect = fetch
+        job = scheduler.schedule("acc-1", user_id=1)
+        semaphore = asyncio.Semaphore(5)
+
+        await scheduler._execute_job(job, semaphore)
+        await scheduler._execute_job(job, semaphore)
+
+        assert seen == [{}, {"transactions": "t1"}]
+        assert job.list_watermarks == {"transactions": "t2"}
+        assert current_watermarks() is None
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_the_previous_watermarks(self, scheduler, fetch_callback):
+        async def fetch(access_token, user_id):
+            current_watermarks().latest["transactions"] = "t9"
+            raise Exception("logged out mid-run")
+
+        fetch_callback.side_effect = fetch
+        job = scheduler.schedule("acc-1", user_id=1)
+        job.list_watermarks = {"transactions": "t1"}
+
+        await scheduler._execute_job(job, asyncio.Semaphore(5))
+
+        assert job.list_watermarks == {"transactions": "t1"}
+
+    def test_watermarks_are_persisted(self, fetch_callback):
+        scheduler = RefreshScheduler(fetch_callback=fetch_callback)
+        job = scheduler.schedule("acc-persisted", user_id=1)
+        job.list_watermarks = {"transactions": "t42"}
+        scheduler._persist_job(job)
+
+        restored = RefreshScheduler(fetch_callback=fetch_callback)
+        restored.load_from_db()
+
+        assert restored._jobs["acc-persisted"].list_watermarks == {"transactions": "t42"}
@@ -2,14 +2,17 @@
 
 import json
 import time
-from pathlib import Path
+
+import pytest
 
 from src.core.selector_cache import (
     DEFAULT_TTL,
     MAX_FAILURES,
     CacheEntry,
     SelectorCache,
+    SharedSelectorCache,
     make_cache_key,
+    template_path,
 )
 
 # ── Cache Key ─────────────────────────────────────────────────────────────────
@@ -46,6 +49,47 @@ class TestMakeCacheKey:
         assert len(key) == 16
         assert all(c in "0123456789abcdef" for c in key)
 
+    def test_account_ids_share_a_key(self):
+        k1 = make_cache_key("example.com", "/accounts/839201/summary")
+        k2 = make_cache_key("example.com", "/accounts/118734/summary")
+        assert k1 == k2
+
+    def test_fingerprint_is_part_of_the_key(self):
+        plain = make_cache_key("example.com", "/page")
+        assert make_cache_key("example.com", "/page", "aaaa") != plain
+        assert make_cache_key("example.com", "/page", "aaaa") != make_cache_key("example.com", "/page", "bbbb")
+
+
+class TestTemplatePath:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/accounts/839201/summary", "accounts/*/summary"),
+            ("/u/3f2b1c9e-1d2a-4b3c-9d8e-7f6a5b4c3d2e/", "u/*"),
+            ("/files/deadbeef01", "files/*"),
+            ("/s/eyJhbGciOiJIUzI1NiJ9x/home", "s/*/home"),
+            ("/a/acct-839201", "a/*"),
+            ("/app;jsessionid=ABC123/home", "app/home"),
+        ],
+    )
+    def test_collapses_ids_and_tokens(self, path, expected):
+        assert template_path(path) == expected
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/dashboard",
+            "/v2/page1",
+            "/account-settings-v2",
+            "/billing/statements",
+            "/billing-history-2024-q1",
+            "/ui/WelcomePage2023v2",
+            "/reports/annual_statement_2023_final",
+        ],
+    )
+    def test_keeps_route_segments(self, path):
+        assert template_path(path) == path.strip("/")
+
 
 # ── CacheEntry ────────────────────────────────────────────────────────────────
 
@@ -136,6 +180,10 @@ class TestCacheEntry:
         assert e2.hit_count == e.hit_count
         assert e2.failure_count == e.failure_count
 
+    def test_from_dict_keeps_fingerprint(self):
+        entry = self._make_entry(fingerprint="f00d")
+        assert CacheEntry.from_dict(entry.to_dict()).fingerprint == "f00d"
+
     def test_from_dict_defaults(self):
         d = {
             "domain": "example.com",
@@ -286,6 +334,7 @@ class TestFilePersistence:
         cache1 = SelectorCache(persist_path=cache_file)
         cache1.put("example.com", "/page", {"balance": "span.bal"}, confidence=0.9)
         cache1.record_success("example.com", "/page")
+        cache1.flush()
 
         # Load in new instance
         cache2 = SelectorCache(persist_path=cache_file)
@@ -305,38 +354,113 @@ class TestFilePersistence:
         cache = SelectorCache(persist_path=str(cache_file))
         assert cache.size == 0  # Gracefully handles corrupt data
 
+        cache.put("a.com", "/page", {"x": "y"})
+        cache.flush()
+        assert len(json.loads(cache_file.read_text())) == 1  # snapshot rewritten
+
     def test_persist_on_put(self, tmp_path):
-        cache_file = tmp_path / "cache.json"
-        cache = SelectorCache(persist_path=str(cache_file))
+        cache_file = str(tmp_path / "cache.json")
+        cache = SelectorCache(persist_path=cache_file)
         cache.put("a.com", "/page", {"x": "y"})
-        assert cache_file.exists()
+        cache.flush()
 
-        data = json.loads(cache_file.read_text())
-        assert len(data) == 1
+        assert SelectorCache(persist_path=cache_file).size == 1
 
     def test_persist_on_invalidate(self, tmp_path):
         cache_file = str(tmp_path / "cache.json")
         cache = SelectorCache(persist_path=cache_file)
         cache.put("a.com", "/page", {"x": "y"})
+        cache.flush()
         cache.invalidate("a.com", "/page")
+        cache.flush()
 
-        data = json.loads(Path(cache_file).read_text())
-        assert len(data) == 0
+        assert SelectorCache(persist_path=cache_file).size == 0
 
     def test_persist_on_clear(self, tmp_path):
         cache_file = str(tmp_path / "cache.json")
         cache = SelectorCache(persist_path=cache_file)
         cache.put("a.com", "/page", {"x": "y"})
+        cache.flush()
         cache.clear()
+        cache.put("b.com", "/page", {"x": "y"})
+        cache.flush()
 
-        data = json.loads(Path(cache_file).read_text())
-        assert len(data) == 0
+        reloaded = SelectorCache(persist_path=cache_file)
+        assert reloaded.size == 1
+        assert reloaded.get("b.com", "/page") is not None
 
     def test_persist_creates_parent_dirs(self, tmp_path):
         cache_file = str(tmp_path / "nested" / "dir" / "cache.json")
         cache = SelectorCache(persist_path=cache_file)
         cache.put("a.com", "/page", {"x": "y"})
-        assert Path(cache_file).exists()
+        cache.flush()
+        assert SelectorCache(persist_path=cache_file).size == 1
+
+
+class TestWriteBehindJournal:
+    def test_mutations_do_not_touch_disk_until_flushed(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        journal = tmp_path / "cache.json.journal"
+        cache = SelectorCache(persist_path=str(cache_file), flush_interval=60)
+        cache.put("a.com", "/page", {"x": "y"})
+        for _ in range(50):
+            cache.record_success("a.com", "/page")
+
+        assert not journal.exists()
+        cache.flush()
+        lines = journal.read_text().splitlines()
+        assert len(lines) == 1  # one record per dirty entry per batch
+        assert json.loads(lines[0])["entry"]["hit_count"] == 50
+        cache.close()
+
+    def test_background_thread_flushes_batches(self, tmp_path):
+        cache_file = str(tmp_path / "cache.json")
+        cache = SelectorCache(persist_path=cache_file, flush_interval=0.01)
+        cache.put("a.com", "/page", {"x": "y"})
+
+        deadline = time.monotonic() + 5
+        while SelectorCache(persist_path=cache_file, flush_interval=60).size == 0:
+            assert time.monotonic() < deadline, "journal was never written"
+            time.sleep(0.02)
+        cache.close()
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        cache = SelectorCache(persist_path=str(cache_file), compact_after=3)
+        for i in range(3):
+            cache.put("a.com", f"/page{i}", {"x": "y"})
+            cache.flush()
+
+        assert len(json.loads(cache_file.read_text())) == 3
+        assert (tmp_path / "cache.json.journal").read_text() == ""
+        assert not (tmp_path / "cache.json.tmp").exists()
+
+    def test_startup_replays_journal_and_ignores_torn_tail(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        journal = tmp_path / "cache.json.journal"
+        entry = CacheEntry("a.com", "/page", {"x": "y"}, 0.9, time.time()).to_dict()
+        cache_file.write_text(json.dumps({"k1": entry, "k2": entry}))
+        journal.write_text(
+            json.dumps({"op": "del", "key": "k1"})
+            + "\n"
+            + json.dumps({"op": "put", "key": "k3", "entry": {**entry, "hit_count": 7}})
+            + '\n{"op": "put", "key": "k4", "ent'
+        )
+
+        cache = SelectorCache(persist_path=str(cache_file))
+
+        assert set(cache._store) == {"k2", "k3"}
+        assert cache._store["k3"].hit_count == 7
+        assert journal.read_text() == ""  # compacted, so new records never follow the torn line
+        assert set(json.loads(cache_file.read_text())) == {"k2", "k3"}
+
+    def test_close_writes_pending_changes(self, tmp_path):
+        cache_file = str(tmp_path / "cache.json")
+        cache = SelectorCache(persist_path=cache_file, flush_interval=60)
+        cache.put("a.com", "/page", {"x": "y"})
+        cache.close()
+
+        assert SelectorCache(persist_path=cache_file).size == 1
 
 
 # ── Self-Healing ──────────────────────────────────────────────────────────────
@@ -388,3 +512,271 @@ class TestSelfHealing:
         assert entry is not None
         assert entry.selectors == {"new": "selector"}
         assert entry.failure_count == 0
+
+
+# ── Key Modes ─────────────────────────────────────────────────────────────────
+
+
+class TestKeyModes:
+    def test_new_layout_misses_the_cache(self):
+        cache = SelectorCache()
+        cache.put("example.com", "/accounts/1234/summary", {"a": "#a"}, fingerprint="layout-1")
+
+        assert cache.get("example.com", "/accounts/5678/summary", fingerprint="layout-1") is not None
+        assert cache.get("example.com", "/accounts/5678/summary", fingerprint="layout-2") is None
+
+    def test_fingerprint_mode_ignores_the_path(self):
+        cache = SelectorCache(key_mode="fingerprint")
+        cache.put("example.com", "/s/abc", {"a": "#a"}, fingerprint="layout-1")
+
+        assert cache.get("example.com", "/t/xyz", fingerprint="layout-1") is not None
+        assert cache.get("other.com", "/s/abc", fingerprint="layout-1") is None
+
+    def test_path_mode_ignores_the_fingerprint(self):
+        cache = SelectorCache(key_mode="path")
+        cache.put("example.com", "/page", {"a": "#a"}, fingerprint="layout-1")
+
+        assert cache.get("example.com", "/page", fingerprint="layout-2") is not None
+
+    def test_failures_count_against_the_fingerprinted_entry(self):
+        cache = SelectorCache()
+        cache.put("example.com", "/page", {"a": "#a"}, fingerprint="layout-1")
+        for _ in range(MAX_FAILURES):
+            cache.record_failure("example.com", "/page", fingerprint="layout-1")
+
+        assert cache.get("example.com", "/page", fingerprint="layout-1") is None
+
+    def test_rejects_unknown_key_mode(self):
+        with pytest.raises(ValueError):
+            SelectorCache(key_mode="url")
+
+
+# ── Shared (Redis) Tier ───────────────────────────────────────────────────────
+
+
+class FakeRedis:
+    """Just enough of a decode_responses redis client for SharedSelectorCache."""
+
+    def __init__(self):
+        self.data = {}
+        self.handlers = []
+        self.deliver = True
+        self.calls = []
+
+    def incr(self, name):
+        self.data[name] = int(self.data.get(name, 0)) + 1
+        return self.data[name]
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        fields = self.data.setdefault(name, {})
+        fields.update({k: str(v) for k, v in (mapping or {key: value}).items()})
+
+    def hget(self, name, key):
+        return self.data.get(name, {}).get(key)
+
+    def hgetall(self, name):
+        self.calls.append(("hgetall", name))
+        return dict(self.data.get(name, {}))
+
+    def hincrby(self, name, key, amount):
+        fields = self.data.setdefault(name, {})
+        fields[key] = str(int(fields.get(key, 0)) + amount)
+        return int(fields[key])
+
+    def expire(self, name, seconds):
+        return name in self.data
+
+    def sadd(self, name, *values):
+        self.data.setdefault(name, set()).update(values)
+
+    def srem(self, name, *values):
+        self.data.get(name, set()).difference_update(values)
+
+    def smembers(self, name):
+        return set(self.data.get(name, set()))
+
+    def delete(self, *names):
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match):
+        return [name for name in list(self.data) if name.startswith(match.rstrip("*"))]
+
+    def publish(self, channel, message):
+        if self.deliver:
+            for handler in self.handlers:
+                handler({"type": "message", "channel": channel, "data": message})
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.queued]
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+
+    def subscribe(self, **handlers):
+        self.redis.handlers.extend(handlers.values())
+
+    def run_in_thread(self, sleep_time, daemon, exception_handler):
+        return self
+
+    def stop(self):
+        pass
+
+
+class DownRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        return fail
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+def _node(redis, **kwargs):
+    return SharedSelectorCache(redis_client=redis, **kwargs)
+
+
+class TestSharedSelectorCache:
+    def test_selectors_learned_on_one_worker_are_used_by_another(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/accounts/1234", {"balance": "#bal"}, confidence=0.9, fingerprint="layout-1")
+
+        entry = b.get("bank.com", "/accounts/5678", fingerprint="layout-1")
+        assert entry.selectors == {"balance": "#bal"}
+        assert entry.confidence == 0.9
+
+    def test_fresh_local_copy_skips_redis(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/page", {"a": "#a"})
+        b.get("bank.com", "/page")
+        reads = len(redis.calls)
+
+        b.get("bank.com", "/page")
+        assert len(redis.calls) == reads
+
+    def test_stale_local_copy_is_reread(self, redis):
+        a, b = _node(redis), _node(redis, local_ttl=0)
+        a.put("bank.com", "/page", {"a": "#a"})
+        b.get("bank.com", "/page")
+        reads = len(redis.calls)
+
+        b.get("bank.com", "/page")
+        assert len(redis.calls) > reads
+
+    def test_hits_and_failures_add_up_across_workers(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/page", {"a": "#a"})
+        b.get("bank.com", "/page")
+        a.record_success("bank.com", "/page")
+        b.record_success("bank.com", "/page")
+        assert _node(redis).get("bank.com", "/page").hit_count == 2
+
+        for node in (a, b, a)[: MAX_FAILURES - 1]:
+            node.record_failure("bank.com", "/page")
+        assert b.get("bank.com", "/page") is not None
+        b.record_failure("bank.com", "/page")
+
+        assert a.get("bank.com", "/page") is None
+        assert b.get("bank.com", "/page") is None
+
+    def test_failure_evicts_other_workers_local_copies(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/page", {"a": "#a"})
+        b.get("bank.com", "/page")
+
+        a.record_failure("bank.com", "/page")
+
+        assert b.size == 0
+        assert b.get("bank.com", "/page").failure_count == 1
+
+    def test_relearned_selectors_replace_other_workers_copies(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/page", {"a": "#old"})
+        b.get("bank.com", "/page")
+
+        a.put("bank.com", "/page", {"a": "#new"})
+
+        assert b.get("bank.com", "/page").selectors == {"a": "#new"}
+
+    def test_failures_against_superseded_selectors_are_ignored(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/page", {"a": "#old"})
+        b.get("bank.com", "/page")
+        redis.deliver = False  # b misses the broadcast and keeps the old version
+        a.put("bank.com", "/page", {"a": "#new"})
+
+        for _ in range(MAX_FAILURES):
+            b.record_failure("bank.com", "/page")
+
+        entry = a.get("bank.com", "/page")
+        assert entry.selectors == {"a": "#new"}
+        assert entry.failure_count == 0
+
+    def test_local_tier_is_bounded_lru(self, redis):
+        cache = _node(redis, max_local_entries=2)
+        cache.put("bank.com", "/a", {"a": "#a"})
+        cache.put("bank.com", "/b", {"b": "#b"})
+        cache.get("bank.com", "/a")
+        cache.put("bank.com", "/c", {"c": "#c"})
+
+        assert cache.size == 2
+        reads = len(redis.calls)
+        cache.get("bank.com", "/a")
+        assert len(redis.calls) == reads
+        assert cache.get("bank.com", "/b") is not None  # evicted locally, still shared
+        assert len(redis.calls) > reads
+
+    def test_invalidate_domain_reaches_every_worker(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/a", {"a": "#a"})
+        a.put("bank.com", "/b", {"b": "#b"})
+        a.put("other.com", "/a", {"a": "#a"})
+        b.get("bank.com", "/a")
+
+        assert a.invalidate_domain("bank.com") == 2
+
+        assert b.get("bank.com", "/a") is None
+        assert b.get("bank.com", "/b") is None
+        assert b.get("other.com", "/a") is not None
+
+    def test_clear_keeps_versions_monotonic(self, redis):
+        a, b = _node(redis), _node(redis)
+        a.put("bank.com", "/a", {"a": "#a"})
+        b.get("bank.com", "/a")
+
+        a.clear()
+
+        assert b.size == 0
+        assert b.get("bank.com", "/a") is None
+        assert redis.data["plaidify:selector_cache:version"] == 1
+
+    def test_falls_back_to_local_tier_without_redis(self):
+        cache = _node(DownRedis())
+        cache.put("bank.com", "/page", {"a": "#a"})
+        cache.record_success("bank.com", "/page")
+
+        entry = cache.get("bank.com", "/page")
+        assert entry.hit_count == 1
+        for _ in range(MAX_FAILURES):
+            cache.record_failure("bank.com", "/page")
+        assert cache.get("bank.com", "/page") is None
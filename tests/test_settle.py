@@ -0,0 +1,247 @@
+"""Tests for settle waits in StepExecutor and list pagination."""
+
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from src.core import settle
+from src.core.blueprint import BlueprintStep, ListExtractionField, PaginationConfig, SettleConfig, StepAction
+from src.core.data_extractor import DataExtractor
+from src.core.settle import PageSettler
+from src.core.step_executor import StepExecutor
+
+
+class FakeRequest:
+    pass
+
+
+class SettlePage:
+    """Page double that emits request events and answers the settle probes."""
+
+    def __init__(self, *, request_seconds=None, ready_after=None, rows_change_after=None, dom_quiet_after=None):
+        self.listeners = defaultdict(list)
+        self.request_seconds = request_seconds
+        self.ready_after = ready_after
+        self.rows_change_after = rows_change_after
+        self.dom_quiet_after = dom_quiet_after
+        self.rows = "10|first|last"
+        self.clicks = 0
+        self.load_state_waits = 0
+
+    def on(self, event, handler):
+        self.listeners[event].append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def _emit(self, event, request):
+        for handler in list(self.listeners[event]):
+            handler(request)
+
+    async def _request(self, seconds):
+        request = FakeRequest()
+        self._emit("request", request)
+        if seconds is None:
+            return  # never finishes (long poll)
+        await asyncio.sleep(seconds)
+        self._emit("requestfinished", request)
+
+    async def _change_rows(self, seconds):
+        await asyncio.sleep(seconds)
+        self.rows = "10|next-first|next-last"
+
+    async def click(self, selector=None):
+        self.clicks += 1
+        if self.request_seconds is not False:
+            asyncio.ensure_future(self._request(self.request_seconds))
+        if self.rows_change_after is not None:
+            asyncio.ensure_future(self._change_rows(self.rows_change_after))
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        if self.ready_after is None:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(selector)
+        await asyncio.sleep(self.ready_after)
+        return object()
+
+    async def evaluate(self, script, arg=None):
+        if script == settle._ROW_SIGNATURE_JS:
+            return self.rows
+        if script == settle._DOM_QUIET_JS:
+            if self.dom_quiet_after is None:
+                raise RuntimeError("Execution context was destroyed")
+            await asyncio.sleep(self.dom_quiet_after)
+            return True
+        raise AssertionError(script)
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        selector, before = arg
+        while self.rows == before:
+            await asyncio.sleep(0.01)
+        return True
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.load_state_waits += 1
+
+
+class NextButton:
+    def __init__(self, page):
+        self.page = page
+
+    async def get_attribute(self, name):
+        return None
+
+    async def click(self):
+        await self.page.click()
+
+
+def _button_for(page):
+    async def query_selector(selector):
+        return NextButton(page)
+
+    return query_selector
+
+
+async def _instant_selector(selector, state=None, timeout=None):
+    return object()
+
+
+@pytest.mark.asyncio
+async def test_network_idle_ends_the_wait_after_the_quiet_window():
+    page = SettlePage(request_seconds=0.1)
+
+    async with PageSettler(page, SettleConfig(network_idle_ms=50, timeout=2000)) as settler:
+        await page.click()
+
+    assert settler.result.signal == "network_idle"
+    assert 100 <= settler.result.waited_ms < 1000
+    assert not any(page.listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_earliest_signal_wins_and_failed_probes_drop_out():
+    # A long-poll keeps the network busy and the DOM probe loses its context;
+    # the ready selector still ends the wait.
+    page = SettlePage(request_seconds=None, ready_after=0.05)
+    config = SettleConfig(network_idle_ms=100, dom_quiet_ms=50, ready_selector="#accounts", timeout=2000)
+
+    async with PageSettler(page, config) as settler:
+        await page.click()
+
+    assert settler.result.signal == "ready_selector"
+    assert settler.result.waited_ms < 1000
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_reported_not_raised():
+    page = SettlePage(request_seconds=None)
+
+    async with PageSettler(page, SettleConfig(network_idle_ms=50, timeout=150)) as settler:
+        await page.click()
+
+    assert settler.result.signal == "timeout"
+    assert settler.result.waited_ms >= 150
+
+
+@pytest.mark.asyncio
+async def test_step_executor_settles_opted_in_steps_and_reports_waits():
+    page = SettlePage(request_seconds=0.05, dom_quiet_after=0.02)
+    executor = StepExecutor(page, {}, site="bank")
+    click = BlueprintStep(
+        action=StepAction.CLICK,
+        selector="#login",
+        settle=SettleConfig(network_idle_ms=None, dom_quiet_ms=20, timeout=2000),
+    )
+    page.wait_for_selector = _instant_selector
+
+    await executor.execute_steps(
+        [click, BlueprintStep(action=StepAction.WAIT_FOR_NAVIGATION)],
+        context="auth",
+    )
+
+    assert [w["step"] for w in executor.waits] == ["auth[0] click", "auth[1] wait_for_navigation"]
+    assert executor.waits[0]["signal"] == "dom_quiet"
+    assert executor.waits[1]["signal"] == "domcontentloaded"
+    assert page.load_state_waits == 1
+
+
+@pytest.mark.asyncio
+async def test_navigation_wait_settles_the_new_document_after_a_late_navigation():
+    page = SettlePage(request_seconds=False, dom_quiet_after=0.02)
+    page.main_frame = object()
+    page.wait_for_selector = _instant_selector
+    events = []
+
+    async def navigate_later():
+        await asyncio.sleep(0.1)
+        events.append("navigated")
+        page._emit("framenavigated", page.main_frame)
+
+    async def click(selector=None):
+        asyncio.ensure_future(navigate_later())
+
+    async def wait_for_load_state(state, timeout=None):
+        events.append(state)
+
+    page.click = click
+    page.wait_for_load_state = wait_for_load_state
+    executor = StepExecutor(page, {}, site="bank")
+
+    await executor.execute_steps(
+        [
+            BlueprintStep(action=StepAction.CLICK, selector="#login"),
+            BlueprintStep(
+                action=StepAction.WAIT_FOR_NAVIGATION,
+                settle=SettleConfig(network_idle_ms=None, dom_quiet_ms=20, timeout=2000),
+            ),
+        ],
+        context="auth",
+    )
+
+    assert events == ["navigated", "domcontentloaded"]
+    assert executor.waits[0]["signal"] == "dom_quiet"
+    assert executor.waits[0]["wait_ms"] >= 100
+    assert not any(page.listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_pagination_settles_on_row_change_instead_of_fixed_timer():
+    page = SettlePage(request_seconds=False, rows_change_after=0.05)
+    page.query_selector = _button_for(page)
+    settled = ListExtractionField(
+        selector="tr.txn",
+        fields={},
+        pagination=PaginationConfig(
+            next_selector="#next",
+            wait_after_click=5000,
+            settle=SettleConfig(network_idle_ms=None, timeout=3000),
+        ),
+    )
+    extractor = DataExtractor(page, batch=False)
+
+    assert await extractor._next_page(settled, "transactions", 0, 3) is True
+
+    assert extractor.waits[0]["step"] == "transactions page 2"
+    assert extractor.waits[0]["signal"] == "rows_changed"
+    assert extractor.waits[0]["wait_ms"] < 1000
+
+
+@pytest.mark.asyncio
+async def test_pagination_without_settle_keeps_the_fixed_wait():
+    page = SettlePage(request_seconds=False)
+    page.query_selector = _button_for(page)
+    waited = []
+
+    async def wait_for_timeout(ms):
+        waited.append(ms)
+
+    page.wait_for_timeout = wait_for_timeout
+    fixed = ListExtractionField(
+        selector="tr.txn", fields={}, pagination=PaginationConfig(next_selector="#next", wait_after_click=1500)
+    )
+    extractor = DataExtractor(page, batch=False)
+
+    assert await extractor._next_page(fixed, "transactions", 0, 3) is True
+    assert waited == [1500]
+    assert extractor.waits == [{"step": "transactions page 2", "signal": "fixed", "wait_ms": 1500.0}]
@@ -0,0 +1,214 @@
+"""Tests for per-site circuit breakers and AIMD concurrency limits."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from src.core import engine
+from src.core.blueprint import BlueprintStep, RateLimitConfig, StepAction
+from src.core.site_guard import AdaptiveConcurrency, get_site_guard, site_guard_status, tripped_sites
+from src.core.step_executor import StepExecutor
+from src.exceptions import ConnectionFailedError, SiteUnavailableError
+from src.scheduled_refresh import RefreshScheduler
+from tests.test_browser_sessions import FakeContext, FakePage, FakePool, RecordingExecutor, _blueprint
+
+
+def test_aimd_adds_on_fast_runs_and_halves_on_overload():
+    limit = AdaptiveConcurrency(8, slo_seconds=10)
+    limit.on_overload()
+    assert limit.limit == 4
+    limit.on_overload()
+    limit.on_overload()
+    limit.on_overload()
+    assert limit.limit == 1
+
+    limit.on_success(30)  # slower than the SLO: no growth
+    assert limit.limit == 1
+    for _ in range(3):  # +1/limit per success: roughly +1 per full round
+        limit.on_success(1)
+    assert limit.limit == 2
+
+    limit.set_max(1)
+    assert limit.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_site_failures_open_the_circuit_and_fail_fast():
+    guard = get_site_guard("down_bank")
+    threshold = guard.breaker.failure_threshold
+    calls = 0
+
+    async def timeout():
+        nonlocal calls
+        calls += 1
+        raise asyncio.TimeoutError()
+
+    for _ in range(threshold):
+        with pytest.raises(asyncio.TimeoutError):
+            await guard.call(timeout)
+
+    with pytest.raises(SiteUnavailableError) as excinfo:
+        await guard.call(timeout)
+    assert calls == threshold
+    assert excinfo.value.retry_after >= 1
+    assert excinfo.value.status_code == 503
+    assert tripped_sites() == ["down_bank"]
+    assert guard.concurrency_limit() == 1
+
+
+def _browser_site(monkeypatch, tmp_path, run_session):
+    """Route ``connect_to_site`` for "bank" to a fake pool and ``run_session``."""
+    pool = FakePool(FakeContext(FakePage(logged_in=True)))
+
+    async def fake_get_pool():
+        return pool
+
+    monkeypatch.setattr(engine, "_load_site_blueprint", lambda *_args: _blueprint(with_probe=False))
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "_run_browser_session", run_session)
+    monkeypatch.setattr(engine.settings, "connectors_dir", str(tmp_path))
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_errors_from_a_responsive_site_do_not_trip_it(monkeypatch, tmp_path):
+    # A rejected password: the post-login wait selector never appears
+    execute = AsyncMock(side_effect=ConnectionFailedError(site="unknown", detail="Step 'wait' timed out"))
+    _browser_site(monkeypatch, tmp_path, execute)
+
+    for _ in range(get_site_guard("bank").breaker.failure_threshold + 1):
+        with pytest.raises(ConnectionFailedError):
+            await engine.connect_to_site("bank", "user", "wrong")
+
+    assert execute.await_count == get_site_guard("bank").breaker.failure_threshold + 1
+    assert site_guard_status()["bank"]["state"] == "closed"
+    assert tripped_sites() == []
+
+
+@pytest.mark.asyncio
+async def test_unreachable_navigation_is_a_site_failure():
+    page = MagicMock()
+    page.goto = AsyncMock(side_effect=PlaywrightError("net::ERR_CONNECTION_REFUSED at https://down.test/login"))
+    executor = StepExecutor(page, {}, site="down_bank")
+
+    with pytest.raises(SiteUnavailableError):
+        await executor.execute_steps([BlueprintStep(action=StepAction.GOTO, url="https://down.test/login")])
+
+
+@pytest.mark.asyncio
+async def test_engine_fails_fast_once_the_site_circuit_is_open(monkeypatch, tmp_path):
+    execute = AsyncMock(side_effect=SiteUnavailableError("bank", "HTTP 503"))
+    pool = _browser_site(monkeypatch, tmp_path, execute)
+    pool.acquire = AsyncMock(return_value=pool.pooled)
+
+    for _ in range(get_site_guard("bank").breaker.failure_threshold):
+        with pytest.raises(SiteUnavailableError):
+            await engine.connect_to_site("bank", "user", "pass")
+    attempts = execute.await_count
+    queued = pool.acquire.await_count
+
+    with pytest.raises(SiteUnavailableError) as excinfo:
+        await engine.connect_to_site("bank", "user", "pass")
+
+    assert execute.await_count == attempts
+    assert pool.acquire.await_count == queued
+    assert excinfo.value.retry_after is not None
+
+
+async def _run_bank(deadline):
+    return await engine._execute_blueprint(
+        blueprint=_blueprint(with_probe=False),
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=None,
+        proxy=None,
+        session_id="sess-deadline",
+        deadline=deadline,
+    )
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_browser_slot_is_not_a_site_failure(monkeypatch, tmp_path):
+    execute = AsyncMock(return_value={"status": "connected", "data": {}})
+    pool = _browser_site(monkeypatch, tmp_path, execute)
+
+    async def saturated(*_args, **_kwargs):
+        await asyncio.sleep(1)
+
+    pool.acquire = saturated
+    limit = get_site_guard("bank").concurrency_limit()
+
+    for _ in range(get_site_guard("bank").breaker.failure_threshold):
+        with pytest.raises(asyncio.TimeoutError):
+            await _run_bank(time.monotonic() + 0.01)
+
+    execute.assert_not_awaited()
+    assert site_guard_status()["bank"]["consecutive_failures"] == 0
+    assert get_site_guard("bank").concurrency_limit() == limit
+
+
+@pytest.mark.asyncio
+async def test_slow_site_runs_count_against_the_site(monkeypatch, tmp_path):
+    async def slow_site(*_args):
+        await asyncio.sleep(1)
+
+    _browser_site(monkeypatch, tmp_path, slow_site)
+    limit = get_site_guard("bank").concurrency_limit()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await _run_bank(time.monotonic() + 0.01)
+
+    assert site_guard_status()["bank"]["consecutive_failures"] == 1
+    assert get_site_guard("bank").concurrency_limit() == max(1, limit // 2)
+
+
+@pytest.mark.asyncio
+async def test_blueprint_run_acquires_with_the_adaptive_site_limit(monkeypatch):
+    pool = FakePool(FakeContext(FakePage(logged_in=True)))
+    pool.acquire = AsyncMock(return_value=pool.pooled)
+
+    async def fake_get_pool():
+        return pool
+
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", RecordingExecutor)
+    blueprint = _blueprint(with_probe=False).model_copy(
+        update={"rate_limit": RateLimitConfig(max_concurrent_sessions=4)}
+    )
+    get_site_guard("bank").concurrency.on_overload()
+
+    await engine._execute_blueprint(
+        blueprint=blueprint,
+        site="bank",
+        username="u",
+        password="p",
+        extract_fields=None,
+        proxy=None,
+        session_id="sess-aimd",
+    )
+
+    assert pool.acquire.await_args.kwargs["site_limit"] == 2
+    assert site_guard_status()["bank"]["concurrency_max"] == 4
+
+
+@pytest.mark.asyncio
+async def test_scheduler_defers_jobs_for_a_tripped_site():
+    fetch = AsyncMock(side_effect=SiteUnavailableError("down_bank", "circuit open", retry_after=45))
+    scheduler = RefreshScheduler(fetch_callback=fetch, interval_seconds=600)
+    job = scheduler.schedule("acc-down", user_id=1)
+
+    await scheduler._execute_job(job, asyncio.Semaphore(1))
+
+    assert job.consecutive_failures == 0
+    assert job.retry_at is not None
+    assert not scheduler._is_due(job, datetime.now(timezone.utc))
+    assert scheduler._is_due(job, datetime.now(timezone.utc) + timedelta(seconds=46))
+
+    fetch.side_effect = SiteUnavailableError("down_bank", "HTTP 500")
+    await scheduler._execute_job(job, asyncio.Semaphore(1))
+    assert job.consecutive_failures == 1
@@ -0,0 +1,168 @@
+"""Tests for the per-site token bucket built from a blueprint's rate_limit."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src import metrics
+from src.core import site_rate_limit
+from src.core.blueprint import RateLimitConfig
+from src.core.site_rate_limit import SiteRateLimiter
+from src.exceptions import RateLimitedError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(site_rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def _limiter(max_wait: float = 120.0) -> SiteRateLimiter:
+    limiter = SiteRateLimiter(max_wait_seconds=max_wait)
+    limiter._client = lambda: None  # no Redis: exercise the in-process bucket
+    return limiter
+
+
+def test_min_interval_queues_callers_in_arrival_order(clock):
+    limiter = _limiter()
+    config = RateLimitConfig(max_requests_per_hour=600, min_interval_seconds=5)
+
+    assert [limiter.reserve("bank", config) for _ in range(3)] == [0.0, 5.0, 10.0]
+    assert limiter.reserve("other", config) == 0.0
+
+    clock.now += 12
+    assert limiter.reserve("bank", config) == pytest.approx(3.0)
+
+
+def test_hourly_budget_refills_over_time(clock):
+    limiter = _limiter(max_wait=3600)
+    config = RateLimitConfig(max_requests_per_hour=2, min_interval_seconds=0)
+
+    assert limiter.reserve("bank", config) == 0.0
+    assert limiter.reserve("bank", config) == 0.0
+    # Bucket is empty: the next token arrives after 3600 / 2 seconds.
+    assert limiter.reserve("bank", config) == pytest.approx(1800.0)
+
+    clock.now += 3600
+    assert limiter.reserve("bank", config) == pytest.approx(0.0)
+
+
+def test_wait_beyond_max_is_rejected_without_reserving(clock):
+    limiter = _limiter(max_wait=60)
+    config = RateLimitConfig(max_requests_per_hour=1, min_interval_seconds=0)
+    limiter.reserve("bank", config)
+
+    for _ in range(2):
+        with pytest.raises(RateLimitedError) as excinfo:
+            limiter.reserve("bank", config)
+        assert excinfo.value.retry_after == 3600
+        assert excinfo.value.status_code == 429
+
+    clock.now += 3600
+    assert limiter.reserve("bank", config) == pytest.approx(0.0)
+
+
+@pytest.mark.asyncio
+async def test_wait_turn_sleeps_until_the_reserved_slot():
+    limiter = _limiter()
+    config = RateLimitConfig(max_requests_per_hour=3600, min_interval_seconds=1)
+
+    started = time.monotonic()
+    waits = await asyncio.gather(limiter.wait_turn("bank", config), limiter.wait_turn("bank", config))
+
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(1.0, abs=0.05)
+    assert time.monotonic() - started >= 0.95
+
+
+def test_redis_reservation_is_shared_through_the_script():
+    redis_client = MagicMock()
+    redis_client.eval.return_value = [1, "2.5"]
+    limiter = SiteRateLimiter(max_wait_seconds=30, redis_client=redis_client)
+
+    wait = limiter.reserve("bank", RateLimitConfig(max_requests_per_hour=7200, min_interval_seconds=4))
+
+    assert wait == 2.5
+    script, numkeys, key, *args = redis_client.eval.call_args.args
+    assert script == site_rate_limit._RESERVE_SCRIPT
+    assert (numkeys, key) == (1, "plaidify:site_rate:bank")
+    assert args == [7200.0, 2.0, 4.0, 30]
+
+    redis_client.eval.return_value = [0, "95.2"]
+    with pytest.raises(RateLimitedError) as excinfo:
+        limiter.reserve("bank", RateLimitConfig())
+    assert excinfo.value.retry_after == 96
+
+
+def test_redis_errors_fall_back_to_the_local_bucket(clock):
+    redis_client = MagicMock()
+    redis_client.eval.side_effect = ConnectionError("redis down")
+    limiter = SiteRateLimiter(redis_client=redis_client)
+    config = RateLimitConfig(max_requests_per_hour=600, min_interval_seconds=5)
+
+    assert limiter.reserve("bank", config) == 0.0
+    assert limiter.reserve("bank", config) == 5.0
+
+
+@pytest.mark.skipif(not metrics.PROMETHEUS_AVAILABLE, reason="prometheus_client not installed")
+def test_reservations_are_exported_as_metrics(clock):
+    from prometheus_client import REGISTRY
+
+    def count(result):
+        return (
+            REGISTRY.get_sample_value("plaidify_site_throttle_total", {"site": "metrics_bank", "result": result}) or 0
+        )
+
+    before = {result: count(result) for result in ("immediate", "delayed", "rejected")}
+    limiter = _limiter(max_wait=10)
+    config = RateLimitConfig(max_requests_per_hour=600, min_interval_seconds=8)
+    limiter.reserve("metrics_bank", config)
+    limiter.reserve("metrics_bank", config)
+    with pytest.raises(RateLimitedError):
+        limiter.reserve("metrics_bank", config)
+
+    assert {result: count(result) - before[result] for result in before} == {
+        "immediate": 1,
+        "delayed": 1,
+        "rejected": 1,
+    }
+    assert REGISTRY.get_sample_value("plaidify_site_throttle_wait_seconds_sum", {"site": "metrics_bank"}) >= 8
+
+
+@pytest.mark.asyncio
+async def test_engine_waits_for_the_site_before_executing(tmp_path):
+    from src.core import engine
+    from src.core.blueprint import BlueprintV2, ExecutionMode
+
+    blueprint = MagicMock(spec=BlueprintV2)
+    blueprint.execution_mode = ExecutionMode.BROWSER
+    blueprint.rate_limit = RateLimitConfig(max_requests_per_hour=60, min_interval_seconds=5)
+    limiter = MagicMock()
+    limiter.wait_turn = AsyncMock(return_value=1.25)
+    execute = AsyncMock(return_value={"status": "connected", "data": {}, "metadata": None})
+
+    with (
+        patch.object(engine, "_load_site_blueprint", return_value=blueprint),
+        patch.object(engine, "get_site_rate_limiter", return_value=limiter),
+        patch.object(engine, "_execute_blueprint", execute),
+        patch.object(engine.settings, "connectors_dir", str(tmp_path)),
+    ):
+        result = await engine.connect_to_site("throttled_bank", "user", "pass")
+
+        limiter.wait_turn.assert_awaited_once_with("throttled_bank", blueprint.rate_limit)
+        assert result["metadata"] == {"throttle_wait_seconds": 1.25}
+
+        with patch.object(engine.settings, "site_rate_limit_enabled", False):
+            await engine.connect_to_site("throttled_bank", "user", "pass")
+        assert limiter.wait_turn.await_count == 1
@@ -0,0 +1,184 @@
+"""Tests for field-aware step pruning of partial fetches."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.core import engine
+from src.core.blueprint import (
+    AuthConfig,
+    BlueprintStep,
+    BlueprintV2,
+    ExtractionField,
+    ExtractionPage,
+    ListExtractionField,
+    StepAction,
+)
+from src.core.step_plan import build_step_plan, prune_steps
+from tests.test_browser_sessions import FakeContext, FakePage, FakePool
+
+
+def _goto(url, fields=None):
+    return BlueprintStep(action=StepAction.GOTO, url=url, fields=fields)
+
+
+def _blueprint() -> BlueprintV2:
+    return BlueprintV2(
+        name="Utility",
+        domain="utility.test",
+        auth=AuthConfig(
+            steps=[
+                _goto("https://utility.test/login"),
+                BlueprintStep(action=StepAction.CLICK, selector="#submit"),
+                _goto("https://utility.test/billing", fields=["current_bill"]),
+            ]
+        ),
+        extract={
+            "account_number": ExtractionField(selector="#acct"),
+            "current_bill": ExtractionField(selector="#bill"),
+            "transactions": ListExtractionField(selector="tr.txn", fields={"amount": ExtractionField(selector="td")}),
+            "statements": ListExtractionField(selector="li.stmt", fields={"date": ExtractionField(selector="span")}),
+        },
+        pages=[
+            ExtractionPage(
+                name="activity",
+                steps=[_goto("https://utility.test/activity")],
+                fields=["transactions"],
+            ),
+            ExtractionPage(
+                name="documents",
+                steps=[
+                    _goto("https://utility.test/documents"),
+                    BlueprintStep(action=StepAction.CLICK, selector="#archive", fields=["old_statements"]),
+                ],
+                fields=["statements"],
+            ),
+        ],
+    )
+
+
+def test_full_fetch_keeps_every_step():
+    plan = build_step_plan(_blueprint(), None)
+
+    assert len(plan.auth_steps) == 3
+    assert [page.name for page in plan.pages] == ["activity", "documents"]
+    assert len(plan.pages[1].steps) == 2
+    assert plan.fields == ["account_number", "current_bill", "transactions", "statements"]
+    assert plan.skipped == []
+
+
+def test_partial_fetch_skips_pages_and_tagged_steps_it_does_not_need():
+    plan = build_step_plan(_blueprint(), ["current_bill"])
+
+    assert [step.url for step in plan.auth_steps if step.url] == [
+        "https://utility.test/login",
+        "https://utility.test/billing",
+    ]
+    assert plan.pages == []
+    assert plan.fields == ["current_bill"]
+    assert plan.skipped == ["page:activity[0] goto", "page:documents[0] goto", "page:documents[1] click"]
+
+    plan = build_step_plan(_blueprint(), ["statements"])
+    assert [step.action for step in plan.auth_steps] == [StepAction.GOTO, StepAction.CLICK]
+    assert [page.name for page in plan.pages] == ["documents"]
+    assert [step.action for step in plan.pages[0].steps] == [StepAction.GOTO]
+    assert "auth[2] goto" in plan.skipped
+
+
+def test_conditional_branches_are_pruned_too():
+    step = BlueprintStep(
+        action=StepAction.CONDITIONAL,
+        condition_selector="#promo",
+        then_steps=[
+            BlueprintStep(action=StepAction.CLICK, selector="#dismiss"),
+            _goto("https://utility.test/usage", fields=["usage"]),
+        ],
+    )
+
+    kept, skipped = prune_steps([step], ["current_bill"], context="auth")
+
+    assert len(kept[0].then_steps) == 1
+    assert skipped == ["auth[0].then_steps[1] goto"]
+    assert len(step.then_steps) == 2  # the blueprint itself is untouched
+
+
+def test_pages_must_reference_known_fields_once():
+    with pytest.raises(ValidationError, match="unknown extract field"):
+        BlueprintV2(
+            name="x",
+            domain="x.test",
+            auth=AuthConfig(steps=[]),
+            pages=[ExtractionPage(name="p", steps=[], fields=["missing"])],
+        )
+    with pytest.raises(ValidationError, match="more than one page"):
+        BlueprintV2(
+            name="x",
+            domain="x.test",
+            auth=AuthConfig(steps=[]),
+            extract={"bill": ExtractionField(selector="#bill")},
+            pages=[
+                ExtractionPage(name="a", steps=[], fields=["bill"]),
+                ExtractionPage(name="b", steps=[], fields=["bill"]),
+            ],
+        )
+
+
+class StepRecorder:
+    runs: list = []
+
+    def __init__(self, *_args, **_kwargs):
+        self.waits: list[dict] = []
+
+    async def execute_steps(self, steps, context=""):
+        StepRecorder.runs.append((context, [step.url or step.selector for step in steps]))
+
+
+class FieldExtractor:
+    def __init__(self, page, **_kwargs):
+        self.timings: dict = {}
+        self.waits: list = []
+
+    async def extract(self, defs, site=None):
+        return {name: f"<{name}>" for name in defs}
+
+
+async def _run(monkeypatch, extract_fields):
+    async def fake_get_pool():
+        return FakePool(FakeContext(FakePage(logged_in=True)))
+
+    StepRecorder.runs = []
+    monkeypatch.setattr(engine, "get_browser_pool", fake_get_pool)
+    monkeypatch.setattr(engine, "StepExecutor", StepRecorder)
+    monkeypatch.setattr(engine, "DataExtractor", FieldExtractor)
+    return await engine._execute_blueprint(
+        blueprint=_blueprint(),
+        site="utility",
+        username="u",
+        password="p",
+        extract_fields=extract_fields,
+        proxy=None,
+        session_id="sess-plan",
+    )
+
+
+@pytest.mark.asyncio
+async def test_engine_visits_only_the_pages_requested_fields_need(monkeypatch):
+    result = await _run(monkeypatch, ["current_bill"])
+
+    assert StepRecorder.runs == [
+        ("auth", ["https://utility.test/login", "#submit", "https://utility.test/billing"]),
+    ]
+    assert result["data"] == {"current_bill": "<current_bill>"}
+    assert result["metadata"]["skipped_steps"] == [
+        "page:activity[0] goto",
+        "page:documents[0] goto",
+        "page:documents[1] click",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_engine_extracts_each_page_after_its_navigation(monkeypatch):
+    result = await _run(monkeypatch, None)
+
+    assert [context for context, _ in StepRecorder.runs] == ["auth", "page:activity", "page:documents"]
+    assert list(result["data"]) == ["account_number", "current_bill", "transactions", "statements"]
+    assert "skipped_steps" not in result["metadata"]
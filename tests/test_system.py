@@ -2,7 +2,10 @@
 Tests for system endpoints: /, /health, /status, /connect, /disconnect.
 """
 
-from unittest.mock import AsyncMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.circuit_breaker import CircuitState
 
 
 class TestSystemEndpoints:
@@ -44,6 +47,51 @@ class TestSystemEndpoints:
         assert data["checks"]["browser_pool"] == "ok"
         browser_pool.assert_awaited_once()
 
+    def test_detailed_health_reports_throttled_browser_pool(self, client):
+        pool = MagicMock()
+        pool.admission_status.return_value = {
+            "active": 2,
+            "queued": 3,
+            "max_size": 8,
+            "effective_limit": 2,
+            "throttled": True,
+        }
+        browser_pool = AsyncMock(return_value=pool)
+
+        with (
+            patch("src.routers.system.settings.health_check_token", None),
+            patch("src.routers.system.get_browser_pool", new=browser_pool),
+        ):
+            response = client.get("/health/detailed")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["checks"]["browser_pool"] == "throttled"
+        assert data["browser_pool"]["effective_limit"] == 2
+
+    def test_detailed_health_reports_tripped_sites(self, client):
+        from src.core.site_guard import get_site_guard
+
+        guard = get_site_guard("down_bank")
+        guard.breaker._state = CircuitState.OPEN
+        guard.breaker._opened_at = time.monotonic()
+        get_site_guard("healthy_bank")
+
+        with (
+            patch("src.routers.system.settings.health_check_token", None),
+            patch("src.routers.system.get_browser_pool", new=AsyncMock(return_value=object())),
+        ):
+            response = client.get("/health/detailed")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["checks"]["sites"] == "tripped"
+        assert data["sites"]["down_bank"]["state"] == "open"
+        assert data["sites"]["down_bank"]["retry_after_seconds"] > 0
+        assert data["sites"]["healthy_bank"]["state"] == "closed"
+
     def test_detailed_health_reports_kms(self, client):
         """KMS provider round-trip is probed and reported healthy by default."""
         browser_pool = AsyncMock(return_value=object())